@@ -0,0 +1,34 @@
+"""add_chunk_content_range
+
+Revision ID: 3c7a91d2e4b8
+Revises: d0cd218cc5eb
+Create Date: 2026-10-16 21:40:12.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7a91d2e4b8'
+down_revision: Union[str, Sequence[str], None] = 'd0cd218cc5eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add byte range columns to chunks for packed chunk sets."""
+    op.add_column(
+        "chunks", sa.Column("content_offset", sa.BigInteger(), nullable=True)
+    )
+    op.add_column(
+        "chunks", sa.Column("content_length", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Remove byte range columns from chunks."""
+    op.drop_column("chunks", "content_length")
+    op.drop_column("chunks", "content_offset")
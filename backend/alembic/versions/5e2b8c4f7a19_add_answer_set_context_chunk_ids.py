@@ -0,0 +1,30 @@
+"""add_answer_set_context_chunk_ids
+
+Revision ID: 5e2b8c4f7a19
+Revises: 8d4f2b6c1e93
+Create Date: 2026-10-17 10:12:37.451903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2b8c4f7a19'
+down_revision: Union[str, Sequence[str], None] = '8d4f2b6c1e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record the chunks shown to the model for retrieval-trimmed answers."""
+    op.add_column(
+        "answer_sets", sa.Column("context_chunk_ids", sa.JSON(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Remove context_chunk_ids from answer_sets."""
+    op.drop_column("answer_sets", "context_chunk_ids")
@@ -0,0 +1,56 @@
+"""add_usage_daily_counters
+
+Revision ID: 8d4f2b6c1e93
+Revises: 3c7a91d2e4b8
+Create Date: 2026-10-16 23:05:41.702115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4f2b6c1e93'
+down_revision: Union[str, Sequence[str], None] = '3c7a91d2e4b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-day usage rollups and backfill them from usage_events."""
+    op.create_table(
+        "usage_daily_counters",
+        sa.Column("company_id", sa.BigInteger(), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("bucket_date", sa.Date(), nullable=False),
+        sa.Column("quantity", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("event_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "file_size_bytes", sa.BigInteger(), server_default="0", nullable=False
+        ),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "event_type", "bucket_date"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO usage_daily_counters
+            (company_id, event_type, bucket_date, quantity, event_count, file_size_bytes)
+        SELECT
+            company_id,
+            event_type,
+            (created_at AT TIME ZONE 'UTC')::date,
+            COALESCE(SUM(quantity), 0),
+            COUNT(*),
+            COALESCE(SUM(file_size_bytes), 0)
+        FROM usage_events
+        GROUP BY company_id, event_type, (created_at AT TIME ZONE 'UTC')::date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop per-day usage rollups."""
+    op.drop_table("usage_daily_counters")
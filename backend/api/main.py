@@ -11,6 +11,7 @@ from common.core.config import settings
 from api.v1.routes.router import api_router
 from internal.routes.router import internal_router
 from common.db.session import init_db
+from common.providers.api_keys.client_pool import close_client_pools
 from common.providers.rate_limiter.limiter import limiter
 
 # Initialize Axiom OpenTelemetry exporter (must be first)
@@ -41,6 +42,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down application...")
+    await close_client_pools()
 
 
 # Only expose OpenAPI docs in local development
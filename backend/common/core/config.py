@@ -1,7 +1,12 @@
 from typing import Optional, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from common.core.constants import Environment, StorageProvider, WorkflowExecutionMode
+from common.core.constants import (
+    Environment,
+    QAContextMode,
+    StorageProvider,
+    WorkflowExecutionMode,
+)
 
 
 class Settings(BaseSettings):
@@ -42,6 +47,10 @@ class Settings(BaseSettings):
     s3_bucket_name: str
     s3_endpoint_url: Optional[str] = None  # For LocalStack / R2
 
+    # Storage I/O (blocking SDK calls run on a dedicated bounded thread pool)
+    storage_max_concurrency: int = 32  # Max in-flight storage calls per process
+    storage_multipart_chunk_size: int = 8 * 1024 * 1024  # Bytes per part/range
+
     # RabbitMQ
     rabbitmq_host: str
     rabbitmq_port: int
@@ -52,6 +61,9 @@ class Settings(BaseSettings):
     # Worker Concurrency Settings
     qa_worker_prefetch_count: int = 5  # How many QA jobs to process concurrently
 
+    # Streamed matrix cell creation (each chunk commits, then its jobs publish)
+    matrix_cell_batch_chunk_size: int = 2000  # Cells per committed chunk
+
     # Redis
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -67,10 +79,30 @@ class Settings(BaseSettings):
         else:
             return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
+    # @cache decorator in-process L1 tier (opt-in per decorated function)
+    cache_local_max_entries: int = 10000
+    cache_local_ttl_jitter: float = 0.1  # Fraction of local TTL randomized
+    cache_invalidation_batch_size: int = 500  # Keys per pipelined UNLINK batch
+
     # OpenRouter (unified AI provider)
     openrouter_api_key: str
     default_model: str = "google/gemini-2.0-flash-001"
 
+    # LLM response cache (only requests at or below the max temperature)
+    llm_response_cache_enabled: bool = True
+    llm_response_cache_max_temperature: float = 0.0
+    llm_response_cache_max_bytes: int = 64 * 1024 * 1024  # Per-process LRU budget
+    llm_response_cache_redis_enabled: bool = True  # Shared tier across processes
+    llm_response_cache_redis_ttl: int = 7 * 86400  # Seconds
+
+    # LLM request governor (per model, per process)
+    llm_max_concurrency_per_model: int = 16  # Max in-flight requests
+    llm_requests_per_second_per_model: float = 10.0  # Sustained request rate
+    llm_request_burst_per_model: int = 20  # Requests allowed back to back
+    llm_max_retries: int = 4  # Retries on 429 / 5xx / connection errors
+    llm_retry_base_delay: float = 1.0  # Seconds; doubled per attempt
+    llm_retry_max_delay: float = 60.0  # Seconds
+
     # Anthropic (for workflow agent execution)
     anthropic_api_key: str
 
@@ -80,10 +112,22 @@ class Settings(BaseSettings):
     # Embeddings
     embedding_provider: str = "openai"  # openai or voyage
     embedding_model: Optional[str] = None  # Provider-specific model
+    embedding_cache_max_entries: int = 10000  # Per-process LRU size
+    embedding_cache_redis_enabled: bool = True  # Persistent tier across processes
+    embedding_cache_redis_ttl: int = 7 * 86400  # Seconds
+    embedding_batch_max_texts: int = 128  # Max inputs per provider request
+    embedding_batch_max_chars: int = 200_000  # Max total characters per request
+    embedding_max_concurrency: int = 4  # Concurrent batch requests per call
+    embedding_max_retries: int = 3  # Retries per failed batch
 
     # Voyage AI (optional embedding provider)
     voyage_api_keys: Optional[List[str]] = None
 
+    # Pooled HTTP clients for API-key providers (one long-lived client per key)
+    http_client_max_connections: int = 100
+    http_client_max_keepalive_connections: int = 20
+    http_client_keepalive_expiry: float = 30.0  # Seconds
+
     # OpenTelemetry
     otel_service_name: str
     otel_service_version: str
@@ -106,6 +150,8 @@ class Settings(BaseSettings):
     temporal_namespace: str = "default"
     temporal_api_key: Optional[str] = None
     temporal_task_queue: Optional[str] = None
+    # Activity string payloads above this size go to storage, passed by reference
+    temporal_payload_offload_threshold: int = 128 * 1024  # Bytes, 0 to disable
 
     # Google Gemini
     gemini_api_keys: List[str]
@@ -119,6 +165,16 @@ class Settings(BaseSettings):
 
     # PDF Processing
     pdf_page_split_size: int = 1
+    # Batched mode: convert page ranges from one download, no per-page objects
+    pdf_batching_enabled: bool = False
+    pdf_batch_max_pages: int = 50  # Pages per batch
+    pdf_batch_max_bytes: int = 16 * 1024 * 1024  # Estimated PDF bytes per batch
+    pdf_batch_concurrency: int = 4  # Batches converted at once per document
+
+    # Extraction engine (MarkItDown conversions run in a process pool)
+    extraction_max_workers: Optional[int] = None  # Defaults to CPU count
+    extraction_memory_limit_mb: Optional[int] = 2048  # Per worker process
+    extraction_timeout: float = 300.0  # Seconds per conversion
 
     # Document Search
     document_search_provider: str = "elasticsearch"
@@ -142,6 +198,12 @@ class Settings(BaseSettings):
     okta_client_id: str = ""
     okta_audience: str = "api://default"
 
+    # Authenticated principal cache (API key hash / SSO subject -> user context)
+    auth_principal_cache_max_entries: int = 10000  # Per-process LRU size
+    auth_principal_cache_local_ttl: float = 30.0  # Seconds; bounds revoke lag
+    auth_principal_cache_redis_enabled: bool = True  # Shared tier across processes
+    auth_principal_cache_redis_ttl: int = 300  # Seconds
+
     # Firebase Auth (uses Workload Identity on GKE - no API keys needed)
     firebase_project_id: Optional[str] = None  # Falls back to google_project_id
 
@@ -176,6 +238,24 @@ class Settings(BaseSettings):
     # Document Chunking (always enabled - small docs become single chunk)
     chunk_target_size: int = 12000  # Target chunk size in characters (~3000 tokens)
     chunk_overlap_size: int = 800  # Overlap between chunks in characters (~200 tokens)
+    chunk_upload_concurrency: int = 16  # Max concurrent chunk uploads per document
+    chunk_storage_packed: bool = False  # Store a chunk set as one blob + offsets
+
+    # QA prompt context (retrieval mode trims large documents to relevant chunks)
+    qa_context_mode: QAContextMode = QAContextMode.FULL
+    qa_context_token_budget: int = 24000  # Document tokens per prompt
+    qa_context_top_k: int = 20  # Max chunks retrieved per document
+    qa_context_chars_per_token: int = 4  # For token estimates
+
+    # Chunk content cache (chunks are immutable once uploaded)
+    chunk_content_cache_max_bytes: int = 64 * 1024 * 1024  # Per-process LRU budget
+    chunk_content_cache_redis_enabled: bool = False  # Shared tier across processes
+    chunk_content_cache_redis_ttl: int = 86400  # Seconds
+
+    # Extracted document content cache (QA strategies reload documents per cell)
+    extracted_content_cache_max_bytes: int = 256 * 1024 * 1024  # Per-process LRU
+    extracted_content_cache_redis_enabled: bool = False  # Shared tier
+    extracted_content_cache_redis_ttl: int = 3600  # Seconds
 
     # Billing - Stripe (payments)
     stripe_secret_key: str = ""
@@ -23,3 +23,10 @@ class WorkflowExecutionMode(str, Enum):
     DOCKER = "docker"
     K8S = "k8s"
     MODAL = "modal"
+
+
+class QAContextMode(str, Enum):
+    """How document content is placed in QA prompts."""
+
+    FULL = "full"  # Whole extracted document
+    RETRIEVAL = "retrieval"  # Top-k relevant chunks under a token budget
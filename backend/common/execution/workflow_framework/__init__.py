@@ -4,7 +4,7 @@ Workflow framework for Temporal orchestration patterns.
 Provides reusable helpers for common workflow patterns:
 - Orchestration helpers (launch→poll→extract→cleanup pattern) - SAFE for workflows
 - Orchestration models (config objects) - SAFE for workflows
-- Activity helpers (executor, status checking, cleanup) - ONLY for activities, not exported
+- Activity helpers (executor, status checking, cleanup, payload offloading) - ONLY for activities, not exported
 - Service account management - ONLY for activities, not exported
 
 IMPORTANT: This package intentionally does NOT export activity_helpers or service_accounts
@@ -1,10 +1,12 @@
 """
 Common helper utilities for temporal activities.
 
-Provides shared logic that all execution activities use.
+Provides shared logic that all execution activities use, plus offloading of
+large activity payloads to storage.
 NOT activities themselves - just helper functions to reduce duplication.
 """
 
+import io
 from typing import Dict, Any, Callable
 from temporalio import activity
 
@@ -12,6 +14,11 @@ from common.core.constants import WorkflowExecutionMode
 from common.execution.executors.docker import DockerExecutor
 from common.execution.executors.k8s import K8sExecutor
 from common.execution.executors.modal_executor import ModalExecutor
+from common.providers.storage.factory import get_storage
+from common.providers.storage.paths import get_temporal_payload_prefix
+
+# Marks an activity string result/argument that was offloaded to storage
+PAYLOAD_REF_PREFIX = "temporal-payload-ref://"
 
 
 def get_executor():
@@ -82,3 +89,81 @@ async def cleanup_execution_resources(
             activity.logger.info(f"Cleaned up service account {service_account_id}")
         except Exception as e:
             activity.logger.error(f"Failed to cleanup service account: {e}")
+
+
+async def offload_payload(content: str) -> str:
+    """
+    Offload a large string result to storage and return a reference instead.
+
+    Keeps large payloads (e.g. extracted markdown) out of workflow history and
+    under Temporal's payload size limit. Pass the returned value to other
+    activities as-is and call resolve_payload() there. Objects are stored
+    under the workflow run's prefix; the workflow should run
+    delete_offloaded_payloads() when it finishes.
+
+    Args:
+        content: Activity result to offload
+
+    Returns:
+        The content itself when under the threshold (or outside an activity),
+        otherwise a reference to the stored object
+    """
+    # Import settings here to avoid workflow sandbox issues
+    from common.core.config import settings  # noqa: PLC0415
+
+    threshold = settings.temporal_payload_offload_threshold
+    if not threshold or not activity.in_activity():
+        return content
+
+    data = content.encode("utf-8")
+    if len(data) <= threshold:
+        return content
+
+    info = activity.info()
+    # Keyed by activity ID so a retried attempt overwrites its own object
+    key = f"{get_temporal_payload_prefix(info.workflow_id, info.workflow_run_id)}/{info.activity_id}"
+
+    success = await get_storage().upload(
+        key, io.BytesIO(data), metadata={"content_type": "text/plain"}
+    )
+    if not success:
+        raise Exception(f"Failed to offload activity payload to {key}")
+
+    activity.logger.info(f"Offloaded {len(data)} byte payload to {key}")
+    return f"{PAYLOAD_REF_PREFIX}{key}"
+
+
+async def resolve_payload(value: str) -> str:
+    """
+    Return the content behind a reference from offload_payload().
+
+    Values that aren't references are returned unchanged.
+
+    Raises:
+        ValueError: If the referenced object no longer exists
+    """
+    if not value.startswith(PAYLOAD_REF_PREFIX):
+        return value
+
+    key = value[len(PAYLOAD_REF_PREFIX) :]
+    data = await get_storage().download(key)
+    if data is None:
+        raise ValueError(f"Offloaded payload not found: {key}")
+    return data.decode("utf-8")
+
+
+async def delete_offloaded_payloads() -> int:
+    """
+    Delete every payload offloaded by the current workflow run.
+
+    Must be called from an activity of the workflow that owns the payloads.
+
+    Returns:
+        Number of objects deleted
+    """
+    info = activity.info()
+    prefix = get_temporal_payload_prefix(info.workflow_id, info.workflow_run_id)
+    deleted = await get_storage().delete_prefix(prefix)
+    if deleted:
+        activity.logger.info(f"Deleted {deleted} offloaded payloads under {prefix}")
+    return deleted
@@ -1,16 +1,61 @@
+import asyncio
+import random
 from typing import Optional, List, Dict, Any
 
-from openai import AsyncOpenAI
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
 
 from .interface import AIProviderInterface
 from .models import Message, ChatCompletionMessageToolCall, Function, InputMessage
+from .rate_governor import get_model_governor
+from .response_cache import (
+    get_llm_response_cache,
+    is_cacheable_request,
+    llm_response_cache_key,
+)
 from common.core.config import settings
 from common.core.otel_axiom_exporter import get_logger, trace_span
+from common.providers.caching import SingleFlight
 
 logger = get_logger(__name__)
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+RETRYABLE_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
+# Identical concurrent cacheable requests share one completion
+_single_flight = SingleFlight()
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the server's retry-after hint (seconds) from an API error."""
+    if not isinstance(error, APIStatusError):
+        return None
+
+    headers = error.response.headers
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return float(retry_after)
+    except ValueError:
+        # HTTP-date form is not used by OpenRouter; fall back to backoff
+        pass
+    return None
+
 
 class OpenRouterProvider(AIProviderInterface):
     """AI provider using OpenRouter's unified API."""
@@ -24,9 +69,60 @@ class OpenRouterProvider(AIProviderInterface):
                        If None, uses default from settings.
         """
         self.model_name = model_name or settings.default_model
+        # Retries are handled here so they go through the rate governor
         self.client = AsyncOpenAI(
             base_url=OPENROUTER_BASE_URL,
             api_key=settings.openrouter_api_key,
+            max_retries=0,
+        )
+
+    async def _create_completion(self, request_params: Dict[str, Any]):
+        """
+        Create a chat completion under the model's rate governor.
+
+        Transient failures are retried with full-jitter exponential backoff;
+        a 429 retry-after pauses the whole model, not just this request.
+        """
+        governor = get_model_governor(self.model_name)
+        max_retries = settings.llm_max_retries
+
+        for attempt in range(max_retries + 1):
+            try:
+                async with governor.slot():
+                    return await self.client.chat.completions.create(**request_params)
+            except RETRYABLE_ERRORS as e:
+                if attempt == max_retries:
+                    raise
+
+                retry_after = _retry_after_seconds(e)
+                if retry_after is not None:
+                    delay = retry_after + random.uniform(0, 1)
+                else:
+                    delay = random.uniform(
+                        0,
+                        min(
+                            settings.llm_retry_max_delay,
+                            settings.llm_retry_base_delay * (2**attempt),
+                        ),
+                    )
+                if isinstance(e, RateLimitError):
+                    governor.pause(delay)
+
+                logger.warning(
+                    f"OpenRouter request for {self.model_name} failed "
+                    f"(attempt {attempt + 1}), retrying in {delay:.1f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def _cached(self, kind: str, request_params: Dict[str, Any], loader):
+        """Serve a deterministic request from the response cache."""
+        if not is_cacheable_request(request_params["temperature"]):
+            return await loader()
+
+        cache_key = llm_response_cache_key(kind, request_params)
+        return await _single_flight.do(
+            cache_key,
+            lambda: get_llm_response_cache().get_or_load(cache_key, loader),
         )
 
     @trace_span
@@ -53,11 +149,14 @@ class OpenRouterProvider(AIProviderInterface):
             if max_tokens:
                 request_params["max_tokens"] = max_tokens
 
-            logger.info(f"Sending request to OpenRouter with model: {self.model_name}")
-
-            response = await self.client.chat.completions.create(**request_params)
+            async def load() -> str:
+                logger.info(
+                    f"Sending request to OpenRouter with model: {self.model_name}"
+                )
+                response = await self._create_completion(request_params)
+                return response.choices[0].message.content.strip()
 
-            return response.choices[0].message.content.strip()
+            return await self._cached("message", request_params, load)
 
         except Exception as e:
             logger.error(f"Error sending message to OpenRouter: {e}")
@@ -89,35 +188,43 @@ class OpenRouterProvider(AIProviderInterface):
             if tools:
                 request_params["tools"] = tools
 
-            logger.info(
-                f"Sending messages request to OpenRouter with model: {self.model_name}"
-            )
-
-            response = await self.client.chat.completions.create(**request_params)
-
-            message_response = response.choices[0].message
+            async def load() -> str:
+                logger.info(
+                    f"Sending messages request to OpenRouter with model: {self.model_name}"
+                )
+                response = await self._create_completion(request_params)
+                return self._to_message(response).model_dump_json()
 
-            # Parse tool calls if present
-            tool_calls = None
-            if hasattr(message_response, "tool_calls") and message_response.tool_calls:
-                tool_calls = []
-                for tc in message_response.tool_calls:
-                    tool_call = ChatCompletionMessageToolCall(
-                        id=tc.id,
-                        type=tc.type,
-                        function=Function(
-                            name=tc.function.name, arguments=tc.function.arguments
-                        ),
-                    )
-                    tool_calls.append(tool_call)
-
-            return Message(
-                content=message_response.content,
-                tool_calls=tool_calls,
-                role="assistant",
+            return Message.model_validate_json(
+                await self._cached("messages", request_params, load)
             )
 
         except Exception as e:
             logger.error(f"Error sending messages to OpenRouter: {e}")
             logger.error(f"Request details - Model: {self.model_name}")
             raise Exception(f"Failed to get response from OpenRouter: {str(e)}")
+
+    @staticmethod
+    def _to_message(response) -> Message:
+        """Convert a chat completion response to a Message."""
+        message_response = response.choices[0].message
+
+        # Parse tool calls if present
+        tool_calls = None
+        if hasattr(message_response, "tool_calls") and message_response.tool_calls:
+            tool_calls = []
+            for tc in message_response.tool_calls:
+                tool_call = ChatCompletionMessageToolCall(
+                    id=tc.id,
+                    type=tc.type,
+                    function=Function(
+                        name=tc.function.name, arguments=tc.function.arguments
+                    ),
+                )
+                tool_calls.append(tool_call)
+
+        return Message(
+            content=message_response.content,
+            tool_calls=tool_calls,
+            role="assistant",
+        )
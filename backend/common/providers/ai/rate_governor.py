@@ -0,0 +1,85 @@
+"""
+Per-model concurrency and request-rate governor for LLM calls.
+
+Each model gets a concurrency ceiling plus a token bucket (steady request rate
+with a burst allowance). When the API answers 429, the model is paused for the
+advertised retry-after so concurrent callers back off together instead of
+retrying into the limit.
+"""
+
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+from common.core.config import settings
+
+
+class ModelRateGovernor:
+    """Concurrency limit and token bucket for one model."""
+
+    def __init__(self, max_concurrency: int, rate: float, burst: int):
+        """
+        Args:
+            max_concurrency: Maximum in-flight requests
+            rate: Sustained requests per second
+            burst: Maximum requests that can start back to back
+        """
+        self.rate = rate
+        self.burst = burst
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _acquire_token(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot once the rate limit allows a new request."""
+        async with self._semaphore:
+            await self._acquire_token()
+            yield
+
+    def pause(self, seconds: float) -> None:
+        """Stop starting new requests for this model for the given time."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+# event loop -> {model_name: governor}; asyncio primitives are loop-bound
+_governors: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_model_governor(model_name: str) -> ModelRateGovernor:
+    """Get the governor for a model on the running event loop."""
+    loop = asyncio.get_running_loop()
+    loop_governors: Dict[str, ModelRateGovernor] = _governors.setdefault(loop, {})
+
+    governor = loop_governors.get(model_name)
+    if governor is None:
+        governor = ModelRateGovernor(
+            max_concurrency=settings.llm_max_concurrency_per_model,
+            rate=settings.llm_requests_per_second_per_model,
+            burst=settings.llm_request_burst_per_model,
+        )
+        loop_governors[model_name] = governor
+
+    return governor
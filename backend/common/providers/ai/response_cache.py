@@ -0,0 +1,58 @@
+"""
+Deterministic LLM response cache.
+
+Completions requested at (near) zero temperature are treated as a pure
+function of (model, messages, params), so re-running a matrix with the same
+question, document and model reuses the earlier completion instead of paying
+for it again.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from common.core.config import settings
+from common.providers.caching import ContentCache, get_cache_provider
+
+_llm_response_cache: Optional[ContentCache] = None
+
+
+def get_llm_response_cache() -> ContentCache:
+    """Get the shared LLM response cache instance."""
+    global _llm_response_cache
+
+    if _llm_response_cache is None:
+        _llm_response_cache = ContentCache(
+            namespace="llm_response",
+            max_bytes=settings.llm_response_cache_max_bytes,
+            shared_cache=(
+                get_cache_provider()
+                if settings.llm_response_cache_redis_enabled
+                else None
+            ),
+            shared_ttl=settings.llm_response_cache_redis_ttl,
+        )
+
+    return _llm_response_cache
+
+
+def is_cacheable_request(temperature: float) -> bool:
+    """Only (near) deterministic requests are served from cache."""
+    return (
+        settings.llm_response_cache_enabled
+        and temperature <= settings.llm_response_cache_max_temperature
+    )
+
+
+def llm_response_cache_key(kind: str, request_params: Dict[str, Any]) -> str:
+    """
+    Cache key for a completion request.
+
+    Params are serialized canonically (sorted keys, no whitespace) so equal
+    requests hash identically regardless of dict ordering.
+    """
+    canonical = json.dumps(
+        request_params, sort_keys=True, separators=(",", ":"), default=str
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{kind}:{request_params['model']}:{digest}"
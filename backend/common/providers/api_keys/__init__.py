@@ -2,6 +2,7 @@ from .rotation_provider import APIKeyRotationProvider
 from .provider_enum import APIProviderType
 from .interface import APIKeyRotationInterface
 from .factory import get_rotator, initialize_all_rotators, reset_rotators
+from .client_pool import KeyedClientPool, close_client_pools, create_http_client
 
 __all__ = [
     "APIKeyRotationProvider",
@@ -10,4 +11,7 @@ __all__ = [
     "initialize_all_rotators",
     "reset_rotators",
     "APIProviderType",
+    "KeyedClientPool",
+    "close_client_pools",
+    "create_http_client",
 ]
@@ -0,0 +1,98 @@
+"""
+Long-lived, per-key HTTP clients for rotated API keys.
+
+Providers that rotate keys via APIKeyRotationProvider keep one client per key
+here instead of building a new client (and new TLS connections) per request.
+Clients are scoped to the running event loop, since httpx connections cannot
+be shared across loops. Call close_client_pools() from the shutdown path of
+the loop that used them so pooled connections are released.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from typing import Callable, Generic, TypeVar
+
+import httpx
+
+from common.core.config import settings
+from common.core.otel_axiom_exporter import get_logger
+
+logger = get_logger(__name__)
+
+ClientType = TypeVar("ClientType")
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package."""
+    return importlib.util.find_spec("h2") is not None
+
+
+HTTP2_AVAILABLE = _http2_available()
+
+# Every pool created in this process, for close_client_pools()
+_pools: "weakref.WeakSet[KeyedClientPool]" = weakref.WeakSet()
+
+
+def create_http_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Create a pooled httpx client with keep-alive and configured limits.
+
+    Uses HTTP/2 when the h2 package is installed. Extra kwargs are passed to
+    httpx.AsyncClient.
+    """
+    limits = httpx.Limits(
+        max_connections=settings.http_client_max_connections,
+        max_keepalive_connections=settings.http_client_max_keepalive_connections,
+        keepalive_expiry=settings.http_client_keepalive_expiry,
+    )
+    return httpx.AsyncClient(limits=limits, http2=HTTP2_AVAILABLE, **kwargs)
+
+
+class KeyedClientPool(Generic[ClientType]):
+    """Per-event-loop cache of one client per API key."""
+
+    def __init__(self, factory: Callable[[str], ClientType]):
+        """
+        Args:
+            factory: Builds a client for an API key
+        """
+        self.factory = factory
+        # event loop -> {api_key: client}
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        _pools.add(self)
+
+    def get(self, api_key: str) -> ClientType:
+        """Get the client for api_key on the running event loop, creating it once."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._clients.setdefault(loop, {})
+            client = loop_clients.get(api_key)
+            if client is None:
+                client = self.factory(api_key)
+                loop_clients[api_key] = client
+            return client
+
+    async def aclose_all(self) -> None:
+        """Close and forget every client created on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._clients.pop(loop, {})
+
+        for client in loop_clients.values():
+            # httpx clients expose aclose(); SDK clients such as AsyncOpenAI close()
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled HTTP client: {e}")
+
+
+async def close_client_pools() -> None:
+    """Close the pooled clients of every KeyedClientPool on the running loop."""
+    for pool in list(_pools):
+        await pool.aclose_all()
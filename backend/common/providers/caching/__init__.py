@@ -1,17 +1,29 @@
 from .interface import CacheInterface
-from .decorators import cache, cache_invalidate, cache_key_for_method
+from .decorators import (
+    cache,
+    cache_invalidate,
+    cache_key_for_method,
+    invalidate_cache_namespace,
+)
 from .factory import get_cache_provider
 from .redis_cache import RedisCache
 from .memory_cache import MemoryCache
 from .passthrough_cache import PassthroughCache
+from .content_cache import ContentCache
+from .local_cache import LocalCache, SingleFlight, get_local_cache
 
 __all__ = [
     "CacheInterface",
     "cache",
     "cache_invalidate",
     "cache_key_for_method",
+    "invalidate_cache_namespace",
     "get_cache_provider",
     "RedisCache",
     "MemoryCache",
     "PassthroughCache",
+    "ContentCache",
+    "LocalCache",
+    "SingleFlight",
+    "get_local_cache",
 ]
@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+from opentelemetry import trace
+
+from common.core.otel_axiom_exporter import get_logger
+from .interface import CacheInterface
+
+logger = get_logger(__name__)
+
+
+class ContentCache:
+    """
+    Two-tier cache for immutable text content addressed by a storage key.
+
+    L1 is a bounded in-process LRU (by total bytes). L2 is an optional shared
+    CacheInterface (e.g. Redis) so content loaded by one process is reused by
+    others. Content must be immutable for a given key - entries are never
+    invalidated, only evicted. Shared entries are looked up by exact key only,
+    so they're written without a pattern index entry and left to expire by TTL.
+
+    All operations are best effort: cache failures never fail the caller.
+    Hit/miss/eviction counters are kept per instance (see stats()).
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_bytes: int,
+        shared_cache: Optional[CacheInterface] = None,
+        shared_ttl: Optional[int] = None,
+    ):
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.shared_cache = shared_cache
+        self.shared_ttl = shared_ttl
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    @staticmethod
+    def _sizeof(content: str) -> int:
+        return len(content.encode("utf-8"))
+
+    def _get_local(self, key: str) -> Optional[str]:
+        content = self._entries.get(key)
+        if content is not None:
+            self._entries.move_to_end(key)
+        return content
+
+    def _set_local(self, key: str, content: str) -> None:
+        size = self._sizeof(content)
+        if size > self.max_bytes:
+            # Never let a single oversized entry flush the whole cache
+            return
+
+        existing = self._entries.pop(key, None)
+        if existing is not None:
+            self._current_bytes -= self._sizeof(existing)
+
+        self._entries[key] = content
+        self._current_bytes += size
+
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._current_bytes -= self._sizeof(evicted)
+            self.evictions += 1
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get content from L1, falling back to the shared tier."""
+        content = self._get_local(key)
+        if content is not None:
+            return content
+
+        if self.shared_cache is None:
+            return None
+
+        try:
+            content = await self.shared_cache.get(self._shared_key(key))
+        except Exception as e:
+            logger.warning(f"Shared content cache get failed for {key}: {e}")
+            return None
+
+        if isinstance(content, str):
+            self._set_local(key, content)
+            return content
+        return None
+
+    async def set(self, key: str, content: str) -> None:
+        """Store content in L1 and the shared tier."""
+        self._set_local(key, content)
+
+        if self.shared_cache is None:
+            return
+
+        try:
+            await self.shared_cache.set(
+                self._shared_key(key), content, self.shared_ttl, indexed=False
+            )
+        except Exception as e:
+            logger.warning(f"Shared content cache set failed for {key}: {e}")
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Optional[str]]]
+    ) -> Optional[str]:
+        """
+        Get content from cache, calling loader on a miss.
+
+        Empty or missing content from the loader is returned but not cached,
+        so a transient storage miss doesn't get pinned.
+        """
+        content = await self.get(key)
+        self._record_lookup(content is not None)
+        if content is not None:
+            return content
+
+        content = await loader()
+        if content:
+            await self.set(key, content)
+        return content
+
+    def _record_lookup(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        trace.get_current_span().set_attribute(f"{self.namespace}.cache_hit", hit)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current L1 usage."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._current_bytes,
+        }
+
+    def clear(self) -> None:
+        """Drop all L1 entries (the shared tier is left untouched)."""
+        self._entries.clear()
+        self._current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
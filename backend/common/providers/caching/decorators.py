@@ -1,11 +1,13 @@
 import functools
 import hashlib
+import inspect
 import json
 from typing import Callable, Optional, List, Type
 from pydantic import BaseModel
 
 from common.core.otel_axiom_exporter import get_logger
 from .factory import get_cache_provider
+from .local_cache import SingleFlight, get_local_cache
 
 logger = get_logger(__name__)
 
@@ -47,34 +49,80 @@ def _generate_cache_key(
         return f"{func.__name__}:fallback"
 
 
-def cache(model_type: Type, ttl: int = 3600, key_generator: Optional[Callable] = None):
+def _deserialize(model_type: Type, cached_value):
+    """Rebuild a cached value (Pydantic models are stored as dicts)."""
+    if issubclass(model_type, BaseModel):
+        if isinstance(cached_value, list):
+            return [model_type.model_validate(item) for item in cached_value]
+        return model_type.model_validate(cached_value)
+    return cached_value
+
+
+def _serialize(model_type: Type, result):
+    """Convert a result to a JSON-serializable cache value."""
+    if result is not None and issubclass(model_type, BaseModel):
+        if isinstance(result, list):
+            return [item.model_dump() for item in result]
+        return result.model_dump()
+    return result
+
+
+def _is_method(func: Callable) -> bool:
+    """Whether func takes self/cls first, i.e. is defined on a class."""
+    try:
+        parameters = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return False
+    return bool(parameters) and parameters[0] in ("self", "cls")
+
+
+_single_flight = SingleFlight()
+
+
+def cache(
+    model_type: Type,
+    ttl: int = 3600,
+    key_generator: Optional[Callable] = None,
+    local_ttl: Optional[int] = None,
+    namespace: Optional[Callable] = None,
+):
     """
     Cache decorator for async methods/functions.
 
+    Concurrent misses for the same key are collapsed so the function runs
+    once per key at a time (singleflight).
+
     Args:
         model_type: Pydantic model type for serialization/deserialization (REQUIRED)
         ttl: Time to live in seconds (default: 1 hour)
         key_generator: Optional custom key generator function
+        local_ttl: Optional TTL in seconds for the in-process L1 tier. L1 hits
+            return the already-validated object without touching Redis, so
+            callers must not mutate results, and other processes may serve a
+            stale value for up to local_ttl after an invalidation.
+        namespace: Optional function of the call arguments (like key_generator)
+            returning a namespace such as "matrix:42". Keys are scoped to the
+            namespace's generation, so invalidate_cache_namespace() drops all
+            of them at once without touching Redis keys.
     """
 
     def decorator(func: Callable):
+        is_method = _is_method(func)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             # Wrap everything in try-catch to ensure we NEVER fail due to caching
+            cache_key = None
+            # key_generator and namespace receive the call args without self/cls
+            call_args = args[1:] if is_method else args
             try:
                 cache_provider = get_cache_provider()
 
                 # Generate cache key with bulletproof fallback
-                cache_key = None
                 try:
                     if key_generator:
                         try:
-                            if args and hasattr(args[0], "__class__"):
-                                # Instance method - skip self and pass only actual function args
-                                cache_key = key_generator(*args[1:], **kwargs)
-                            else:
-                                # Function - pass all args
-                                cache_key = key_generator(*args, **kwargs)
+                            cache_key = key_generator(*call_args, **kwargs)
                         except Exception as e:
                             logger.warning(
                                 f"Custom key generator failed for {func.__name__}: {e}"
@@ -88,25 +136,37 @@ def cache(model_type: Type, ttl: int = 3600, key_generator: Optional[Callable] =
                     )
                     # Continue without cache key - will skip caching entirely
 
-                # Try to get from cache first (only if we have a valid key)
+                # Scope the key to the namespace's current generation
+                if cache_key and namespace:
+                    try:
+                        cache_namespace = namespace(*call_args, **kwargs)
+                        generation = await cache_provider.get_generation(
+                            cache_namespace
+                        )
+                        cache_key = f"{cache_namespace}@{generation}:{cache_key}"
+                    except Exception as e:
+                        logger.warning(
+                            f"Cache namespace lookup failed for {func.__name__}: {e}"
+                        )
+                        # Never serve a possibly invalidated generation
+                        cache_key = None
+
+                # Try L1, then the shared cache (only if we have a valid key)
                 if cache_key:
+                    if local_ttl:
+                        local_value = get_local_cache().get(cache_key)
+                        if local_value is not None:
+                            logger.debug(f"Local cache hit for key: {cache_key}")
+                            return local_value
+
                     try:
                         cached_value = await cache_provider.get(cache_key)
                         if cached_value is not None:
                             logger.debug(f"Cache hit for key: {cache_key}")
-                            # Check if it's a Pydantic model type or regular type
-                            if issubclass(model_type, BaseModel):
-                                # Pydantic model - reconstruct from dict
-                                if isinstance(cached_value, list):
-                                    return [
-                                        model_type.model_validate(item)
-                                        for item in cached_value
-                                    ]
-                                else:
-                                    return model_type.model_validate(cached_value)
-                            else:
-                                # Regular type - return as is
-                                return cached_value
+                            value = _deserialize(model_type, cached_value)
+                            if local_ttl:
+                                get_local_cache().set(cache_key, value, local_ttl)
+                            return value
                     except Exception as e:
                         logger.warning(f"Cache get failed for key {cache_key}: {e}")
                         # Continue to execute function
@@ -115,34 +175,34 @@ def cache(model_type: Type, ttl: int = 3600, key_generator: Optional[Callable] =
                 # If ANYTHING in the cache setup fails, log and continue
                 logger.warning(f"Cache decorator setup failed for {func.__name__}: {e}")
 
-            # Execute the original function (this should NEVER be wrapped in try-catch)
-            # Cache miss or cache failure - execute function
-            logger.debug(
-                f"Cache miss or cache error for {func.__name__} - executing function"
-            )
-            result = await func(*args, **kwargs)
+            if not cache_key:
+                return await func(*args, **kwargs)
 
-            # Try to store in cache (best effort, never fail)
-            if cache_key:
-                try:
-                    cache_value = result
-                    if result is not None and issubclass(model_type, BaseModel):
-                        # Convert Pydantic models to dict for serialization
-                        if isinstance(result, list):
-                            # List of Pydantic models
-                            cache_value = [item.model_dump() for item in result]
-                        else:
-                            # Single Pydantic model
-                            cache_value = result.model_dump()
+            async def load():
+                # Execute the original function (this should NEVER be wrapped in try-catch)
+                # Cache miss or cache failure - execute function
+                logger.debug(
+                    f"Cache miss or cache error for {func.__name__} - executing function"
+                )
+                result = await func(*args, **kwargs)
 
+                # Try to store in cache (best effort, never fail)
+                try:
                     cache_provider = get_cache_provider()
-                    await cache_provider.set(cache_key, cache_value, ttl)
+                    await cache_provider.set(
+                        cache_key, _serialize(model_type, result), ttl
+                    )
+                    if local_ttl and result is not None:
+                        get_local_cache().set(cache_key, result, local_ttl)
                     logger.debug(f"Cached result for key: {cache_key}")
                 except Exception as e:
                     logger.warning(f"Cache set failed for key {cache_key}: {e}")
                     # Continue regardless
 
-            return result
+                return result
+
+            # Only one coroutine per key recomputes a missing value
+            return await _single_flight.do(cache_key, load)
 
         return wrapper
 
@@ -192,6 +252,21 @@ def cache_invalidate(patterns: List[str]):
     return decorator
 
 
+async def invalidate_cache_namespace(namespace: str) -> None:
+    """
+    Invalidate every @cache entry scoped to a namespace in O(1).
+
+    Best effort: failures are logged, never raised.
+    """
+    try:
+        generation = await get_cache_provider().bump_generation(namespace)
+        logger.info(
+            f"Invalidated cache namespace {namespace} (generation {generation})"
+        )
+    except Exception as e:
+        logger.warning(f"Cache namespace invalidation failed for {namespace}: {e}")
+
+
 def cache_key_for_method(class_name: str, method_name: str, *args) -> str:
     """
     Helper function to generate cache keys for specific methods.
@@ -19,7 +19,9 @@ class CacheInterface(ABC):
         pass
 
     @abstractmethod
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, indexed: bool = True
+    ) -> bool:
         """
         Set a value in cache.
 
@@ -27,6 +29,8 @@ class CacheInterface(ABC):
             key: The cache key
             value: The value to cache
             ttl: Time to live in seconds
+            indexed: Whether get_keys / delete_pattern must find the key. Pass
+                False for high-cardinality keys that only expire by TTL
 
         Returns:
             True if set successfully, False otherwise
@@ -94,3 +98,38 @@ class CacheInterface(ABC):
             List of matching keys
         """
         pass
+
+    @abstractmethod
+    async def get_generation(self, namespace: str) -> int:
+        """
+        Get the current generation of a cache namespace.
+
+        Keys built with the generation (see the @cache namespace option) are
+        invalidated all at once by bumping it.
+
+        Args:
+            namespace: The namespace (e.g., "matrix:42")
+
+        Returns:
+            The current generation, 0 if never bumped
+
+        Raises:
+            Exception: If the generation cannot be read; callers must not
+                fall back to a default generation
+        """
+        pass
+
+    @abstractmethod
+    async def bump_generation(self, namespace: str) -> int:
+        """
+        Invalidate every key of a namespace without touching the keys.
+
+        Old-generation keys are no longer read and expire by their TTL.
+
+        Args:
+            namespace: The namespace to invalidate
+
+        Returns:
+            The new generation
+        """
+        pass
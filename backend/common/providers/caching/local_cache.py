@@ -0,0 +1,165 @@
+"""
+In-process L1 tier and singleflight for the @cache decorator.
+
+L1 keeps already-deserialized values (validated pydantic models) so a hit costs
+no Redis round-trip, JSON decode or model_validate. Entries use a short TTL
+with jitter so processes that warmed up together don't expire together, and
+the tier is bounded by entry count (LRU).
+
+Invalidations issued through the cache provider (delete / delete_pattern) also
+drop matching L1 entries in the same process; other processes converge within
+the L1 TTL, so only opt in where a few seconds of staleness is acceptable.
+"""
+
+import asyncio
+import fnmatch
+import math
+import random
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from common.core.config import settings
+
+
+class LocalCache:
+    """Bounded in-process LRU with per-entry TTL and jitter."""
+
+    def __init__(self, max_entries: int, ttl_jitter: float = 0.1):
+        """
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+            ttl_jitter: Fraction of the TTL randomly added or removed per entry
+        """
+        self.max_entries = max_entries
+        self.ttl_jitter = ttl_jitter
+        # key -> (expires_at monotonic, value)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store a value for about ttl seconds (± jitter), forever if ttl is None."""
+        if ttl is None:
+            expires_at = math.inf
+        elif ttl <= 0:
+            return
+        else:
+            jitter = ttl * self.ttl_jitter
+            expires_at = time.monotonic() + ttl + random.uniform(-jitter, jitter)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        """Drop a key. Returns True if it was present."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Drop all keys matching a glob pattern (e.g. "ai_model:*")."""
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatch(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the loader; callers arriving while it is in
+    flight await the same result (or exception). If the leader is cancelled,
+    waiting callers retry instead of being cancelled with it. Calls are tracked
+    per event loop, since futures cannot be awaited across loops.
+    """
+
+    def __init__(self):
+        # event loop -> {key: future}
+        self._calls: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        calls: Dict[str, asyncio.Future] = self._calls.setdefault(loop, {})
+
+        while (in_flight := calls.get(key)) is not None:
+            try:
+                # shield: a cancelled follower must not cancel the leader's call
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # Only the leader was cancelled; retry, possibly as the leader
+
+        future = loop.create_future()
+        calls[key] = future
+        try:
+            result = await loader()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a leader-only failure doesn't log a warning
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Number of keys currently being loaded on the running loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return 0
+        return len(self._calls.get(loop, {}))
+
+
+_local_cache: Optional[LocalCache] = None
+
+
+def get_local_cache() -> LocalCache:
+    """Get the process-wide L1 cache used by the @cache decorator."""
+    global _local_cache
+
+    if _local_cache is None:
+        _local_cache = LocalCache(
+            max_entries=settings.cache_local_max_entries,
+            ttl_jitter=settings.cache_local_ttl_jitter,
+        )
+
+    return _local_cache
+
+
+def get_local_cache_if_initialized() -> Optional[LocalCache]:
+    """Get the L1 cache without creating it (for invalidation paths)."""
+    return _local_cache
@@ -28,6 +28,7 @@ class MemoryCache(CacheInterface):
 
     def __init__(self):
         self._cache: Dict[str, CacheEntry] = {}
+        self._generations: Dict[str, int] = {}
         logger.info("Memory cache provider initialized")
 
     async def _cleanup_expired(self) -> None:
@@ -58,7 +59,9 @@ class MemoryCache(CacheInterface):
 
         return entry.value
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, indexed: bool = True
+    ) -> bool:
         """Set a value in cache."""
         try:
             expires_at = None
@@ -146,3 +149,12 @@ class MemoryCache(CacheInterface):
         except Exception as e:
             logger.error(f"Error getting cache keys for pattern {pattern}: {e}")
             return []
+
+    async def get_generation(self, namespace: str) -> int:
+        """Get the current generation of a cache namespace."""
+        return self._generations.get(namespace, 0)
+
+    async def bump_generation(self, namespace: str) -> int:
+        """Invalidate a namespace by incrementing its generation."""
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        return self._generations[namespace]
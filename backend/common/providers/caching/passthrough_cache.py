@@ -16,7 +16,9 @@ class PassthroughCache(CacheInterface):
         """Always return None (cache miss)."""
         return None
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, indexed: bool = True
+    ) -> bool:
         """Always return True but don't actually cache."""
         return True
 
@@ -39,3 +41,11 @@ class PassthroughCache(CacheInterface):
     async def get_keys(self, pattern: str) -> List[str]:
         """Always return empty list."""
         return []
+
+    async def get_generation(self, namespace: str) -> int:
+        """Always return 0."""
+        return 0
+
+    async def bump_generation(self, namespace: str) -> int:
+        """Always return 0 (nothing is cached)."""
+        return 0
@@ -1,9 +1,10 @@
 import json
-from typing import Any, Optional, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 import redis.asyncio as redis
 
 from common.core.config import settings
 from .interface import CacheInterface
+from .local_cache import get_local_cache_if_initialized
 from common.core.otel_axiom_exporter import (
     get_logger,
     trace_span,
@@ -24,6 +25,8 @@ class RedisCache(CacheInterface):
         self._client: Optional[redis.Redis] = None
         self._connected = False
         self._index_prefix = "cache_index:"
+        self._generation_prefix = "cache_generation:"
+        self._batch_size = settings.cache_invalidation_batch_size
 
     @trace_span
     async def connect(self) -> bool:
@@ -60,12 +63,6 @@ class RedisCache(CacheInterface):
             return  # Short circuit - already connected
         await self.connect()
 
-    def _get_index_key(self, pattern: str) -> str:
-        """Get the index key for a given pattern."""
-        # Convert pattern like "ai_model:*" to "ai_model" for indexing
-        base_pattern = pattern.rstrip("*").rstrip(":")
-        return f"{self._index_prefix}{base_pattern}"
-
     def _get_pattern_base(self, key: str) -> str:
         """Extract the base pattern from a cache key for indexing."""
         # For key "ai_model:get:123", return "ai_model"
@@ -110,7 +107,9 @@ class RedisCache(CacheInterface):
             return None
 
     @trace_span
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, indexed: bool = True
+    ) -> bool:
         """Set a value in cache."""
         await self._ensure_connected()
 
@@ -126,11 +125,12 @@ class RedisCache(CacheInterface):
                     success = await self._client.set(key, serialized_value)
 
                 if success:
-                    # Add to index for pattern matching
-                    with create_span_with_context("set_index"):
-                        await self._add_to_index(key)
-                        logger.debug(f"Cached key {key} with TTL {ttl}")
-                        return True
+                    if indexed:
+                        # Add to index for pattern matching
+                        with create_span_with_context("set_index"):
+                            await self._add_to_index(key)
+                    logger.debug(f"Cached key {key} with TTL {ttl}")
+                    return True
                 return False
 
             except Exception as e:
@@ -140,6 +140,11 @@ class RedisCache(CacheInterface):
     @trace_span
     async def delete(self, key: str) -> bool:
         """Delete a specific key from cache."""
+        # Keep the @cache L1 tier in this process consistent
+        local = get_local_cache_if_initialized()
+        if local is not None:
+            local.delete(key)
+
         await self._ensure_connected()
 
         try:
@@ -156,22 +161,33 @@ class RedisCache(CacheInterface):
 
     @trace_span
     async def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching a pattern using index-based approach."""
+        """
+        Delete all keys matching a pattern using index-based approach.
+
+        Matching keys are removed in pipelined UNLINK batches (memory is
+        reclaimed by Redis in the background) together with their index
+        entries, so large invalidations cost a handful of round-trips.
+        """
+        # Keep the @cache L1 tier in this process consistent
+        local = get_local_cache_if_initialized()
+        if local is not None:
+            local.delete_pattern(pattern)
+
         await self._ensure_connected()
 
         try:
-            # Get keys from index instead of using KEYS command
-            keys = await self.get_keys(pattern)
-
-            if not keys:
-                return 0
-
-            # Delete all matching keys
-            deleted_count = await self._client.delete(*keys)
-
-            # Remove from indices
-            for key in keys:
-                await self._remove_from_index(key)
+            if not self._is_pattern(pattern):
+                return 1 if await self.delete(pattern) else 0
+
+            deleted_count = 0
+            batch: List[str] = []
+            async for key in self._iter_pattern_keys(pattern):
+                batch.append(key)
+                if len(batch) >= self._batch_size:
+                    deleted_count += await self._unlink_batch(batch)
+                    batch = []
+            if batch:
+                deleted_count += await self._unlink_batch(batch)
 
             logger.info(
                 f"Deleted {deleted_count} cache keys matching pattern {pattern}"
@@ -182,9 +198,57 @@ class RedisCache(CacheInterface):
             logger.error(f"Error deleting cache pattern {pattern}: {e}")
             return 0
 
+    @staticmethod
+    def _is_pattern(pattern: str) -> bool:
+        return any(char in pattern for char in "*?[")
+
+    async def _iter_pattern_keys(self, pattern: str) -> AsyncIterator[str]:
+        """
+        Iterate over indexed keys matching a glob pattern.
+
+        Uses SSCAN over the index of the pattern's first segment; patterns
+        starting with a wildcard fall back to an incremental keyspace SCAN.
+        Either way Redis is never blocked by a single large command.
+        """
+        base_pattern = self._get_pattern_base(pattern)
+        if self._is_pattern(base_pattern):
+            async for key in self._client.scan_iter(
+                match=pattern, count=self._batch_size
+            ):
+                if not key.startswith((self._index_prefix, self._generation_prefix)):
+                    yield key
+            return
+
+        index_key = f"{self._index_prefix}{base_pattern}"
+        async for key in self._client.sscan_iter(
+            index_key, match=pattern, count=self._batch_size
+        ):
+            yield key
+
+    def _group_by_index(self, keys: List[str]) -> Dict[str, List[str]]:
+        keys_by_index: Dict[str, List[str]] = {}
+        for key in keys:
+            index_key = f"{self._index_prefix}{self._get_pattern_base(key)}"
+            keys_by_index.setdefault(index_key, []).append(key)
+        return keys_by_index
+
+    async def _unlink_batch(self, keys: List[str]) -> int:
+        """UNLINK a batch of keys and drop them from their indices in one round-trip."""
+        pipeline = self._client.pipeline(transaction=False)
+        pipeline.unlink(*keys)
+        for index_key, index_keys in self._group_by_index(keys).items():
+            pipeline.srem(index_key, *index_keys)
+        results = await pipeline.execute()
+        return results[0]
+
     @trace_span
     async def clear(self) -> bool:
         """Clear all cached data."""
+        # Keep the @cache L1 tier in this process consistent
+        local = get_local_cache_if_initialized()
+        if local is not None:
+            local.clear()
+
         await self._ensure_connected()
 
         try:
@@ -214,37 +278,60 @@ class RedisCache(CacheInterface):
         await self._ensure_connected()
 
         try:
-            # Convert pattern to index lookup
-            if pattern.endswith("*"):
-                # For patterns like "ai_model:*", get from index
-                base_pattern = pattern.rstrip("*").rstrip(":")
-                index_key = f"{self._index_prefix}{base_pattern}"
-                keys = await self._client.smembers(index_key)
-
-                # Filter keys that still exist (handle expired keys)
-                existing_keys = []
-                if keys:
-                    # Check which keys still exist
-                    pipeline = self._client.pipeline()
-                    for key in keys:
-                        pipeline.exists(key)
-                    results = await pipeline.execute()
-
-                    # Keep only existing keys and clean up index
-                    for key, exists in zip(keys, results):
-                        if exists:
-                            existing_keys.append(key)
-                        else:
-                            # Remove expired key from index
-                            await self._remove_from_index(key)
-
-                return existing_keys
-            else:
+            if not self._is_pattern(pattern):
                 # Exact key match
                 if await self.exists(pattern):
                     return [pattern]
                 return []
 
+            candidates = [key async for key in self._iter_pattern_keys(pattern)]
+
+            # Filter keys that still exist (handle expired keys)
+            existing_keys = []
+            for i in range(0, len(candidates), self._batch_size):
+                batch = candidates[i : i + self._batch_size]
+                pipeline = self._client.pipeline(transaction=False)
+                for key in batch:
+                    pipeline.exists(key)
+                results = await pipeline.execute()
+
+                expired_keys = []
+                for key, exists in zip(batch, results):
+                    if exists:
+                        existing_keys.append(key)
+                    else:
+                        expired_keys.append(key)
+
+                if expired_keys:
+                    # Clean up expired keys from the index
+                    pipeline = self._client.pipeline(transaction=False)
+                    for index_key, index_keys in self._group_by_index(
+                        expired_keys
+                    ).items():
+                        pipeline.srem(index_key, *index_keys)
+                    await pipeline.execute()
+
+            return existing_keys
+
         except Exception as e:
             logger.error(f"Error getting cache keys for pattern {pattern}: {e}")
             return []
+
+    @trace_span
+    async def get_generation(self, namespace: str) -> int:
+        """Get the current generation of a cache namespace.
+
+        Errors propagate: defaulting to generation 0 would serve entries from
+        before an invalidation, so callers must skip caching instead.
+        """
+        await self._ensure_connected()
+
+        value = await self._client.get(f"{self._generation_prefix}{namespace}")
+        return int(value) if value is not None else 0
+
+    @trace_span
+    async def bump_generation(self, namespace: str) -> int:
+        """Invalidate a namespace in O(1) by incrementing its generation."""
+        await self._ensure_connected()
+
+        return await self._client.incr(f"{self._generation_prefix}{namespace}")
@@ -2,5 +2,14 @@
 
 from common.providers.embeddings.factory import get_embedding_provider
 from common.providers.embeddings.interface import EmbeddingProviderInterface
+from common.providers.embeddings.cached_provider import (
+    CachedEmbeddingProvider,
+    EmbeddingCache,
+)
 
-__all__ = ["get_embedding_provider", "EmbeddingProviderInterface"]
+__all__ = [
+    "get_embedding_provider",
+    "EmbeddingProviderInterface",
+    "CachedEmbeddingProvider",
+    "EmbeddingCache",
+]
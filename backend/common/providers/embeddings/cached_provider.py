@@ -0,0 +1,235 @@
+"""Caching and batching wrapper for embedding providers."""
+
+import asyncio
+import hashlib
+from typing import Dict, List, Optional
+
+from common.core.config import settings
+from common.core.otel_axiom_exporter import trace_span, get_logger
+from common.providers.caching import CacheInterface, LocalCache, get_cache_provider
+from common.providers.embeddings.interface import EmbeddingProviderInterface
+
+logger = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache keyed by (model, sha256(text)).
+
+    L1 is a bounded in-process LocalCache (by entry count). L2 is an optional
+    shared CacheInterface (e.g. Redis) so embeddings survive restarts and are
+    shared across workers. Embeddings are deterministic for a given model and
+    text, so entries are never invalidated, only evicted; shared entries are
+    written unindexed and only expire by TTL.
+
+    All operations are best effort: cache failures never fail the caller.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        shared_cache: Optional[CacheInterface] = None,
+        shared_ttl: Optional[int] = None,
+    ):
+        self.max_entries = max_entries
+        self.shared_cache = shared_cache
+        self.shared_ttl = shared_ttl
+        self._local = LocalCache(max_entries)
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"embedding:{model_name}:{digest}"
+
+    async def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Get cached embeddings for keys, checking L1 then the shared tier."""
+        found: Dict[str, List[float]] = {}
+        missing = []
+        for key in keys:
+            embedding = self._local.get(key)
+            if embedding is not None:
+                found[key] = embedding
+            else:
+                missing.append(key)
+
+        if not missing or self.shared_cache is None:
+            return found
+
+        try:
+            shared_values = await asyncio.gather(
+                *(self.shared_cache.get(key) for key in missing)
+            )
+        except Exception as e:
+            logger.warning(f"Shared embedding cache get failed: {e}")
+            return found
+
+        for key, embedding in zip(missing, shared_values):
+            if isinstance(embedding, list):
+                self._local.set(key, embedding, ttl=None)
+                found[key] = embedding
+
+        return found
+
+    async def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings in L1 and the shared tier."""
+        for key, embedding in embeddings.items():
+            self._local.set(key, embedding, ttl=None)
+
+        if self.shared_cache is None or not embeddings:
+            return
+
+        try:
+            await asyncio.gather(
+                *(
+                    self.shared_cache.set(
+                        key, embedding, self.shared_ttl, indexed=False
+                    )
+                    for key, embedding in embeddings.items()
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Shared embedding cache set failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all L1 entries (the shared tier is left untouched)."""
+        self._local.clear()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+
+class CachedEmbeddingProvider(EmbeddingProviderInterface):
+    """
+    Embedding provider wrapper adding caching and bounded batching.
+
+    Cache misses are deduplicated, split into batches bounded by item count
+    and total characters, and sent to the wrapped provider concurrently with
+    per-batch retries.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProviderInterface,
+        cache: EmbeddingCache,
+        max_batch_texts: int = 128,
+        max_batch_chars: int = 200_000,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+    ):
+        self.provider = provider
+        self.cache = cache
+        self.max_batch_texts = max_batch_texts
+        self.max_batch_chars = max_batch_chars
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+
+    def _split_batches(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into batches bounded by count and total characters."""
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_chars = 0
+        for text in texts:
+            if current and (
+                len(current) >= self.max_batch_texts
+                or current_chars + len(text) > self.max_batch_chars
+            ):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(text)
+            current_chars += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _embed_batch(
+        self, batch: List[str], semaphore: asyncio.Semaphore
+    ) -> List[List[float]]:
+        """Embed one batch, retrying with exponential backoff."""
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return await self.provider.generate_embeddings(batch)
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        raise
+                    delay = self.retry_base_delay * (2**attempt)
+                    logger.warning(
+                        f"Embedding batch of {len(batch)} failed "
+                        f"(attempt {attempt + 1}), retrying in {delay}s: {e}"
+                    )
+                    await asyncio.sleep(delay)
+
+    @trace_span
+    async def generate_embedding(self, text: str) -> List[float]:
+        """Generate embedding for single text, served from cache when possible."""
+        embeddings = await self.generate_embeddings([text])
+        return embeddings[0]
+
+    @trace_span
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for multiple texts, embedding only cache misses."""
+        if not texts:
+            return []
+
+        model_name = self.provider.get_model_name()
+        keys = [EmbeddingCache.make_key(model_name, text) for text in texts]
+        embeddings_by_key = await self.cache.get_many(list(dict.fromkeys(keys)))
+
+        # Unique texts that still need embedding
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in embeddings_by_key:
+                missing.setdefault(key, text)
+
+        if missing:
+            missing_keys = list(missing)
+            batches = self._split_batches([missing[key] for key in missing_keys])
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            batch_results = await asyncio.gather(
+                *(self._embed_batch(batch, semaphore) for batch in batches)
+            )
+
+            new_embeddings = dict(
+                zip(
+                    missing_keys,
+                    (emb for result in batch_results for emb in result),
+                )
+            )
+            await self.cache.set_many(new_embeddings)
+            embeddings_by_key.update(new_embeddings)
+
+            logger.info(
+                f"Embedded {len(missing)} uncached texts of {len(texts)} "
+                f"in {len(batches)} batches"
+            )
+
+        return [embeddings_by_key[key] for key in keys]
+
+    def get_embedding_dimension(self) -> int:
+        """Get embedding dimension of the wrapped provider."""
+        return self.provider.get_embedding_dimension()
+
+    def get_model_name(self) -> str:
+        """Get the model name of the wrapped provider."""
+        return self.provider.get_model_name()
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the shared embedding cache instance."""
+    global _embedding_cache
+
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            max_entries=settings.embedding_cache_max_entries,
+            shared_cache=(
+                get_cache_provider() if settings.embedding_cache_redis_enabled else None
+            ),
+            shared_ttl=settings.embedding_cache_redis_ttl,
+        )
+
+    return _embedding_cache
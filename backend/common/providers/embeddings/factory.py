@@ -2,6 +2,10 @@
 
 from typing import Optional
 
+from common.providers.embeddings.cached_provider import (
+    CachedEmbeddingProvider,
+    get_embedding_cache,
+)
 from common.providers.embeddings.interface import EmbeddingProviderInterface
 from common.providers.embeddings.openai_provider import OpenAIEmbeddingProvider
 from common.providers.embeddings.voyage_provider import VoyageEmbeddingProvider
@@ -22,7 +26,8 @@ def get_embedding_provider(
         model_name: Specific model to use. If None, uses provider default.
 
     Returns:
-        An instance of the requested embedding provider.
+        An instance of the requested embedding provider, wrapped with the
+        shared embedding cache and batch splitting.
 
     Raises:
         ValueError: If provider type is unknown.
@@ -34,8 +39,17 @@ def get_embedding_provider(
 
     match provider_type:
         case EmbeddingProviderType.OPENAI:
-            return OpenAIEmbeddingProvider(model_name=model_name)
+            provider = OpenAIEmbeddingProvider(model_name=model_name)
         case EmbeddingProviderType.VOYAGE:
-            return VoyageEmbeddingProvider(model_name=model_name)
+            provider = VoyageEmbeddingProvider(model_name=model_name)
         case _:
             raise ValueError(f"Unknown embedding provider type: {provider_type}")
+
+    return CachedEmbeddingProvider(
+        provider,
+        cache=get_embedding_cache(),
+        max_batch_texts=settings.embedding_batch_max_texts,
+        max_batch_chars=settings.embedding_batch_max_chars,
+        max_concurrency=settings.embedding_max_concurrency,
+        max_retries=settings.embedding_max_retries,
+    )
@@ -8,6 +8,12 @@ from common.core.config import settings
 from common.core.otel_axiom_exporter import trace_span
 from common.providers.api_keys.rotation_provider import APIKeyRotationProvider
 from common.providers.api_keys.provider_enum import APIProviderType
+from common.providers.api_keys.client_pool import KeyedClientPool, create_http_client
+
+# Shared across provider instances so connections outlive a single call
+_client_pool: KeyedClientPool[AsyncOpenAI] = KeyedClientPool(
+    lambda api_key: AsyncOpenAI(api_key=api_key, http_client=create_http_client())
+)
 
 
 class OpenAIEmbeddingProvider(EmbeddingProviderInterface):
@@ -37,7 +43,7 @@ class OpenAIEmbeddingProvider(EmbeddingProviderInterface):
         """Generate embedding for single text."""
         api_key = self.rotator.get_next_key()
         try:
-            client = AsyncOpenAI(api_key=api_key)
+            client = _client_pool.get(api_key)
             response = await client.embeddings.create(input=text, model=self.model_name)
             self.rotator.report_success(api_key)
             return response.data[0].embedding
@@ -50,7 +56,7 @@ class OpenAIEmbeddingProvider(EmbeddingProviderInterface):
         """Generate embeddings for multiple texts."""
         api_key = self.rotator.get_next_key()
         try:
-            client = AsyncOpenAI(api_key=api_key)
+            client = _client_pool.get(api_key)
             response = await client.embeddings.create(
                 input=texts, model=self.model_name
             )
@@ -7,6 +7,21 @@ from common.providers.embeddings.interface import EmbeddingProviderInterface
 from common.core.config import settings
 from common.providers.api_keys.rotation_provider import APIKeyRotationProvider
 from common.providers.api_keys.provider_enum import APIProviderType
+from common.providers.api_keys.client_pool import KeyedClientPool, create_http_client
+
+VOYAGE_BASE_URL = "https://api.voyageai.com/v1"
+
+# Shared across provider instances so connections outlive a single call
+_client_pool: KeyedClientPool[httpx.AsyncClient] = KeyedClientPool(
+    lambda api_key: create_http_client(
+        base_url=VOYAGE_BASE_URL,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        timeout=30.0,
+    )
+)
 
 
 class VoyageEmbeddingProvider(EmbeddingProviderInterface):
@@ -28,7 +43,7 @@ class VoyageEmbeddingProvider(EmbeddingProviderInterface):
             keys=settings.voyage_api_keys, provider_type=APIProviderType.VOYAGE
         )
         self.model_name = model_name or "voyage-2"
-        self.base_url = "https://api.voyageai.com/v1"
+        self.base_url = VOYAGE_BASE_URL
 
         # Model dimension mapping
         self.dimensions = {
@@ -46,20 +61,15 @@ class VoyageEmbeddingProvider(EmbeddingProviderInterface):
         """Generate embeddings for multiple texts."""
         api_key = self.rotator.get_next_key()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/embeddings",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={"input": texts, "model": self.model_name},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-                self.rotator.report_success(api_key)
-                return [item["embedding"] for item in data["data"]]
+            client = _client_pool.get(api_key)
+            response = await client.post(
+                "/embeddings",
+                json={"input": texts, "model": self.model_name},
+            )
+            response.raise_for_status()
+            data = response.json()
+            self.rotator.report_success(api_key)
+            return [item["embedding"] for item in data["data"]]
         except Exception as e:
             self.rotator.report_failure(api_key)
             raise e
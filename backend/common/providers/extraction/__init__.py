@@ -0,0 +1,3 @@
+"""
+Process-pool extraction engine for CPU-bound document conversions.
+"""
@@ -0,0 +1,206 @@
+"""
+Bounded process pool for CPU-bound document conversions (MarkItDown).
+
+Conversions run in worker processes so a large spreadsheet or PDF doesn't
+block the event loop (and every other activity on the worker). Each worker
+runs one job at a time under an address-space limit and a SIGALRM time limit.
+Input is streamed from storage to a temp file and the worker reads that path,
+so file bytes are not held in the parent or pickled across processes.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+
+from opentelemetry import trace
+
+from common.core.config import settings
+from common.core.otel_axiom_exporter import get_logger, trace_span
+from common.providers.storage.interface import StorageInterface
+
+from .worker import ConversionError, ConversionResult, convert_file, init_worker
+
+logger = get_logger(__name__)
+
+
+class ExtractionEngine:
+    """Runs MarkItDown conversions on a bounded process pool."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        memory_limit_bytes: Optional[int],
+        timeout: float,
+    ):
+        """
+        Args:
+            max_workers: Worker processes (concurrent conversions)
+            memory_limit_bytes: Address-space limit per worker, None to disable
+            timeout: Seconds a single conversion may run
+        """
+        self.max_workers = max_workers
+        self.memory_limit_bytes = memory_limit_bytes
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self.pending = 0  # Submitted and not finished (queued + running)
+        self.completed = 0
+        self.failed = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process with live event loop / exporter
+                # threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_worker,
+                    initargs=(self.memory_limit_bytes,),
+                )
+            return self._executor
+
+    def _reset_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a pool whose worker died (e.g. killed by the OOM killer)."""
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        running = min(self.pending, self.max_workers)
+        return {
+            "max_workers": self.max_workers,
+            "running": running,
+            "queued": self.pending - running,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+    @trace_span
+    async def convert_file(
+        self,
+        path: str,
+        mimetype: str,
+        extension: str,
+        filename: Optional[str] = None,
+    ) -> ConversionResult:
+        """
+        Convert a local file in a worker process.
+
+        Raises:
+            ConversionError: If the conversion fails, times out or exceeds the
+                memory limit
+        """
+        executor = self._get_executor()
+
+        self.pending += 1
+        span = trace.get_current_span()
+        for name, value in self.stats().items():
+            span.set_attribute(f"extraction_engine.{name}", value)
+
+        try:
+            result = await asyncio.wrap_future(
+                executor.submit(
+                    convert_file, path, mimetype, extension, filename, self.timeout
+                )
+            )
+        except BrokenProcessPool:
+            self.failed += 1
+            self._reset_executor(executor)
+            raise ConversionError(
+                f"Extraction worker died converting {filename or path}"
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+
+        self.completed += 1
+        return result
+
+    @trace_span
+    async def convert_storage_object(
+        self,
+        storage: StorageInterface,
+        key: str,
+        mimetype: str,
+        extension: str,
+        filename: Optional[str] = None,
+    ) -> ConversionResult:
+        """
+        Stream a stored object to a temp file and convert it.
+
+        Raises:
+            ValueError: If the object doesn't exist
+            ConversionError: If the conversion fails
+        """
+        fd, path = tempfile.mkstemp(suffix=extension)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                await self.download_to_file(storage, key, temp_file)
+            return await self.convert_file(path, mimetype, extension, filename)
+        finally:
+            os.unlink(path)
+
+    @staticmethod
+    async def download_to_file(storage: StorageInterface, key: str, file) -> None:
+        """
+        Write a stored object to an open binary file using ranged reads.
+
+        Raises:
+            ValueError: If the object doesn't exist or a range read fails
+        """
+        size = await storage.get_size(key)
+        if size is None:
+            raise ValueError(f"Failed to download file from {key}")
+
+        chunk_size = settings.storage_multipart_chunk_size
+        offset = 0
+        while offset < size:
+            chunk = await storage.download_range(
+                key, offset, min(chunk_size, size - offset)
+            )
+            if not chunk:
+                # A partial file would be converted as if it were complete
+                raise ValueError(
+                    f"Failed to download bytes {offset}-{size - 1} of {key}"
+                )
+            await asyncio.to_thread(file.write, chunk)
+            offset += len(chunk)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_extraction_engine: Optional[ExtractionEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_extraction_engine() -> ExtractionEngine:
+    """Get the process-wide extraction engine."""
+    global _extraction_engine
+
+    if _extraction_engine is None:
+        with _engine_lock:
+            if _extraction_engine is None:
+                memory_limit_mb = settings.extraction_memory_limit_mb
+                _extraction_engine = ExtractionEngine(
+                    max_workers=settings.extraction_max_workers or os.cpu_count() or 1,
+                    memory_limit_bytes=(
+                        memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+                    ),
+                    timeout=settings.extraction_timeout,
+                )
+
+    return _extraction_engine
@@ -0,0 +1,86 @@
+"""
+Child-process side of the extraction engine.
+
+Kept free of app imports (settings, telemetry, DB) so spawned workers start
+quickly and don't open their own exporters or connection pools.
+"""
+
+import os
+import resource
+import signal
+from typing import NamedTuple, Optional
+
+from markitdown import MarkItDown
+from markitdown._stream_info import StreamInfo
+
+_markitdown: Optional[MarkItDown] = None
+
+
+class ConversionResult(NamedTuple):
+    """Picklable subset of a MarkItDown result."""
+
+    text_content: str
+    title: Optional[str]
+    file_size: int
+
+
+class ConversionError(Exception):
+    """Conversion failed in the worker (message only, always picklable)."""
+
+
+class ConversionTimeoutError(ConversionError):
+    """Conversion exceeded its time limit."""
+
+
+def init_worker(memory_limit_bytes: Optional[int]) -> None:
+    """Cap the worker's address space; each worker runs one job at a time."""
+    if memory_limit_bytes:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, hard))
+
+
+def _on_timeout(signum, frame):
+    raise ConversionTimeoutError("Conversion timed out")
+
+
+def convert_file(
+    path: str,
+    mimetype: str,
+    extension: str,
+    filename: Optional[str],
+    timeout: float,
+) -> ConversionResult:
+    """Convert a local file to markdown with MarkItDown."""
+    global _markitdown
+
+    if _markitdown is None:
+        _markitdown = MarkItDown(enable_plugins=True)
+
+    # Tasks run on the worker's main thread, so SIGALRM interrupts them
+    signal.signal(signal.SIGALRM, _on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with open(path, "rb") as file_stream:
+            result = _markitdown.convert_stream(
+                file_stream,
+                stream_info=StreamInfo(
+                    mimetype=mimetype, extension=extension, filename=filename
+                ),
+            )
+    except ConversionError:
+        raise
+    except MemoryError:
+        raise ConversionError("Conversion exceeded the memory limit")
+    except Exception as e:
+        raise ConversionError(f"{type(e).__name__}: {e}")
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    file_size = os.path.getsize(path)
+    if not result:
+        return ConversionResult(text_content="", title=None, file_size=file_size)
+    return ConversionResult(
+        text_content=result.text_content or "",
+        title=getattr(result, "title", None),
+        file_size=file_size,
+    )
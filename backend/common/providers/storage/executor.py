@@ -0,0 +1,43 @@
+"""
+Dedicated thread pool for blocking storage SDK calls.
+
+boto3 and google-cloud-storage are synchronous. Running their calls here keeps
+the event loop free, and the pool size caps how many storage requests a single
+process can have in flight (settings.storage_max_concurrency).
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from common.core.config import settings
+
+T = TypeVar("T")
+
+_storage_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    """Get the process-wide storage executor."""
+    global _storage_executor
+
+    if _storage_executor is None:
+        with _executor_lock:
+            if _storage_executor is None:
+                _storage_executor = ThreadPoolExecutor(
+                    max_workers=settings.storage_max_concurrency,
+                    thread_name_prefix="storage-io",
+                )
+
+    return _storage_executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking storage call on the storage executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_storage_executor(), functools.partial(func, *args, **kwargs)
+    )
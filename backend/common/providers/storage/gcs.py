@@ -1,28 +1,52 @@
-from typing import Optional, List, BinaryIO
+import asyncio
+import threading
+from typing import Optional, List, BinaryIO, Tuple
 from datetime import timedelta
 from google.cloud import storage
 from google.api_core.exceptions import NotFound
 import google.auth
 
 from common.core.config import settings
+from .executor import run_blocking
 from .interface import StorageInterface
 from common.core.otel_axiom_exporter import trace_span, get_logger
 
 logger = get_logger(__name__)
 
 
+_shared_client: Optional[Tuple[storage.Client, str]] = None
+_client_lock = threading.Lock()
+
+
+def _get_shared_client() -> Tuple[storage.Client, str]:
+    """
+    Get the process-wide GCS client and signing service account email.
+
+    Sharing the client reuses its authorized HTTP session (and connection
+    pool) across GCSStorage instances instead of re-authenticating each time.
+    """
+    global _shared_client
+
+    if _shared_client is None:
+        with _client_lock:
+            if _shared_client is None:
+                # Initialize GCS client with Workload Identity
+                client = storage.Client()
+
+                # Get service account email for IAM signing (Workload Identity compatible)
+                credentials, _ = google.auth.default()
+                _shared_client = (client, credentials.service_account_email)
+
+    return _shared_client
+
+
 class GCSStorage(StorageInterface):
     def __init__(self, bucket_name: Optional[str] = None):
         self.bucket_name = bucket_name or settings.s3_bucket_name
 
-        # Initialize GCS client with Workload Identity
-        self.client = storage.Client()
+        self.client, self.service_account_email = _get_shared_client()
         self.bucket = self.client.bucket(self.bucket_name)
 
-        # Get service account email for IAM signing (Workload Identity compatible)
-        credentials, _ = google.auth.default()
-        self.service_account_email = credentials.service_account_email
-
         logger.info(
             f"Initialized GCS storage with bucket: {self.bucket_name}, "
             f"service account: {self.service_account_email}"
@@ -33,14 +57,17 @@ class GCSStorage(StorageInterface):
         self, key: str, data: BinaryIO, metadata: Optional[dict] = None
     ) -> bool:
         try:
-            blob = self.bucket.blob(key)
+            # chunk_size turns large uploads into a resumable, chunked stream
+            blob = self.bucket.blob(
+                key, chunk_size=settings.storage_multipart_chunk_size
+            )
 
             # Set metadata if provided
             if metadata:
                 blob.metadata = metadata
 
             # Upload the data
-            blob.upload_from_file(data, rewind=True)
+            await run_blocking(blob.upload_from_file, data, rewind=True)
 
             logger.info(f"Successfully uploaded {key} to {self.bucket_name}")
             return True
@@ -52,7 +79,7 @@ class GCSStorage(StorageInterface):
     async def download(self, key: str) -> Optional[bytes]:
         try:
             blob = self.bucket.blob(key)
-            return blob.download_as_bytes()
+            return await run_blocking(blob.download_as_bytes)
         except NotFound:
             logger.warning(f"Object {key} not found")
             return None
@@ -60,11 +87,40 @@ class GCSStorage(StorageInterface):
             logger.error(f"Failed to download {key}: {e}")
             return None
 
+    @trace_span
+    async def download_range(
+        self, key: str, offset: int, length: int
+    ) -> Optional[bytes]:
+        try:
+            blob = self.bucket.blob(key)
+            # GCS ranges are inclusive of the end byte
+            return await run_blocking(
+                blob.download_as_bytes, start=offset, end=offset + length - 1
+            )
+        except NotFound:
+            logger.warning(f"Object {key} not found")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to download range of {key}: {e}")
+            return None
+
+    @trace_span
+    async def get_size(self, key: str) -> Optional[int]:
+        try:
+            blob = await run_blocking(self.bucket.get_blob, key)
+            if blob is None:
+                logger.warning(f"Object {key} not found")
+                return None
+            return blob.size
+        except Exception as e:
+            logger.error(f"Failed to get size of {key}: {e}")
+            return None
+
     @trace_span
     async def delete(self, key: str) -> bool:
         try:
             blob = self.bucket.blob(key)
-            blob.delete()
+            await run_blocking(blob.delete)
             logger.info(f"Successfully deleted {key}")
             return True
         except NotFound:
@@ -78,7 +134,7 @@ class GCSStorage(StorageInterface):
     async def exists(self, key: str) -> bool:
         try:
             blob = self.bucket.blob(key)
-            return blob.exists()
+            return await run_blocking(blob.exists)
         except Exception as e:
             logger.error(f"Failed to check if {key} exists: {e}")
             return False
@@ -86,8 +142,12 @@ class GCSStorage(StorageInterface):
     @trace_span
     async def list_objects(self, prefix: str = "", limit: int = 1000) -> List[str]:
         try:
-            blobs = self.client.list_blobs(
-                self.bucket_name, prefix=prefix, max_results=limit
+            blobs = await run_blocking(
+                lambda: list(
+                    self.client.list_blobs(
+                        self.bucket_name, prefix=prefix, max_results=limit
+                    )
+                )
             )
             return [blob.name for blob in blobs]
         except Exception as e:
@@ -101,7 +161,8 @@ class GCSStorage(StorageInterface):
         try:
             blob = self.bucket.blob(key)
             # Use IAM signing (Workload Identity compatible - no private key needed)
-            url = blob.generate_signed_url(
+            url = await run_blocking(
+                blob.generate_signed_url,
                 version="v4",
                 expiration=timedelta(seconds=expiration),
                 service_account_email=self.service_account_email,
@@ -118,7 +179,8 @@ class GCSStorage(StorageInterface):
         try:
             blob = self.bucket.blob(key)
             # Use IAM signing (Workload Identity compatible - no private key needed)
-            url = blob.generate_signed_url(
+            url = await run_blocking(
+                blob.generate_signed_url,
                 version="v4",
                 expiration=timedelta(seconds=expiration),
                 method="PUT",
@@ -146,20 +208,27 @@ class GCSStorage(StorageInterface):
         """
         try:
             # List all blobs with prefix
-            blobs = list(self.client.list_blobs(self.bucket_name, prefix=prefix))
+            blobs = await run_blocking(
+                lambda: list(self.client.list_blobs(self.bucket_name, prefix=prefix))
+            )
 
             if not blobs:
                 logger.info(f"No objects found with prefix {prefix}")
                 return 0
 
             # Delete all blobs
-            deleted_count = 0
-            for blob in blobs:
+            def _delete_blob(blob) -> bool:
                 try:
                     blob.delete()
-                    deleted_count += 1
+                    return True
                 except Exception as e:
                     logger.error(f"Failed to delete {blob.name}: {e}")
+                    return False
+
+            results = await asyncio.gather(
+                *(run_blocking(_delete_blob, blob) for blob in blobs)
+            )
+            deleted_count = sum(results)
 
             logger.info(f"Deleted {deleted_count} objects with prefix {prefix}")
             return deleted_count
@@ -13,6 +13,33 @@ class StorageInterface(ABC):
     async def download(self, key: str) -> Optional[bytes]:
         pass
 
+    @abstractmethod
+    async def download_range(
+        self, key: str, offset: int, length: int
+    ) -> Optional[bytes]:
+        """
+        Download a byte range of an object.
+
+        Args:
+            key: The storage key
+            offset: First byte to read
+            length: Number of bytes to read
+
+        Returns:
+            The requested bytes, or None if the object doesn't exist
+        """
+        pass
+
+    @abstractmethod
+    async def get_size(self, key: str) -> Optional[int]:
+        """
+        Get the size of an object in bytes.
+
+        Returns:
+            The object size, or None if the object doesn't exist
+        """
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         pass
@@ -87,6 +87,28 @@ def get_document_chunk_manifest_path(company_id: int, document_id: int) -> str:
     return f"{get_document_chunks_prefix(company_id, document_id)}/manifest.json"
 
 
+def get_document_chunk_pack_path(
+    company_id: int, document_id: int, pack_id: str
+) -> str:
+    """
+    Get S3 path for a packed chunk set (all chunk contents in one object).
+
+    Each chunk set gets its own pack, so re-chunking never overwrites bytes
+    that existing chunk rows (and cached byte ranges) still point into.
+
+    Pattern: company/{company_id}/documents/{document_id}/chunks/{pack_id}.pack
+
+    Args:
+        company_id: Company ID
+        document_id: Document ID
+        pack_id: Unique ID of the chunk set's pack
+
+    Returns:
+        S3 path for the packed chunk content blob
+    """
+    return f"{get_document_chunks_prefix(company_id, document_id)}/{pack_id}.pack"
+
+
 def get_workflow_base_path(company_id: int, workflow_id: int) -> str:
     """
     Get base S3 path for a workflow and all its executions.
@@ -122,3 +144,19 @@ def get_workflow_execution_path(
     return (
         f"{get_workflow_base_path(company_id, workflow_id)}/executions/{execution_id}"
     )
+
+
+def get_temporal_payload_prefix(workflow_id: str, run_id: str) -> str:
+    """
+    Get S3 prefix for activity payloads offloaded during one workflow run.
+
+    Pattern: temporal/payloads/{workflow_id}/{run_id}/
+
+    Args:
+        workflow_id: Temporal workflow ID
+        run_id: Temporal workflow run ID
+
+    Returns:
+        S3 prefix for the run's offloaded payloads
+    """
+    return f"temporal/payloads/{workflow_id}/{run_id}"
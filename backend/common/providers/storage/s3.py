@@ -1,33 +1,78 @@
-from typing import Optional, List, BinaryIO
+import threading
+from typing import Any, Dict, Optional, List, BinaryIO, Set, Tuple
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from common.core.config import settings
+from .executor import run_blocking
 from .interface import StorageInterface
 from common.core.otel_axiom_exporter import trace_span, get_logger
 
 logger = get_logger(__name__)
 
 
+_clients: Dict[Tuple[Optional[str], str, str], Any] = {}
+_ensured_buckets: Set[str] = set()
+_clients_lock = threading.Lock()
+
+
+def _get_shared_client() -> Any:
+    """
+    Get the process-wide boto3 client for the configured endpoint.
+
+    boto3 clients are thread-safe; sharing one keeps its urllib3 connection
+    pool warm across S3Storage instances instead of reconnecting per request.
+    """
+    client_key = (
+        settings.s3_endpoint_url,
+        settings.aws_region,
+        settings.aws_access_key_id,
+    )
+    client = _clients.get(client_key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(client_key)
+        if client is None:
+            client_config = {
+                "service_name": "s3",
+                "aws_access_key_id": settings.aws_access_key_id,
+                "aws_secret_access_key": settings.aws_secret_access_key,
+                "region_name": settings.aws_region,
+            }
+
+            config_kwargs = {"max_pool_connections": settings.storage_max_concurrency}
+            if settings.s3_endpoint_url:
+                client_config["endpoint_url"] = settings.s3_endpoint_url
+                config_kwargs["s3"] = {"addressing_style": "path"}
+            client_config["config"] = Config(**config_kwargs)
+
+            client = boto3.client(**client_config)
+            _clients[client_key] = client
+
+    return client
+
+
 class S3Storage(StorageInterface):
     def __init__(self, bucket_name: Optional[str] = None):
         self.bucket_name = bucket_name or settings.s3_bucket_name
+        self.client = _get_shared_client()
 
-        client_config = {
-            "service_name": "s3",
-            "aws_access_key_id": settings.aws_access_key_id,
-            "aws_secret_access_key": settings.aws_secret_access_key,
-            "region_name": settings.aws_region,
-        }
-
-        if settings.s3_endpoint_url:
-            client_config["endpoint_url"] = settings.s3_endpoint_url
-            client_config["config"] = boto3.session.Config(
-                s3={"addressing_style": "path"}
-            )
+        # Large uploads are sent as multipart parts on the transfer manager's
+        # own threads; small ones stay a single request. Downloads bypass it,
+        # since it adds a HeadObject and a thread pool to every read.
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.storage_multipart_chunk_size,
+            multipart_chunksize=settings.storage_multipart_chunk_size,
+            max_concurrency=min(10, settings.storage_max_concurrency),
+        )
 
-        self.client = boto3.client(**client_config)
-        self._ensure_bucket_exists()
+        if self.bucket_name not in _ensured_buckets:
+            self._ensure_bucket_exists()
+            _ensured_buckets.add(self.bucket_name)
 
     def _ensure_bucket_exists(self):
         try:
@@ -52,6 +97,25 @@ class S3Storage(StorageInterface):
                 except Exception as create_error:
                     logger.error(f"Failed to create bucket: {create_error}")
 
+    def _download_sync(self, key: str) -> bytes:
+        response = self.client.get_object(Bucket=self.bucket_name, Key=key)
+        return response["Body"].read()
+
+    def _list_objects_sync(self, prefix: str, limit: int) -> List[str]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={"MaxItems": limit},
+        )
+
+        keys = []
+        for page in pages:
+            if "Contents" in page:
+                keys.extend([obj["Key"] for obj in page["Contents"]])
+
+        return keys
+
     @trace_span
     async def upload(
         self, key: str, data: BinaryIO, metadata: Optional[dict] = None
@@ -61,8 +125,13 @@ class S3Storage(StorageInterface):
             if metadata:
                 extra_args["Metadata"] = metadata
 
-            self.client.upload_fileobj(
-                data, self.bucket_name, key, ExtraArgs=extra_args
+            await run_blocking(
+                self.client.upload_fileobj,
+                data,
+                self.bucket_name,
+                key,
+                ExtraArgs=extra_args,
+                Config=self.transfer_config,
             )
             logger.info(f"Successfully uploaded {key} to {self.bucket_name}")
             return True
@@ -73,19 +142,53 @@ class S3Storage(StorageInterface):
     @trace_span
     async def download(self, key: str) -> Optional[bytes]:
         try:
-            response = self.client.get_object(Bucket=self.bucket_name, Key=key)
-            return response["Body"].read()
+            return await run_blocking(self._download_sync, key)
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
                 logger.warning(f"Object {key} not found")
             else:
                 logger.error(f"Failed to download {key}: {e}")
             return None
 
+    @trace_span
+    async def download_range(
+        self, key: str, offset: int, length: int
+    ) -> Optional[bytes]:
+        try:
+            response = await run_blocking(
+                self.client.get_object,
+                Bucket=self.bucket_name,
+                Key=key,
+                Range=f"bytes={offset}-{offset + length - 1}",
+            )
+            return await run_blocking(response["Body"].read)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                logger.warning(f"Object {key} not found")
+            else:
+                logger.error(f"Failed to download range of {key}: {e}")
+            return None
+
+    @trace_span
+    async def get_size(self, key: str) -> Optional[int]:
+        try:
+            response = await run_blocking(
+                self.client.head_object, Bucket=self.bucket_name, Key=key
+            )
+            return response["ContentLength"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                logger.warning(f"Object {key} not found")
+            else:
+                logger.error(f"Failed to get size of {key}: {e}")
+            return None
+
     @trace_span
     async def delete(self, key: str) -> bool:
         try:
-            self.client.delete_object(Bucket=self.bucket_name, Key=key)
+            await run_blocking(
+                self.client.delete_object, Bucket=self.bucket_name, Key=key
+            )
             logger.info(f"Successfully deleted {key}")
             return True
         except Exception as e:
@@ -95,7 +198,9 @@ class S3Storage(StorageInterface):
     @trace_span
     async def exists(self, key: str) -> bool:
         try:
-            self.client.head_object(Bucket=self.bucket_name, Key=key)
+            await run_blocking(
+                self.client.head_object, Bucket=self.bucket_name, Key=key
+            )
             return True
         except ClientError:
             return False
@@ -103,19 +208,7 @@ class S3Storage(StorageInterface):
     @trace_span
     async def list_objects(self, prefix: str = "", limit: int = 1000) -> List[str]:
         try:
-            paginator = self.client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                PaginationConfig={"MaxItems": limit},
-            )
-
-            keys = []
-            for page in pages:
-                if "Contents" in page:
-                    keys.extend([obj["Key"] for obj in page["Contents"]])
-
-            return keys
+            return await run_blocking(self._list_objects_sync, prefix, limit)
         except Exception as e:
             logger.error(f"Failed to list objects: {e}")
             return []
@@ -179,8 +272,10 @@ class S3Storage(StorageInterface):
                 batch = objects_to_delete[i : i + 1000]
                 delete_dict = {"Objects": [{"Key": key} for key in batch]}
 
-                response = self.client.delete_objects(
-                    Bucket=self.bucket_name, Delete=delete_dict
+                response = await run_blocking(
+                    self.client.delete_objects,
+                    Bucket=self.bucket_name,
+                    Delete=delete_dict,
                 )
 
                 deleted_count += len(response.get("Deleted", []))
@@ -9,6 +9,7 @@ import sys
 from typing import Optional, Any, Callable
 
 from common.core.otel_axiom_exporter import _initialize_telemetry, get_logger
+from common.providers.api_keys.client_pool import close_client_pools
 
 
 class WorkerLauncher:
@@ -57,6 +58,7 @@ class WorkerLauncher:
             try:
                 self.logger.info("Performing worker cleanup...")
                 await worker_instance.stop()
+                await close_client_pools()
                 self.logger.info("Worker shutdown complete")
             except Exception as cleanup_error:
                 self.logger.error(f"Error during cleanup: {cleanup_error}")
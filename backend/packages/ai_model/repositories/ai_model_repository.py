@@ -15,7 +15,7 @@ class AIModelRepository(BaseRepository[AIModelEntity, AIModelModel]):
         super().__init__(AIModelEntity, AIModelModel)
 
     @trace_span
-    @cache(AIModelModel, ttl=3600)  # 1 hour cache
+    @cache(AIModelModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get(self, model_id: int) -> Optional[AIModelModel]:
         """Override base get to include provider information."""
         async with self._get_session() as session:
@@ -47,7 +47,7 @@ class AIModelRepository(BaseRepository[AIModelEntity, AIModelModel]):
             return model
 
     @trace_span
-    @cache(AIModelModel, ttl=3600)  # 1 hour cache
+    @cache(AIModelModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_multi(self, skip: int = 0, limit: int = 100) -> List[AIModelModel]:
         """Override base get_multi to include provider information."""
         async with self._get_session() as session:
@@ -78,7 +78,7 @@ class AIModelRepository(BaseRepository[AIModelEntity, AIModelModel]):
             return models
 
     @trace_span
-    @cache(AIModelModel, ttl=3600)  # 1 hour cache
+    @cache(AIModelModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_by_provider_id(self, provider_id: int) -> List[AIModelModel]:
         """Get all AI models for a specific provider."""
         async with self._get_session() as session:
@@ -103,7 +103,7 @@ class AIModelRepository(BaseRepository[AIModelEntity, AIModelModel]):
             return models
 
     @trace_span
-    @cache(AIModelModel, ttl=3600)  # 1 hour cache
+    @cache(AIModelModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_enabled_by_provider_id(self, provider_id: int) -> List[AIModelModel]:
         """Get all enabled AI models for a specific provider."""
         async with self._get_session() as session:
@@ -131,7 +131,7 @@ class AIModelRepository(BaseRepository[AIModelEntity, AIModelModel]):
             return models
 
     @trace_span
-    @cache(AIModelModel, ttl=3600)  # 1 hour cache
+    @cache(AIModelModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_enabled(self) -> List[AIModelModel]:
         """Get all enabled AI models."""
         async with self._get_session() as session:
@@ -156,7 +156,7 @@ class AIModelRepository(BaseRepository[AIModelEntity, AIModelModel]):
             return models
 
     @trace_span
-    @cache(AIModelModel, ttl=3600)  # 1 hour cache
+    @cache(AIModelModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_by_model_name_and_provider(
         self, model_name: str, provider_id: int
     ) -> Optional[AIModelModel]:
@@ -206,7 +206,7 @@ class AIModelRepository(BaseRepository[AIModelEntity, AIModelModel]):
             return result.scalar() is not None
 
     @trace_span
-    @cache(AIModelModel, ttl=3600)  # 1 hour cache
+    @cache(AIModelModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_with_provider(self, model_id: int) -> Optional[AIModelModel]:
         """Get AI model with provider information using JOIN.
 
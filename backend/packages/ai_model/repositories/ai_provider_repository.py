@@ -13,7 +13,7 @@ class AIProviderRepository(BaseRepository[AIProviderEntity, AIProviderModel]):
         super().__init__(AIProviderEntity, AIProviderModel)
 
     @trace_span
-    @cache(AIProviderModel, ttl=3600)  # 1 hour cache
+    @cache(AIProviderModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_by_name(self, name: str) -> Optional[AIProviderModel]:
         """Get AI provider by name."""
         async with self._get_session() as session:
@@ -23,7 +23,7 @@ class AIProviderRepository(BaseRepository[AIProviderEntity, AIProviderModel]):
             return self._entity_to_domain(entity) if entity else None
 
     @trace_span
-    @cache(AIProviderModel, ttl=3600)  # 1 hour cache
+    @cache(AIProviderModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_enabled(self) -> List[AIProviderModel]:
         """Get all enabled AI providers."""
         async with self._get_session() as session:
@@ -0,0 +1,11 @@
+"""Cache key generators for auth package."""
+
+
+def principal_by_api_key_key(api_key_hash: str) -> str:
+    """Generate cache key for the principal authenticated by an API key hash."""
+    return f"principal:api_key:{api_key_hash}"
+
+
+def principal_by_sso_key(sso_provider: str, sso_user_id: str) -> str:
+    """Generate cache key for the principal authenticated by an SSO subject."""
+    return f"principal:sso:{sso_provider}:{sso_user_id}"
@@ -0,0 +1,132 @@
+"""
+Process-wide cache of authenticated principals.
+
+Every authenticated request resolves an API key hash or SSO subject to an
+AuthenticatedUser. This keeps the result in a short-lived in-process
+LocalCache and, optionally, in Redis so the service account / user lookup only
+runs on a miss.
+
+Revoking or deleting a service account or user invalidates its entry locally
+and in the shared tier. Other processes drop their L1 copy within about
+settings.auth_principal_cache_local_ttl (± jitter), so keep that TTL short.
+"""
+
+from typing import Dict, Optional
+
+from opentelemetry import trace
+
+from common.core.config import settings
+from common.core.otel_axiom_exporter import get_logger
+from common.providers.caching import CacheInterface, LocalCache, get_cache_provider
+from packages.auth.models.domain.authenticated_user import AuthenticatedUser
+
+logger = get_logger(__name__)
+
+
+class PrincipalCache:
+    """
+    Two-tier cache of AuthenticatedUser by principal key.
+
+    L1 is a LocalCache (bounded LRU with a jittered per-entry TTL). L2 is an
+    optional shared CacheInterface. Only successful authentications are cached.
+
+    All operations are best effort: cache failures never fail the caller.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        local_ttl: float,
+        shared_cache: Optional[CacheInterface] = None,
+        shared_ttl: Optional[int] = None,
+    ):
+        self.local_ttl = local_ttl
+        self.shared_cache = shared_cache
+        self.shared_ttl = shared_ttl
+        self._local = LocalCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[AuthenticatedUser]:
+        """Get a principal from L1, falling back to the shared tier."""
+        principal = self._local.get(key)
+
+        if principal is None and self.shared_cache is not None:
+            try:
+                cached = await self.shared_cache.get(key)
+                if cached is not None:
+                    principal = AuthenticatedUser.model_validate(cached)
+                    self._local.set(key, principal, self.local_ttl)
+            except Exception as e:
+                logger.warning(f"Shared principal cache get failed: {e}")
+
+        self._record_lookup(principal is not None)
+        return principal
+
+    async def set(self, key: str, principal: AuthenticatedUser) -> None:
+        """Store a principal in L1 and the shared tier."""
+        self._local.set(key, principal, self.local_ttl)
+
+        if self.shared_cache is None:
+            return
+
+        try:
+            await self.shared_cache.set(key, principal.model_dump(), self.shared_ttl)
+        except Exception as e:
+            logger.warning(f"Shared principal cache set failed: {e}")
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a principal from L1 and the shared tier."""
+        self._local.delete(key)
+
+        if self.shared_cache is None:
+            return
+
+        try:
+            await self.shared_cache.delete(key)
+        except Exception as e:
+            logger.warning(f"Shared principal cache delete failed: {e}")
+
+    def _record_lookup(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        trace.get_current_span().set_attribute("principal_cache.cache_hit", hit)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current L1 size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._local),
+        }
+
+    def clear(self) -> None:
+        """Drop all L1 entries (the shared tier is left untouched)."""
+        self._local.clear()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the shared principal cache instance."""
+    global _principal_cache
+
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            max_entries=settings.auth_principal_cache_max_entries,
+            local_ttl=settings.auth_principal_cache_local_ttl,
+            shared_cache=(
+                get_cache_provider()
+                if settings.auth_principal_cache_redis_enabled
+                else None
+            ),
+            shared_ttl=settings.auth_principal_cache_redis_ttl,
+        )
+
+    return _principal_cache
@@ -13,6 +13,8 @@ from packages.auth.models.domain.service_account import (
     ServiceAccountWithApiKey,
 )
 from packages.auth.models.domain.authenticated_user import AuthenticatedUser
+from packages.auth.cache_keys import principal_by_api_key_key
+from packages.auth.services.principal_cache import get_principal_cache
 from common.core.otel_axiom_exporter import trace_span, get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +25,7 @@ class ServiceAccountService:
 
     def __init__(self):
         self.service_account_repo = ServiceAccountRepository()
+        self.principal_cache = get_principal_cache()
 
     @staticmethod
     def _generate_api_key() -> str:
@@ -94,6 +97,10 @@ class ServiceAccountService:
 
         account = await self.service_account_repo.update(account_id, account_update)
         if account:
+            # Deactivation must take effect for cached principals too
+            await self.principal_cache.invalidate(
+                principal_by_api_key_key(existing.api_key_hash)
+            )
             logger.info(f"Updated service account {account_id}")
         return account
 
@@ -112,6 +119,9 @@ class ServiceAccountService:
         success = await self.service_account_repo.soft_delete(account_id)
         logger.info(f"Delete success {success}")
         if success:
+            await self.principal_cache.invalidate(
+                principal_by_api_key_key(existing.api_key_hash)
+            )
             logger.info(f"Deleted service account {account_id}")
         return success
 
@@ -122,6 +132,11 @@ class ServiceAccountService:
             return None
 
         api_key_hash = self._hash_api_key(api_key)
+        cache_key = principal_by_api_key_key(api_key_hash)
+        cached = await self.principal_cache.get(cache_key)
+        if cached:
+            return cached
+
         account = await self.service_account_repo.get_by_api_key_hash(api_key_hash)
 
         if not account:
@@ -129,4 +144,6 @@ class ServiceAccountService:
 
         # Return authenticated user context with service account's company
         # user_id is the service account id
-        return AuthenticatedUser(user_id=account.id, company_id=account.company_id)
+        user = AuthenticatedUser(user_id=account.id, company_id=account.company_id)
+        await self.principal_cache.set(cache_key, user)
+        return user
@@ -13,6 +13,8 @@ from packages.companies.models.domain.company import (
     CompanyUpdateModel,
 )
 from packages.auth.models.domain.authenticated_user import AuthenticatedUser
+from packages.auth.cache_keys import principal_by_sso_key
+from packages.auth.services.principal_cache import get_principal_cache
 from common.core.otel_axiom_exporter import trace_span, get_logger
 from common.providers.bloom_filter.factory import get_bloom_filter_provider
 
@@ -28,6 +30,7 @@ class SSOAuthService:
         self.company_service = CompanyService()
         self.subscription_service = SubscriptionService()
         self.bloom_filter = get_bloom_filter_provider()
+        self.principal_cache = get_principal_cache()
 
         # Get singleton provider instance from factory
         self.sso_provider = get_sso_provider(provider)
@@ -50,6 +53,12 @@ class SSOAuthService:
         )
         provider_name = self.sso_provider.get_provider_name().value
 
+        # Token is verified above on every call; only the user lookup is cached
+        cache_key = principal_by_sso_key(provider_name, provider_user_id)
+        cached = await self.principal_cache.get(cache_key)
+        if cached:
+            return cached
+
         # Fast bloom filter check
         bloom_key = f"{provider_name}:{provider_user_id}"
         might_exist = await self.bloom_filter.exists("sso_users", bloom_key)
@@ -63,7 +72,9 @@ class SSOAuthService:
             # Existing user found, no need for external API calls
             # await self.user_service.update_last_login(user.id)
             logger.info("Found user")
-            return AuthenticatedUser(company_id=user.company_id, user_id=user.id)
+            principal = AuthenticatedUser(company_id=user.company_id, user_id=user.id)
+            await self.principal_cache.set(cache_key, principal)
+            return principal
 
         logger.info("Creating new user")
         # New user - need to fetch full profile info from SSO provider
@@ -78,7 +89,9 @@ class SSOAuthService:
         # Update last login and return
         # await self.user_service.update_last_login(user.id)
 
-        return AuthenticatedUser(company_id=user.company_id, user_id=user.id)
+        principal = AuthenticatedUser(company_id=user.company_id, user_id=user.id)
+        await self.principal_cache.set(cache_key, principal)
+        return principal
 
     @trace_span
     async def _create_new_user(self, sso_user_info) -> User:
@@ -1,9 +1,13 @@
 """Database models for billing."""
 
 from packages.billing.models.database.subscription import SubscriptionEntity
-from packages.billing.models.database.usage import UsageEventEntity
+from packages.billing.models.database.usage import (
+    UsageDailyCounterEntity,
+    UsageEventEntity,
+)
 
 __all__ = [
     "SubscriptionEntity",
     "UsageEventEntity",
+    "UsageDailyCounterEntity",
 ]
@@ -2,7 +2,17 @@
 Database entity for usage events.
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Index, JSON, Integer
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+)
 from sqlalchemy.sql import func
 
 from common.db.base import Base, BigIntegerType
@@ -59,3 +69,26 @@ class UsageEventEntity(Base):
         Index("idx_usage_company_type_date", "company_id", "event_type", "created_at"),
         Index("idx_usage_user_date", "user_id", "created_at"),
     )
+
+
+class UsageDailyCounterEntity(Base):
+    """
+    Per-company, per-event-type usage totals for one UTC day.
+
+    Maintained in the same transaction as usage event inserts so quota checks
+    can read a handful of counter rows instead of summing usage_events.
+    """
+
+    __tablename__ = "usage_daily_counters"
+
+    company_id = Column(
+        BigIntegerType,
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    event_type = Column(String(50), primary_key=True)
+    bucket_date = Column(Date, primary_key=True)  # UTC day of created_at
+
+    quantity = Column(BigInteger, nullable=False, server_default="0")
+    event_count = Column(BigInteger, nullable=False, server_default="0")
+    file_size_bytes = Column(BigInteger, nullable=False, server_default="0")
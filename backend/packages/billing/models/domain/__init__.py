@@ -16,6 +16,7 @@ from packages.billing.models.domain.usage import (
     UsageStats,
     QuotaCheck,
     UsageEvent,
+    UsageTotals,
 )
 
 __all__ = [
@@ -33,4 +34,5 @@ __all__ = [
     "UsageStats",
     "QuotaCheck",
     "UsageEvent",
+    "UsageTotals",
 ]
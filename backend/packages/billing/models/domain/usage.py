@@ -131,6 +131,14 @@ class UsageEventCreateModel(BaseModel):
     event_metadata: dict = {}
 
 
+class UsageTotals(BaseModel):
+    """Aggregated usage for one event type over a period."""
+
+    quantity: int = 0  # Sum of quantity (refunds are negative)
+    event_count: int = 0  # Number of events (e.g. documents uploaded)
+    file_size_bytes: int = 0  # Sum of file sizes (storage uploads)
+
+
 class QuotaReservationResult(BaseModel):
     """Result of an atomic quota check and reservation."""
 
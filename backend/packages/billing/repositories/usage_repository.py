@@ -2,17 +2,36 @@
 Repository for usage event tracking.
 """
 
-from typing import Optional
-from datetime import datetime
+from typing import Dict, Optional
+from datetime import date, datetime, time, timedelta, timezone
 from sqlalchemy import select, func, text, update
+from sqlalchemy.dialects import postgresql, sqlite
 
 from common.repositories.base import BaseRepository
-from packages.billing.models.database.usage import UsageEventEntity
-from packages.billing.models.domain.usage import UsageEvent
+from packages.billing.models.database.usage import (
+    UsageDailyCounterEntity,
+    UsageEventEntity,
+)
+from packages.billing.models.domain.usage import (
+    UsageEvent,
+    UsageEventCreateModel,
+    UsageTotals,
+)
 from packages.billing.models.domain.enums import UsageEventType
 from common.core.otel_axiom_exporter import trace_span
 
 
+def _utc(value: datetime) -> datetime:
+    """Normalize a timestamp to aware UTC (SQLite returns naive UTC)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
 class UsageEventRepository(BaseRepository[UsageEventEntity, UsageEvent]):
     """Repository for managing usage events."""
 
@@ -20,46 +39,141 @@ class UsageEventRepository(BaseRepository[UsageEventEntity, UsageEvent]):
         super().__init__(UsageEventEntity, UsageEvent)
 
     @trace_span
-    async def get_monthly_count(
-        self, company_id: int, event_type: UsageEventType, year: int, month: int
-    ) -> int:
-        """Get sum of quantity for a specific month."""
-        start_date = datetime(year, month, 1)
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1)
-        else:
-            end_date = datetime(year, month + 1, 1)
+    async def create(self, create_model: UsageEventCreateModel) -> UsageEvent:
+        """
+        Create a usage event and add it to its daily counter.
 
+        Both writes share one session, so the counter commits (or rolls back)
+        with the event.
+        """
+        data = create_model.model_dump(exclude_none=True)
+        db_obj = UsageEventEntity(**data)
         async with self._get_session() as session:
-            result = await session.execute(
-                select(func.coalesce(func.sum(UsageEventEntity.quantity), 0)).where(
-                    UsageEventEntity.company_id == company_id,
-                    UsageEventEntity.event_type == event_type.value,
-                    UsageEventEntity.created_at >= start_date,
-                    UsageEventEntity.created_at < end_date,
+            session.add(db_obj)
+            await session.flush()
+            await session.refresh(db_obj)
+
+            insert = (
+                postgresql.insert
+                if session.get_bind().dialect.name == "postgresql"
+                else sqlite.insert
+            )
+            stmt = insert(UsageDailyCounterEntity).values(
+                company_id=db_obj.company_id,
+                event_type=db_obj.event_type,
+                bucket_date=_utc(db_obj.created_at).date(),
+                quantity=db_obj.quantity,
+                event_count=1,
+                file_size_bytes=db_obj.file_size_bytes or 0,
+            )
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["company_id", "event_type", "bucket_date"],
+                    set_={
+                        "quantity": UsageDailyCounterEntity.quantity
+                        + stmt.excluded.quantity,
+                        "event_count": UsageDailyCounterEntity.event_count + 1,
+                        "file_size_bytes": UsageDailyCounterEntity.file_size_bytes
+                        + stmt.excluded.file_size_bytes,
+                    },
                 )
             )
-            return result.scalar_one() or 0
+            return self._entity_to_domain(db_obj)
 
     @trace_span
-    async def get_period_count(
+    async def get_period_totals(
         self,
         company_id: int,
-        event_type: UsageEventType,
         start_date: datetime,
         end_date: datetime,
-    ) -> int:
-        """Get sum of quantity for a billing period."""
+        event_type: Optional[UsageEventType] = None,
+    ) -> Dict[UsageEventType, UsageTotals]:
+        """
+        Get usage totals per event type for a billing period.
+
+        Whole UTC days inside the period are read from usage_daily_counters;
+        only the partial days at either edge are summed from usage_events, so
+        cost is bounded by the period length rather than the event volume.
+        """
+        start_date = _utc(start_date)
+        end_date = _utc(end_date)
+
+        first_full_day = start_date.date()
+        if start_date != _day_start(first_full_day):
+            first_full_day += timedelta(days=1)
+        end_day = end_date.date()  # First day not fully inside the period
+
+        # (start, end) ranges summed from raw events
+        event_ranges = []
+        if first_full_day < end_day:
+            event_ranges.append((start_date, _day_start(first_full_day)))
+            event_ranges.append((_day_start(end_day), end_date))
+        else:
+            event_ranges.append((start_date, end_date))
+
+        totals: Dict[UsageEventType, UsageTotals] = {}
+
+        def add(row) -> None:
+            current = totals.setdefault(UsageEventType(row[0]), UsageTotals())
+            current.quantity += row[1] or 0
+            current.event_count += row[2] or 0
+            current.file_size_bytes += row[3] or 0
+
         async with self._get_session() as session:
-            result = await session.execute(
-                select(func.coalesce(func.sum(UsageEventEntity.quantity), 0)).where(
+            if first_full_day < end_day:
+                counters = UsageDailyCounterEntity
+                query = select(
+                    counters.event_type,
+                    func.sum(counters.quantity),
+                    func.sum(counters.event_count),
+                    func.sum(counters.file_size_bytes),
+                ).where(
+                    counters.company_id == company_id,
+                    counters.bucket_date >= first_full_day,
+                    counters.bucket_date < end_day,
+                )
+                if event_type:
+                    query = query.where(counters.event_type == event_type.value)
+                result = await session.execute(query.group_by(counters.event_type))
+                for row in result.all():
+                    add(row)
+
+            for range_start, range_end in event_ranges:
+                if range_start >= range_end:
+                    continue
+                query = select(
+                    UsageEventEntity.event_type,
+                    func.sum(UsageEventEntity.quantity),
+                    func.count(UsageEventEntity.id),
+                    func.sum(UsageEventEntity.file_size_bytes),
+                ).where(
                     UsageEventEntity.company_id == company_id,
-                    UsageEventEntity.event_type == event_type.value,
-                    UsageEventEntity.created_at >= start_date,
-                    UsageEventEntity.created_at < end_date,
+                    UsageEventEntity.created_at >= range_start,
+                    UsageEventEntity.created_at < range_end,
                 )
-            )
-            return result.scalar_one() or 0
+                if event_type:
+                    query = query.where(UsageEventEntity.event_type == event_type.value)
+                result = await session.execute(
+                    query.group_by(UsageEventEntity.event_type)
+                )
+                for row in result.all():
+                    add(row)
+
+        return totals
+
+    @trace_span
+    async def get_period_total(
+        self,
+        company_id: int,
+        event_type: UsageEventType,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> UsageTotals:
+        """Get usage totals for one event type in a billing period."""
+        totals = await self.get_period_totals(
+            company_id, start_date, end_date, event_type=event_type
+        )
+        return totals.get(event_type, UsageTotals())
 
     @trace_span
     async def get_by_user(
@@ -102,50 +216,6 @@ class UsageEventRepository(BaseRepository[UsageEventEntity, UsageEvent]):
             db_events = result.scalars().all()
             return [self._entity_to_domain(event) for event in db_events]
 
-    @trace_span
-    async def get_storage_bytes_for_period(
-        self, company_id: int, start_date: datetime, end_date: datetime
-    ) -> int:
-        """
-        Sum total file size bytes from document upload events for a billing period.
-
-        Uses the file_size_bytes column for fast aggregation.
-        Used for quota enforcement based on subscription billing period.
-        """
-        async with self._get_session() as session:
-            result = await session.execute(
-                select(
-                    func.coalesce(func.sum(UsageEventEntity.file_size_bytes), 0)
-                ).where(
-                    UsageEventEntity.company_id == company_id,
-                    UsageEventEntity.event_type == UsageEventType.STORAGE_UPLOAD.value,
-                    UsageEventEntity.created_at >= start_date,
-                    UsageEventEntity.created_at < end_date,
-                )
-            )
-            return result.scalar_one() or 0
-
-    @trace_span
-    async def get_document_count_for_period(
-        self, company_id: int, start_date: datetime, end_date: datetime
-    ) -> int:
-        """
-        Count document upload events for a billing period.
-
-        Each STORAGE_UPLOAD event represents one document upload.
-        Used for document count quota enforcement.
-        """
-        async with self._get_session() as session:
-            result = await session.execute(
-                select(func.count(UsageEventEntity.id)).where(
-                    UsageEventEntity.company_id == company_id,
-                    UsageEventEntity.event_type == UsageEventType.STORAGE_UPLOAD.value,
-                    UsageEventEntity.created_at >= start_date,
-                    UsageEventEntity.created_at < end_date,
-                )
-            )
-            return result.scalar_one() or 0
-
     @trace_span
     async def acquire_company_quota_lock(self, company_id: int) -> None:
         """
@@ -15,6 +15,7 @@ from packages.billing.models.domain.usage import (
     QuotaReservationResult,
     UsageStats,
     UsageEventCreateModel,
+    UsageTotals,
 )
 from packages.billing.models.domain.enums import SubscriptionTier, UsageEventType
 
@@ -45,6 +46,17 @@ class QuotaService:
 
         return subscription
 
+    async def _get_period_total(
+        self, subscription, event_type: UsageEventType
+    ) -> UsageTotals:
+        """Get the current billing period's totals from the daily counters."""
+        return await self.usage_repo.get_period_total(
+            company_id=subscription.company_id,
+            event_type=event_type,
+            start_date=subscription.current_period_start,
+            end_date=subscription.current_period_end,
+        )
+
     def _build_quota_check(
         self, metric_name: str, current: int, limit: int, period_end: datetime
     ) -> QuotaCheck:
@@ -75,12 +87,9 @@ class QuotaService:
         limits = subscription.tier.get_quota_limits()
         limit = limits["cell_operations_per_month"]
 
-        current = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.CELL_OPERATION,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        current = (
+            await self._get_period_total(subscription, UsageEventType.CELL_OPERATION)
+        ).quantity
 
         if current >= limit:
             logger.warning(
@@ -107,12 +116,9 @@ class QuotaService:
         limits = subscription.tier.get_quota_limits()
         limit = limits["agentic_qa_per_month"]
 
-        current = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.AGENTIC_QA,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        current = (
+            await self._get_period_total(subscription, UsageEventType.AGENTIC_QA)
+        ).quantity
 
         if current >= limit:
             logger.warning(
@@ -139,12 +145,9 @@ class QuotaService:
         limits = subscription.tier.get_quota_limits()
         limit = limits["workflows_per_month"]
 
-        current = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.WORKFLOW,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        current = (
+            await self._get_period_total(subscription, UsageEventType.WORKFLOW)
+        ).quantity
 
         if current >= limit:
             logger.warning(
@@ -171,12 +174,9 @@ class QuotaService:
         limits = subscription.tier.get_quota_limits()
         limit = limits["agentic_chunking_per_month"]
 
-        current = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        current = (
+            await self._get_period_total(subscription, UsageEventType.AGENTIC_CHUNKING)
+        ).quantity
 
         if current >= limit:
             logger.warning(
@@ -203,11 +203,9 @@ class QuotaService:
         limits = subscription.tier.get_quota_limits()
         limit = limits["documents_per_month"]
 
-        current = await self.usage_repo.get_document_count_for_period(
-            company_id=company_id,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        current = (
+            await self._get_period_total(subscription, UsageEventType.STORAGE_UPLOAD)
+        ).event_count
 
         if current >= limit:
             logger.warning(
@@ -236,11 +234,9 @@ class QuotaService:
         limits = subscription.tier.get_quota_limits()
         limit = limits["storage_bytes_per_month"]
 
-        current = await self.usage_repo.get_storage_bytes_for_period(
-            company_id=company_id,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        current = (
+            await self._get_period_total(subscription, UsageEventType.STORAGE_UPLOAD)
+        ).file_size_bytes
 
         if current + file_size_bytes > limit:
             current_mb = current / (1024 * 1024)
@@ -297,12 +293,9 @@ class QuotaService:
         limits = subscription.tier.get_quota_limits()
         limit = limits["agentic_chunking_per_month"]
 
-        current = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        current = (
+            await self._get_period_total(subscription, UsageEventType.AGENTIC_CHUNKING)
+        ).quantity
 
         if current >= limit:
             logger.info(
@@ -357,60 +350,29 @@ class QuotaService:
 
         limits = subscription.tier.get_quota_limits()
 
-        cell_ops = await self.usage_repo.get_period_count(
+        totals = await self.usage_repo.get_period_totals(
             company_id=company_id,
-            event_type=UsageEventType.CELL_OPERATION,
             start_date=subscription.current_period_start,
             end_date=subscription.current_period_end,
         )
 
-        agentic_qa = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.AGENTIC_QA,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
-
-        workflows = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.WORKFLOW,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
-
-        storage_bytes = await self.usage_repo.get_storage_bytes_for_period(
-            company_id=company_id,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
-
-        agentic_chunking = await self.usage_repo.get_period_count(
-            company_id=company_id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
-
-        documents = await self.usage_repo.get_document_count_for_period(
-            company_id=company_id,
-            start_date=subscription.current_period_start,
-            end_date=subscription.current_period_end,
-        )
+        def total(event_type: UsageEventType) -> UsageTotals:
+            return totals.get(event_type, UsageTotals())
 
         return UsageStats(
             company_id=company_id,
             tier=subscription.tier,
-            cell_operations=cell_ops,
+            cell_operations=total(UsageEventType.CELL_OPERATION).quantity,
             cell_operations_limit=limits["cell_operations_per_month"],
-            agentic_qa=agentic_qa,
+            agentic_qa=total(UsageEventType.AGENTIC_QA).quantity,
             agentic_qa_limit=limits["agentic_qa_per_month"],
-            workflows=workflows,
+            workflows=total(UsageEventType.WORKFLOW).quantity,
             workflows_limit=limits["workflows_per_month"],
-            storage_bytes=storage_bytes,
+            storage_bytes=total(UsageEventType.STORAGE_UPLOAD).file_size_bytes,
             storage_bytes_limit=limits["storage_bytes_per_month"],
-            agentic_chunking=agentic_chunking,
+            agentic_chunking=total(UsageEventType.AGENTIC_CHUNKING).quantity,
             agentic_chunking_limit=limits["agentic_chunking_per_month"],
-            documents=documents,
+            documents=total(UsageEventType.STORAGE_UPLOAD).event_count,
             documents_limit=limits["documents_per_month"],
             period_start=subscription.current_period_start,
             period_end=subscription.current_period_end,
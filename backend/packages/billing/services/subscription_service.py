@@ -98,7 +98,12 @@ class SubscriptionService:
         return subscription
 
     @trace_span
-    @cache(model_type=Subscription, ttl=300, key_generator=subscription_by_company_key)
+    @cache(
+        model_type=Subscription,
+        ttl=300,
+        key_generator=subscription_by_company_key,
+        local_ttl=30,
+    )
     async def get_by_company_id(self, company_id: int) -> Optional[Subscription]:
         """Get subscription for a company. Cached for 5 minutes."""
         return await self.subscription_repo.get_by_company_id(company_id)
@@ -20,6 +20,9 @@ class ChunkEntity(Base):
         BigIntegerType, ForeignKey("companies.id"), nullable=False, index=True
     )
     s3_key = Column(String, nullable=False)  # Actual content location in S3
+    # Byte range within s3_key for packed chunk sets (NULL: whole object)
+    content_offset = Column(BigIntegerType, nullable=True)
+    content_length = Column(Integer, nullable=True)
     chunk_metadata = Column(JSON, nullable=False)  # page_start, page_end, section, etc.
     chunk_order = Column(Integer, nullable=False)  # Position in document
     deleted = Column(
@@ -14,6 +14,8 @@ class ChunkModel(BaseModel):
     document_id: int
     company_id: int
     s3_key: str
+    content_offset: Optional[int] = None
+    content_length: Optional[int] = None
     chunk_metadata: Dict[str, Any]
     chunk_order: int
     deleted: bool
@@ -32,6 +34,8 @@ class ChunkCreateModel(BaseModel):
     document_id: int
     company_id: int
     s3_key: str
+    content_offset: Optional[int] = None
+    content_length: Optional[int] = None
     chunk_metadata: Dict[str, Any]
     chunk_order: int
 
@@ -40,3 +44,17 @@ class ChunkUpdateModel(BaseModel):
     """Model for updating a chunk."""
 
     deleted: Optional[bool] = None
+
+
+class ChunkLocation(BaseModel):
+    """Where a chunk's content lives in storage."""
+
+    s3_key: str
+    offset: Optional[int] = None  # Byte range within s3_key (packed sets only)
+    length: Optional[int] = None
+
+    def to_manifest(self) -> dict:
+        """Manifest fields for this location."""
+        if self.offset is None:
+            return {"s3_key": self.s3_key}
+        return {"s3_key": self.s3_key, "offset": self.offset, "length": self.length}
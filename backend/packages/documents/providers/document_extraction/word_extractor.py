@@ -1,10 +1,8 @@
-import io
 from typing import Dict, Any
-from markitdown import MarkItDown
-from markitdown._stream_info import StreamInfo
 
 from .interface import DocumentExtractorInterface
 from common.core.otel_axiom_exporter import get_logger
+from common.providers.extraction.engine import get_extraction_engine
 from common.providers.storage.factory import get_storage
 from packages.documents.models.domain.document import DocumentModel
 
@@ -19,7 +17,6 @@ class WordExtractor(DocumentExtractorInterface):
     }
 
     def __init__(self):
-        self.markitdown = MarkItDown(enable_plugins=True)
         self.storage = get_storage()
 
     def supports_file_type(self, file_type: str) -> bool:
@@ -29,21 +26,17 @@ class WordExtractor(DocumentExtractorInterface):
     async def extract_text(self, document: DocumentModel) -> str:
         """Extract text content from a Word document."""
         try:
-            # Download file from storage
-            file_data = await self.storage.download(document.storage_key)
-            if not file_data:
-                raise ValueError(f"Failed to download file from {document.storage_key}")
-
             file_type = document.content_type or ""
             if file_type.lower() not in self.SUPPORTED_TYPES:
                 raise ValueError(f"Unsupported file type: {file_type}")
 
-            file_stream = io.BytesIO(file_data)
-            stream_info = StreamInfo(
-                mimetype=file_type, extension=".docx", filename=document.filename
-            )
-            result = self.markitdown.convert_stream(
-                file_stream, stream_info=stream_info
+            # Streamed to a temp file and converted in a worker process
+            result = await get_extraction_engine().convert_storage_object(
+                self.storage,
+                document.storage_key,
+                mimetype=file_type,
+                extension=".docx",
+                filename=document.filename,
             )
 
             if result and result.text_content:
@@ -62,37 +55,31 @@ class WordExtractor(DocumentExtractorInterface):
     async def get_metadata(self, document: DocumentModel) -> Dict[str, Any]:
         """Extract metadata from a Word document."""
         try:
-            # Download file from storage
-            file_data = await self.storage.download(document.storage_key)
-            if not file_data:
-                raise ValueError(f"Failed to download file from {document.storage_key}")
-
             file_type = document.content_type or ""
-            metadata = {
-                "file_size": len(file_data),
-                "file_type": file_type,
-                "extractor": "WordExtractor",
-            }
-
             if file_type.lower() not in self.SUPPORTED_TYPES:
                 raise ValueError(f"Unsupported file type: {file_type}")
 
-            file_stream = io.BytesIO(file_data)
-            stream_info = StreamInfo(
-                mimetype=file_type, extension=".docx", filename=document.filename
-            )
-            result = self.markitdown.convert_stream(
-                file_stream, stream_info=stream_info
+            # Streamed to a temp file and converted in a worker process
+            result = await get_extraction_engine().convert_storage_object(
+                self.storage,
+                document.storage_key,
+                mimetype=file_type,
+                extension=".docx",
+                filename=document.filename,
             )
 
-            if result:
-                if hasattr(result, "title") and result.title:
-                    metadata["title"] = result.title
+            metadata = {
+                "file_size": result.file_size,
+                "file_type": file_type,
+                "extractor": "WordExtractor",
+            }
+            if result.title:
+                metadata["title"] = result.title
 
-                # Add character and line count from extracted text
-                if result.text_content:
-                    metadata["character_count"] = len(result.text_content)
-                    metadata["line_count"] = len(result.text_content.splitlines())
+            # Add character and line count from extracted text
+            if result.text_content:
+                metadata["character_count"] = len(result.text_content)
+                metadata["line_count"] = len(result.text_content.splitlines())
 
             return metadata
 
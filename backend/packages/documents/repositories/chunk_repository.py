@@ -1,4 +1,5 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import func, tuple_
 from sqlalchemy.future import select
 from common.core.otel_axiom_exporter import trace_span
 from common.repositories.base import BaseRepository
@@ -50,6 +51,71 @@ class ChunkRepository(BaseRepository[ChunkEntity, ChunkModel]):
             entities = result.scalars().all()
             return self._entities_to_domain(entities)
 
+    @trace_span
+    async def search_by_document_metadata(
+        self,
+        document_id: int,
+        company_id: Optional[int] = None,
+        section: Optional[str] = None,
+        page: Optional[int] = None,
+    ) -> List[ChunkModel]:
+        """
+        Get chunks for a document filtered by metadata, evaluated in SQL.
+
+        Section matches case-insensitively. Page matches chunks whose
+        page_start..page_end range contains it (missing bounds count as 0).
+        """
+        async with self._get_session() as session:
+            query = (
+                select(ChunkEntity)
+                .where(
+                    ChunkEntity.document_id == document_id,
+                    ChunkEntity.deleted == False,
+                )
+                .order_by(ChunkEntity.chunk_order)
+            )
+            if company_id is not None:
+                query = self._add_company_filter(query, company_id)
+            if section:
+                query = query.where(
+                    func.lower(ChunkEntity.chunk_metadata["section"].as_string())
+                    == section.lower()
+                )
+            if page is not None:
+                page_start = func.coalesce(
+                    ChunkEntity.chunk_metadata["page_start"].as_integer(), 0
+                )
+                page_end = func.coalesce(
+                    ChunkEntity.chunk_metadata["page_end"].as_integer(), 0
+                )
+                query = query.where(page_start <= page, page_end >= page)
+            result = await session.execute(query)
+            entities = result.scalars().all()
+            return self._entities_to_domain(entities)
+
+    @trace_span
+    async def get_by_document_chunk_ids(
+        self,
+        document_chunk_ids: Sequence[Tuple[int, str]],
+        company_id: Optional[int] = None,
+    ) -> List[ChunkModel]:
+        """Get chunks for (document_id, chunk_id) pairs in a single query."""
+        if not document_chunk_ids:
+            return []
+
+        async with self._get_session() as session:
+            query = select(ChunkEntity).where(
+                tuple_(ChunkEntity.document_id, ChunkEntity.chunk_id).in_(
+                    list(document_chunk_ids)
+                ),
+                ChunkEntity.deleted == False,
+            )
+            if company_id is not None:
+                query = self._add_company_filter(query, company_id)
+            result = await session.execute(query)
+            entities = result.scalars().all()
+            return self._entities_to_domain(entities)
+
     @trace_span
     async def get_by_chunk_id(
         self, chunk_id: str, document_id: int, company_id: Optional[int] = None
@@ -54,9 +54,9 @@ async def list_document_chunks(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    # Get chunks
+    # Get chunk metadata from the database (no S3 reads)
     chunking_service = get_document_chunking_service()
-    chunks = await chunking_service.get_chunks_for_document(
+    chunks = await chunking_service.get_chunk_metadata_for_document(
         document_id=document_id, company_id=current_user.company_id
     )
 
@@ -68,7 +68,7 @@ async def list_document_chunks(
 
     # Convert to response format (inject chunk_id from chunk object, not metadata)
     chunk_metadata_list = [
-        ChunkMetadataResponse(chunk_id=chunk.chunk_id, **chunk.metadata)
+        ChunkMetadataResponse(chunk_id=chunk.chunk_id, **chunk.chunk_metadata)
         for chunk in chunks
     ]
 
@@ -101,17 +101,13 @@ async def read_document_chunk(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    # Get all chunks for document
+    # Load just the requested chunk
     chunking_service = get_document_chunking_service()
-    chunks = await chunking_service.get_chunks_for_document(
-        document_id=document_id, company_id=current_user.company_id
+    chunk = await chunking_service.get_chunk_by_id(
+        chunk_id=chunk_id,
+        document_id=document_id,
+        company_id=current_user.company_id,
     )
-
-    if not chunks:
-        raise HTTPException(status_code=404, detail="No chunks found for document")
-
-    # Find requested chunk
-    chunk = next((c for c in chunks if c.chunk_id == chunk_id), None)
     if not chunk:
         raise HTTPException(
             status_code=404,
@@ -151,35 +147,28 @@ async def search_document_chunks(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    # Get all chunks
+    # Filter by metadata in the database (no S3 reads)
     chunking_service = get_document_chunking_service()
-    chunks = await chunking_service.get_chunks_for_document(
-        document_id=document_id, company_id=current_user.company_id
+    filtered_chunks = await chunking_service.get_chunk_metadata_for_document(
+        document_id=document_id,
+        company_id=current_user.company_id,
+        section=section,
+        page=page,
     )
 
-    if not chunks:
-        raise HTTPException(status_code=404, detail="No chunks found for document")
-
-    # Filter by metadata
-    filtered_chunks = chunks
-    if section:
-        filtered_chunks = [
-            c
-            for c in filtered_chunks
-            if c.metadata.get("section", "").lower() == section.lower()
-        ]
-    if page is not None:
-        filtered_chunks = [
-            c
-            for c in filtered_chunks
-            if (c.metadata.get("page_start") or 0)
-            <= page
-            <= (c.metadata.get("page_end") or 0)
-        ]
+    if not filtered_chunks:
+        # Distinguish "no matches" from "document not chunked yet"
+        has_chunks = (section or page is not None) and bool(
+            await chunking_service.get_chunk_metadata_for_document(
+                document_id=document_id, company_id=current_user.company_id
+            )
+        )
+        if not has_chunks:
+            raise HTTPException(status_code=404, detail="No chunks found for document")
 
     # Convert to response format (inject chunk_id from chunk object, not metadata)
     chunk_metadata_list = [
-        ChunkMetadataResponse(chunk_id=chunk.chunk_id, **chunk.metadata)
+        ChunkMetadataResponse(chunk_id=chunk.chunk_id, **chunk.chunk_metadata)
         for chunk in filtered_chunks
     ]
 
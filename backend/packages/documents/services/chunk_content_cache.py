@@ -0,0 +1,32 @@
+"""
+Process-wide cache for chunk content, keyed by S3 key.
+
+Chunk objects are written once by ChunkUploadService and never modified,
+so cached entries never go stale.
+"""
+
+from typing import Optional
+
+from common.core.config import settings
+from common.providers.caching import ContentCache, get_cache_provider
+
+_chunk_content_cache: Optional[ContentCache] = None
+
+
+def get_chunk_content_cache() -> ContentCache:
+    """Get the shared chunk content cache instance."""
+    global _chunk_content_cache
+
+    if _chunk_content_cache is None:
+        _chunk_content_cache = ContentCache(
+            namespace="chunk_content",
+            max_bytes=settings.chunk_content_cache_max_bytes,
+            shared_cache=(
+                get_cache_provider()
+                if settings.chunk_content_cache_redis_enabled
+                else None
+            ),
+            shared_ttl=settings.chunk_content_cache_redis_ttl,
+        )
+
+    return _chunk_content_cache
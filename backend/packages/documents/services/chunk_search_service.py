@@ -1,7 +1,7 @@
 """Service for hybrid chunk search combining keyword + vector search."""
 
 import asyncio
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from packages.documents.providers.document_search.keyword_search_interface import (
     KeywordSearchInterface,
@@ -298,6 +298,10 @@ class ChunkSearchService:
         """
         Fetch actual chunk content from S3 for search results.
 
+        Only the hit chunks are loaded (not whole documents), with one DB
+        query per company and concurrent, cached content reads. Hits keep
+        their ranked order.
+
         Args:
             chunk_hits: Search results without content
 
@@ -309,37 +313,38 @@ class ChunkSearchService:
 
         chunking_service = get_document_chunking_service()
 
-        # Group chunks by document for efficient fetching
-        chunks_by_doc = {}
+        # Group hit keys by company (search is company-scoped, so usually one)
+        keys_by_company: Dict[int, List[Tuple[int, str]]] = {}
         for hit in chunk_hits:
-            if hit.document_id not in chunks_by_doc:
-                chunks_by_doc[hit.document_id] = []
-            chunks_by_doc[hit.document_id].append(hit)
+            keys_by_company.setdefault(hit.company_id, []).append(
+                (hit.document_id, hit.chunk_id)
+            )
 
-        # Fetch content for each document's chunks
-        hydrated_hits = []
-        for document_id, hits in chunks_by_doc.items():
+        async def _load_for_company(company_id: int, keys: List[Tuple[int, str]]):
             try:
-                # Get all chunks for this document
-                chunks = await chunking_service.get_chunks_for_document(
-                    document_id=document_id,
-                    company_id=hits[0].company_id,
+                return await chunking_service.get_chunks_by_ids(keys, company_id)
+            except Exception as e:
+                logger.error(
+                    f"Error fetching chunk content for company {company_id}: {e}"
                 )
+                return {}
 
-                # Map chunk_id to content
-                chunk_content_map = {c.chunk_id: c.content for c in chunks}
-
-                # Populate content in hits
-                for hit in hits:
-                    hit.content = chunk_content_map.get(hit.chunk_id, "")
-                    hydrated_hits.append(hit)
+        loaded = await asyncio.gather(
+            *(
+                _load_for_company(company_id, keys)
+                for company_id, keys in keys_by_company.items()
+            )
+        )
+        chunks_by_key = {}
+        for chunk_map in loaded:
+            chunks_by_key.update(chunk_map)
 
-            except Exception as e:
-                logger.error(f"Error fetching content for document {document_id}: {e}")
-                # Add hits without content
-                hydrated_hits.extend(hits)
+        # Populate content in hits, preserving rank order
+        for hit in chunk_hits:
+            chunk = chunks_by_key.get((hit.document_id, hit.chunk_id))
+            hit.content = chunk.content if chunk else ""
 
-        return hydrated_hits
+        return chunk_hits
 
     async def delete_chunk(self, chunk_id: str, document_id: int) -> bool:
         """
@@ -1,6 +1,6 @@
 """Service for managing individual chunks."""
 
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from common.core.otel_axiom_exporter import trace_span, get_logger
 from packages.documents.repositories.chunk_repository import ChunkRepository
@@ -30,11 +30,8 @@ class ChunkService:
     async def create_chunks_batch(
         self, chunks_data: List[ChunkCreateModel]
     ) -> List[ChunkModel]:
-        """Create multiple chunks in batch."""
-        chunks = []
-        for chunk_data in chunks_data:
-            chunk = await self.chunk_repo.create(chunk_data)
-            chunks.append(chunk)
+        """Create multiple chunks with a single bulk insert."""
+        chunks = await self.chunk_repo.bulk_create_from_models(chunks_data)
 
         logger.info(f"Created {len(chunks)} chunks")
         return chunks
@@ -53,6 +50,17 @@ class ChunkService:
         """Get a chunk by its chunk_id and document_id."""
         return await self.chunk_repo.get_by_chunk_id(chunk_id, document_id, company_id)
 
+    @trace_span
+    async def get_chunks_by_document_chunk_ids(
+        self,
+        document_chunk_ids: Sequence[Tuple[int, str]],
+        company_id: Optional[int] = None,
+    ) -> List[ChunkModel]:
+        """Get chunks for (document_id, chunk_id) pairs in a single query."""
+        return await self.chunk_repo.get_by_document_chunk_ids(
+            document_chunk_ids, company_id
+        )
+
     @trace_span
     async def get_chunks_for_chunk_set(
         self, chunk_set_id: int, company_id: Optional[int] = None
@@ -67,6 +75,19 @@ class ChunkService:
         """Get all chunks for a document."""
         return await self.chunk_repo.get_by_document_id(document_id, company_id)
 
+    @trace_span
+    async def search_chunks_for_document(
+        self,
+        document_id: int,
+        company_id: Optional[int] = None,
+        section: Optional[str] = None,
+        page: Optional[int] = None,
+    ) -> List[ChunkModel]:
+        """Get chunks for a document filtered by section and/or page."""
+        return await self.chunk_repo.search_by_document_metadata(
+            document_id, company_id, section=section, page=page
+        )
+
     @trace_span
     async def update_chunk(
         self,
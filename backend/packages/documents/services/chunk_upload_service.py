@@ -4,19 +4,25 @@ Service for processing chunk uploads from chunking agents.
 Handles receiving chunks from agents and uploading to S3 and creating DB records.
 """
 
+import asyncio
 import io
 import json
+import uuid
 from typing import List
 from datetime import datetime
 
+from common.core.config import settings
 from common.providers.storage.factory import get_storage
-from common.providers.storage.paths import get_document_chunks_prefix
+from common.providers.storage.paths import (
+    get_document_chunk_pack_path,
+    get_document_chunks_prefix,
+)
 from common.core.otel_axiom_exporter import trace_span, get_logger
 from packages.documents.models.schemas.chunk import ChunkUploadItem
 from packages.documents.services.chunk_set_service import ChunkSetService
 from packages.documents.services.chunk_service import ChunkService
 from packages.documents.models.domain.chunk_set import ChunkSetCreateModel
-from packages.documents.models.domain.chunk import ChunkCreateModel
+from packages.documents.models.domain.chunk import ChunkCreateModel, ChunkLocation
 from packages.documents.models.domain.chunking_strategy import ChunkingStrategy
 
 logger = get_logger(__name__)
@@ -30,6 +36,71 @@ class ChunkUploadService:
         self.chunk_set_service = ChunkSetService()
         self.chunk_service = ChunkService()
 
+    async def _upload_objects(
+        self, s3_prefix: str, document_id: int, chunks: List[ChunkUploadItem]
+    ) -> List[ChunkLocation]:
+        """Upload each chunk as its own object, concurrently."""
+        semaphore = asyncio.Semaphore(settings.chunk_upload_concurrency)
+
+        async def _upload_chunk(chunk: ChunkUploadItem) -> bool:
+            async with semaphore:
+                return await self.storage.upload(
+                    f"{s3_prefix}/{chunk.chunk_id}.md",
+                    io.BytesIO(chunk.content.encode("utf-8")),
+                    metadata={"content_type": "text/markdown"},
+                )
+
+        # Chunk metadata lives in the manifest and the chunks table, so no
+        # per-chunk metadata objects.
+        results = await asyncio.gather(*(_upload_chunk(chunk) for chunk in chunks))
+        failed = [chunk.chunk_id for chunk, ok in zip(chunks, results) if not ok]
+        if failed:
+            raise Exception(
+                f"Failed to upload {len(failed)} chunks for document {document_id}: "
+                f"{failed[:10]}"
+            )
+
+        return [
+            ChunkLocation(s3_key=f"{s3_prefix}/{chunk.chunk_id}.md") for chunk in chunks
+        ]
+
+    async def _upload_packed(
+        self,
+        s3_prefix: str,
+        company_id: int,
+        document_id: int,
+        chunks: List[ChunkUploadItem],
+    ) -> List[ChunkLocation]:
+        """Upload all chunk contents as one blob and return each chunk's byte range."""
+        # The chunk set row doesn't exist yet, so the pack gets a unique ID
+        pack_key = get_document_chunk_pack_path(
+            company_id, document_id, uuid.uuid4().hex
+        )
+
+        buffer = io.BytesIO()
+        locations = []
+        for chunk in chunks:
+            content_bytes = chunk.content.encode("utf-8")
+            locations.append(
+                ChunkLocation(
+                    s3_key=pack_key,
+                    offset=buffer.tell(),
+                    length=len(content_bytes),
+                )
+            )
+            buffer.write(content_bytes)
+        buffer.seek(0)
+
+        uploaded = await self.storage.upload(
+            pack_key,
+            buffer,
+            metadata={"content_type": "application/octet-stream"},
+        )
+        if not uploaded:
+            raise Exception(f"Failed to upload chunk pack for document {document_id}")
+
+        return locations
+
     @trace_span
     async def process_chunk_upload(
         self,
@@ -41,7 +112,11 @@ class ChunkUploadService:
         """
         Process chunk upload from chunking agent or naive chunking.
 
-        Uploads all chunks and manifest to S3 and creates database records.
+        Uploads chunk content to S3 - either one object per chunk, uploaded
+        concurrently (bounded by settings.chunk_upload_concurrency), or a
+        single packed blob with per-chunk byte ranges when
+        settings.chunk_storage_packed is set. Then writes the manifest and
+        creates all chunk records with a single bulk insert.
 
         Args:
             document_id: Document ID
@@ -61,33 +136,26 @@ class ChunkUploadService:
             f"Uploading {len(chunks)} chunks for document {document_id} to {s3_prefix}"
         )
 
-        # Upload each chunk to S3
-        for chunk in chunks:
-            # Upload chunk content
-            chunk_key = f"{s3_prefix}/{chunk.chunk_id}.md"
-            await self.storage.upload(
-                chunk_key,
-                io.BytesIO(chunk.content.encode("utf-8")),
-                metadata={"content_type": "text/markdown"},
-            )
-
-            # Upload chunk metadata
-            meta_key = f"{s3_prefix}/{chunk.chunk_id}.meta.json"
-            meta_json = json.dumps(chunk.metadata)
-            await self.storage.upload(
-                meta_key,
-                io.BytesIO(meta_json.encode("utf-8")),
-                metadata={"content_type": "application/json"},
+        if settings.chunk_storage_packed:
+            chunk_locations = await self._upload_packed(
+                s3_prefix, company_id, document_id, chunks
             )
+        else:
+            chunk_locations = await self._upload_objects(s3_prefix, document_id, chunks)
 
         # Create and upload manifest
         manifest_data = {
             "document_id": document_id,
             "created_at": datetime.utcnow().isoformat(),
             "total_chunks": len(chunks),
+            "storage_format": "packed" if settings.chunk_storage_packed else "objects",
             "chunks": [
-                {"chunk_id": chunk.chunk_id, "metadata": chunk.metadata}
-                for chunk in chunks
+                {
+                    "chunk_id": chunk.chunk_id,
+                    "metadata": chunk.metadata,
+                    **location.to_manifest(),
+                }
+                for chunk, location in zip(chunks, chunk_locations)
             ],
         }
 
@@ -115,21 +183,22 @@ class ChunkUploadService:
         logger.info(f"Created chunk set {chunk_set.id} for document {document_id}")
 
         # Create chunk records in database
-        chunk_models = []
-        for idx, chunk in enumerate(chunks):
-            chunk_key = f"{s3_prefix}/{chunk.chunk_id}.md"
-            chunk_model = await self.chunk_service.create_chunk(
+        chunk_models = await self.chunk_service.create_chunks_batch(
+            [
                 ChunkCreateModel(
                     chunk_set_id=chunk_set.id,
                     chunk_id=chunk.chunk_id,
                     document_id=document_id,
                     company_id=company_id,
-                    s3_key=chunk_key,
+                    s3_key=location.s3_key,
+                    content_offset=location.offset,
+                    content_length=location.length,
                     chunk_metadata=chunk.metadata,
                     chunk_order=idx,
                 )
-            )
-            chunk_models.append(chunk_model)
+                for idx, (chunk, location) in enumerate(zip(chunks, chunk_locations))
+            ]
+        )
 
         logger.info(
             f"Created {len(chunk_models)} chunk records in database for document {document_id}"
@@ -2,13 +2,19 @@
 Service for retrieving document chunks with content from S3.
 
 This service bridges the gap between database chunk metadata and S3 content storage.
-It uses ChunkService to get metadata from DB and loads content from S3.
+It uses ChunkService to get metadata from DB and loads content from S3, going
+through the shared chunk content cache. Chunks are either individual objects or
+byte ranges of a packed chunk-set blob (content_offset/content_length set).
 """
 
-from typing import List, Optional
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 from common.providers.storage.factory import get_storage
 from common.core.otel_axiom_exporter import trace_span, get_logger
+from packages.documents.models.domain.chunk import ChunkModel
+from packages.documents.services.chunk_content_cache import get_chunk_content_cache
 from packages.documents.services.chunk_service import ChunkService
 from packages.documents.services.chunk_set_service import ChunkSetService
 
@@ -25,6 +31,76 @@ class DocumentChunkingService:
         self.storage = get_storage()
         self.chunk_service = ChunkService()
         self.chunk_set_service = ChunkSetService()
+        self.content_cache = get_chunk_content_cache()
+
+    @staticmethod
+    def _cache_key(chunk_model: ChunkModel) -> str:
+        """Cache key for a chunk's content (packed chunks share an s3_key)."""
+        if chunk_model.content_offset is None:
+            return chunk_model.s3_key
+        return (
+            f"{chunk_model.s3_key}#{chunk_model.content_offset}"
+            f":{chunk_model.content_length}"
+        )
+
+    async def _download_content(self, chunk_model: ChunkModel) -> Optional[str]:
+        """Download a chunk's content, using a ranged GET for packed chunks."""
+        if chunk_model.content_offset is None:
+            content_bytes = await self.storage.download(chunk_model.s3_key)
+        elif not chunk_model.content_length:
+            return None
+        else:
+            content_bytes = await self.storage.download_range(
+                chunk_model.s3_key,
+                chunk_model.content_offset,
+                chunk_model.content_length,
+            )
+        return content_bytes.decode("utf-8") if content_bytes else None
+
+    async def _load_content(self, chunk_model: ChunkModel) -> str:
+        """Load chunk content, served from cache when possible."""
+        content = await self.content_cache.get_or_load(
+            self._cache_key(chunk_model),
+            lambda: self._download_content(chunk_model),
+        )
+        if not content:
+            logger.warning(f"No content found in S3 for chunk {chunk_model.chunk_id}")
+            return ""
+        return content
+
+    async def _prefetch_packed_contents(
+        self, chunk_models: List[ChunkModel]
+    ) -> Dict[str, str]:
+        """
+        Load uncached packed chunks with one full fetch per pack.
+
+        Returns content by cache key and populates the content cache. Chunks
+        stored as individual objects are left to _load_content.
+        """
+        missing_by_pack: Dict[str, List[ChunkModel]] = defaultdict(list)
+        for chunk_model in chunk_models:
+            if chunk_model.content_offset is None:
+                continue
+            if await self.content_cache.get(self._cache_key(chunk_model)) is None:
+                missing_by_pack[chunk_model.s3_key].append(chunk_model)
+
+        contents: Dict[str, str] = {}
+        for pack_key, pack_chunks in missing_by_pack.items():
+            pack_bytes = await self.storage.download(pack_key)
+            if not pack_bytes:
+                logger.warning(f"No content found in S3 for chunk pack {pack_key}")
+                continue
+
+            for chunk_model in pack_chunks:
+                start = chunk_model.content_offset
+                end = start + (chunk_model.content_length or 0)
+                content = pack_bytes[start:end].decode("utf-8")
+                if content:
+                    cache_key = self._cache_key(chunk_model)
+                    contents[cache_key] = content
+                    await self.content_cache.set(cache_key, content)
+
+        return contents
 
     @trace_span
     async def get_chunks_for_document(
@@ -49,19 +125,16 @@ class DocumentChunkingService:
             logger.info(f"No chunks found in database for document {document_id}")
             return []
 
+        # Packed chunk sets are fetched whole rather than range by range
+        packed_contents = await self._prefetch_packed_contents(chunk_models)
+
         # Load content from S3 for each chunk
         chunks_with_content = []
         for chunk_model in chunk_models:
             try:
-                # Download content from S3
-                content_bytes = await self.storage.download(chunk_model.s3_key)
-                if content_bytes:
-                    content = content_bytes.decode("utf-8")
-                else:
-                    logger.warning(
-                        f"No content found in S3 for chunk {chunk_model.chunk_id}"
-                    )
-                    content = ""
+                content = packed_contents.get(self._cache_key(chunk_model))
+                if content is None:
+                    content = await self._load_content(chunk_model)
 
                 # Create DocumentChunk with content
                 chunk_with_content = DocumentChunk(
@@ -85,6 +158,77 @@ class DocumentChunkingService:
 
         return chunks_with_content
 
+    @trace_span
+    async def get_chunks_by_ids(
+        self, document_chunk_ids: List[Tuple[int, str]], company_id: int
+    ) -> Dict[Tuple[int, str], DocumentChunk]:
+        """
+        Get specific chunks, possibly across documents, with content from S3.
+
+        Chunk rows are fetched in one query and contents are loaded
+        concurrently through the chunk content cache.
+
+        Args:
+            document_chunk_ids: (document_id, chunk_id) pairs to load
+            company_id: Company ID for authorization
+
+        Returns:
+            DocumentChunk by (document_id, chunk_id); missing chunks are omitted
+        """
+        unique_ids = list(dict.fromkeys(document_chunk_ids))
+        chunk_models = await self.chunk_service.get_chunks_by_document_chunk_ids(
+            unique_ids, company_id
+        )
+
+        async def _load(chunk_model: ChunkModel) -> Optional[DocumentChunk]:
+            try:
+                content = await self._load_content(chunk_model)
+            except Exception as e:
+                logger.error(
+                    f"Failed to load content for chunk {chunk_model.chunk_id}: {e}"
+                )
+                return None
+            return DocumentChunk(
+                chunk_id=chunk_model.chunk_id,
+                document_id=chunk_model.document_id,
+                content=content,
+                metadata=chunk_model.chunk_metadata,
+            )
+
+        chunks = await asyncio.gather(*(_load(c) for c in chunk_models))
+        return {(c.document_id, c.chunk_id): c for c in chunks if c is not None}
+
+    @trace_span
+    async def get_chunk_metadata_for_document(
+        self,
+        document_id: int,
+        company_id: int,
+        section: Optional[str] = None,
+        page: Optional[int] = None,
+    ) -> List[ChunkModel]:
+        """
+        Get chunk metadata for a document without loading content from S3.
+
+        Section and page filters are evaluated in the database.
+
+        Args:
+            document_id: Document ID
+            company_id: Company ID for authorization
+            section: Optional section title to match (case-insensitive)
+            page: Optional page number the chunk must span
+
+        Returns:
+            List of ChunkModel records ordered by chunk_order
+        """
+        if section is None and page is None:
+            return await self.chunk_service.get_chunks_for_document(
+                document_id, company_id
+            )
+
+        return await self.chunk_service.search_chunks_for_document(
+            document_id, company_id, section=section, page=page
+        )
+
     @trace_span
     async def get_chunk_by_id(
         self, chunk_id: str, document_id: int, company_id: int
@@ -92,6 +236,9 @@ class DocumentChunkingService:
         """
         Get a specific chunk by ID with content from S3.
 
+        Only the requested chunk is loaded; content is served from the chunk
+        content cache when available.
+
         Args:
             chunk_id: Chunk ID
             document_id: Document ID
@@ -108,13 +255,7 @@ class DocumentChunkingService:
         if not chunk_model:
             return None
 
-        # Download content from S3
-        content_bytes = await self.storage.download(chunk_model.s3_key)
-        if content_bytes:
-            content = content_bytes.decode("utf-8")
-        else:
-            logger.warning(f"No content found in S3 for chunk {chunk_id}")
-            content = ""
+        content = await self._load_content(chunk_model)
 
         # Create DocumentChunk with content
         return DocumentChunk(
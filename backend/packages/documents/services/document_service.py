@@ -26,6 +26,10 @@ from packages.documents.utils.url_helpers import (
     cleanup_temp_file,
 )
 from packages.documents.services.chunk_search_service import get_chunk_search_service
+from packages.documents.services.extracted_content_cache import (
+    extracted_content_cache_key,
+    get_extracted_content_cache,
+)
 from packages.documents.providers.document_search.types import ChunkSearchFilters
 from packages.documents.models.domain.document_search import (
     HybridDocumentSearchResult,
@@ -234,7 +238,7 @@ class DocumentService:
 
     @trace_span
     async def get_extracted_content(self, document: DocumentModel) -> Optional[str]:
-        """Get extracted content for a document, downloading from S3 if available."""
+        """Get extracted content for a document, from cache or downloaded from S3."""
         if not document.extracted_content_path:
             logger.warning(f"Document {document.id} has no extracted content path")
             return None
@@ -245,8 +249,7 @@ class DocumentService:
             )
             return None
 
-        try:
-            # Download extracted content from S3
+        async def _download() -> Optional[str]:
             content_bytes = await self.storage.download(document.extracted_content_path)
             if not content_bytes:
                 logger.error(
@@ -259,6 +262,12 @@ class DocumentService:
             logger.info(f"Downloaded {len(content)} characters of extracted content")
             return content
 
+        try:
+            # Served from the extracted content cache, downloading on a miss
+            return await get_extracted_content_cache().get_or_load(
+                extracted_content_cache_key(document), _download
+            )
+
         except Exception as e:
             logger.error(
                 f"Error getting extracted content for document {document.id}: {e}"
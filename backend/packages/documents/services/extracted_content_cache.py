@@ -0,0 +1,42 @@
+"""
+Process-wide cache for extracted document content (markdown).
+
+QA strategies load the same document's extracted content for every cell in a
+matrix; this keeps it in memory (and optionally in Redis) across cells.
+
+The extracted content path is stable per document and re-extraction overwrites
+it, so keys include the extraction completion time.
+"""
+
+from typing import Optional
+
+from common.core.config import settings
+from common.providers.caching import ContentCache, get_cache_provider
+from packages.documents.models.domain.document import DocumentModel
+
+_extracted_content_cache: Optional[ContentCache] = None
+
+
+def get_extracted_content_cache() -> ContentCache:
+    """Get the shared extracted content cache instance."""
+    global _extracted_content_cache
+
+    if _extracted_content_cache is None:
+        _extracted_content_cache = ContentCache(
+            namespace="extracted_content",
+            max_bytes=settings.extracted_content_cache_max_bytes,
+            shared_cache=(
+                get_cache_provider()
+                if settings.extracted_content_cache_redis_enabled
+                else None
+            ),
+            shared_ttl=settings.extracted_content_cache_redis_ttl,
+        )
+
+    return _extracted_content_cache
+
+
+def extracted_content_cache_key(document: DocumentModel) -> str:
+    """Cache key for a document's current extracted content."""
+    version = document.extraction_completed_at or document.updated_at
+    return f"{document.extracted_content_path}@{version.isoformat()}"
@@ -1,10 +1,12 @@
+import asyncio
 import io
-from typing import List
+import os
+import tempfile
+from typing import Callable, List, Optional, Tuple
 from PyPDF2 import PdfReader, PdfWriter
-from markitdown import MarkItDown
-from markitdown._stream_info import StreamInfo
 
 from common.core.config import settings
+from common.providers.extraction.engine import get_extraction_engine
 from common.providers.storage.factory import get_storage
 from common.core.otel_axiom_exporter import trace_span, get_logger
 
@@ -14,7 +16,6 @@ logger = get_logger(__name__)
 class PdfService:
     def __init__(self):
         self.storage_provider = get_storage()
-        self.markitdown = MarkItDown(enable_plugins=True)
 
     @trace_span
     async def split_pdf(self, storage_key: str, pages_per_split: int = 1) -> List[str]:
@@ -81,6 +82,122 @@ class PdfService:
             logger.error(f"Error splitting PDF: {e}")
             raise
 
+    @staticmethod
+    def plan_page_batches(
+        total_pages: int, file_size: int, max_pages: int, max_bytes: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Split pages into [start, end) ranges bounded by page count and size.
+
+        Page size is estimated as the file's average bytes per page, so
+        image-heavy scans get small batches and text PDFs get large ones.
+        """
+        if total_pages == 0:
+            return []
+
+        bytes_per_page = max(file_size // total_pages, 1)
+        pages_per_batch = max(1, min(max_pages, max_bytes // bytes_per_page))
+        return [
+            (start, min(start + pages_per_batch, total_pages))
+            for start in range(0, total_pages, pages_per_batch)
+        ]
+
+    @trace_span
+    async def convert_pdf_in_batches(
+        self,
+        storage_key: str,
+        on_batch_converted: Optional[Callable[[], None]] = None,
+    ) -> str:
+        """
+        Convert a whole PDF to markdown in page-range batches.
+
+        The PDF is downloaded once to a temp file; each batch is written as a
+        page-range PDF next to it and converted on the extraction engine, with
+        at most pdf_batch_concurrency batches in flight. Nothing is uploaded
+        per page or per batch.
+
+        Args:
+            storage_key: Storage key of the PDF
+            on_batch_converted: Called after each batch (e.g. activity heartbeat)
+
+        Returns:
+            Combined markdown, batches in page order
+        """
+        engine = get_extraction_engine()
+        base_name = storage_key.split("/")[-1].replace(".pdf", "")
+
+        fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+        try:
+            with os.fdopen(fd, "wb") as pdf_file:
+                await engine.download_to_file(
+                    self.storage_provider, storage_key, pdf_file
+                )
+
+            # PdfReader reads the whole file into memory up front, so the source
+            # is held once; memory is bounded by that copy plus the batch PDFs
+            # in flight, each capped by the page and byte limits below
+            pdf_reader = await asyncio.to_thread(PdfReader, pdf_path)
+            total_pages = len(pdf_reader.pages)
+            batches = self.plan_page_batches(
+                total_pages,
+                os.path.getsize(pdf_path),
+                settings.pdf_batch_max_pages,
+                settings.pdf_batch_max_bytes,
+            )
+            logger.info(
+                f"Converting {total_pages} pages of {storage_key} in "
+                f"{len(batches)} batches"
+            )
+
+            semaphore = asyncio.Semaphore(settings.pdf_batch_concurrency)
+            # PdfReader isn't thread-safe (it seeks one in-memory stream and fills
+            # a shared object cache as pages resolve), so page ranges are written
+            # one at a time; conversions still overlap
+            reader_lock = asyncio.Lock()
+
+            async def convert_batch(start: int, end: int) -> str:
+                async with semaphore:
+                    batch_fd, batch_path = tempfile.mkstemp(suffix=".pdf")
+                    os.close(batch_fd)
+                    try:
+                        async with reader_lock:
+                            await asyncio.to_thread(
+                                self._write_page_range,
+                                pdf_reader,
+                                start,
+                                end,
+                                batch_path,
+                            )
+                        result = await engine.convert_file(
+                            batch_path,
+                            mimetype="application/pdf",
+                            extension=".pdf",
+                            filename=f"{base_name}_pages_{start + 1}-{end}.pdf",
+                        )
+                    finally:
+                        os.unlink(batch_path)
+
+                if on_batch_converted:
+                    on_batch_converted()
+                return result.text_content.strip()
+
+            contents = await asyncio.gather(
+                *(convert_batch(start, end) for start, end in batches)
+            )
+        finally:
+            os.unlink(pdf_path)
+
+        logger.info(f"Converted {total_pages} pages of {storage_key} to markdown")
+        return "\n\n---\n\n".join(contents)
+
+    def _write_page_range(
+        self, pdf_reader: PdfReader, start: int, end: int, path: str
+    ) -> None:
+        """Write pages [start, end) to a new PDF file."""
+        with open(path, "wb") as batch_file:
+            chunk_buffer = self._create_chunk_pdf(pdf_reader, start, end)
+            batch_file.write(chunk_buffer.getbuffer())
+
     def _create_chunk_pdf(
         self, pdf_reader: PdfReader, chunk_start: int, chunk_end: int
     ) -> io.BytesIO:
@@ -116,23 +233,16 @@ class PdfService:
         logger.info(f"Converting page to markdown: {page_url}")
 
         try:
-            # Download the page PDF
             page_key = page_url.replace(f"s3://{settings.s3_bucket_name}/", "")
-            page_data = await self.storage_provider.download(page_key)
-
-            if not page_data:
-                raise ValueError(f"Failed to download page PDF from {page_url}")
 
-            # Use MarkItDown to extract markdown
-            file_stream = io.BytesIO(page_data)
-            stream_info = StreamInfo(
+            # Streamed to a temp file and converted in a worker process
+            result = await get_extraction_engine().convert_storage_object(
+                self.storage_provider,
+                page_key,
                 mimetype="application/pdf",
                 extension=".pdf",
                 filename=page_key.split("/")[-1],
             )
-            result = self.markitdown.convert_stream(
-                file_stream, stream_info=stream_info
-            )
 
             if result and result.text_content:
                 markdown_content = result.text_content.strip()
@@ -4,6 +4,7 @@ from datetime import datetime
 from temporalio.client import Client
 from temporalio.common import WorkflowIDConflictPolicy
 
+from common.core.config import settings
 from common.temporal.client import get_temporal_client as get_temporal_client_helper
 from packages.documents.repositories.document_extraction_job_repository import (
     DocumentExtractionJobRepository,
@@ -86,6 +87,7 @@ class TemporalDocumentExtractionService:
                 matrix_id=None,  # Documents are now standalone, no matrix association needed for extraction
                 extraction_job_id=extraction_job.id,
                 trace_headers=trace_headers,
+                pdf_batching=settings.pdf_batching_enabled,
             )
 
             # Start the workflow with deterministic ID for deduplication
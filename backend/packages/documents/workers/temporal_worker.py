@@ -12,6 +12,7 @@ from packages.documents.workflows import DocumentChunkingWorkflow
 from packages.documents.workflows.activities import (
     split_pdf_activity,
     convert_page_to_markdown_activity,
+    convert_pdf_in_batches_activity,
     extract_document_content_activity,
     save_extracted_content_to_s3_activity,
     combine_markdown_activity,
@@ -22,6 +23,7 @@ from packages.documents.workflows.activities import (
     queue_qa_jobs_for_document_activity,
     get_document_details_activity,
     index_document_for_search_activity,
+    cleanup_offloaded_payloads_activity,
     # Chunking activities
     get_chunking_strategy_activity,
     launch_chunking_activity,
@@ -81,9 +83,11 @@ class TemporalWorker:
                 "workflows": [PDFToMarkdownWorkflow],
                 "activities": [
                     split_pdf_activity,
+                    convert_pdf_in_batches_activity,
                     combine_markdown_activity,
                     save_markdown_to_s3_activity,
                     index_document_for_search_activity,
+                    cleanup_offloaded_payloads_activity,
                 ],
             },
             TaskQueueType.PAGE_CONVERSION.value: {
@@ -99,6 +103,7 @@ class TemporalWorker:
                     extract_document_content_activity,
                     save_extracted_content_to_s3_activity,
                     index_document_for_search_activity,
+                    cleanup_offloaded_payloads_activity,
                     update_document_completion_activity,
                     queue_qa_jobs_for_document_activity,
                 ],
@@ -127,6 +132,7 @@ class TemporalWorker:
                 "activities": [
                     split_pdf_activity,
                     convert_page_to_markdown_activity,
+                    convert_pdf_in_batches_activity,
                     extract_document_content_activity,
                     save_extracted_content_to_s3_activity,
                     combine_markdown_activity,
@@ -137,6 +143,7 @@ class TemporalWorker:
                     update_document_completion_activity,
                     queue_qa_jobs_for_document_activity,
                     index_document_for_search_activity,
+                    cleanup_offloaded_payloads_activity,
                     # Chunking activities
                     get_chunking_strategy_activity,
                     launch_chunking_activity,
@@ -5,11 +5,13 @@ Temporal activities for document extraction workflows.
 from .pdf_processing import (
     split_pdf_activity,
     convert_page_to_markdown_activity,
+    convert_pdf_in_batches_activity,
 )
 from .document_extraction import (
     extract_document_content_activity,
     save_extracted_content_to_s3_activity,
     index_document_for_search_activity,
+    cleanup_offloaded_payloads_activity,
 )
 from .markdown_processing import (
     combine_markdown_activity,
@@ -36,6 +38,7 @@ from .chunking_activities import (
 __all__ = [
     "split_pdf_activity",
     "convert_page_to_markdown_activity",
+    "convert_pdf_in_batches_activity",
     "extract_document_content_activity",
     "save_extracted_content_to_s3_activity",
     "combine_markdown_activity",
@@ -46,6 +49,7 @@ __all__ = [
     "queue_qa_jobs_for_document_activity",
     "get_document_details_activity",
     "index_document_for_search_activity",
+    "cleanup_offloaded_payloads_activity",
     # Chunking activities
     "get_chunking_strategy_activity",
     "launch_chunking_activity",
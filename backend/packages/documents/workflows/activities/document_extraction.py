@@ -8,6 +8,11 @@ import io
 from temporalio import activity
 
 from common.core.otel_axiom_exporter import create_span_with_context, get_logger
+from common.execution.workflow_framework.activity_helpers import (
+    delete_offloaded_payloads,
+    offload_payload,
+    resolve_payload,
+)
 from common.providers.storage.factory import get_storage
 from common.providers.storage.paths import get_document_extracted_path
 from packages.documents.providers.document_extraction.extractor_factory import (
@@ -29,7 +34,7 @@ async def extract_document_content_activity(
 ) -> str:
     """
     Extract content from any supported document type using appropriate extractor.
-    Returns extracted content as markdown/text.
+    Returns extracted content as markdown/text (a storage reference if large).
     """
     with create_span_with_context(
         "temporal::extract_document_content_activity", trace_headers
@@ -60,7 +65,7 @@ async def extract_document_content_activity(
             logger.info(
                 f"Successfully extracted content ({len(extracted_content)} characters)"
             )
-            return extracted_content
+            return await offload_payload(extracted_content)
 
         except Exception as e:
             logger.error(f"Error extracting document content: {e}")
@@ -93,6 +98,7 @@ async def save_extracted_content_to_s3_activity(
             s3_key = get_document_extracted_path(company_id, document_id)
 
             # Convert to bytes and upload
+            content = await resolve_payload(content)
             content_bytes = content.encode("utf-8")
             success = await storage_provider.upload(
                 s3_key,
@@ -136,7 +142,7 @@ async def index_document_for_search_activity(
             # Get search provider and index
             search_provider = get_document_search_provider()
             success = await search_provider.index_document(
-                document_model, extracted_content
+                document_model, await resolve_payload(extracted_content)
             )
 
             if success:
@@ -150,3 +156,12 @@ async def index_document_for_search_activity(
             logger.error(f"Error indexing document {document_id} for search: {e}")
             # Don't raise - we don't want indexing failures to fail the entire extraction workflow
             return False
+
+
+@activity.defn
+async def cleanup_offloaded_payloads_activity(trace_headers: dict = None) -> int:
+    """Delete payloads the calling workflow run offloaded to storage."""
+    with create_span_with_context(
+        "temporal::cleanup_offloaded_payloads_activity", trace_headers
+    ):
+        return await delete_offloaded_payloads()
@@ -4,6 +4,10 @@ from typing import List
 from temporalio import activity
 
 from common.core.otel_axiom_exporter import create_span_with_context, get_logger
+from common.execution.workflow_framework.activity_helpers import (
+    offload_payload,
+    resolve_payload,
+)
 from common.providers.storage.factory import get_storage
 from common.providers.storage.paths import get_document_extracted_path
 from packages.documents.workflows.common import MarkdownPage
@@ -16,10 +20,10 @@ logger = get_logger(__name__)
 async def combine_markdown_activity(
     pages: List[MarkdownPage], trace_headers: dict = None
 ) -> str:
-    """Combine all markdown pages in order."""
+    """Combine all markdown pages in order (a storage reference if large)."""
     with create_span_with_context("temporal::combine_markdown_activity", trace_headers):
         combined = "\n\n---\n\n".join(page.content for page in pages)
-        return combined
+        return await offload_payload(combined)
 
 
 @activity.defn
@@ -48,6 +52,7 @@ async def save_markdown_to_s3_activity(
             s3_key = get_document_extracted_path(company_id, document_id)
 
             # Convert to bytes and upload
+            markdown_content = await resolve_payload(markdown_content)
             markdown_bytes = markdown_content.encode("utf-8")
             success = await storage_provider.upload(
                 s3_key,
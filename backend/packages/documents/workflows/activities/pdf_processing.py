@@ -4,6 +4,7 @@ from temporalio import activity
 
 from common.core.otel_axiom_exporter import create_span_with_context, get_logger
 from common.core.config import settings
+from common.execution.workflow_framework.activity_helpers import offload_payload
 from packages.documents.services.pdf_service import PdfService
 from packages.documents.services.document_service import get_document_service
 
@@ -43,3 +44,28 @@ async def convert_page_to_markdown_activity(
     ):
         pdf_service = PdfService()
         return await pdf_service.convert_page_to_markdown(page_url)
+
+
+@activity.defn
+async def convert_pdf_in_batches_activity(
+    document_id: int, trace_headers: dict = None
+) -> str:
+    """
+    Convert a whole PDF to markdown in page-range batches.
+    Returns the combined markdown, a storage reference if large (heartbeats
+    after each batch).
+    """
+    with create_span_with_context(
+        "temporal::convert_pdf_in_batches_activity", trace_headers
+    ):
+        document_service = get_document_service()
+        document = await document_service.get_document(document_id)
+
+        if not document:
+            raise ValueError(f"Document {document_id} not found")
+
+        pdf_service = PdfService()
+        markdown = await pdf_service.convert_pdf_in_batches(
+            document.storage_key, on_batch_converted=activity.heartbeat
+        )
+        return await offload_payload(markdown)
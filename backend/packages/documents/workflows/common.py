@@ -61,6 +61,10 @@ class DocumentProcessingInput(BaseModel):
     trace_headers: Optional[Dict[str, str]] = Field(
         default_factory=dict, description="OpenTelemetry trace context headers"
     )
+    pdf_batching: bool = Field(
+        default=False,
+        description="Convert PDFs in page-range batches instead of per-page child workflows",
+    )
 
 
 # For backward compatibility
@@ -78,10 +82,12 @@ UPDATE_DOCUMENT_CONTENT_PATH_ACTIVITY = "update_document_content_path_activity"
 UPDATE_DOCUMENT_COMPLETION_ACTIVITY = "update_document_completion_activity"
 QUEUE_QA_JOBS_FOR_DOCUMENT_ACTIVITY = "queue_qa_jobs_for_document_activity"
 GET_DOCUMENT_DETAILS_ACTIVITY = "get_document_details_activity"
+CLEANUP_OFFLOADED_PAYLOADS_ACTIVITY = "cleanup_offloaded_payloads_activity"
 
 # PDF-specific activities (for multi-page processing)
 SPLIT_PDF_ACTIVITY = "split_pdf_activity"
 CONVERT_PAGE_TO_MARKDOWN_ACTIVITY = "convert_page_to_markdown_activity"
+CONVERT_PDF_IN_BATCHES_ACTIVITY = "convert_pdf_in_batches_activity"
 COMBINE_MARKDOWN_ACTIVITY = "combine_markdown_activity"
 SAVE_MARKDOWN_TO_S3_ACTIVITY = "save_markdown_to_s3_activity"
 
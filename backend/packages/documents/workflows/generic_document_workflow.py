@@ -4,6 +4,8 @@ Handles Word, Excel, PowerPoint, images, text files, etc.
 """
 
 from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ActivityError
 from datetime import timedelta
 
 from .common import (
@@ -12,6 +14,7 @@ from .common import (
     SAVE_EXTRACTED_CONTENT_TO_S3_ACTIVITY,
     INDEX_DOCUMENT_FOR_SEARCH_ACTIVITY,
     GET_DOCUMENT_DETAILS_ACTIVITY,
+    CLEANUP_OFFLOADED_PAYLOADS_ACTIVITY,
 )
 
 
@@ -27,6 +30,19 @@ class GenericDocumentWorkflow:
             f"Starting generic document extraction for document {input_data.document_id}"
         )
 
+        try:
+            s3_key = await self._extract_and_save(input_data)
+        finally:
+            # Large content is passed between activities by storage reference
+            await self._cleanup_offloaded_payloads(input_data)
+
+        workflow.logger.info(
+            f"Generic document extraction completed for document {input_data.document_id}"
+        )
+        return s3_key
+
+    async def _extract_and_save(self, input_data: DocumentProcessingInput) -> str:
+        """Extract the document's content, save it to S3 and index it."""
         # Step 1: Get document details to retrieve company_id
         document_details = await workflow.execute_activity(
             GET_DOCUMENT_DETAILS_ACTIVITY,
@@ -48,7 +64,7 @@ class GenericDocumentWorkflow:
         )
 
         workflow.logger.info(
-            f"Extracted {len(extracted_content)} characters from document {input_data.document_id}"
+            f"Extracted content from document {input_data.document_id}"
         )
 
         # Step 3: Save extracted content to S3
@@ -72,8 +88,18 @@ class GenericDocumentWorkflow:
             ],
             start_to_close_timeout=timedelta(minutes=2),
         )
-
-        workflow.logger.info(
-            f"Generic document extraction completed for document {input_data.document_id}"
-        )
         return s3_key
+
+    async def _cleanup_offloaded_payloads(
+        self, input_data: DocumentProcessingInput
+    ) -> None:
+        """Delete payloads this run offloaded; failures only leave orphans."""
+        try:
+            await workflow.execute_activity(
+                CLEANUP_OFFLOADED_PAYLOADS_ACTIVITY,
+                args=[input_data.trace_headers],
+                start_to_close_timeout=timedelta(minutes=2),
+                retry_policy=RetryPolicy(maximum_attempts=3),
+            )
+        except ActivityError as e:
+            workflow.logger.warning(f"Failed to clean up offloaded payloads: {e}")
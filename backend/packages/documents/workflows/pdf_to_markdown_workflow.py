@@ -4,6 +4,8 @@ Orchestrates the complete PDF extraction process.
 """
 
 from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ActivityError
 from datetime import timedelta
 import asyncio
 
@@ -11,9 +13,11 @@ from .common import (
     PDFProcessingInput,
     TaskQueueType,
     SPLIT_PDF_ACTIVITY,
+    CONVERT_PDF_IN_BATCHES_ACTIVITY,
     COMBINE_MARKDOWN_ACTIVITY,
     SAVE_MARKDOWN_TO_S3_ACTIVITY,
     INDEX_DOCUMENT_FOR_SEARCH_ACTIVITY,
+    CLEANUP_OFFLOADED_PAYLOADS_ACTIVITY,
 )
 from .convert_page_workflow import ConvertPageWorkflow
 
@@ -28,11 +32,82 @@ class PDFToMarkdownWorkflow:
         2. Launches child workflows to convert each page to markdown
         3. Combines all markdown content in order
         4. Returns S3 key (status updates handled by parent workflow)
+
+        With pdf_batching, steps 1-3 run as a single activity converting
+        page-range batches in-process.
         """
         workflow.logger.info(
             f"Starting PDF to Markdown workflow for document {input_data.document_id}"
         )
 
+        try:
+            s3_key = await self._convert_and_save(input_data)
+        finally:
+            # Large markdown is passed between activities by storage reference
+            await self._cleanup_offloaded_payloads(input_data)
+
+        workflow.logger.info(
+            f"PDF to Markdown workflow completed successfully for document {input_data.document_id}"
+        )
+        return s3_key
+
+    async def _convert_and_save(self, input_data: PDFProcessingInput) -> str:
+        """Convert the PDF to markdown, save it to S3 and index it."""
+        if input_data.pdf_batching:
+            # Steps 1-4 in one activity: page-range batches from a single
+            # download, no per-page objects or child workflows
+            combined_markdown = await workflow.execute_activity(
+                CONVERT_PDF_IN_BATCHES_ACTIVITY,
+                args=[input_data.document_id, input_data.trace_headers],
+                start_to_close_timeout=timedelta(minutes=60),
+                heartbeat_timeout=timedelta(minutes=10),
+            )
+        else:
+            combined_markdown = await self._convert_pages(input_data)
+
+        # Step 5: Save combined markdown to S3
+        s3_key = await workflow.execute_activity(
+            SAVE_MARKDOWN_TO_S3_ACTIVITY,
+            args=[
+                combined_markdown,
+                input_data.document_id,
+                input_data.trace_headers,
+            ],
+            start_to_close_timeout=timedelta(minutes=2),
+        )
+
+        # Step 6: Index document for search with extracted content
+        await workflow.execute_activity(
+            INDEX_DOCUMENT_FOR_SEARCH_ACTIVITY,
+            args=[
+                input_data.document_id,
+                combined_markdown,
+                input_data.trace_headers,
+            ],
+            start_to_close_timeout=timedelta(minutes=2),
+            # retry_policy=workflow.RetryPolicy(
+            #    initial_interval=timedelta(seconds=1),
+            #    maximum_interval=timedelta(seconds=30),
+            #    maximum_attempts=3,
+            #    non_retryable_error_types=[]
+            # ),
+        )
+        return s3_key
+
+    async def _cleanup_offloaded_payloads(self, input_data: PDFProcessingInput) -> None:
+        """Delete payloads this run offloaded; failures only leave orphans."""
+        try:
+            await workflow.execute_activity(
+                CLEANUP_OFFLOADED_PAYLOADS_ACTIVITY,
+                args=[input_data.trace_headers],
+                start_to_close_timeout=timedelta(minutes=2),
+                retry_policy=RetryPolicy(maximum_attempts=3),
+            )
+        except ActivityError as e:
+            workflow.logger.warning(f"Failed to clean up offloaded payloads: {e}")
+
+    async def _convert_pages(self, input_data: PDFProcessingInput) -> str:
+        """Split into per-page objects and convert each in a child workflow."""
         # Step 1: Split PDF into pages
         page_urls = await workflow.execute_activity(
             SPLIT_PDF_ACTIVITY,
@@ -68,35 +143,4 @@ class PDFToMarkdownWorkflow:
             start_to_close_timeout=timedelta(minutes=2),
         )
 
-        # Step 5: Save combined markdown to S3
-        s3_key = await workflow.execute_activity(
-            SAVE_MARKDOWN_TO_S3_ACTIVITY,
-            args=[
-                combined_markdown,
-                input_data.document_id,
-                input_data.trace_headers,
-            ],
-            start_to_close_timeout=timedelta(minutes=2),
-        )
-
-        # Step 6: Index document for search with extracted content
-        await workflow.execute_activity(
-            INDEX_DOCUMENT_FOR_SEARCH_ACTIVITY,
-            args=[
-                input_data.document_id,
-                combined_markdown,
-                input_data.trace_headers,
-            ],
-            start_to_close_timeout=timedelta(minutes=2),
-            # retry_policy=workflow.RetryPolicy(
-            #    initial_interval=timedelta(seconds=1),
-            #    maximum_interval=timedelta(seconds=30),
-            #    maximum_attempts=3,
-            #    non_retryable_error_types=[]
-            # ),
-        )
-
-        workflow.logger.info(
-            f"PDF to Markdown workflow completed successfully for document {input_data.document_id}"
-        )
-        return s3_key
+        return combined_markdown
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import enum
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel, field_validator
 
 from packages.matrices.models.domain.matrix_enums import MatrixType, CellType
@@ -92,6 +92,23 @@ class MatrixCellUpdateModel(BaseModel):
         return v
 
 
+class MatrixDuplicationResultModel(BaseModel):
+    """Row counts from copying one matrix's contents into another."""
+
+    members_copied: Dict[int, int] = {}  # {source_entity_set_id: members_count}
+    questions_copied: int = 0
+    cells_copied: int = 0  # Cells copied with their current answer sets
+
+
+class MatrixCellBatchResultModel(BaseModel):
+    """Counts from creating matrix cells and QA jobs in committed chunks."""
+
+    cells_created: int = 0
+    jobs_created: int = 0
+    chunks_committed: int = 0
+    jobs_requeued: int = 0  # Left unpublished by an interrupted earlier run
+
+
 class MatrixCellStatsModel(BaseModel):
     """Model for matrix cell statistics by status."""
 
@@ -136,3 +153,10 @@ class MatrixCellModel(BaseModel):
                     return status
             return v
         return v
+
+
+class MatrixReprocessPlanModel(BaseModel):
+    """Cells reset to pending for a reprocess request, with their question IDs."""
+
+    cells: List[MatrixCellModel] = []
+    question_ids: List[int] = []  # Distinct question entity IDs, for agentic quota
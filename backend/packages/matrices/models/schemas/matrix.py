@@ -312,6 +312,8 @@ class MatrixDuplicateRequest(BaseModel):
     description: Optional[str] = None
     entity_set_ids: List[int]  # Which entity sets to copy members from
     template_variable_overrides: Optional[List[TemplateVariableOverride]] = None
+    # Copy completed cells and their current answers instead of re-running QA
+    copy_answers: bool = False
 
     model_config = ConfigDict(
         alias_generator=to_camel,
@@ -326,6 +328,23 @@ class MatrixDuplicateResponse(BaseModel):
     duplicate_matrix_id: int
     entity_sets_duplicated: Dict[int, int]  # {source_entity_set_id: members_count}
     cells_created: int
+    # False if cell creation stopped part way; resume the duplicate to finish
+    complete: bool = True
+    message: str
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,  # Allows population by both original name and alias
+    )
+
+
+class MatrixDuplicateResumeResponse(BaseModel):
+    """Response schema for resuming a duplicate's cell creation."""
+
+    duplicate_matrix_id: int
+    cells_created: int  # Created by this call
+    jobs_requeued: int  # Committed earlier but never published
+    complete: bool
     message: str
 
     model_config = ConfigDict(
@@ -4,6 +4,7 @@ from .matrix_template_variable_repository import MatrixTemplateVariableRepositor
 from .entity_set_repository import EntitySetRepository
 from .entity_set_member_repository import EntitySetMemberRepository
 from .cell_entity_reference_repository import CellEntityReferenceRepository
+from .matrix_duplication_repository import MatrixDuplicationRepository
 
 __all__ = [
     "MatrixRepository",
@@ -12,4 +13,5 @@ __all__ = [
     "EntitySetRepository",
     "EntitySetMemberRepository",
     "CellEntityReferenceRepository",
+    "MatrixDuplicationRepository",
 ]
@@ -5,12 +5,14 @@ Manages the matrix_entity_set_members table, which links entities
 (documents or questions) to entity sets with ordering.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from sqlalchemy.future import select
-from sqlalchemy import update
+from sqlalchemy import func, update
 
 from common.repositories.base import BaseRepository
+from packages.matrices.models.database.matrix import MatrixCellEntity
 from packages.matrices.models.database.matrix_entity_set import (
+    MatrixCellEntityReferenceEntity,
     MatrixEntitySetMemberEntity,
 )
 from packages.matrices.models.domain.matrix_entity_set import (
@@ -156,6 +158,112 @@ class EntitySetMemberRepository(
             result = await session.execute(query)
             return [row[0] for row in result.fetchall()]
 
+    @trace_span
+    async def soft_delete_with_cells(
+        self, matrix_id: int, entity_set_id: int, entity_ids: List[int]
+    ) -> Tuple[int, int]:
+        """Soft delete the members for entity IDs and every cell that references them.
+
+        Members, the cells referencing them (any role) and those cells' entity
+        refs are marked deleted set-wise; on Postgres this is one statement
+        using data-modifying CTEs. Members are deleted even if they have no
+        cells.
+
+        Returns:
+            Tuple of (members_deleted, cells_deleted)
+        """
+        if not entity_ids:
+            return 0, 0
+
+        member = self.entity_class
+        ref = MatrixCellEntityReferenceEntity
+        cell = MatrixCellEntity
+        member_filter = (
+            member.entity_set_id == entity_set_id,
+            member.entity_id.in_(entity_ids),
+            member.deleted == False,  # noqa
+        )
+
+        def referencing_cell_ids(member_ids):
+            return select(ref.matrix_cell_id).where(
+                ref.matrix_id == matrix_id,
+                ref.entity_set_id == entity_set_id,
+                ref.entity_set_member_id.in_(member_ids),
+                ref.deleted == False,  # noqa
+            )
+
+        async with self._get_session() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                deleted_members = (
+                    update(member)
+                    .where(*member_filter)
+                    .values(deleted=True)
+                    .returning(member.id)
+                    .cte("deleted_members")
+                )
+                # Every sub-statement sees the pre-statement snapshot, so refs
+                # are read and updated independently
+                cell_ids = referencing_cell_ids(select(deleted_members.c.id)).cte(
+                    "member_cells"
+                )
+                deleted_cells = (
+                    update(cell)
+                    .where(
+                        cell.id.in_(select(cell_ids.c.matrix_cell_id)),
+                        cell.deleted == False,  # noqa
+                    )
+                    .values(deleted=True)
+                    .returning(cell.id)
+                    .cte("deleted_cells")
+                )
+                deleted_refs = (
+                    update(ref)
+                    .where(
+                        ref.matrix_cell_id.in_(select(cell_ids.c.matrix_cell_id)),
+                        ref.deleted == False,  # noqa
+                    )
+                    .values(deleted=True)
+                    .returning(ref.id)
+                    .cte("deleted_refs")
+                )
+                result = await session.execute(
+                    select(
+                        *(
+                            select(func.count()).select_from(deleted).scalar_subquery()
+                            for deleted in (
+                                deleted_members,
+                                deleted_cells,
+                                deleted_refs,
+                            )
+                        )
+                    )
+                )
+                member_count, cell_count, _ = result.one()
+                return member_count, cell_count
+
+            # Cells and refs first: both are found through the members
+            cell_ids = referencing_cell_ids(select(member.id).where(*member_filter))
+            result = await session.execute(
+                update(cell)
+                .where(cell.id.in_(cell_ids), cell.deleted == False)  # noqa
+                .values(deleted=True)
+                .execution_options(synchronize_session=False)
+            )
+            cell_count = result.rowcount
+            await session.execute(
+                update(ref)
+                .where(ref.matrix_cell_id.in_(cell_ids), ref.deleted == False)  # noqa
+                .values(deleted=True)
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(
+                update(member)
+                .where(*member_filter)
+                .values(deleted=True)
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount, cell_count
+
     @trace_span
     async def get_members_by_entity_id(
         self,
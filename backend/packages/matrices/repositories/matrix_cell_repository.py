@@ -1,12 +1,14 @@
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, or_, true
 
 from common.core.otel_axiom_exporter import trace_span, get_logger
 from common.repositories.base import BaseRepository
 from sqlalchemy import exists
 from packages.matrices.models.database import (
     MatrixCellEntity,
+    MatrixCellEntityReferenceEntity,
+    MatrixEntitySetMemberEntity,
 )
 from packages.matrices.models.domain.matrix import (
     MatrixCellModel,
@@ -14,7 +16,9 @@ from packages.matrices.models.domain.matrix import (
     MatrixCellUpdateModel,
     MatrixCellStatus,
     MatrixCellStatsModel,
+    MatrixReprocessPlanModel,
 )
+from packages.matrices.models.domain.matrix_enums import EntityRole
 
 logger = get_logger(__name__)
 
@@ -129,6 +133,40 @@ class MatrixCellRepository(BaseRepository[MatrixCellEntity, MatrixCellModel]):
             result = await session.execute(query)
             return result.scalar()
 
+    @trace_span
+    async def get_existing_signatures(
+        self,
+        matrix_id: int,
+        signatures: List[str],
+        company_id: Optional[int] = None,
+        batch_size: int = 5000,
+    ) -> Set[str]:
+        """Return which of the given cell signatures already exist in the matrix.
+
+        Only signatures are read (no cell or entity ref rows), matching the
+        partial unique index on (matrix_id, cell_signature) for non-deleted cells.
+        """
+        existing: Set[str] = set()
+        unique_signatures = list(dict.fromkeys(signatures))
+        if not unique_signatures:
+            return existing
+
+        async with self._get_session() as session:
+            for i in range(0, len(unique_signatures), batch_size):
+                query = select(self.entity_class.cell_signature).where(
+                    self.entity_class.matrix_id == matrix_id,
+                    self.entity_class.cell_signature.in_(
+                        unique_signatures[i : i + batch_size]
+                    ),
+                    self.entity_class.deleted == False,  # noqa
+                )
+                if company_id is not None:
+                    query = self._add_company_filter(query, company_id)
+                result = await session.execute(query)
+                existing.update(result.scalars().all())
+
+        return existing
+
     @trace_span
     async def bulk_update_cells_to_pending(self, cell_ids: List[int]) -> int:
         """Bulk update matrix cells to pending status and clear current_answer_set_id."""
@@ -146,6 +184,114 @@ class MatrixCellRepository(BaseRepository[MatrixCellEntity, MatrixCellModel]):
             await session.flush()
             return result.rowcount
 
+    @trace_span
+    async def mark_cells_pending_for_reprocess(
+        self,
+        matrix_id: int,
+        whole_matrix: bool = False,
+        entity_set_filters: Optional[List[Tuple[int, List[int]]]] = None,
+        cell_ids: Optional[List[int]] = None,
+    ) -> MatrixReprocessPlanModel:
+        """Reset the cells selected by a reprocess request to pending in one statement.
+
+        Cells match if the whole matrix is requested, if they reference any of the
+        given entities in the given entity set (any role), or if their ID is listed.
+        On Postgres the UPDATE also returns each cell's question entity ID, so
+        callers need no further reads to queue jobs or check quotas.
+
+        Args:
+            matrix_id: Matrix whose cells are reprocessed
+            whole_matrix: Select every non-deleted cell in the matrix
+            entity_set_filters: (entity_set_id, entity_ids) pairs
+            cell_ids: Explicit cell IDs (IDs outside the matrix are ignored)
+        """
+        cell = self.entity_class
+        ref = MatrixCellEntityReferenceEntity
+        member = MatrixEntitySetMemberEntity
+
+        criteria = []
+        if whole_matrix:
+            criteria.append(true())
+        for entity_set_id, entity_ids in entity_set_filters or []:
+            if not entity_ids:
+                continue
+            criteria.append(
+                cell.id.in_(
+                    select(ref.matrix_cell_id)
+                    .join(member, member.id == ref.entity_set_member_id)
+                    .where(
+                        ref.matrix_id == matrix_id,
+                        ref.entity_set_id == entity_set_id,
+                        ref.deleted == False,  # noqa
+                        member.entity_set_id == entity_set_id,
+                        member.entity_id.in_(entity_ids),
+                        member.deleted == False,  # noqa
+                    )
+                )
+            )
+        if cell_ids:
+            criteria.append(cell.id.in_(cell_ids))
+
+        if not criteria:
+            return MatrixReprocessPlanModel()
+
+        selected = (
+            cell.matrix_id == matrix_id,
+            cell.deleted == False,  # noqa
+            or_(*criteria),
+        )
+        question_ids = (
+            select(member.entity_id)
+            .join(ref, ref.entity_set_member_id == member.id)
+            .where(
+                ref.role == EntityRole.QUESTION.value,
+                ref.deleted == False,  # noqa
+            )
+        )
+        mark_pending = (
+            update(cell)
+            .where(*selected)
+            .values(status=MatrixCellStatus.PENDING.value, current_answer_set_id=None)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+        async with self._get_session() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                # Each cell's question comes back as a correlated RETURNING column
+                question_id = (
+                    question_ids.where(ref.matrix_cell_id == cell.id)
+                    .limit(1)
+                    .correlate(cell)
+                    .scalar_subquery()
+                )
+                rows = (
+                    await session.execute(mark_pending.returning(cell, question_id))
+                ).all()
+                entities = [row[0] for row in rows]
+                found_question_ids = {row[1] for row in rows if row[1] is not None}
+            else:
+                # SQLite renders RETURNING columns unqualified, so a correlated
+                # subquery there is ambiguous; read the questions afterwards.
+                # The selection doesn't depend on status, so it still matches.
+                entities = (
+                    (await session.execute(mark_pending.returning(cell)))
+                    .scalars()
+                    .all()
+                )
+                found_question_ids = set()
+                if entities:
+                    result = await session.execute(
+                        question_ids.where(
+                            ref.matrix_cell_id.in_(select(cell.id).where(*selected))
+                        )
+                    )
+                    found_question_ids = set(result.scalars().all())
+
+        return MatrixReprocessPlanModel(
+            cells=self._entities_to_domain(entities),
+            question_ids=sorted(found_question_ids),
+        )
+
     @trace_span
     async def bulk_soft_delete_by_cell_ids(self, cell_ids: List[int]) -> int:
         """Bulk soft delete matrix cells by cell IDs."""
@@ -0,0 +1,771 @@
+"""
+Set-wise matrix duplication.
+
+Each copied table is written with one INSERT ... SELECT. New primary keys are
+allocated up front into a temporary (kind, old_id, new_id) mapping table and
+child rows join through it for their new foreign keys, so a copy is a fixed
+number of statements however many questions, members or cells the matrix has.
+"""
+
+import hashlib
+from collections import defaultdict
+from typing import Dict
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    MetaData,
+    String,
+    Table,
+    and_,
+    cast,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.schema import CreateTable, DropTable
+
+from common.core.otel_axiom_exporter import get_logger, trace_span
+from common.repositories.base import BaseRepository
+from packages.matrices.models.database.matrix import MatrixCellEntity, MatrixEntity
+from packages.matrices.models.database.matrix_entity_set import (
+    MatrixCellEntityReferenceEntity,
+    MatrixEntitySetMemberEntity,
+)
+from packages.matrices.models.domain.matrix import (
+    MatrixCellStatus,
+    MatrixDuplicationResultModel,
+    MatrixModel,
+)
+from packages.matrices.models.domain.matrix_enums import EntityType
+from packages.qa.models.database.answer import AnswerEntity
+from packages.qa.models.database.answer_set import AnswerSetEntity
+from packages.qa.models.database.citation import CitationEntity, CitationSetEntity
+from packages.questions.models.database.question import QuestionEntity
+from packages.questions.models.database.question_option import (
+    QuestionOptionEntity,
+    QuestionOptionSetEntity,
+)
+from packages.questions.models.database.question_template_variable import (
+    QuestionTemplateVariableEntity,
+)
+
+logger = get_logger(__name__)
+
+# Not on Base.metadata, so create_all/alembic never see it
+_metadata = MetaData()
+
+_id_map = Table(
+    "matrix_duplication_id_map",
+    _metadata,
+    Column("kind", String, primary_key=True),
+    Column("old_id", BigInteger, primary_key=True),
+    Column("new_id", BigInteger, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# Mapping kinds
+_ENTITY_SET = "entity_set"
+_TEMPLATE_VARIABLE = "template_variable"
+_QUESTION = "question"
+_OPTION_SET = "option_set"
+_MEMBER = "member"
+_CELL = "cell"
+_ANSWER_SET = "answer_set"
+_ANSWER = "answer"
+_CITATION_SET = "citation_set"
+
+
+def _mapped(kind: str):
+    """Alias of the mapping table restricted (via join conditions) to one kind."""
+    return _id_map.alias(f"{kind}_map")
+
+
+def _maps(mapping, kind: str, old_id):
+    return and_(mapping.c.kind == kind, mapping.c.old_id == old_id)
+
+
+class MatrixDuplicationRepository(BaseRepository[MatrixEntity, MatrixModel]):
+    """Copies a matrix's questions, members, cells and answers set-wise."""
+
+    def __init__(self):
+        super().__init__(MatrixEntity, MatrixModel)
+
+    @trace_span
+    async def copy_matrix_contents(
+        self,
+        source_matrix_id: int,
+        target_matrix_id: int,
+        entity_set_id_mapping: Dict[int, int],
+        template_variable_id_mapping: Dict[int, int],
+        copy_questions: bool,
+        copy_answers: bool = False,
+    ) -> MatrixDuplicationResultModel:
+        """
+        Copy matrix contents into an existing target matrix.
+
+        Args:
+            source_matrix_id: Matrix to copy from
+            target_matrix_id: Matrix to copy into (entity sets and template
+                variables already created)
+            entity_set_id_mapping: Source entity set ID -> target entity set ID;
+                only members of these sets are copied
+            template_variable_id_mapping: Source -> target template variable ID,
+                used to rewrite question text and associations
+            copy_questions: Copy the source matrix's questions, options and
+                template variable associations
+            copy_answers: Also copy completed cells whose coordinates were all
+                copied, together with their current answer sets, answers and
+                citations
+
+        Returns:
+            Row counts for the copy
+        """
+        result = MatrixDuplicationResultModel(
+            members_copied={source_id: 0 for source_id in entity_set_id_mapping}
+        )
+        if not entity_set_id_mapping:
+            return result
+
+        async with self._get_session() as session:
+            await session.execute(CreateTable(_id_map))
+
+            await session.execute(
+                insert(_id_map),
+                [
+                    {"kind": _ENTITY_SET, "old_id": old_id, "new_id": new_id}
+                    for old_id, new_id in entity_set_id_mapping.items()
+                ]
+                + [
+                    {"kind": _TEMPLATE_VARIABLE, "old_id": old_id, "new_id": new_id}
+                    for old_id, new_id in template_variable_id_mapping.items()
+                ],
+            )
+
+            if copy_questions:
+                result.questions_copied = await self._copy_questions(
+                    session,
+                    source_matrix_id,
+                    target_matrix_id,
+                    template_variable_id_mapping,
+                )
+
+            result.members_copied.update(await self._copy_members(session))
+
+            if copy_answers:
+                result.cells_copied = await self._copy_cells(
+                    session, source_matrix_id, target_matrix_id
+                )
+                if result.cells_copied:
+                    await self._copy_current_answer_sets(session, target_matrix_id)
+
+            await session.execute(DropTable(_id_map))
+
+        logger.info(
+            f"Copied matrix {source_matrix_id} into {target_matrix_id}: "
+            f"{result.questions_copied} questions, "
+            f"{sum(result.members_copied.values())} members, "
+            f"{result.cells_copied} cells"
+        )
+        return result
+
+    async def _allocate_ids(
+        self, session: AsyncSession, kind: str, entity_class, source_ids
+    ) -> int:
+        """
+        Map each source ID to a new primary key for ``entity_class``.
+
+        Postgres draws the keys from the table's sequence, so concurrent
+        inserts can't collide with them; other dialects (SQLite in tests)
+        number up from the current max ID.
+
+        Args:
+            source_ids: Select of one column holding the source row IDs
+
+        Returns:
+            Number of IDs allocated
+        """
+        source = source_ids.subquery()
+        old_id = source.c[0]
+        if session.get_bind().dialect.name == "postgresql":
+            new_id = func.nextval(
+                func.pg_get_serial_sequence(entity_class.__tablename__, "id")
+            )
+        else:
+            new_id = select(
+                func.coalesce(func.max(entity_class.id), 0)
+            ).scalar_subquery() + func.row_number().over(order_by=old_id)
+
+        result = await session.execute(
+            insert(_id_map).from_select(
+                ["kind", "old_id", "new_id"],
+                select(literal(kind), old_id, new_id),
+            )
+        )
+        return result.rowcount
+
+    async def _copy_questions(
+        self,
+        session: AsyncSession,
+        source_matrix_id: int,
+        target_matrix_id: int,
+        template_variable_id_mapping: Dict[int, int],
+    ) -> int:
+        """Copy questions, their option sets and template variable associations."""
+        copied = await self._allocate_ids(
+            session,
+            _QUESTION,
+            QuestionEntity,
+            select(QuestionEntity.id).where(
+                QuestionEntity.matrix_id == source_matrix_id,
+                QuestionEntity.deleted == False,  # noqa
+            ),
+        )
+        if not copied:
+            return 0
+
+        # New IDs are all above any existing ID, so a rewritten reference is
+        # never rewritten again by a later replace()
+        question_text = QuestionEntity.question_text
+        for old_id, new_id in template_variable_id_mapping.items():
+            question_text = func.replace(
+                question_text, f"#{{{{{old_id}}}}}", f"#{{{{{new_id}}}}}"
+            )
+
+        question_map = _mapped(_QUESTION)
+        await session.execute(
+            insert(QuestionEntity).from_select(
+                [
+                    "id",
+                    "question_text",
+                    "matrix_id",
+                    "company_id",
+                    "question_type_id",
+                    "ai_model_id",
+                    "ai_config_override",
+                    "label",
+                    "min_answers",
+                    "max_answers",
+                    "use_agent_qa",
+                ],
+                select(
+                    question_map.c.new_id,
+                    question_text,
+                    literal(target_matrix_id),
+                    QuestionEntity.company_id,
+                    QuestionEntity.question_type_id,
+                    QuestionEntity.ai_model_id,
+                    QuestionEntity.ai_config_override,
+                    QuestionEntity.label,
+                    QuestionEntity.min_answers,
+                    QuestionEntity.max_answers,
+                    QuestionEntity.use_agent_qa,
+                )
+                .select_from(QuestionEntity)
+                .join(question_map, _maps(question_map, _QUESTION, QuestionEntity.id)),
+            )
+        )
+
+        option_set_map = _mapped(_OPTION_SET)
+        await self._allocate_ids(
+            session,
+            _OPTION_SET,
+            QuestionOptionSetEntity,
+            select(QuestionOptionSetEntity.id).join(
+                question_map,
+                _maps(question_map, _QUESTION, QuestionOptionSetEntity.question_id),
+            ),
+        )
+        await session.execute(
+            insert(QuestionOptionSetEntity).from_select(
+                ["id", "question_id"],
+                select(option_set_map.c.new_id, question_map.c.new_id)
+                .select_from(QuestionOptionSetEntity)
+                .join(
+                    option_set_map,
+                    _maps(option_set_map, _OPTION_SET, QuestionOptionSetEntity.id),
+                )
+                .join(
+                    question_map,
+                    _maps(question_map, _QUESTION, QuestionOptionSetEntity.question_id),
+                ),
+            )
+        )
+        await session.execute(
+            insert(QuestionOptionEntity).from_select(
+                ["option_set_id", "value"],
+                select(option_set_map.c.new_id, QuestionOptionEntity.value)
+                .select_from(QuestionOptionEntity)
+                .join(
+                    option_set_map,
+                    _maps(
+                        option_set_map,
+                        _OPTION_SET,
+                        QuestionOptionEntity.option_set_id,
+                    ),
+                )
+                .order_by(QuestionOptionEntity.id),
+            )
+        )
+
+        if template_variable_id_mapping:
+            template_variable_map = _mapped(_TEMPLATE_VARIABLE)
+            await session.execute(
+                insert(QuestionTemplateVariableEntity).from_select(
+                    ["question_id", "template_variable_id", "company_id"],
+                    select(
+                        question_map.c.new_id,
+                        template_variable_map.c.new_id,
+                        QuestionTemplateVariableEntity.company_id,
+                    )
+                    .select_from(QuestionTemplateVariableEntity)
+                    .join(
+                        question_map,
+                        _maps(
+                            question_map,
+                            _QUESTION,
+                            QuestionTemplateVariableEntity.question_id,
+                        ),
+                    )
+                    .join(
+                        template_variable_map,
+                        _maps(
+                            template_variable_map,
+                            _TEMPLATE_VARIABLE,
+                            QuestionTemplateVariableEntity.template_variable_id,
+                        ),
+                    )
+                    .where(QuestionTemplateVariableEntity.deleted == False),  # noqa
+                )
+            )
+
+        return copied
+
+    async def _copy_members(self, session: AsyncSession) -> Dict[int, int]:
+        """
+        Copy members of the mapped entity sets.
+
+        Question members point at the copied questions; a question member
+        whose question wasn't copied (deleted) is dropped.
+
+        Returns:
+            Members copied per source entity set
+        """
+        member = MatrixEntitySetMemberEntity
+        entity_set_map = _mapped(_ENTITY_SET)
+        question_map = _mapped(_QUESTION)
+        member_map = _mapped(_MEMBER)
+
+        def from_members(query):
+            return (
+                query.select_from(member)
+                .join(
+                    entity_set_map,
+                    _maps(entity_set_map, _ENTITY_SET, member.entity_set_id),
+                )
+                .outerjoin(
+                    question_map,
+                    and_(
+                        member.entity_type == EntityType.QUESTION.value,
+                        _maps(question_map, _QUESTION, member.entity_id),
+                    ),
+                )
+            )
+
+        copied = await self._allocate_ids(
+            session,
+            _MEMBER,
+            member,
+            from_members(select(member.id)).where(
+                member.deleted == False,  # noqa
+                or_(
+                    member.entity_type != EntityType.QUESTION.value,
+                    question_map.c.new_id.isnot(None),
+                ),
+            ),
+        )
+        if not copied:
+            return {}
+
+        await session.execute(
+            insert(member).from_select(
+                [
+                    "id",
+                    "entity_set_id",
+                    "company_id",
+                    "entity_type",
+                    "entity_id",
+                    "member_order",
+                    "label",
+                ],
+                from_members(
+                    select(
+                        member_map.c.new_id,
+                        entity_set_map.c.new_id,
+                        member.company_id,
+                        member.entity_type,
+                        func.coalesce(question_map.c.new_id, member.entity_id),
+                        member.member_order,
+                        member.label,
+                    )
+                ).join(member_map, _maps(member_map, _MEMBER, member.id)),
+            )
+        )
+
+        result = await session.execute(
+            select(member.entity_set_id, func.count())
+            .select_from(member)
+            .join(member_map, _maps(member_map, _MEMBER, member.id))
+            .group_by(member.entity_set_id)
+        )
+        return {entity_set_id: count for entity_set_id, count in result.all()}
+
+    async def _copy_cells(
+        self, session: AsyncSession, source_matrix_id: int, target_matrix_id: int
+    ) -> int:
+        """
+        Copy completed cells whose entity refs all point at copied members.
+
+        Cells keep their status; current_answer_set_id is set once the answer
+        sets exist. Signatures are recomputed for the new entity set and
+        member IDs.
+        """
+        cell = MatrixCellEntity
+        ref = MatrixCellEntityReferenceEntity
+        copied_members = select(_id_map.c.old_id).where(_id_map.c.kind == _MEMBER)
+
+        copied = await self._allocate_ids(
+            session,
+            _CELL,
+            cell,
+            select(cell.id).where(
+                cell.matrix_id == source_matrix_id,
+                cell.deleted == False,  # noqa
+                cell.status == MatrixCellStatus.COMPLETED.value,
+                cell.current_answer_set_id.isnot(None),
+                ~exists().where(
+                    ref.matrix_cell_id == cell.id,
+                    ref.deleted == False,  # noqa
+                    ref.entity_set_member_id.not_in(copied_members),
+                ),
+            ),
+        )
+        if not copied:
+            return 0
+
+        cell_map = _mapped(_CELL)
+        member_map = _mapped(_MEMBER)
+        entity_set_map = _mapped(_ENTITY_SET)
+        await session.execute(
+            insert(cell).from_select(
+                [
+                    "id",
+                    "matrix_id",
+                    "company_id",
+                    "status",
+                    "cell_type",
+                    "cell_signature",
+                ],
+                # Source signatures are unique, so they're safe placeholders
+                select(
+                    cell_map.c.new_id,
+                    literal(target_matrix_id),
+                    cell.company_id,
+                    cell.status,
+                    cell.cell_type,
+                    cell.cell_signature,
+                )
+                .select_from(cell)
+                .join(cell_map, _maps(cell_map, _CELL, cell.id)),
+            )
+        )
+        await session.execute(
+            insert(ref).from_select(
+                [
+                    "matrix_id",
+                    "matrix_cell_id",
+                    "entity_set_id",
+                    "entity_set_member_id",
+                    "company_id",
+                    "role",
+                    "entity_order",
+                ],
+                select(
+                    literal(target_matrix_id),
+                    cell_map.c.new_id,
+                    entity_set_map.c.new_id,
+                    member_map.c.new_id,
+                    ref.company_id,
+                    ref.role,
+                    ref.entity_order,
+                )
+                .select_from(ref)
+                .join(cell_map, _maps(cell_map, _CELL, ref.matrix_cell_id))
+                .join(member_map, _maps(member_map, _MEMBER, ref.entity_set_member_id))
+                .join(
+                    entity_set_map,
+                    _maps(entity_set_map, _ENTITY_SET, ref.entity_set_id),
+                )
+                .where(ref.deleted == False),  # noqa
+            )
+        )
+
+        await self._recompute_cell_signatures(session, target_matrix_id)
+        return copied
+
+    async def _recompute_cell_signatures(
+        self, session: AsyncSession, matrix_id: int
+    ) -> None:
+        """
+        Set cell signatures from the cells' entity refs.
+
+        Same format as BaseCellStrategy._compute_cell_signature: md5 of the
+        sorted "role|entity_set_id|entity_set_member_id" parts joined by ",".
+        Postgres hashes them in a single UPDATE ... FROM; other dialects
+        (SQLite in tests) read the refs and hash them in Python.
+        """
+        ref = MatrixCellEntityReferenceEntity
+        part = (
+            ref.role
+            + "|"
+            + cast(ref.entity_set_id, String)
+            + "|"
+            + cast(ref.entity_set_member_id, String)
+        )
+        active_refs = and_(ref.matrix_id == matrix_id, ref.deleted == False)  # noqa
+
+        if session.get_bind().dialect.name == "postgresql":
+            # "C" collation sorts by code point, like Python's sorted()
+            signatures = (
+                select(
+                    ref.matrix_cell_id,
+                    func.md5(
+                        func.string_agg(
+                            part,
+                            aggregate_order_by(
+                                literal(","), part.self_group().collate("C")
+                            ),
+                        )
+                    ).label("signature"),
+                )
+                .where(active_refs)
+                .group_by(ref.matrix_cell_id)
+                .subquery()
+            )
+            await session.execute(
+                update(MatrixCellEntity)
+                .where(MatrixCellEntity.id == signatures.c.matrix_cell_id)
+                .values(cell_signature=signatures.c.signature)
+                .execution_options(synchronize_session=False)
+            )
+            return
+
+        parts_by_cell = defaultdict(list)
+        result = await session.execute(
+            select(ref.matrix_cell_id, part).where(active_refs)
+        )
+        for cell_id, cell_part in result.all():
+            parts_by_cell[cell_id].append(cell_part)
+        await session.execute(
+            update(MatrixCellEntity),
+            [
+                {
+                    "id": cell_id,
+                    "cell_signature": hashlib.md5(
+                        ",".join(sorted(parts)).encode()
+                    ).hexdigest(),
+                }
+                for cell_id, parts in parts_by_cell.items()
+            ],
+        )
+
+    async def _copy_current_answer_sets(
+        self, session: AsyncSession, target_matrix_id: int
+    ) -> None:
+        """Copy the copied cells' current answer sets, answers and citations."""
+        cell_map = _mapped(_CELL)
+        answer_set_map = _mapped(_ANSWER_SET)
+        answer_map = _mapped(_ANSWER)
+        citation_set_map = _mapped(_CITATION_SET)
+
+        await self._allocate_ids(
+            session,
+            _ANSWER_SET,
+            AnswerSetEntity,
+            select(MatrixCellEntity.current_answer_set_id).join(
+                cell_map, _maps(cell_map, _CELL, MatrixCellEntity.id)
+            ),
+        )
+        await session.execute(
+            insert(AnswerSetEntity).from_select(
+                [
+                    "id",
+                    "matrix_cell_id",
+                    "question_type_id",
+                    "company_id",
+                    "answer_found",
+                    "confidence",
+                    "context_chunk_ids",
+                ],
+                select(
+                    answer_set_map.c.new_id,
+                    cell_map.c.new_id,
+                    AnswerSetEntity.question_type_id,
+                    AnswerSetEntity.company_id,
+                    AnswerSetEntity.answer_found,
+                    AnswerSetEntity.confidence,
+                    AnswerSetEntity.context_chunk_ids,
+                )
+                .select_from(AnswerSetEntity)
+                .join(
+                    answer_set_map,
+                    _maps(answer_set_map, _ANSWER_SET, AnswerSetEntity.id),
+                )
+                .join(cell_map, _maps(cell_map, _CELL, AnswerSetEntity.matrix_cell_id)),
+            )
+        )
+
+        await self._allocate_ids(
+            session,
+            _ANSWER,
+            AnswerEntity,
+            select(AnswerEntity.id).join(
+                answer_set_map,
+                _maps(answer_set_map, _ANSWER_SET, AnswerEntity.answer_set_id),
+            ),
+        )
+        await session.execute(
+            insert(AnswerEntity).from_select(
+                ["id", "answer_set_id", "company_id", "answer_data"],
+                select(
+                    answer_map.c.new_id,
+                    answer_set_map.c.new_id,
+                    AnswerEntity.company_id,
+                    AnswerEntity.answer_data,
+                )
+                .select_from(AnswerEntity)
+                .join(answer_map, _maps(answer_map, _ANSWER, AnswerEntity.id))
+                .join(
+                    answer_set_map,
+                    _maps(answer_set_map, _ANSWER_SET, AnswerEntity.answer_set_id),
+                ),
+            )
+        )
+
+        await self._allocate_ids(
+            session,
+            _CITATION_SET,
+            CitationSetEntity,
+            select(AnswerEntity.current_citation_set_id)
+            .join(answer_map, _maps(answer_map, _ANSWER, AnswerEntity.id))
+            .where(AnswerEntity.current_citation_set_id.isnot(None)),
+        )
+        await session.execute(
+            insert(CitationSetEntity).from_select(
+                ["id", "answer_id", "company_id"],
+                select(
+                    citation_set_map.c.new_id,
+                    answer_map.c.new_id,
+                    CitationSetEntity.company_id,
+                )
+                .select_from(CitationSetEntity)
+                .join(
+                    citation_set_map,
+                    _maps(citation_set_map, _CITATION_SET, CitationSetEntity.id),
+                )
+                .join(
+                    answer_map, _maps(answer_map, _ANSWER, CitationSetEntity.answer_id)
+                ),
+            )
+        )
+        await session.execute(
+            insert(CitationEntity).from_select(
+                [
+                    "citation_set_id",
+                    "document_id",
+                    "company_id",
+                    "quote_text",
+                    "citation_order",
+                ],
+                select(
+                    citation_set_map.c.new_id,
+                    CitationEntity.document_id,
+                    CitationEntity.company_id,
+                    CitationEntity.quote_text,
+                    CitationEntity.citation_order,
+                )
+                .select_from(CitationEntity)
+                .join(
+                    citation_set_map,
+                    _maps(
+                        citation_set_map,
+                        _CITATION_SET,
+                        CitationEntity.citation_set_id,
+                    ),
+                )
+                .order_by(CitationEntity.id),
+            )
+        )
+
+        # Point the copies at their copied current rows. The FKs run both
+        # ways, so these are set after both sides exist.
+        source_answer = AnswerEntity.__table__.alias("source_answer")
+        await session.execute(
+            update(AnswerEntity)
+            .where(
+                AnswerEntity.id.in_(
+                    select(_id_map.c.new_id).where(_id_map.c.kind == _ANSWER)
+                )
+            )
+            .values(
+                current_citation_set_id=select(citation_set_map.c.new_id)
+                .select_from(answer_map)
+                .join(source_answer, source_answer.c.id == answer_map.c.old_id)
+                .join(
+                    citation_set_map,
+                    _maps(
+                        citation_set_map,
+                        _CITATION_SET,
+                        source_answer.c.current_citation_set_id,
+                    ),
+                )
+                .where(
+                    answer_map.c.kind == _ANSWER,
+                    answer_map.c.new_id == AnswerEntity.id,
+                )
+                .scalar_subquery()
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        source_cell = MatrixCellEntity.__table__.alias("source_cell")
+        await session.execute(
+            update(MatrixCellEntity)
+            .where(MatrixCellEntity.matrix_id == target_matrix_id)
+            .values(
+                current_answer_set_id=select(answer_set_map.c.new_id)
+                .select_from(cell_map)
+                .join(source_cell, source_cell.c.id == cell_map.c.old_id)
+                .join(
+                    answer_set_map,
+                    _maps(
+                        answer_set_map,
+                        _ANSWER_SET,
+                        source_cell.c.current_answer_set_id,
+                    ),
+                )
+                .where(
+                    cell_map.c.kind == _CELL,
+                    cell_map.c.new_id == MatrixCellEntity.id,
+                )
+                .scalar_subquery()
+            )
+            .execution_options(synchronize_session=False)
+        )
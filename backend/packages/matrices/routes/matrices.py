@@ -22,6 +22,7 @@ from packages.matrices.models.schemas.matrix import (
     MatrixSoftDeleteResponse,
     MatrixDuplicateRequest,
     MatrixDuplicateResponse,
+    MatrixDuplicateResumeResponse,
     MatrixCellsBatchRequest,
     EntityRefResponse,
     MatrixStructureResponse,
@@ -556,11 +557,27 @@ async def duplicate_matrix(
     """Duplicate a matrix with specified duplication type (documents only, questions only, or full matrix)."""
     matrix_service = get_matrix_service()
 
-    # Use the service's duplicate_matrix method which is already transactional
+    # Atomic for small duplicates; large ones stream cell creation in chunks
     # TODO: validate ownership
     return await matrix_service.duplicate_matrix(matrix_id, request)
 
 
+@router.post(
+    "/matrices/{matrixId}/duplicate/resume",
+    response_model=MatrixDuplicateResumeResponse,
+)
+@trace_span
+async def resume_matrix_duplication(
+    matrix_id: Annotated[int, Path(alias="matrixId")],
+    current_user: AuthenticatedUser = Depends(get_current_active_user),
+):
+    """Finish creating the cells of a duplicate whose response was incomplete."""
+    matrix_service = get_matrix_service()
+
+    # TODO: validate ownership
+    return await matrix_service.resume_matrix_duplication(matrix_id)
+
+
 @router.get(
     "/matrices/{matrixId}/template-variables",
     response_model=List[MatrixTemplateVariableResponse],
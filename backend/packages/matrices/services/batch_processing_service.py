@@ -1,9 +1,11 @@
-from typing import List, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 
 from packages.matrices.strategies.factory import CellStrategyFactory
 from packages.matrices.models.domain.matrix import (
+    MatrixModel,
     MatrixCellModel,
     MatrixCellCreateModel,
+    MatrixCellBatchResultModel,
 )
 from packages.qa.models.domain.qa_job import (
     QAJobModel,
@@ -27,7 +29,9 @@ from packages.matrices.strategies.models import CellUpdateSpec
 from common.providers.messaging.factory import get_message_queue
 from common.providers.messaging.messages import QAJobMessage
 from common.providers.messaging.constants import QueueName
+from common.core.config import settings
 from common.core.otel_axiom_exporter import trace_span, get_logger
+from common.db.context import get_current_session
 from common.db.scoped import transaction
 from packages.billing.services.usage_service import UsageService
 from packages.billing.services.quota_service import QuotaService
@@ -227,8 +231,9 @@ class BatchProcessingService:
     ) -> Tuple[List[MatrixCellModel], List[QAJobModel]]:
         """Batch create matrix cells and optionally QA jobs for all entity combinations.
 
-        This is used for operations like matrix duplication where we want to create
-        cells for the Cartesian product of ALL members in the given entity sets.
+        Creates cells for the Cartesian product of ALL members in the given entity
+        sets in one transaction. For very large matrices use
+        stream_create_matrix_cells_and_jobs, which commits in bounded chunks.
 
         Args:
             matrix_id: The matrix ID
@@ -246,6 +251,89 @@ class BatchProcessingService:
         if not matrix:
             raise ValueError(f"Matrix {matrix_id} not found")
 
+        all_cell_models = []
+        async for cell_models in self._iter_cell_models(matrix, entity_set_ids):
+            all_cell_models.extend(cell_models)
+
+        if not all_cell_models:
+            return [], []
+
+        logger.info(f"Strategy generated {len(all_cell_models)} total cell models")
+
+        # FAST PATH DEDUPLICATION: Check if matrix has any cells
+        matrix_has_cells = await self.matrix_cell_repo.matrix_has_cells(
+            matrix_id, matrix.company_id
+        )
+
+        if matrix_has_cells:
+            # Look up only the candidate signatures, not every existing cell
+            existing_signatures = await self.matrix_cell_repo.get_existing_signatures(
+                matrix_id,
+                [cell_model.cell_signature for cell_model in all_cell_models],
+                matrix.company_id,
+            )
+            logger.info(
+                f"Found {len(existing_signatures)} existing cells among candidates"
+            )
+        else:
+            logger.info("Matrix is empty, skipping deduplication")
+            existing_signatures = set()
+
+        # Filter out existing cells and duplicates within this batch
+        new_cell_models = []
+        seen_signatures = set(existing_signatures)
+        for cell_model in all_cell_models:
+            if cell_model.cell_signature not in seen_signatures:
+                seen_signatures.add(cell_model.cell_signature)
+                new_cell_models.append(cell_model)
+
+        logger.info(
+            f"Creating {len(new_cell_models)} new cells (filtered {len(all_cell_models) - len(new_cell_models)} duplicates)"
+        )
+
+        # Check quota before creating cells (raises 429 if exceeded)
+        agentic_count = await self._check_quota_for_cells(
+            new_cell_models, matrix.company_id
+        )
+
+        # All DB operations in transaction - commits when exiting context
+        created_cells = []
+        created_jobs = []
+        async with transaction():
+            # Insert cells
+            created_cells = await self._batch_insert_matrix_cells(new_cell_models)
+
+            # Track usage for billing
+            await self._track_usage_for_cells(
+                new_cell_models, matrix.company_id, matrix_id, agentic_count
+            )
+
+            # Optionally create QA jobs
+            if create_qa_jobs and created_cells:
+                job_models = self._create_qa_job_models(created_cells)
+                created_jobs = await self._batch_insert_qa_jobs(job_models)
+
+        # Transaction committed - now safe to publish messages
+        logger.info("Committed cells and jobs to database")
+
+        if created_jobs:
+            await self._batch_queue_jobs(created_jobs, created_cells)
+            logger.info(f"Created and queued {len(created_jobs)} QA jobs")
+
+        logger.info(
+            f"Successfully created {len(created_cells)} matrix cells and {len(created_jobs)} QA jobs"
+        )
+        return created_cells, created_jobs
+
+    async def _iter_cell_models(
+        self, matrix: MatrixModel, entity_set_ids: List[int]
+    ) -> AsyncIterator[List[MatrixCellCreateModel]]:
+        """Yield the strategy's cell models for the entity sets, one entity at a time.
+
+        Cells are generated for each entity of the first entity set in turn, so
+        only one entity's cells are in memory at once. Nothing is yielded if any
+        entity set is empty.
+        """
         # Get all members from each entity set
         entity_ids_by_set = {}
         for entity_set_id in entity_set_ids:
@@ -258,13 +346,10 @@ class BatchProcessingService:
         # Check if any entity set is empty
         if any(len(ids) == 0 for ids in entity_ids_by_set.values()):
             logger.warning("One or more entity sets are empty, no cells to create")
-            return [], []
+            return
 
-        # Get strategy and use it to create cell models
-        # We'll call the strategy for each entity in the first entity set
+        # We call the strategy for each entity in the first entity set
         # This is a bit hacky but maintains the deduplication logic
-
-        all_cell_models = []
         strategy = CellStrategyFactory.get_strategy(matrix.matrix_type)
 
         # Get first entity set to iterate over
@@ -275,88 +360,183 @@ class BatchProcessingService:
             f"Creating cells by processing {len(first_entity_ids)} entities from first entity set"
         )
 
-        # Process each entity in the first set
         for entity_id in first_entity_ids:
-            cell_models = await strategy.create_cells_for_new_entity(
-                matrix_id,
+            yield await strategy.create_cells_for_new_entity(
+                matrix.id,
                 matrix.company_id,
                 entity_id,
                 first_entity_set_id,
             )
-            all_cell_models.extend(cell_models)
 
-        logger.info(f"Strategy generated {len(all_cell_models)} total cell models")
+    @trace_span
+    async def stream_create_matrix_cells_and_jobs(
+        self,
+        matrix_id: int,
+        entity_set_ids: List[int],
+        create_qa_jobs: bool = True,
+        chunk_size: Optional[int] = None,
+        result: Optional[MatrixCellBatchResultModel] = None,
+    ) -> MatrixCellBatchResultModel:
+        """Create cells and QA jobs for all entity combinations in committed chunks.
+
+        Streaming counterpart of batch_create_matrix_cells_and_jobs for very large
+        matrices. Cell models are pulled lazily from the strategy and persisted
+        chunk by chunk: each chunk is deduplicated against the matrix, quota
+        checked, committed with its usage events and QA jobs, and its jobs are
+        published before the next chunk is generated. Publishing waits for broker
+        confirms, so generation never runs ahead of RabbitMQ by more than one
+        chunk, and memory stays bounded by the chunk size.
+
+        Committed chunks are kept if a later chunk fails (e.g. quota exceeded).
+        Calling again with the same arguments resumes: jobs whose messages were
+        never published (publish fell short, or the process died after commit)
+        are republished first, then cells that already exist are skipped by the
+        signature check.
+
+        Must be called outside a transaction, so that each chunk commits before
+        its jobs are published.
 
-        # FAST PATH DEDUPLICATION: Check if matrix has any cells
-        matrix_has_cells = await self.matrix_cell_repo.matrix_has_cells(
-            matrix_id, matrix.company_id
-        )
+        Args:
+            matrix_id: The matrix ID
+            entity_set_ids: List of entity set IDs to create cells from
+            create_qa_jobs: Whether to create and queue QA jobs for each chunk
+            chunk_size: Cells per chunk (defaults to settings.matrix_cell_batch_chunk_size)
+            result: Counts to add to as chunks commit, so the caller still has
+                the progress made if a later chunk fails
 
-        if matrix_has_cells:
-            logger.info("Matrix has existing cells, loading refs for deduplication")
-            # SLOW PATH: Load all refs for deduplication
-            all_existing_refs = await self.cell_entity_ref_repo.get_by_matrix_id(
-                matrix_id
+        Returns:
+            Counts of created cells, created jobs, committed chunks and
+            requeued jobs
+        """
+        if get_current_session() is not None:
+            raise RuntimeError(
+                "stream_create_matrix_cells_and_jobs must run outside a transaction"
             )
-            refs_by_cell = {}
-            for ref in all_existing_refs:
-                if ref.matrix_cell_id not in refs_by_cell:
-                    refs_by_cell[ref.matrix_cell_id] = []
-                refs_by_cell[ref.matrix_cell_id].append(ref)
 
-            existing_combos = set()
-            for cell_id, refs in refs_by_cell.items():
-                key = self._get_entity_ref_key(refs)
-                existing_combos.add(key)
-            logger.info(f"Found {len(existing_combos)} existing cell combinations")
-        else:
-            logger.info("Matrix is empty, skipping deduplication")
-            existing_combos = set()
+        if result is None:
+            result = MatrixCellBatchResultModel()
+        if not entity_set_ids:
+            return result
 
-        # Filter out duplicates
-        new_cell_models = []
-        for cell_model in all_cell_models:
-            cell_key = self._get_entity_ref_key(cell_model.entity_refs)
-            if cell_key not in existing_combos:
-                new_cell_models.append(cell_model)
+        matrix = await self.matrix_repo.get(matrix_id)
+        if not matrix:
+            raise ValueError(f"Matrix {matrix_id} not found")
+
+        if create_qa_jobs:
+            result.jobs_requeued = await self._requeue_unpublished_jobs(matrix.id)
+
+        chunk_size = chunk_size or settings.matrix_cell_batch_chunk_size
+        chunk: List[MatrixCellCreateModel] = []
+        chunk_signatures = set()
+
+        async for cell_models in self._iter_cell_models(matrix, entity_set_ids):
+            for cell_model in cell_models:
+                # Duplicates within the chunk; earlier chunks are in the database
+                if cell_model.cell_signature in chunk_signatures:
+                    continue
+                chunk_signatures.add(cell_model.cell_signature)
+                chunk.append(cell_model)
+
+                if len(chunk) >= chunk_size:
+                    await self._commit_and_queue_chunk(
+                        matrix, chunk, create_qa_jobs, result
+                    )
+                    chunk = []
+                    chunk_signatures = set()
+
+        if chunk:
+            await self._commit_and_queue_chunk(matrix, chunk, create_qa_jobs, result)
 
         logger.info(
-            f"Creating {len(new_cell_models)} new cells (filtered {len(all_cell_models) - len(new_cell_models)} duplicates)"
+            f"Streamed {result.cells_created} matrix cells and {result.jobs_created} "
+            f"QA jobs in {result.chunks_committed} chunks for matrix {matrix_id}"
+        )
+        return result
+
+    async def _requeue_unpublished_jobs(self, matrix_id: int) -> int:
+        """Publish the matrix's queued jobs that never got a worker message.
+
+        Returns the number of jobs requeued.
+        """
+        jobs = await self.qa_job_repo.get_unpublished_for_matrix(matrix_id)
+        if not jobs:
+            return 0
+
+        await self.ensure_queue_declared()
+        messages = [
+            QAJobMessage(job_id=job.id, matrix_cell_id=job.matrix_cell_id)
+            for job in jobs
+        ]
+        published_count = await self._publish_messages(messages)
+        if published_count != len(messages):
+            raise RuntimeError(
+                f"Requeued {published_count}/{len(messages)} unpublished QA jobs "
+                f"of matrix {matrix_id}, stopping"
+            )
+
+        logger.info(f"Requeued {len(jobs)} unpublished QA jobs for matrix {matrix_id}")
+        return len(jobs)
+
+    async def _commit_and_queue_chunk(
+        self,
+        matrix: MatrixModel,
+        cell_models: List[MatrixCellCreateModel],
+        create_qa_jobs: bool,
+        result: MatrixCellBatchResultModel,
+    ) -> None:
+        """Commit one chunk of cells (and jobs), then publish its jobs.
+
+        Adds the chunk's counts to result.
+        """
+        existing_signatures = await self.matrix_cell_repo.get_existing_signatures(
+            matrix.id,
+            [cell_model.cell_signature for cell_model in cell_models],
+            matrix.company_id,
         )
+        new_cell_models = [
+            cell_model
+            for cell_model in cell_models
+            if cell_model.cell_signature not in existing_signatures
+        ]
+        if not new_cell_models:
+            logger.info(f"Skipped chunk of {len(cell_models)} existing cells")
+            return
 
         # Check quota before creating cells (raises 429 if exceeded)
         agentic_count = await self._check_quota_for_cells(
             new_cell_models, matrix.company_id
         )
 
-        # All DB operations in transaction - commits when exiting context
-        created_cells = []
         created_jobs = []
         async with transaction():
-            # Insert cells
             created_cells = await self._batch_insert_matrix_cells(new_cell_models)
 
-            # Track usage for billing
             await self._track_usage_for_cells(
-                new_cell_models, matrix.company_id, matrix_id, agentic_count
+                new_cell_models, matrix.company_id, matrix.id, agentic_count
             )
 
-            # Optionally create QA jobs
             if create_qa_jobs and created_cells:
                 job_models = self._create_qa_job_models(created_cells)
                 created_jobs = await self._batch_insert_qa_jobs(job_models)
 
-        # Transaction committed - now safe to publish messages
-        logger.info("Committed cells and jobs to database")
+        result.cells_created += len(created_cells)
+        result.jobs_created += len(created_jobs)
+        result.chunks_committed += 1
 
+        # Chunk committed - publish before generating the next one
         if created_jobs:
-            await self._batch_queue_jobs(created_jobs, created_cells)
-            logger.info(f"Created and queued {len(created_jobs)} QA jobs")
+            published_count = await self._batch_queue_jobs(created_jobs, created_cells)
+            if published_count != len(created_jobs):
+                raise RuntimeError(
+                    f"Published {published_count}/{len(created_jobs)} QA jobs for "
+                    f"chunk {result.chunks_committed} of matrix {matrix.id}, stopping"
+                )
 
         logger.info(
-            f"Successfully created {len(created_cells)} matrix cells and {len(created_jobs)} QA jobs"
+            f"Committed chunk {result.chunks_committed} for matrix {matrix.id}: "
+            f"{len(created_cells)} cells, {len(created_jobs)} jobs "
+            f"({result.cells_created} cells so far)"
         )
-        return created_cells, created_jobs
 
     @trace_span
     def _prepare_job_messages(
@@ -386,8 +566,12 @@ class BatchProcessingService:
         return messages
 
     @trace_span
-    async def _publish_messages(self, messages: List[QAJobMessage]) -> None:
-        """Publish all messages to the queue in batch."""
+    async def _publish_messages(self, messages: List[QAJobMessage]) -> int:
+        """Publish all messages to the queue in batch. Returns the published count.
+
+        When every message is confirmed, the jobs are marked published so an
+        interrupted streaming run can find the ones that were not.
+        """
         logger.info(f"Publishing {len(messages)} messages to qa_worker queue")
 
         # Convert to dict format for batch publish
@@ -400,14 +584,20 @@ class BatchProcessingService:
 
         if published_count != len(messages):
             logger.error(f"Only published {published_count}/{len(messages)} messages")
+        else:
+            await self.qa_job_repo.mark_published(
+                [message.job_id for message in messages]
+            )
+
+        return published_count
 
     @trace_span
     async def _batch_queue_jobs(
         self,
         qa_jobs: List[QAJobModel],
         matrix_cells: List[MatrixCellModel],
-    ) -> None:
-        """Batch queue jobs for processing."""
+    ) -> int:
+        """Batch queue jobs for processing. Returns the published count."""
         await self.ensure_queue_declared()
 
         cell_map = {cell.id: cell for cell in matrix_cells}
@@ -418,7 +608,7 @@ class BatchProcessingService:
 
         messages = self._prepare_job_messages(qa_jobs, cell_map)
 
-        await self._publish_messages(messages)
+        return await self._publish_messages(messages)
 
     @trace_span
     async def create_jobs_and_queue_for_cells(
@@ -410,13 +410,11 @@ class EntitySetService:
         # Collect unique member IDs
         member_ids = list(set(ref.entity_set_member_id for ref in entity_refs))
 
-        # Load all members
-        members_by_id: Dict[int, MatrixEntitySetMemberModel] = {}
-        if member_ids:
-            for member_id in member_ids:
-                member = await self.member_repo.get(member_id, company_id)
-                if member:
-                    members_by_id[member_id] = member
+        # Load all members in one query
+        members = await self.member_repo.get_by_member_ids(member_ids, company_id)
+        members_by_id: Dict[int, MatrixEntitySetMemberModel] = {
+            member.id: member for member in members
+        }
 
         # Group entity refs by cell_id
         entity_refs_by_cell: Dict[int, List[MatrixCellEntityReferenceModel]] = {}
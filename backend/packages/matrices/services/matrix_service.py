@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List, Optional, Dict
+import math
+from typing import List, Optional, Dict, Tuple
 
 from packages.matrices.models.domain.matrix_enums import EntityRole, EntityType
 from packages.qa.models.domain.answer_data import AIAnswerSet
@@ -22,6 +23,9 @@ from packages.matrices.repositories.cell_entity_reference_repository import (
 from packages.matrices.repositories.entity_set_member_repository import (
     EntitySetMemberRepository,
 )
+from packages.matrices.repositories.matrix_duplication_repository import (
+    MatrixDuplicationRepository,
+)
 from packages.matrices.models.domain.matrix_entity_set import (
     MatrixCellEntityReferenceModel,
 )
@@ -33,28 +37,24 @@ from packages.matrices.models.domain.matrix import (
     MatrixCellUpdateModel,
     MatrixCellStatus,
     MatrixCellStatsModel,
+    MatrixDuplicationResultModel,
+    MatrixCellBatchResultModel,
 )
 from packages.matrices.models.schemas.matrix import MatrixCellWithAnswerResponse
-from packages.qa.models.domain.answer_set import AnswerSetCreateModel, AnswerSetModel
-from packages.qa.models.domain.answer import (
-    AnswerCreateModel,
-    AnswerUpdateModel,
-    AnswerModel,
-)
-from packages.qa.models.domain.citation import (
-    CitationSetCreateModel,
-    CitationCreateWithoutSetIdModel,
-    CitationModel,
-)
+from packages.qa.models.domain.answer_set import AnswerSetModel
+from packages.qa.models.domain.answer import AnswerModel
+from packages.qa.models.domain.citation import CitationModel
 from packages.matrices.models.schemas.matrix import (
     MatrixDuplicateRequest,
     MatrixDuplicateResponse,
+    MatrixDuplicateResumeResponse,
 )
 from packages.qa.services.answer_set_service import AnswerSetService
 from packages.qa.services.citation_service import CitationService
 from packages.qa.services.answer_service import AnswerService
 from packages.documents.services.document_service import DocumentService
 from common.db.context import transactional
+from common.core.config import settings
 from common.core.otel_axiom_exporter import trace_span, get_logger
 from packages.matrices.services.batch_processing_service import BatchProcessingService
 from packages.matrices.services.entity_set_service import EntitySetService
@@ -76,6 +76,7 @@ class MatrixService:
         self.matrix_cell_repo = MatrixCellRepository()
         self.cell_entity_ref_repo = CellEntityReferenceRepository()
         self.member_repo = EntitySetMemberRepository()
+        self.duplication_repo = MatrixDuplicationRepository()
         self.answer_set_service = AnswerSetService()
         self.answer_service = AnswerService()
         self.citation_service = CitationService()
@@ -241,24 +242,17 @@ class MatrixService:
         ai_answer_set: AIAnswerSet,
         set_as_current: bool = True,
     ) -> bool:
-        """Create a new answer set from AI response for a matrix cell, including citations."""
-        # Create the answer set with the AI-provided answer_found status
-        cell = await self.matrix_cell_repo.get(cell_id)
+        """Create a new answer set from AI response for a matrix cell, including citations.
 
+        The answer set, answers, citation sets, citations and current pointers
+        are written in a handful of bulk statements in one session.
+        """
         # Calculate average confidence from individual answers
         avg_confidence = 1.0
         if ai_answer_set.answers:
             confidence_sum = sum(answer.confidence for answer in ai_answer_set.answers)
             avg_confidence = confidence_sum / len(ai_answer_set.answers)
 
-        answer_set_create = AnswerSetCreateModel(
-            matrix_cell_id=cell_id,
-            question_type_id=question_type_id,
-            answer_found=ai_answer_set.answer_found,
-            confidence=avg_confidence,
-            company_id=cell.company_id,
-        )
-
         logger.info(
             f"Creating answer set for cell {cell_id} from AI response with {ai_answer_set.answer_count} answers, "
             f"answer_found: {ai_answer_set.answer_found}, confidence: {avg_confidence:.2f}"
@@ -272,76 +266,23 @@ class MatrixService:
                 f"(below threshold {CONFIDENCE_THRESHOLD}). Answer may need human review."
             )
 
-        answer_set = await self.answer_set_service.create_answer_set(
-            answer_set_create, company_id=cell.company_id
+        answer_set = await self.answer_set_service.create_answer_set_with_answers(
+            matrix_cell_id=cell_id,
+            question_type_id=question_type_id,
+            answer_found=ai_answer_set.answer_found,
+            confidence=avg_confidence,
+            answers=ai_answer_set.answers,
+            set_as_current=set_as_current,
+            context_chunk_ids=ai_answer_set.context_chunk_ids or None,
         )
+        if not answer_set:
+            logger.error(f"Failed to create answer set: cell {cell_id} not found")
+            return False
 
-        # Create individual answers within the answer set (if any)
-        created_answers = []
-        for answer_data in ai_answer_set.answers:
-            answer_create = AnswerCreateModel(
-                answer_set_id=answer_set.id,
-                answer_data=answer_data,
-                company_id=cell.company_id,
-            )
-            answer = await self.answer_service.create_answer(
-                answer_create, company_id=cell.company_id
-            )
-            created_answers.append(answer)
-
-            # Create citations for this answer - all answer types now have citations field
-            if answer_data.citations:
-                logger.info(
-                    f"Creating {len(answer_data.citations)} citations for answer {answer.id}"
-                )
-
-                # Build citation create models from the answer data citations
-                citation_creates = []
-                for citation_ref in answer_data.citations:
-                    citation_creates.append(
-                        CitationCreateWithoutSetIdModel(
-                            document_id=citation_ref.document_id,
-                            company_id=cell.company_id,
-                            quote_text=citation_ref.quote_text,
-                            citation_order=citation_ref.citation_number,
-                        )
-                    )
-
-                # Create citation set with all citations
-                if citation_creates:
-                    citation_set_create = CitationSetCreateModel(
-                        answer_id=answer.id,
-                        company_id=cell.company_id,
-                        citations=citation_creates,
-                    )
-                    citation_set = (
-                        await self.citation_service.create_citation_set_with_citations(
-                            citation_set_create, cell.company_id
-                        )
-                    )
-
-                    # Update answer to point to current citation set
-                    answer_update = AnswerUpdateModel(
-                        current_citation_set_id=citation_set.id
-                    )
-                    await self.answer_service.update_answer(answer.id, answer_update)
-                    logger.info(
-                        f"Created citation set {citation_set.id} with {len(citation_creates)} citations for answer {answer.id}"
-                    )
-
-        if set_as_current:
-            # Update matrix cell to point to this answer set as current
-            updated_cell = await self.matrix_cell_repo.update_current_answer_set(
-                cell_id, answer_set.id
-            )
-            if not updated_cell:
-                logger.error(
-                    f"Failed to set answer set {answer_set.id} as current for cell {cell_id}"
-                )
-                return False
-
+        citation_count = sum(len(answer.citations) for answer in ai_answer_set.answers)
         logger.info(
-            f"Created answer set {answer_set.id} from AI with {len(created_answers)} answers for cell {cell_id}, answer_found: {answer_set.answer_found}"
+            f"Created answer set {answer_set.id} from AI with {len(ai_answer_set.answers)} answers "
+            f"and {citation_count} citations for cell {cell_id}, answer_found: {answer_set.answer_found}"
         )
         return True
 
@@ -645,16 +586,169 @@ class MatrixService:
 
     # TODO: should this take company id?
     @trace_span
-    @transactional
     async def duplicate_matrix(
         self, matrix_id: int, duplicate_request: MatrixDuplicateRequest
     ) -> MatrixDuplicateResponse:
         """Duplicate a matrix with specified entity sets.
 
         Entity-set based duplication: creates a new matrix with the same structure,
-        then copies members from specified entity sets and creates cells.
+        then copies members from specified entity sets and creates cells. With
+        copy_answers, completed cells are copied with their current answers and
+        only the remaining cells are sent to QA.
+
+        Duplicates of up to matrix_cell_batch_chunk_size cells are all-or-nothing:
+        the matrix, its contents, cells and QA jobs commit in one transaction.
+        Larger duplicates commit the matrix and its copied contents first, then
+        create and queue the remaining cells in committed chunks, so they never
+        sit in a single transaction. If a chunk fails (e.g. quota exceeded), the
+        committed chunks are kept and the response has complete=False with the
+        cells created so far; resume_matrix_duplication finishes the duplicate.
         """
+        (
+            source_matrix,
+            duplicate_matrix,
+            copy_result,
+            target_entity_set_ids,
+            batch_result,
+        ) = await self._duplicate_matrix_contents(matrix_id, duplicate_request)
+        entity_sets_duplicated = copy_result.members_copied
+
+        stopped_reason = None
+        if batch_result is None:
+            # Too large for one transaction; copied cells already exist in the
+            # target, so signature dedup skips them
+            batch_result, stopped_reason = await self._stream_duplicate_cells(
+                duplicate_matrix.id, target_entity_set_ids
+            )
 
+        cells_created = copy_result.cells_copied + batch_result.cells_created
+        logger.info(
+            f"Copied {copy_result.cells_copied} answered cells, created "
+            f"{batch_result.cells_created} matrix cells and "
+            f"{batch_result.jobs_created} QA jobs"
+        )
+
+        # Build response message
+        total_members = sum(entity_sets_duplicated.values())
+        message = f"Successfully duplicated matrix '{source_matrix.name}' as '{duplicate_matrix.name}' "
+        message += f"with {len(entity_sets_duplicated)} entity sets ({total_members} total members) and {cells_created} cells"
+        if stopped_reason is not None:
+            message = (
+                f"Partially duplicated matrix '{source_matrix.name}' as "
+                f"'{duplicate_matrix.name}': cell creation stopped after "
+                f"{cells_created} cells ({stopped_reason}); resume the duplicate "
+                f"to create the rest"
+            )
+
+        logger.info(f"Completed matrix duplication: {message}")
+
+        return MatrixDuplicateResponse(
+            original_matrix_id=matrix_id,
+            duplicate_matrix_id=duplicate_matrix.id,
+            entity_sets_duplicated=entity_sets_duplicated,
+            cells_created=cells_created,
+            complete=stopped_reason is None,
+            message=message,
+        )
+
+    @trace_span
+    async def resume_matrix_duplication(
+        self, matrix_id: int
+    ) -> MatrixDuplicateResumeResponse:
+        """Finish creating the cells of a duplicate that stopped part way.
+
+        Cells are streamed for the matrix's populated entity sets, which are the
+        sets its members were copied into. Jobs committed but never published
+        are requeued first and existing cells are skipped, so this is safe to
+        call again until the response is complete.
+        """
+        matrix = await self.get_matrix(matrix_id)
+        if not matrix:
+            raise HTTPException(status_code=404, detail="Matrix not found")
+
+        entity_set_service = EntitySetService()
+        entity_set_ids = []
+        for entity_set in await entity_set_service.get_matrix_entity_sets(
+            matrix_id, matrix.company_id
+        ):
+            members = await entity_set_service.get_entity_set_members(
+                entity_set.id, matrix.company_id
+            )
+            if members:
+                entity_set_ids.append(entity_set.id)
+
+        batch_result, stopped_reason = await self._stream_duplicate_cells(
+            matrix_id, entity_set_ids
+        )
+
+        message = (
+            f"Created {batch_result.cells_created} cells and requeued "
+            f"{batch_result.jobs_requeued} QA jobs for matrix '{matrix.name}'"
+        )
+        if stopped_reason is not None:
+            message += f" before stopping ({stopped_reason})"
+
+        return MatrixDuplicateResumeResponse(
+            duplicate_matrix_id=matrix_id,
+            cells_created=batch_result.cells_created,
+            jobs_requeued=batch_result.jobs_requeued,
+            complete=stopped_reason is None,
+            message=message,
+        )
+
+    async def _stream_duplicate_cells(
+        self, matrix_id: int, entity_set_ids: List[int]
+    ) -> Tuple[MatrixCellBatchResultModel, Optional[str]]:
+        """Stream a duplicate's cells, keeping committed chunks if one fails.
+
+        Returns:
+            Tuple of (counts so far, reason streaming stopped or None if it
+            finished)
+        """
+        batch_result = MatrixCellBatchResultModel()
+        try:
+            await BatchProcessingService().stream_create_matrix_cells_and_jobs(
+                matrix_id,
+                entity_set_ids,
+                create_qa_jobs=True,
+                result=batch_result,
+            )
+        except HTTPException as e:
+            stopped_reason = str(e.detail)
+        except Exception as e:
+            logger.error(
+                f"Streaming cells into duplicate matrix {matrix_id} failed: {e}",
+                exc_info=True,
+            )
+            stopped_reason = "cell creation failed"
+        else:
+            return batch_result, None
+
+        logger.warning(
+            f"Duplicate matrix {matrix_id} stopped after "
+            f"{batch_result.chunks_committed} chunks: {stopped_reason}"
+        )
+        return batch_result, stopped_reason
+
+    @transactional
+    async def _duplicate_matrix_contents(
+        self, matrix_id: int, duplicate_request: MatrixDuplicateRequest
+    ) -> Tuple[
+        MatrixModel,
+        MatrixModel,
+        MatrixDuplicationResultModel,
+        List[int],
+        Optional[MatrixCellBatchResultModel],
+    ]:
+        """Create the duplicate matrix and copy its contents in one transaction.
+
+        If the duplicate's cells fit in one chunk, they and their QA jobs are
+        created in the same transaction.
+
+        Returns:
+            Tuple of (source matrix, duplicate matrix, copy result, target entity
+            set IDs, cell batch result or None if cells are left to stream)
+        """
         logger.info(
             f"Duplicating matrix {matrix_id} with entity sets {duplicate_request.entity_set_ids}"
         )
@@ -718,40 +812,10 @@ class MatrixService:
                 duplicate_request.template_variable_overrides,
             )
 
-        # Duplicate questions if any question entity sets are being duplicated
-        question_id_mapping = {}
-        if has_question_set:
-            question_service = QuestionService()
-
-            # Use existing duplicate_questions_to_matrix_with_template_mapping method
-            duplicated_questions = await question_service.duplicate_questions_to_matrix_with_template_mapping(
-                matrix_id,
-                duplicate_matrix.id,
-                template_variable_id_mapping,
-            )
-
-            # Build mapping of old question ID -> new question ID
-            # We need to get the source questions to match them up
-            source_questions = await question_service.get_questions_for_matrix(
-                matrix_id
-            )
-
-            # Match by label to create the ID mapping
-            for i, source_q in enumerate(source_questions):
-                if i < len(duplicated_questions):
-                    question_id_mapping[source_q.id] = duplicated_questions[i].id
-
-            logger.info(
-                f"Duplicated {len(question_id_mapping)} questions with template variable remapping"
-            )
-
-        # Track duplication stats
-        entity_sets_duplicated = {}
-        target_entity_set_ids = []
-
-        # For each requested entity set, copy members to corresponding target entity set
+        # Pair each requested source entity set with the target set of the same
+        # type and name
+        entity_set_id_mapping = {}
         for source_entity_set_id in duplicate_request.entity_set_ids:
-            # Find source entity set
             source_entity_set = next(
                 (es for es in source_entity_sets if es.id == source_entity_set_id), None
             )
@@ -761,7 +825,6 @@ class MatrixService:
                 )
                 continue
 
-            # Find corresponding target entity set (match by entity_type and name)
             target_entity_set = next(
                 (
                     es
@@ -777,55 +840,47 @@ class MatrixService:
                 )
                 continue
 
-            # Copy members from source to target
-            # For questions, use the question_id_mapping; for documents, no mapping needed
-            entity_id_mapping = (
-                question_id_mapping
-                if source_entity_set.entity_type == EntityType.QUESTION
-                else None
-            )
-            members_copied = await entity_set_service.duplicate_entity_set_members(
-                source_entity_set.id,
-                target_entity_set.id,
-                company_id,
-                entity_id_mapping,
-            )
-
-            entity_sets_duplicated[source_entity_set_id] = members_copied
-            target_entity_set_ids.append(target_entity_set.id)
-            logger.info(
-                f"Copied {members_copied} members from entity set {source_entity_set.name}"
-            )
-
-        # Create cells for all populated entity sets
-        cells_created = 0
-        if len(target_entity_set_ids) > 0:
-            batch_service = BatchProcessingService()
-            created_cells, created_jobs = (
-                await batch_service.batch_create_matrix_cells_and_jobs(
-                    duplicate_matrix.id,
-                    target_entity_set_ids,
-                    create_qa_jobs=True,
+            entity_set_id_mapping[source_entity_set.id] = target_entity_set.id
+
+        # Copy questions, options, members (and optionally answered cells)
+        # set-wise, remapping IDs in the database
+        copy_result = await self.duplication_repo.copy_matrix_contents(
+            matrix_id,
+            duplicate_matrix.id,
+            entity_set_id_mapping,
+            template_variable_id_mapping,
+            copy_questions=has_question_set,
+            copy_answers=duplicate_request.copy_answers,
+        )
+        target_entity_set_ids = list(entity_set_id_mapping.values())
+
+        # Every combination of members is an upper bound on the cells to create
+        batch_result = MatrixCellBatchResultModel()
+        if target_entity_set_ids:
+            max_cells = math.prod(copy_result.members_copied.values())
+            if max_cells > settings.matrix_cell_batch_chunk_size:
+                batch_result = None
+            else:
+                batch_service = BatchProcessingService()
+                created_cells, created_jobs = (
+                    await batch_service.batch_create_matrix_cells_and_jobs(
+                        duplicate_matrix.id,
+                        target_entity_set_ids,
+                        create_qa_jobs=True,
+                    )
+                )
+                batch_result = MatrixCellBatchResultModel(
+                    cells_created=len(created_cells),
+                    jobs_created=len(created_jobs),
+                    chunks_committed=1 if created_cells else 0,
                 )
-            )
-            cells_created = len(created_cells)
-            logger.info(
-                f"Created {cells_created} matrix cells and {len(created_jobs)} QA jobs"
-            )
-
-        # Build response message
-        total_members = sum(entity_sets_duplicated.values())
-        message = f"Successfully duplicated matrix '{source_matrix.name}' as '{duplicate_matrix.name}' "
-        message += f"with {len(entity_sets_duplicated)} entity sets ({total_members} total members) and {cells_created} cells"
-
-        logger.info(f"Completed matrix duplication: {message}")
 
-        return MatrixDuplicateResponse(
-            original_matrix_id=matrix_id,
-            duplicate_matrix_id=duplicate_matrix.id,
-            entity_sets_duplicated=entity_sets_duplicated,
-            cells_created=cells_created,
-            message=message,
+        return (
+            source_matrix,
+            duplicate_matrix,
+            copy_result,
+            target_entity_set_ids,
+            batch_result,
         )
 
     @trace_span
@@ -5,9 +5,6 @@ from packages.matrices.repositories.matrix_cell_repository import MatrixCellRepo
 from packages.matrices.repositories.entity_set_member_repository import (
     EntitySetMemberRepository,
 )
-from packages.matrices.repositories.cell_entity_reference_repository import (
-    CellEntityReferenceRepository,
-)
 from packages.matrices.models.schemas.matrix import MatrixSoftDeleteRequest
 from common.db.context import transactional
 from common.core.otel_axiom_exporter import trace_span, get_logger
@@ -22,7 +19,6 @@ class SoftDeleteService:
         self.matrix_repo = MatrixRepository()
         self.matrix_cell_repo = MatrixCellRepository()
         self.member_repo = EntitySetMemberRepository()
-        self.cell_ref_repo = CellEntityReferenceRepository()
 
     @trace_span
     @transactional
@@ -34,7 +30,9 @@ class SoftDeleteService:
         Returns (entities_deleted, cells_deleted).
         """
         logger.info(
-            f"Starting soft delete for matrix {matrix_id} with request: {request}"
+            f"Starting soft delete for matrix {matrix_id}: "
+            f"{len(request.entity_set_filters or [])} entity set filters, "
+            f"{len(request.matrix_ids or [])} matrices"
         )
 
         entities_deleted = 0
@@ -67,79 +65,35 @@ class SoftDeleteService:
         IMPORTANT: Entity set members are ALWAYS deleted, even if no cells are found.
         This ensures entities are removed from the UI even if all their cells were already deleted.
 
-        Process:
-        1. entity_ids → member_ids (via entity_set_members table)
-        2. Soft delete the entity set members (ALWAYS)
-        3. member_ids → cell_ids (via cell_entity_refs table)
-        4. Soft delete cells (if any found)
+        Each filter is set-based (one statement on Postgres): entity_ids ->
+        members -> cells, marking the members, cells and the cells' entity refs
+        deleted. Cells shared between filters are only counted by the first.
 
         Returns:
             Tuple of (entities_deleted, cells_deleted)
         """
-        cell_ids_set: set[int] = set()
-        member_ids_to_delete: set[int] = set()
+        member_count = 0
+        cell_count = 0
 
         for filter in entity_set_filters:
-            # Step 1: Get member IDs for these entity IDs
-            # NOTE: This uses the version that includes deleted=False filter,
-            # so we only find non-deleted members to delete
-            member_ids = await self.member_repo.get_member_ids_by_entity_ids(
-                filter.entity_set_id, filter.entity_ids
+            filter_members, filter_cells = (
+                await self.member_repo.soft_delete_with_cells(
+                    matrix_id, filter.entity_set_id, filter.entity_ids
+                )
             )
 
-            if not member_ids:
+            if not filter_members:
                 logger.warning(
-                    f"No members found for entity_set_id={filter.entity_set_id}, "
-                    f"entity_ids={filter.entity_ids} - may already be deleted"
+                    f"No members found for entity_set_id={filter.entity_set_id} "
+                    f"({len(filter.entity_ids)} entity IDs) - may already be deleted"
                 )
                 continue
 
-            # Track member IDs to delete
-            member_ids_to_delete.update(member_ids)
-
-            # Step 2: Get cells that reference these members (any role)
-            found_cell_ids = await self.cell_ref_repo.get_cells_by_member_ids(
-                matrix_id, filter.entity_set_id, member_ids
-            )
-
-            cell_ids_set.update(found_cell_ids)
-            logger.info(
-                f"Entity set filter (set_id={filter.entity_set_id}, "
-                f"entity_ids={filter.entity_ids}): found {len(member_ids)} members and {len(found_cell_ids)} cells"
-            )
-
-        if not member_ids_to_delete:
-            logger.info(
-                "No members matched the entity filters for deletion (may already be deleted)"
-            )
-            return 0, 0
-
-        logger.info(
-            f"Preparing to soft delete: {len(member_ids_to_delete)} members and {len(cell_ids_set)} cells"
-        )
-        logger.info(f"Member IDs to delete: {list(member_ids_to_delete)}")
-        logger.info(f"Cell IDs to delete: {list(cell_ids_set)}")
-
-        # CRITICAL: Soft delete the entity set members FIRST and ALWAYS
-        # This ensures they disappear from the UI even if cells are already deleted
-        member_count = 0
-        if member_ids_to_delete:
-            for member_id in member_ids_to_delete:
-                deleted = await self.member_repo.soft_delete(member_id)
-                if deleted:
-                    member_count += 1
-            logger.info(
-                f"Soft deleted {member_count} entity set members (attempted {len(member_ids_to_delete)})"
-            )
-
-        # Soft delete the cells (if any found)
-        cell_count = 0
-        if cell_ids_set:
-            cell_count = await self.matrix_cell_repo.bulk_soft_delete_by_cell_ids(
-                list(cell_ids_set)
-            )
+            member_count += filter_members
+            cell_count += filter_cells
             logger.info(
-                f"Soft deleted {cell_count} cells (attempted {len(cell_ids_set)})"
+                f"Entity set filter (set_id={filter.entity_set_id}): soft deleted "
+                f"{filter_members} members and {filter_cells} cells"
             )
 
         return member_count, cell_count
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Boolean, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Boolean, DateTime, ForeignKey, Float, JSON
 from common.db.base import Base, BigIntegerType
 from sqlalchemy.sql import func
 
@@ -18,6 +18,8 @@ class AnswerSetEntity(Base):
     )
     answer_found = Column(Boolean, default=False, nullable=False)
     confidence = Column(Float, default=1.0, nullable=True)
+    # document_id -> chunk IDs shown to the model (retrieval-trimmed prompts only)
+    context_chunk_ids = Column(JSON, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
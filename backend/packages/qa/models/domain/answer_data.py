@@ -1,4 +1,4 @@
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Union
 from pydantic import BaseModel
 from packages.qa.models.domain.citation import CitationReference
 
@@ -65,6 +65,8 @@ class AIAnswerSet:
         """
         self.answer_found = answer_found
         self.answers = answers
+        # document_id -> chunk IDs shown to the model, for retrieval-trimmed prompts
+        self.context_chunk_ids: Dict[int, List[str]] = {}
 
     @classmethod
     def not_found(cls) -> "AIAnswerSet":
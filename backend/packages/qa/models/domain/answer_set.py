@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 
@@ -11,6 +12,7 @@ class AnswerSetModel(BaseModel):
     company_id: int
     answer_found: bool = False
     confidence: float = 1.0
+    context_chunk_ids: Optional[Dict[int, List[str]]] = None
     created_at: datetime
     updated_at: datetime
 
@@ -1,9 +1,14 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from sqlalchemy import JSON, case, insert, literal, update
 from sqlalchemy.future import select
 from common.core.otel_axiom_exporter import trace_span
 from common.repositories.base import BaseRepository
 from common.providers.caching import cache
+from packages.matrices.models.database.matrix import MatrixCellEntity
+from packages.qa.models.database.answer import AnswerEntity
 from packages.qa.models.database.answer_set import AnswerSetEntity
+from packages.qa.models.database.citation import CitationEntity, CitationSetEntity
+from packages.qa.models.domain.answer_data import AnswerData
 from packages.qa.models.domain.answer_set import AnswerSetModel
 from packages.qa.cache_keys import (
     answer_set_by_matrix_cell_key,
@@ -51,3 +56,131 @@ class AnswerSetRepository(BaseRepository[AnswerSetEntity, AnswerSetModel]):
             result = await session.execute(query)
             entity = result.scalar_one_or_none()
             return self._entity_to_domain(entity) if entity else None
+
+    @trace_span
+    async def create_with_answers(
+        self,
+        matrix_cell_id: int,
+        question_type_id: int,
+        answer_found: bool,
+        confidence: float,
+        answers: List[AnswerData],
+        set_as_current: bool = True,
+        context_chunk_ids: Optional[Dict[int, List[str]]] = None,
+    ) -> Optional[AnswerSetModel]:
+        """
+        Persist an answer set with its answers, citation sets and citations.
+
+        Uses one multi-row INSERT ... RETURNING per table, then sets the
+        answers' current citation sets and the cell's current answer set, all
+        in one session. The company comes from the cell inside the first
+        INSERT, so the cell isn't fetched separately.
+
+        Returns:
+            The created answer set, or None if the cell doesn't exist
+        """
+        async with self._get_session() as session:
+            columns = [
+                AnswerSetEntity.matrix_cell_id,
+                AnswerSetEntity.question_type_id,
+                AnswerSetEntity.answer_found,
+                AnswerSetEntity.confidence,
+                AnswerSetEntity.company_id,
+            ]
+            values = [
+                literal(matrix_cell_id),
+                literal(question_type_id),
+                literal(answer_found),
+                literal(confidence),
+                MatrixCellEntity.company_id,
+            ]
+            if context_chunk_ids is not None:
+                columns.append(AnswerSetEntity.context_chunk_ids)
+                values.append(literal(context_chunk_ids, JSON))
+            cell = select(*values).where(MatrixCellEntity.id == matrix_cell_id)
+            result = await session.execute(
+                insert(AnswerSetEntity)
+                .from_select(columns, cell)
+                .returning(AnswerSetEntity)
+            )
+            answer_set = result.scalar_one_or_none()
+            if answer_set is None:
+                return None
+            company_id = answer_set.company_id
+
+            if answers:
+                result = await session.execute(
+                    insert(AnswerEntity).returning(
+                        AnswerEntity.id, sort_by_parameter_order=True
+                    ),
+                    [
+                        {
+                            "answer_set_id": answer_set.id,
+                            "company_id": company_id,
+                            "answer_data": answer.model_dump(exclude_none=True),
+                        }
+                        for answer in answers
+                    ],
+                )
+                answer_ids = result.scalars().all()
+
+                cited = [
+                    (answer_id, answer)
+                    for answer_id, answer in zip(answer_ids, answers)
+                    if answer.citations
+                ]
+                if cited:
+                    result = await session.execute(
+                        insert(CitationSetEntity).returning(
+                            CitationSetEntity.id, sort_by_parameter_order=True
+                        ),
+                        [
+                            {"answer_id": answer_id, "company_id": company_id}
+                            for answer_id, _ in cited
+                        ],
+                    )
+                    citation_set_ids = result.scalars().all()
+
+                    await session.execute(
+                        insert(CitationEntity),
+                        [
+                            {
+                                "citation_set_id": citation_set_id,
+                                "document_id": citation.document_id,
+                                "company_id": company_id,
+                                "quote_text": citation.quote_text,
+                                "citation_order": citation.citation_number,
+                            }
+                            for citation_set_id, (_, answer) in zip(
+                                citation_set_ids, cited
+                            )
+                            for citation in answer.citations
+                        ],
+                    )
+
+                    current_by_answer = {
+                        answer_id: citation_set_id
+                        for citation_set_id, (answer_id, _) in zip(
+                            citation_set_ids, cited
+                        )
+                    }
+                    await session.execute(
+                        update(AnswerEntity)
+                        .where(AnswerEntity.id.in_(current_by_answer))
+                        .values(
+                            current_citation_set_id=case(
+                                current_by_answer, value=AnswerEntity.id
+                            )
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+
+            if set_as_current:
+                await session.execute(
+                    update(MatrixCellEntity)
+                    .where(MatrixCellEntity.id == matrix_cell_id)
+                    .values(current_answer_set_id=answer_set.id)
+                    .execution_options(synchronize_session=False)
+                )
+
+            return self._entity_to_domain(answer_set)
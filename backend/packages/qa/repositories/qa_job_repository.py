@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy import String, cast, update
 from sqlalchemy.future import select
 
 from common.repositories.base import BaseRepository
@@ -53,3 +54,37 @@ class QAJobRepository(BaseRepository[QAJobEntity, QAJobModel]):
             )
             entities = result.scalars().all()
             return self._entities_to_domain(entities)
+
+    @trace_span
+    async def get_unpublished_for_matrix(self, matrix_id: int) -> List[QAJobModel]:
+        """Get queued jobs of a matrix whose worker message was never published."""
+        async with self._get_session() as session:
+            result = await session.execute(
+                select(self.entity_class)
+                .join(
+                    MatrixCellEntity,
+                    MatrixCellEntity.id == self.entity_class.matrix_cell_id,
+                )
+                .where(
+                    MatrixCellEntity.matrix_id == matrix_id,
+                    self.entity_class.status == QAJobStatus.QUEUED.value,
+                    self.entity_class.worker_message_id.is_(None),
+                )
+                .order_by(self.entity_class.id)
+            )
+            entities = result.scalars().all()
+            return self._entities_to_domain(entities)
+
+    @trace_span
+    async def mark_published(self, job_ids: List[int]) -> None:
+        """Record that worker messages were published for jobs (message ID = job ID)."""
+        if not job_ids:
+            return
+
+        async with self._get_session() as session:
+            await session.execute(
+                update(self.entity_class)
+                .where(self.entity_class.id.in_(job_ids))
+                .values(worker_message_id=cast(self.entity_class.id, String))
+                .execution_options(synchronize_session=False)
+            )
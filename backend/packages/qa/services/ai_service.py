@@ -7,6 +7,8 @@ from typing import Optional, Dict, Any, List
 from common.providers.ai import get_ai_provider
 from common.providers.ai.interface import AIProviderInterface
 from common.providers.ai.models import InputMessage, MessageRole
+from common.core.config import settings
+from common.core.constants import QAContextMode
 from common.core.otel_axiom_exporter import trace_span, axiom_tracer, get_logger
 from packages.ai_model.repositories.ai_model_repository import AIModelRepository
 from packages.questions.models.domain.question import QuestionModel
@@ -19,6 +21,9 @@ from ai_config import (
 from packages.matrices.models.domain.matrix_enums import MatrixType
 from packages.qa.utils.message_builders import MessageBuilder, DocumentContext
 from packages.qa.services.ai_response_parser import AIResponseParser
+from packages.qa.services.context_retrieval_service import (
+    get_context_retrieval_service,
+)
 from packages.qa.models.domain.answer_data import AIAnswerSet
 from packages.questions.services.question_option_service import QuestionOptionService
 
@@ -113,6 +118,11 @@ class AIService:
                     f"Loaded {len(options)} options for SELECT question: {options}"
                 )
 
+            if settings.qa_context_mode == QAContextMode.RETRIEVAL:
+                documents = await get_context_retrieval_service().trim_documents(
+                    documents, question, company_id
+                )
+
             # Build structured messages optimized for caching
             user_messages = MessageBuilder.build_user_message(
                 documents, question, type_enum, options, min_answers, max_answers
@@ -161,6 +171,12 @@ class AIService:
                 f"Parsed response into answer set: found={answer_set.answer_found}, count={answer_set.answer_count}"
             )
 
+            answer_set.context_chunk_ids = {
+                doc.document_id: doc.included_chunk_ids
+                for doc in documents
+                if doc.included_chunk_ids is not None
+            }
+
             logger.info(
                 f"Generated answer set with {answer_set.answer_count} answer(s), found={answer_set.answer_found} for {type_enum.name if type_enum else 'standard'} question: {question[:50]}..."
             )
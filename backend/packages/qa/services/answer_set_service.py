@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from common.core.otel_axiom_exporter import trace_span, get_logger
 from packages.qa.repositories.answer_set_repository import AnswerSetRepository
+from packages.qa.models.domain.answer_data import AnswerData
 from packages.qa.models.domain.answer_set import AnswerSetModel, AnswerSetCreateModel
 
 logger = get_logger(__name__)
@@ -30,6 +31,34 @@ class AnswerSetService:
         logger.info(f"Created answer set with ID: {answer_set.id}")
         return answer_set
 
+    @trace_span
+    async def create_answer_set_with_answers(
+        self,
+        matrix_cell_id: int,
+        question_type_id: int,
+        answer_found: bool,
+        confidence: float,
+        answers: List[AnswerData],
+        set_as_current: bool = True,
+        context_chunk_ids: Optional[Dict[int, List[str]]] = None,
+    ) -> Optional[AnswerSetModel]:
+        """
+        Create an answer set with all answers and citations in a few bulk writes.
+
+        context_chunk_ids records, per document, the chunks shown to the model
+        when the prompt was retrieval-trimmed. Returns None if the matrix cell
+        doesn't exist.
+        """
+        return await self.answer_set_repo.create_with_answers(
+            matrix_cell_id,
+            question_type_id,
+            answer_found,
+            confidence,
+            answers,
+            set_as_current=set_as_current,
+            context_chunk_ids=context_chunk_ids,
+        )
+
     @trace_span
     async def get_answer_set(
         self, answer_set_id: int, company_id: Optional[int] = None
@@ -0,0 +1,173 @@
+"""
+Retrieval-trimmed document context for QA prompts.
+
+In retrieval mode, documents that don't fit the prompt's token budget are
+replaced by their most relevant chunks (hybrid keyword + vector search over the
+chunk index). Selected chunks are rendered in document order (chunk_order) and
+their IDs are recorded on the DocumentContext, so quotes in the answer can still
+be resolved to the chunks the model actually saw.
+"""
+
+import asyncio
+from typing import List, Optional
+
+from packages.documents.providers.document_search.types import (
+    ChunkSearchFilters,
+    ChunkSearchHit,
+)
+from packages.documents.services.chunk_search_service import (
+    ChunkSearchService,
+    get_chunk_search_service,
+)
+from packages.documents.services.chunk_service import ChunkService
+from packages.qa.utils.message_builders import ContextChunk, DocumentContext
+from common.core.config import settings
+from common.core.otel_axiom_exporter import get_logger, trace_span
+
+logger = get_logger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate from character count."""
+    return len(text) // settings.qa_context_chars_per_token
+
+
+class ContextRetrievalService:
+    """Selects the relevant chunks of large documents for a question."""
+
+    def __init__(
+        self,
+        chunk_search_service: Optional[ChunkSearchService] = None,
+        chunk_service: Optional[ChunkService] = None,
+    ):
+        self.chunk_search_service = chunk_search_service or get_chunk_search_service()
+        self.chunk_service = chunk_service or ChunkService()
+
+    @trace_span
+    async def trim_documents(
+        self,
+        documents: List[DocumentContext],
+        query: str,
+        company_id: int,
+        token_budget: Optional[int] = None,
+        top_k: Optional[int] = None,
+    ) -> List[DocumentContext]:
+        """
+        Fit documents into a token budget using the chunk index.
+
+        Documents that fit their share of the budget are kept whole; the rest
+        of the budget is split across the larger documents, which are reduced
+        to their top-k chunks for the query. A document for which no chunk
+        fits (e.g. not indexed yet, or no budget left) is truncated to its
+        share instead, so the budget always holds.
+
+        Args:
+            documents: Full-content document contexts
+            query: Resolved question text used as the search query
+            company_id: Company ID for search scoping
+            token_budget: Total document tokens allowed (default from settings)
+            top_k: Maximum chunks retrieved per document (default from settings)
+
+        Returns:
+            Document contexts in the same order, trimmed where needed
+        """
+        token_budget = token_budget or settings.qa_context_token_budget
+        top_k = top_k or settings.qa_context_top_k
+
+        sizes = [estimate_tokens(doc.content) for doc in documents]
+        if sum(sizes) <= token_budget:
+            return documents
+
+        # Small documents keep their full content; large ones share the rest
+        fair_share = token_budget // len(documents)
+        large = [i for i, size in enumerate(sizes) if size > fair_share]
+        remaining = token_budget - sum(
+            size for i, size in enumerate(sizes) if i not in large
+        )
+        per_document_budget = max(remaining // len(large), 0)
+
+        trimmed = await asyncio.gather(
+            *(
+                self._select_chunks(
+                    documents[i], query, company_id, per_document_budget, top_k
+                )
+                for i in large
+            )
+        )
+
+        result = list(documents)
+        for i, doc in zip(large, trimmed):
+            result[i] = doc
+        return result
+
+    async def _select_chunks(
+        self,
+        document: DocumentContext,
+        query: str,
+        company_id: int,
+        token_budget: int,
+        top_k: int,
+    ) -> DocumentContext:
+        """Reduce one document to its highest-ranked chunks within budget."""
+        if token_budget <= 0:
+            return self._truncate(document, token_budget)
+
+        search_result = await self.chunk_search_service.hybrid_search_chunks(
+            query=query,
+            filters=ChunkSearchFilters(
+                company_id=company_id, document_ids=[document.document_id]
+            ),
+            limit=top_k,
+        )
+
+        selected: List[ChunkSearchHit] = []
+        used = 0
+        for hit in search_result.chunks:
+            if not hit.content:
+                continue
+            size = estimate_tokens(hit.content)
+            if used + size > token_budget:
+                continue
+            selected.append(hit)
+            used += size
+
+        if not selected:
+            logger.warning(
+                f"No chunks retrieved for document {document.document_id}, "
+                f"truncating content to budget"
+            )
+            return self._truncate(document, token_budget)
+
+        # Present excerpts in reading order rather than rank order
+        chunk_models = await self.chunk_service.get_chunks_by_document_chunk_ids(
+            [(document.document_id, hit.chunk_id) for hit in selected], company_id
+        )
+        chunk_order = {chunk.chunk_id: chunk.chunk_order for chunk in chunk_models}
+        selected.sort(key=lambda hit: chunk_order.get(hit.chunk_id, len(chunk_order)))
+
+        logger.info(
+            f"Trimmed document {document.document_id} to {len(selected)} chunk(s) "
+            f"(~{used} tokens)"
+        )
+
+        return DocumentContext(
+            document_id=document.document_id,
+            content=document.content,
+            chunks=[
+                ContextChunk(chunk_id=hit.chunk_id, content=hit.content)
+                for hit in selected
+            ],
+        )
+
+    @staticmethod
+    def _truncate(document: DocumentContext, token_budget: int) -> DocumentContext:
+        """Cut a document's full content down to token_budget."""
+        max_chars = max(token_budget, 0) * settings.qa_context_chars_per_token
+        return DocumentContext(
+            document_id=document.document_id, content=document.content[:max_chars]
+        )
+
+
+def get_context_retrieval_service() -> ContextRetrievalService:
+    """Get context retrieval service instance."""
+    return ContextRetrievalService()
@@ -7,11 +7,36 @@ from ai_config import get_type_instruction
 from common.providers.ai.models import InputMessage, MessageRole
 
 
+class ContextChunk(BaseModel):
+    """A retrieved chunk included in the prompt in place of the full document."""
+
+    chunk_id: str
+    content: str
+
+
 class DocumentContext(BaseModel):
     """Document context for message building - pairs document ID with content."""
 
     document_id: int
     content: str
+    # Set when the document was trimmed to retrieved chunks (retrieval mode)
+    chunks: Optional[List[ContextChunk]] = None
+
+    @property
+    def included_chunk_ids(self) -> Optional[List[str]]:
+        """IDs of the chunks shown to the model, or None if the full content was."""
+        if self.chunks is None:
+            return None
+        return [chunk.chunk_id for chunk in self.chunks]
+
+    def render(self) -> str:
+        """Document text as shown to the model."""
+        if self.chunks is None:
+            return self.content
+
+        return "\n\n".join(
+            f"[Excerpt {chunk.chunk_id}]\n{chunk.content}" for chunk in self.chunks
+        )
 
 
 class MessageBuilder:
@@ -49,7 +74,7 @@ class MessageBuilder:
             messages.append(
                 InputMessage(
                     role=MessageRole.USER,
-                    content=f"Document {doc_context.document_id}:\n{doc_context.content}",
+                    content=f"Document {doc_context.document_id}:\n{doc_context.render()}",
                 )
             )
 
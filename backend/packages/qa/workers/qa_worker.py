@@ -13,10 +13,13 @@ from packages.qa.temporal.agent_qa_workflow import AgentQAWorkflow
 from common.providers.locking.factory import get_lock_provider
 from common.temporal.client import get_temporal_client
 from common.core.config import settings
+from packages.documents.services.extracted_content_cache import (
+    get_extracted_content_cache,
+)
 
 from datetime import datetime
 
-from common.core.otel_axiom_exporter import trace_span, get_logger
+from common.core.otel_axiom_exporter import trace_span, get_logger, log_span_event
 
 logger = get_logger(__name__)
 
@@ -274,6 +277,10 @@ class QAWorker(BaseWorker[QAJobMessage]):
                 )
 
                 logger.info(f"Successfully completed QA job {job_id}")
+                log_span_event(
+                    "Extracted content cache stats",
+                    get_extracted_content_cache().stats(),
+                )
 
             finally:
                 # Always release the lock
@@ -11,7 +11,7 @@ class QuestionTypeRepository(BaseRepository[QuestionTypeEntity, QuestionTypeMode
     def __init__(self):
         super().__init__(QuestionTypeEntity, QuestionTypeModel)
 
-    @cache(QuestionTypeModel, ttl=3600)  # 1 hour cache
+    @cache(QuestionTypeModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_all_question_types(self) -> List[QuestionTypeModel]:
         """Get all available question types."""
         async with self._get_session() as session:
@@ -20,7 +20,7 @@ class QuestionTypeRepository(BaseRepository[QuestionTypeEntity, QuestionTypeMode
             entities = result.scalars().all()
             return [QuestionTypeModel.model_validate(entity) for entity in entities]
 
-    @cache(QuestionTypeModel, ttl=3600)  # 1 hour cache
+    @cache(QuestionTypeModel, ttl=3600, local_ttl=60)  # 1 hour cache
     async def get_question_type_by_name(self, name: str) -> Optional[QuestionTypeModel]:
         """Get a question type by its name."""
         async with self._get_session() as session:
@@ -3,7 +3,9 @@ from fastapi import HTTPException
 
 from packages.users.repositories.user_repository import UserRepository
 from packages.users.models.domain.user import User, UserCreateModel, UserUpdateModel
+from packages.users.cache_keys import user_by_sso_key
 from common.core.otel_axiom_exporter import trace_span, get_logger
+from common.providers.caching import get_cache_provider
 
 logger = get_logger(__name__)
 
@@ -93,6 +95,7 @@ class UserService:
 
         user = await self.user_repo.update(user_id, user_update)
         if user:
+            await self._invalidate_auth_caches(existing)
             logger.info(f"Updated user {user_id}")
         return user
 
@@ -104,7 +107,32 @@ class UserService:
     @trace_span
     async def delete_user(self, user_id: int) -> bool:
         """Delete a user."""
+        existing = await self.user_repo.get(user_id)
         success = await self.user_repo.delete(user_id)
         if success:
+            if existing:
+                await self._invalidate_auth_caches(existing)
             logger.info(f"Deleted user {user_id}")
         return success
+
+    @trace_span
+    async def _invalidate_auth_caches(self, user: User) -> None:
+        """Drop cached SSO lookups so a changed or deleted user stops authenticating."""
+        if not user.sso_provider or not user.sso_user_id:
+            return
+
+        # Deferred: the auth package imports this service
+        from packages.auth.cache_keys import principal_by_sso_key  # noqa: PLC0415
+        from packages.auth.services.principal_cache import (  # noqa: PLC0415
+            get_principal_cache,
+        )
+
+        await get_principal_cache().invalidate(
+            principal_by_sso_key(user.sso_provider, user.sso_user_id)
+        )
+        try:
+            await get_cache_provider().delete(
+                user_by_sso_key(user.sso_provider, user.sso_user_id)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to invalidate SSO user cache for {user.id}: {e}")
@@ -24,6 +24,8 @@ with patch("common.providers.rate_limiter.limiter.limiter", test_limiter):
     from api.main import app
 
 from common.db.session import get_db, get_db_readonly
+from common.providers.caching.local_cache import get_local_cache_if_initialized
+from packages.auth.services.principal_cache import get_principal_cache
 from common.db.base import Base
 from packages.agents.models.database.conversation import ConversationEntity
 from packages.agents.models.database.message import MessageEntity
@@ -129,6 +131,16 @@ async def patch_lazy_sessions(test_session_factory, monkeypatch):
     )
 
 
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def reset_local_caches():
+    """Drop in-process cache tiers so entries don't leak between test databases."""
+    yield
+    local_cache = get_local_cache_if_initialized()
+    if local_cache is not None:
+        local_cache.clear()
+    get_principal_cache().clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(test_db: AsyncSession, test_user):
     """Create a test client."""
@@ -140,6 +140,13 @@ class TestS3Integration:
         content = await s3_storage.download("nonexistent/file.txt")
         assert content is None
 
+    async def test_get_size(self, s3_storage, test_s3_key, sample_file_content):
+        """Test getting the size of a file, and of one that doesn't exist."""
+        await s3_storage.upload(test_s3_key, io.BytesIO(sample_file_content))
+
+        assert await s3_storage.get_size(test_s3_key) == len(sample_file_content)
+        assert await s3_storage.get_size("nonexistent/file.txt") is None
+
     async def test_delete_nonexistent_file(self, s3_storage):
         """Test deleting a file that doesn't exist."""
         # S3 delete is idempotent - deleting non-existent file should succeed
@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from temporalio.testing import ActivityEnvironment
+
+from common.core.config import settings
+from common.execution.workflow_framework.activity_helpers import (
+    PAYLOAD_REF_PREFIX,
+    delete_offloaded_payloads,
+    offload_payload,
+    resolve_payload,
+)
+
+
+@pytest.fixture
+def storage():
+    """In-memory storage mock."""
+    objects = {}
+    storage = MagicMock()
+
+    async def upload(key, file_obj, metadata=None):
+        objects[key] = file_obj.getvalue()
+        return True
+
+    async def download(key):
+        return objects.get(key)
+
+    async def delete_prefix(prefix):
+        keys = [key for key in objects if key.startswith(prefix)]
+        for key in keys:
+            del objects[key]
+        return len(keys)
+
+    storage.upload = AsyncMock(side_effect=upload)
+    storage.download = AsyncMock(side_effect=download)
+    storage.delete_prefix = AsyncMock(side_effect=delete_prefix)
+    storage.objects = objects
+
+    with (
+        patch(
+            "common.execution.workflow_framework.activity_helpers.get_storage",
+            return_value=storage,
+        ),
+        patch.object(settings, "temporal_payload_offload_threshold", 100),
+    ):
+        yield storage
+
+
+class TestPayloadOffloading:
+    @pytest.mark.asyncio
+    async def test_small_payload_passed_inline(self, storage):
+        """Test that payloads under the threshold are returned unchanged."""
+        result = await ActivityEnvironment().run(offload_payload, "small")
+
+        assert result == "small"
+        storage.upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_payload_round_trips_by_reference(self, storage):
+        """Test that large payloads are stored under the workflow run's prefix."""
+        content = "é" * 200
+
+        ref = await ActivityEnvironment().run(offload_payload, content)
+
+        assert ref.startswith(PAYLOAD_REF_PREFIX)
+        key = ref[len(PAYLOAD_REF_PREFIX) :]
+        assert key.startswith("temporal/payloads/")
+        assert storage.objects[key] == content.encode("utf-8")
+        assert await resolve_payload(ref) == content
+
+    @pytest.mark.asyncio
+    async def test_outside_activity_is_inline(self, storage):
+        """Test that direct calls (no activity context) never offload."""
+        content = "x" * 1000
+
+        assert await offload_payload(content) == content
+        storage.upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_deletes_run_payloads(self, storage):
+        """Test that cleanup removes what the run offloaded."""
+        env = ActivityEnvironment()
+        ref = await env.run(offload_payload, "x" * 1000)
+
+        deleted = await env.run(delete_offloaded_payloads)
+
+        assert deleted == 1
+        assert storage.objects == {}
+        with pytest.raises(ValueError, match="Offloaded payload not found"):
+            await resolve_payload(ref)
+
+    @pytest.mark.asyncio
+    async def test_plain_values_resolve_to_themselves(self, storage):
+        """Test that non-reference values pass through resolve_payload."""
+        assert await resolve_payload("# Markdown") == "# Markdown"
+        storage.download.assert_not_called()
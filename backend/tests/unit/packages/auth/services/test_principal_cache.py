@@ -0,0 +1,84 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from packages.auth.models.domain.authenticated_user import AuthenticatedUser
+from packages.auth.services.principal_cache import PrincipalCache
+
+
+class TestPrincipalCache:
+    """Test PrincipalCache behavior."""
+
+    @pytest.fixture
+    def principal(self):
+        return AuthenticatedUser(user_id=1, company_id=10)
+
+    async def test_set_and_get(self, principal):
+        """Test that a stored principal is served from L1 and counted as a hit."""
+        cache = PrincipalCache(max_entries=10, local_ttl=30)
+
+        assert await cache.get("principal:api_key:abc") is None
+        await cache.set("principal:api_key:abc", principal)
+
+        assert await cache.get("principal:api_key:abc") == principal
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    async def test_local_entries_expire(self, principal):
+        """Test that L1 entries are dropped after the local TTL (plus jitter)."""
+        cache = PrincipalCache(max_entries=10, local_ttl=30)
+
+        with patch("common.providers.caching.local_cache.time.monotonic") as clock:
+            clock.return_value = 100.0
+            await cache.set("key", principal)
+            clock.return_value = 134.0
+            assert await cache.get("key") is None
+
+        assert len(cache) == 0
+
+    async def test_evicts_least_recently_used(self, principal):
+        """Test that the LRU is bounded by entry count."""
+        cache = PrincipalCache(max_entries=2, local_ttl=30)
+
+        await cache.set("a", principal)
+        await cache.set("b", principal)
+        await cache.get("a")
+        await cache.set("c", principal)
+
+        assert await cache.get("a") == principal
+        assert await cache.get("b") is None
+
+    async def test_falls_back_to_shared_tier(self, principal):
+        """Test that an L1 miss is served from the shared cache and promoted."""
+        shared = AsyncMock()
+        shared.get = AsyncMock(return_value=principal.model_dump())
+        cache = PrincipalCache(max_entries=10, local_ttl=30, shared_cache=shared)
+
+        assert await cache.get("key") == principal
+        assert await cache.get("key") == principal
+        shared.get.assert_awaited_once_with("key")
+
+    async def test_invalidate_drops_both_tiers(self, principal):
+        """Test that invalidation removes the principal locally and shared."""
+        shared = AsyncMock()
+        shared.get = AsyncMock(return_value=None)
+        cache = PrincipalCache(
+            max_entries=10, local_ttl=30, shared_cache=shared, shared_ttl=300
+        )
+
+        await cache.set("key", principal)
+        shared.set.assert_awaited_once_with("key", principal.model_dump(), 300)
+
+        await cache.invalidate("key")
+
+        shared.delete.assert_awaited_once_with("key")
+        assert await cache.get("key") is None
+
+    async def test_shared_failures_are_ignored(self, principal):
+        """Test that shared cache errors never fail authentication."""
+        shared = AsyncMock()
+        shared.get = AsyncMock(side_effect=Exception("redis down"))
+        shared.set = AsyncMock(side_effect=Exception("redis down"))
+        cache = PrincipalCache(max_entries=10, local_ttl=30, shared_cache=shared)
+
+        assert await cache.get("key") is None
+        await cache.set("key", principal)
+        assert await cache.get("key") == principal
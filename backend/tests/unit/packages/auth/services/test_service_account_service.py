@@ -1,5 +1,6 @@
 import pytest
 import hashlib
+from unittest.mock import patch
 from sqlalchemy.ext.asyncio import AsyncSession
 from packages.auth.services.service_account_service import ServiceAccountService
 from packages.auth.models.domain.service_account import (
@@ -180,3 +181,35 @@ class TestServiceAccountService:
         """Test authenticating with non-existent key returns None."""
         result = await service.authenticate_api_key("sa_nonexistent123")
         assert result is None
+
+    async def test_authenticate_api_key_uses_principal_cache(
+        self, service, sample_company
+    ):
+        """Test that repeated authentication skips the service account lookup."""
+        result = await service.create_service_account(
+            ServiceAccountCreate(name="Cached Account", company_id=sample_company.id)
+        )
+
+        first = await service.authenticate_api_key(result.api_key)
+        with patch.object(
+            service.service_account_repo, "get_by_api_key_hash"
+        ) as mock_lookup:
+            second = await service.authenticate_api_key(result.api_key)
+
+        mock_lookup.assert_not_called()
+        assert second == first
+
+    async def test_delete_service_account_revokes_cached_principal(
+        self, service, sample_company
+    ):
+        """Test that a deleted service account stops authenticating immediately."""
+        result = await service.create_service_account(
+            ServiceAccountCreate(name="Revoked Account", company_id=sample_company.id)
+        )
+        assert await service.authenticate_api_key(result.api_key) is not None
+
+        await service.delete_service_account(
+            result.service_account.id, sample_company.id
+        )
+
+        assert await service.authenticate_api_key(result.api_key) is None
@@ -6,7 +6,9 @@ Tests database operations for usage events without mocking the database.
 
 import pytest
 from datetime import datetime, timezone, timedelta
+from sqlalchemy import select
 
+from packages.billing.models.database.usage import UsageDailyCounterEntity
 from packages.billing.repositories.usage_repository import UsageEventRepository
 from packages.billing.models.domain.usage import UsageEventCreateModel
 from packages.billing.models.domain.enums import UsageEventType
@@ -37,108 +39,7 @@ class TestUsageEventRepository:
         assert event.event_type == UsageEventType.CELL_OPERATION
         assert event.event_metadata["cell_id"] == 100
 
-    async def test_get_monthly_count(self, test_db, sample_company, sample_user_entity):
-        """Test getting monthly usage count."""
-        repo = UsageEventRepository()
-
-        # Create several usage events
-        now = datetime.now(timezone.utc)
-        for i in range(5):
-            event_data = UsageEventCreateModel(
-                company_id=sample_company.id,
-                user_id=sample_user_entity.id,
-                event_type=UsageEventType.CELL_OPERATION,
-                event_metadata={"sequence": i},
-            )
-            await repo.create(event_data)
-
-        # Get monthly count
-        count = await repo.get_monthly_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.CELL_OPERATION,
-            year=now.year,
-            month=now.month,
-        )
-
-        assert count == 5
-
-    async def test_get_period_count(self, test_db, sample_company, sample_user_entity):
-        """Test getting usage count for a billing period."""
-        repo = UsageEventRepository()
-
-        now = datetime.now(timezone.utc)
-        period_start = now - timedelta(days=15)
-        period_end = now + timedelta(days=15)
-
-        # Create several usage events
-        for i in range(4):
-            event_data = UsageEventCreateModel(
-                company_id=sample_company.id,
-                user_id=sample_user_entity.id,
-                event_type=UsageEventType.AGENTIC_QA,
-                event_metadata={"session_id": i},
-            )
-            await repo.create(event_data)
-
-        # Get period count
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_QA,
-            start_date=period_start,
-            end_date=period_end,
-        )
-
-        assert count == 4
-
-    async def test_get_monthly_count_filtered_by_type(
-        self, test_db, sample_company, sample_user_entity
-    ):
-        """Test that monthly count filters by event type."""
-        repo = UsageEventRepository()
-
-        now = datetime.now(timezone.utc)
-
-        # Create 3 cell operation events
-        for i in range(3):
-            await repo.create(
-                UsageEventCreateModel(
-                    company_id=sample_company.id,
-                    user_id=sample_user_entity.id,
-                    event_type=UsageEventType.CELL_OPERATION,
-                    event_metadata={"sequence": i},
-                )
-            )
-
-        # Create 2 storage upload events
-        for i in range(2):
-            await repo.create(
-                UsageEventCreateModel(
-                    company_id=sample_company.id,
-                    user_id=sample_user_entity.id,
-                    event_type=UsageEventType.STORAGE_UPLOAD,
-                    file_size_bytes=1000 * (i + 1),
-                    event_metadata={"document_id": i},
-                )
-            )
-
-        # Check counts
-        cell_count = await repo.get_monthly_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.CELL_OPERATION,
-            year=now.year,
-            month=now.month,
-        )
-        storage_count = await repo.get_monthly_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.STORAGE_UPLOAD,
-            year=now.year,
-            month=now.month,
-        )
-
-        assert cell_count == 3
-        assert storage_count == 2
-
-    async def test_get_storage_bytes_for_period(
+    async def test_period_total_sums_storage_bytes(
         self, test_db, sample_company, sample_user_entity
     ):
         """Test getting total storage bytes for a billing period."""
@@ -162,11 +63,14 @@ class TestUsageEventRepository:
             )
 
         # Get total storage bytes
-        total_bytes = await repo.get_storage_bytes_for_period(
-            company_id=sample_company.id,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        total_bytes = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.STORAGE_UPLOAD,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).file_size_bytes
 
         assert total_bytes == sum(file_sizes)  # 6000 bytes
 
@@ -228,6 +132,8 @@ class TestUsageEventRepository:
         repo = UsageEventRepository()
 
         now = datetime.now(timezone.utc)
+        period_start = now - timedelta(days=15)
+        period_end = now + timedelta(days=15)
 
         # Create events for company 1
         for i in range(3):
@@ -252,18 +158,22 @@ class TestUsageEventRepository:
             )
 
         # Check counts are isolated
-        count1 = await repo.get_monthly_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.CELL_OPERATION,
-            year=now.year,
-            month=now.month,
-        )
-        count2 = await repo.get_monthly_count(
-            company_id=second_company.id,
-            event_type=UsageEventType.CELL_OPERATION,
-            year=now.year,
-            month=now.month,
-        )
+        count1 = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.CELL_OPERATION,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
+        count2 = (
+            await repo.get_period_total(
+                company_id=second_company.id,
+                event_type=UsageEventType.CELL_OPERATION,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
 
         assert count1 == 3
         assert count2 == 5
@@ -311,52 +221,16 @@ class TestUsageEventRepository:
         )
 
         # Get period count - should be SUM of quantities (100 + 50 + 1 = 151)
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.CELL_OPERATION,
-            start_date=period_start,
-            end_date=period_end,
-        )
-
-        assert count == 151  # 100 + 50 + 1
-
-    async def test_monthly_count_with_quantities(
-        self, test_db, sample_company, sample_user_entity
-    ):
-        """Test that monthly count properly sums quantities."""
-        repo = UsageEventRepository()
-
-        now = datetime.now(timezone.utc)
-
-        # Create events with various quantities
-        await repo.create(
-            UsageEventCreateModel(
-                company_id=sample_company.id,
-                user_id=sample_user_entity.id,
-                event_type=UsageEventType.AGENTIC_QA,
-                quantity=25,
-                event_metadata={"question_id": 1},
-            )
-        )
-        await repo.create(
-            UsageEventCreateModel(
+        count = (
+            await repo.get_period_total(
                 company_id=sample_company.id,
-                user_id=sample_user_entity.id,
-                event_type=UsageEventType.AGENTIC_QA,
-                quantity=75,
-                event_metadata={"question_id": 2},
+                event_type=UsageEventType.CELL_OPERATION,
+                start_date=period_start,
+                end_date=period_end,
             )
-        )
-
-        # Get monthly count
-        count = await repo.get_monthly_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_QA,
-            year=now.year,
-            month=now.month,
-        )
+        ).quantity
 
-        assert count == 100  # 25 + 75
+        assert count == 151  # 100 + 50 + 1
 
     async def test_negative_quantity_reduces_count(
         self, test_db, sample_company, sample_user_entity
@@ -392,12 +266,14 @@ class TestUsageEventRepository:
         )
 
         # Get period count - should be 3 + (-1) = 2
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.AGENTIC_CHUNKING,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
 
         assert count == 2  # 3 reservations - 1 refund
 
@@ -436,12 +312,14 @@ class TestUsageEventRepository:
             )
 
         # Get period count - should be 5 + (-3) = 2
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.AGENTIC_CHUNKING,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
 
         assert count == 2  # 5 reservations - 3 refunds
 
@@ -476,16 +354,18 @@ class TestUsageEventRepository:
         )
 
         # Get period count - should be 0
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.AGENTIC_CHUNKING,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
 
         assert count == 0
 
-    async def test_get_document_count_for_period(
+    async def test_period_total_counts_document_uploads(
         self, test_db, sample_company, sample_user_entity
     ):
         """Test counting STORAGE_UPLOAD events for document quota."""
@@ -508,19 +388,22 @@ class TestUsageEventRepository:
             )
 
         # Get document count
-        count = await repo.get_document_count_for_period(
-            company_id=sample_company.id,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.STORAGE_UPLOAD,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).event_count
 
         # Should count events, not sum quantities or bytes
         assert count == 5
 
-    async def test_get_document_count_excludes_other_event_types(
+    async def test_period_total_filters_by_event_type(
         self, test_db, sample_company, sample_user_entity
     ):
-        """Test that document count only counts STORAGE_UPLOAD events."""
+        """Test that the upload count only includes STORAGE_UPLOAD events."""
         repo = UsageEventRepository()
 
         now = datetime.now(timezone.utc)
@@ -558,59 +441,109 @@ class TestUsageEventRepository:
         )
 
         # Get document count - should only count STORAGE_UPLOAD events
-        count = await repo.get_document_count_for_period(
-            company_id=sample_company.id,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.STORAGE_UPLOAD,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).event_count
 
         assert count == 3
 
-    async def test_get_document_count_isolated_by_company(
-        self, test_db, sample_company, second_company, sample_user_entity
+    async def test_create_maintains_daily_counter(
+        self, test_db, sample_company, sample_user_entity
     ):
-        """Test that document count is properly isolated by company."""
+        """Test that each event is added to its company/type/day counter."""
         repo = UsageEventRepository()
 
-        now = datetime.now(timezone.utc)
-        period_start = now - timedelta(days=15)
-        period_end = now + timedelta(days=15)
-
-        # Create 3 documents for company 1
-        for i in range(3):
+        for size in (1000, 2000):
             await repo.create(
                 UsageEventCreateModel(
                     company_id=sample_company.id,
                     user_id=sample_user_entity.id,
                     event_type=UsageEventType.STORAGE_UPLOAD,
-                    file_size_bytes=1000,
-                    event_metadata={"document_id": i},
+                    file_size_bytes=size,
                 )
             )
 
-        # Create 7 documents for company 2
-        for i in range(7):
-            await repo.create(
-                UsageEventCreateModel(
-                    company_id=second_company.id,
-                    user_id=sample_user_entity.id,
-                    event_type=UsageEventType.STORAGE_UPLOAD,
-                    file_size_bytes=2000,
-                    event_metadata={"document_id": i},
-                )
+        counters = (
+            (await test_db.execute(select(UsageDailyCounterEntity))).scalars().all()
+        )
+
+        assert len(counters) == 1
+        assert counters[0].event_type == UsageEventType.STORAGE_UPLOAD.value
+        assert counters[0].quantity == 2
+        assert counters[0].event_count == 2
+        assert counters[0].file_size_bytes == 3000
+
+    async def test_period_totals_read_full_days_from_counters(
+        self, test_db, sample_company, sample_user_entity
+    ):
+        """Test that whole days come from counters, not usage_events."""
+        repo = UsageEventRepository()
+
+        now = datetime.now(timezone.utc)
+        # Rolled-up usage with no underlying events (e.g. a backfilled day)
+        test_db.add(
+            UsageDailyCounterEntity(
+                company_id=sample_company.id,
+                event_type=UsageEventType.CELL_OPERATION.value,
+                bucket_date=(now - timedelta(days=3)).date(),
+                quantity=40,
+                event_count=1,
+                file_size_bytes=0,
             )
+        )
+        await test_db.commit()
 
-        # Check counts are isolated
-        count1 = await repo.get_document_count_for_period(
+        await repo.create(
+            UsageEventCreateModel(
+                company_id=sample_company.id,
+                user_id=sample_user_entity.id,
+                event_type=UsageEventType.CELL_OPERATION,
+                quantity=2,
+            )
+        )
+
+        totals = await repo.get_period_totals(
             company_id=sample_company.id,
-            start_date=period_start,
-            end_date=period_end,
+            start_date=now - timedelta(days=15),
+            end_date=now + timedelta(days=15),
         )
-        count2 = await repo.get_document_count_for_period(
-            company_id=second_company.id,
-            start_date=period_start,
-            end_date=period_end,
+
+        assert totals[UsageEventType.CELL_OPERATION].quantity == 42
+        assert totals[UsageEventType.CELL_OPERATION].event_count == 2
+
+    async def test_period_total_within_one_day_uses_events(
+        self, test_db, sample_company, sample_user_entity
+    ):
+        """Test that a period with no whole days is summed from events."""
+        repo = UsageEventRepository()
+
+        await repo.create(
+            UsageEventCreateModel(
+                company_id=sample_company.id,
+                user_id=sample_user_entity.id,
+                event_type=UsageEventType.AGENTIC_CHUNKING,
+                quantity=3,
+            )
         )
 
-        assert count1 == 3
-        assert count2 == 7
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        total = await repo.get_period_total(
+            company_id=sample_company.id,
+            event_type=UsageEventType.AGENTIC_CHUNKING,
+            start_date=now - timedelta(minutes=1),
+            end_date=now + timedelta(minutes=1),
+        )
+        empty = await repo.get_period_total(
+            company_id=sample_company.id,
+            event_type=UsageEventType.WORKFLOW,
+            start_date=now - timedelta(minutes=1),
+            end_date=now + timedelta(minutes=1),
+        )
+
+        assert total.quantity == 3
+        assert empty.quantity == 0
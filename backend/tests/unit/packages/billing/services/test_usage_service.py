@@ -173,12 +173,14 @@ class TestUsageServiceRefund:
         )
 
         # Check count is 1
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.AGENTIC_CHUNKING,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
         assert count == 1
 
         # Refund
@@ -189,12 +191,14 @@ class TestUsageServiceRefund:
         )
 
         # Check count is now 0
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.AGENTIC_CHUNKING,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
         assert count == 0
 
     async def test_partial_refund_scenario(self, test_db, sample_company):
@@ -228,12 +232,14 @@ class TestUsageServiceRefund:
         )
 
         # Check count is 3 (5 - 2)
-        count = await repo.get_period_count(
-            company_id=sample_company.id,
-            event_type=UsageEventType.AGENTIC_CHUNKING,
-            start_date=period_start,
-            end_date=period_end,
-        )
+        count = (
+            await repo.get_period_total(
+                company_id=sample_company.id,
+                event_type=UsageEventType.AGENTIC_CHUNKING,
+                start_date=period_start,
+                end_date=period_end,
+            )
+        ).quantity
         assert count == 3
 
     async def test_refund_preserves_audit_trail(self, test_db, sample_company):
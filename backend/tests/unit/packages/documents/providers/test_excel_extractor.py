@@ -1,8 +1,8 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
-import io
 from datetime import datetime
 
+from common.providers.extraction.worker import ConversionResult
 from packages.documents.providers.document_extraction.excel_extractor import (
     ExcelExtractor,
 )
@@ -22,6 +22,16 @@ class TestExcelExtractor:
             extractor = ExcelExtractor()
             return extractor
 
+    @pytest.fixture
+    def engine(self):
+        with patch(
+            "packages.documents.providers.document_extraction.excel_extractor.get_extraction_engine"
+        ) as mock_get_engine:
+            engine = MagicMock()
+            engine.convert_storage_object = AsyncMock()
+            mock_get_engine.return_value = engine
+            yield engine
+
     @pytest.fixture
     def mock_file_data(self):
         return b"fake excel file data"
@@ -74,38 +84,40 @@ class TestExcelExtractor:
         )
         assert extractor.supports_file_type("text/plain") is False
 
-    async def test_extract_text_success(self, extractor, mock_document, mock_file_data):
+    async def test_extract_text_success(
+        self, extractor, engine, mock_document, mock_file_data
+    ):
         """Test successful text extraction from Excel file."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = "Sample Excel content\nRow 1, Col 1\tRow 1, Col 2"
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="Sample Excel content\nRow 1, Col 1\tRow 1, Col 2",
+            title=None,
+            file_size=len(mock_file_data),
+        )
 
         # Test
         result = await extractor.extract_text(mock_document)
 
         # Assertions
         assert result == "Sample Excel content\nRow 1, Col 1\tRow 1, Col 2"
-        extractor.storage.download.assert_called_once_with(mock_document.storage_key)
-        extractor.markitdown.convert_stream.assert_called_once()
-        call_args = extractor.markitdown.convert_stream.call_args
-        assert isinstance(call_args[0][0], io.BytesIO)
-        # Check that stream_info was passed with correct values
-        stream_info = call_args[1]["stream_info"]
-        assert stream_info.mimetype == mock_document.content_type
-        assert stream_info.extension == ".xlsx"
-        assert stream_info.filename == mock_document.filename
+        engine.convert_storage_object.assert_called_once()
+        call_args = engine.convert_storage_object.call_args
+        assert call_args[0][1] == mock_document.storage_key
+        # Check that the file was described with correct values
+        assert call_args[1]["mimetype"] == mock_document.content_type
+        assert call_args[1]["extension"] == ".xlsx"
+        assert call_args[1]["filename"] == mock_document.filename
 
     async def test_extract_text_empty_content(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test text extraction when Excel file has no content."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = ""
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="",
+            title=None,
+            file_size=len(mock_file_data),
+        )
 
         # Test
         result = await extractor.extract_text(mock_document)
@@ -114,12 +126,13 @@ class TestExcelExtractor:
         assert result == ""
 
     async def test_extract_text_no_result(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
-        """Test text extraction when MarkItDown returns None."""
+        """Test text extraction when the conversion returns no content."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        extractor.markitdown.convert_stream = MagicMock(return_value=None)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="", title=None, file_size=len(mock_file_data)
+        )
 
         # Test
         result = await extractor.extract_text(mock_document)
@@ -128,14 +141,11 @@ class TestExcelExtractor:
         assert result == ""
 
     async def test_extract_text_exception(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test text extraction when an exception occurs."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        extractor.markitdown.convert_stream = MagicMock(
-            side_effect=Exception("Conversion failed")
-        )
+        engine.convert_storage_object.side_effect = Exception("Conversion failed")
 
         # Test
         with pytest.raises(Exception) as exc_info:
@@ -143,14 +153,16 @@ class TestExcelExtractor:
 
         assert "Failed to extract text from Excel file" in str(exc_info.value)
 
-    async def test_get_metadata_success(self, extractor, mock_document, mock_file_data):
+    async def test_get_metadata_success(
+        self, extractor, engine, mock_document, mock_file_data
+    ):
         """Test successful metadata extraction from Excel file."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = "Sample content with multiple lines\nSecond line"
-        mock_result.title = "Sample Excel File"
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="Sample content with multiple lines\nSecond line",
+            title="Sample Excel File",
+            file_size=len(mock_file_data),
+        )
 
         # Test
         result = await extractor.get_metadata(mock_document)
@@ -167,15 +179,15 @@ class TestExcelExtractor:
         assert result == expected_metadata
 
     async def test_get_metadata_no_title(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test metadata extraction when Excel file has no title."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = "Sample content"
-        mock_result.title = None
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="Sample content",
+            title=None,
+            file_size=len(mock_file_data),
+        )
 
         # Test
         result = await extractor.get_metadata(mock_document)
@@ -186,13 +198,12 @@ class TestExcelExtractor:
         assert result["line_count"] == 1
 
     async def test_get_metadata_exception(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test metadata extraction when an exception occurs."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        extractor.markitdown.convert_stream = MagicMock(
-            side_effect=Exception("Metadata extraction failed")
+        engine.convert_storage_object.side_effect = Exception(
+            "Metadata extraction failed"
         )
 
         # Test
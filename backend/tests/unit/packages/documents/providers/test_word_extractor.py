@@ -1,8 +1,8 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
-import io
 from datetime import datetime
 
+from common.providers.extraction.worker import ConversionResult
 from packages.documents.providers.document_extraction.word_extractor import (
     WordExtractor,
 )
@@ -22,6 +22,16 @@ class TestWordExtractor:
             extractor = WordExtractor()
             return extractor
 
+    @pytest.fixture
+    def engine(self):
+        with patch(
+            "packages.documents.providers.document_extraction.word_extractor.get_extraction_engine"
+        ) as mock_get_engine:
+            engine = MagicMock()
+            engine.convert_storage_object = AsyncMock()
+            mock_get_engine.return_value = engine
+            yield engine
+
     @pytest.fixture
     def mock_file_data(self):
         return b"fake word document file data"
@@ -75,40 +85,40 @@ class TestWordExtractor:
         )
         assert extractor.supports_file_type("text/plain") is False
 
-    async def test_extract_text_success(self, extractor, mock_document, mock_file_data):
+    async def test_extract_text_success(
+        self, extractor, engine, mock_document, mock_file_data
+    ):
         """Test successful text extraction from Word document."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = (
-            "Document Title\n\nParagraph 1 content\n\nParagraph 2 content"
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="Document Title\n\nParagraph 1 content\n\nParagraph 2 content",
+            title=None,
+            file_size=len(mock_file_data),
         )
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
 
         # Test
         result = await extractor.extract_text(mock_document)
 
         # Assertions
         assert result == "Document Title\n\nParagraph 1 content\n\nParagraph 2 content"
-        extractor.storage.download.assert_called_once_with(mock_document.storage_key)
-        extractor.markitdown.convert_stream.assert_called_once()
-        call_args = extractor.markitdown.convert_stream.call_args
-        assert isinstance(call_args[0][0], io.BytesIO)
-        # Check that stream_info was passed with correct values
-        stream_info = call_args[1]["stream_info"]
-        assert stream_info.mimetype == mock_document.content_type
-        assert stream_info.extension == ".docx"
-        assert stream_info.filename == mock_document.filename
+        engine.convert_storage_object.assert_called_once()
+        call_args = engine.convert_storage_object.call_args
+        assert call_args[0][1] == mock_document.storage_key
+        # Check that the file was described with correct values
+        assert call_args[1]["mimetype"] == mock_document.content_type
+        assert call_args[1]["extension"] == ".docx"
+        assert call_args[1]["filename"] == mock_document.filename
 
     async def test_extract_text_empty_content(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test text extraction when Word document has no content."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = ""
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="",
+            title=None,
+            file_size=len(mock_file_data),
+        )
 
         # Test
         result = await extractor.extract_text(mock_document)
@@ -117,12 +127,13 @@ class TestWordExtractor:
         assert result == ""
 
     async def test_extract_text_no_result(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
-        """Test text extraction when MarkItDown returns None."""
+        """Test text extraction when the conversion returns no content."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        extractor.markitdown.convert_stream = MagicMock(return_value=None)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="", title=None, file_size=len(mock_file_data)
+        )
 
         # Test
         result = await extractor.extract_text(mock_document)
@@ -131,14 +142,11 @@ class TestWordExtractor:
         assert result == ""
 
     async def test_extract_text_exception(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test text extraction when an exception occurs."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        extractor.markitdown.convert_stream = MagicMock(
-            side_effect=Exception("Conversion failed")
-        )
+        engine.convert_storage_object.side_effect = Exception("Conversion failed")
 
         # Test
         with pytest.raises(Exception) as exc_info:
@@ -146,14 +154,16 @@ class TestWordExtractor:
 
         assert "Failed to extract text from Word document" in str(exc_info.value)
 
-    async def test_get_metadata_success(self, extractor, mock_document, mock_file_data):
+    async def test_get_metadata_success(
+        self, extractor, engine, mock_document, mock_file_data
+    ):
         """Test successful metadata extraction from Word document."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = "Document content\nLine 1\nLine 2\nLine 3"
-        mock_result.title = "Sample Document"
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="Document content\nLine 1\nLine 2\nLine 3",
+            title="Sample Document",
+            file_size=len(mock_file_data),
+        )
 
         # Test
         result = await extractor.get_metadata(mock_document)
@@ -170,15 +180,15 @@ class TestWordExtractor:
         assert result == expected_metadata
 
     async def test_get_metadata_no_title(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test metadata extraction when Word document has no title."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        mock_result = MagicMock()
-        mock_result.text_content = "Document content"
-        mock_result.title = None
-        extractor.markitdown.convert_stream = MagicMock(return_value=mock_result)
+        engine.convert_storage_object.return_value = ConversionResult(
+            text_content="Document content",
+            title=None,
+            file_size=len(mock_file_data),
+        )
 
         # Test
         result = await extractor.get_metadata(mock_document)
@@ -189,13 +199,12 @@ class TestWordExtractor:
         assert result["line_count"] == 1
 
     async def test_get_metadata_exception(
-        self, extractor, mock_document, mock_file_data
+        self, extractor, engine, mock_document, mock_file_data
     ):
         """Test metadata extraction when an exception occurs."""
         # Setup mocks
-        extractor.storage.download = AsyncMock(return_value=mock_file_data)
-        extractor.markitdown.convert_stream = MagicMock(
-            side_effect=Exception("Metadata extraction failed")
+        engine.convert_storage_object.side_effect = Exception(
+            "Metadata extraction failed"
         )
 
         # Test
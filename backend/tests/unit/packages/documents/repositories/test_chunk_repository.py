@@ -0,0 +1,128 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from packages.documents.repositories.chunk_repository import ChunkRepository
+from packages.documents.models.database.chunk import ChunkEntity
+from packages.documents.models.database.chunk_set import ChunkSetEntity
+
+
+class TestChunkRepository:
+    """Unit tests for ChunkRepository."""
+
+    @pytest.fixture
+    async def repo(self, test_db: AsyncSession):
+        """Create a ChunkRepository instance."""
+        return ChunkRepository()
+
+    @pytest.fixture
+    async def sample_chunks(
+        self, test_db: AsyncSession, sample_document, sample_company
+    ):
+        """Create a chunk set with chunks spanning different sections/pages."""
+        chunk_set = ChunkSetEntity(
+            document_id=sample_document.id,
+            company_id=sample_company.id,
+            chunking_strategy="agentic",
+            total_chunks=3,
+            s3_prefix="chunks/prefix",
+        )
+        test_db.add(chunk_set)
+        await test_db.commit()
+        await test_db.refresh(chunk_set)
+
+        metadata = [
+            {"section": "Introduction", "page_start": 1, "page_end": 2},
+            {"section": "Results", "page_start": 3, "page_end": 5},
+            {"section": "results", "page_start": None, "page_end": None},
+        ]
+        chunks = []
+        for idx, meta in enumerate(metadata):
+            chunk = ChunkEntity(
+                chunk_set_id=chunk_set.id,
+                chunk_id=f"chunk_{idx + 1}",
+                document_id=sample_document.id,
+                company_id=sample_company.id,
+                s3_key=f"chunks/prefix/chunk_{idx + 1}.md",
+                chunk_metadata=meta,
+                chunk_order=idx,
+            )
+            test_db.add(chunk)
+            chunks.append(chunk)
+        await test_db.commit()
+        return chunks
+
+    @pytest.mark.asyncio
+    async def test_search_by_document_metadata_no_filters(
+        self, repo, sample_document, sample_company, sample_chunks
+    ):
+        """Test that no filters returns all chunks in order."""
+        result = await repo.search_by_document_metadata(
+            sample_document.id, sample_company.id
+        )
+
+        assert [c.chunk_id for c in result] == ["chunk_1", "chunk_2", "chunk_3"]
+
+    @pytest.mark.asyncio
+    async def test_search_by_document_metadata_section_case_insensitive(
+        self, repo, sample_document, sample_company, sample_chunks
+    ):
+        """Test section filter matches case-insensitively."""
+        result = await repo.search_by_document_metadata(
+            sample_document.id, sample_company.id, section="RESULTS"
+        )
+
+        assert [c.chunk_id for c in result] == ["chunk_2", "chunk_3"]
+
+    @pytest.mark.asyncio
+    async def test_search_by_document_metadata_page(
+        self, repo, sample_document, sample_company, sample_chunks
+    ):
+        """Test page filter matches chunks whose page range contains the page."""
+        result = await repo.search_by_document_metadata(
+            sample_document.id, sample_company.id, page=4
+        )
+
+        assert [c.chunk_id for c in result] == ["chunk_2"]
+
+    @pytest.mark.asyncio
+    async def test_search_by_document_metadata_section_and_page(
+        self, repo, sample_document, sample_company, sample_chunks
+    ):
+        """Test section and page filters combine."""
+        result = await repo.search_by_document_metadata(
+            sample_document.id, sample_company.id, section="introduction", page=4
+        )
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_search_by_document_metadata_company_scoped(
+        self, repo, sample_document, second_company, sample_chunks
+    ):
+        """Test chunks from another company are not returned."""
+        result = await repo.search_by_document_metadata(
+            sample_document.id, second_company.id
+        )
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_get_by_document_chunk_ids(
+        self, repo, sample_document, sample_company, sample_chunks
+    ):
+        """Test that only the requested (document_id, chunk_id) pairs are returned."""
+        result = await repo.get_by_document_chunk_ids(
+            [
+                (sample_document.id, "chunk_1"),
+                (sample_document.id, "chunk_3"),
+                (sample_document.id + 1000, "chunk_2"),
+            ],
+            sample_company.id,
+        )
+
+        assert sorted(c.chunk_id for c in result) == ["chunk_1", "chunk_3"]
+
+    @pytest.mark.asyncio
+    async def test_get_by_document_chunk_ids_empty(self, repo, sample_company):
+        """Test that an empty key list returns no chunks without querying."""
+        assert await repo.get_by_document_chunk_ids([], sample_company.id) == []
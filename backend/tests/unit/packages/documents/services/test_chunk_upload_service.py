@@ -0,0 +1,154 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from packages.documents.models.schemas.chunk import ChunkUploadItem
+from packages.documents.services.chunk_service import ChunkService
+from packages.documents.services.chunk_upload_service import ChunkUploadService
+
+
+@pytest.fixture
+def chunk_upload_service(test_db, mock_storage):
+    """Create a ChunkUploadService instance with mocked storage."""
+    with patch(
+        "packages.documents.services.chunk_upload_service.get_storage",
+        return_value=mock_storage,
+    ):
+        return ChunkUploadService()
+
+
+def _make_chunks(count: int):
+    return [
+        ChunkUploadItem(
+            chunk_id=f"chunk_{i + 1}",
+            content=f"content {i + 1}",
+            metadata={"section": f"Section {i + 1}"},
+        )
+        for i in range(count)
+    ]
+
+
+class TestChunkUploadService:
+    """Unit tests for ChunkUploadService."""
+
+    @pytest.mark.asyncio
+    async def test_process_chunk_upload_uploads_content_and_manifest(
+        self, chunk_upload_service, mock_storage, sample_document, sample_company
+    ):
+        """Test that one object per chunk plus the manifest is uploaded."""
+        chunks = _make_chunks(5)
+
+        s3_prefix = await chunk_upload_service.process_chunk_upload(
+            document_id=sample_document.id,
+            company_id=sample_company.id,
+            chunks=chunks,
+        )
+
+        uploaded_keys = {call.args[0] for call in mock_storage.upload.call_args_list}
+        assert uploaded_keys == {
+            *(f"{s3_prefix}/chunk_{i + 1}.md" for i in range(5)),
+            f"{s3_prefix}/manifest.json",
+        }
+
+    @pytest.mark.asyncio
+    async def test_process_chunk_upload_bulk_creates_chunk_rows(
+        self, chunk_upload_service, sample_document, sample_company
+    ):
+        """Test that chunk rows are created in order with their metadata."""
+        chunks = _make_chunks(3)
+
+        await chunk_upload_service.process_chunk_upload(
+            document_id=sample_document.id,
+            company_id=sample_company.id,
+            chunks=chunks,
+        )
+
+        stored = await ChunkService().get_chunks_for_document(
+            sample_document.id, sample_company.id
+        )
+        assert [c.chunk_id for c in stored] == ["chunk_1", "chunk_2", "chunk_3"]
+        assert [c.chunk_order for c in stored] == [0, 1, 2]
+        assert stored[1].chunk_metadata == {"section": "Section 2"}
+
+    @pytest.mark.asyncio
+    async def test_process_chunk_upload_raises_on_failed_upload(
+        self, chunk_upload_service, mock_storage, sample_document, sample_company
+    ):
+        """Test that a failed chunk upload aborts before any rows are written."""
+        mock_storage.upload = AsyncMock(side_effect=[True, False, True])
+
+        with pytest.raises(Exception, match="Failed to upload 1 chunks"):
+            await chunk_upload_service.process_chunk_upload(
+                document_id=sample_document.id,
+                company_id=sample_company.id,
+                chunks=_make_chunks(3),
+            )
+
+        stored = await ChunkService().get_chunks_for_document(
+            sample_document.id, sample_company.id
+        )
+        assert stored == []
+
+    @pytest.mark.asyncio
+    async def test_process_chunk_upload_packed_format(
+        self, chunk_upload_service, mock_storage, sample_document, sample_company
+    ):
+        """Test that packed mode uploads one blob and records byte ranges."""
+        chunks = [
+            ChunkUploadItem(chunk_id="chunk_1", content="abc", metadata={}),
+            ChunkUploadItem(chunk_id="chunk_2", content="héllo", metadata={}),
+        ]
+
+        with patch(
+            "packages.documents.services.chunk_upload_service.settings"
+        ) as mock_settings:
+            mock_settings.chunk_storage_packed = True
+            s3_prefix = await chunk_upload_service.process_chunk_upload(
+                document_id=sample_document.id,
+                company_id=sample_company.id,
+                chunks=chunks,
+            )
+
+        uploads = {
+            call.args[0]: call.args[1] for call in mock_storage.upload.call_args_list
+        }
+        (pack_key,) = set(uploads) - {f"{s3_prefix}/manifest.json"}
+        assert pack_key.startswith(f"{s3_prefix}/")
+        assert pack_key.endswith(".pack")
+        pack_bytes = uploads[pack_key].getvalue()
+
+        stored = await ChunkService().get_chunks_for_document(
+            sample_document.id, sample_company.id
+        )
+        assert all(c.s3_key == pack_key for c in stored)
+        contents = [
+            pack_bytes[c.content_offset : c.content_offset + c.content_length].decode(
+                "utf-8"
+            )
+            for c in stored
+        ]
+        assert contents == ["abc", "héllo"]
+
+    @pytest.mark.asyncio
+    async def test_rechunking_writes_a_new_pack(
+        self, chunk_upload_service, mock_storage, sample_document, sample_company
+    ):
+        """Test that each chunk set gets its own pack, so old ranges stay valid."""
+        chunks = [ChunkUploadItem(chunk_id="chunk_1", content="abc", metadata={})]
+
+        with patch(
+            "packages.documents.services.chunk_upload_service.settings"
+        ) as mock_settings:
+            mock_settings.chunk_storage_packed = True
+            for _ in range(2):
+                await chunk_upload_service.process_chunk_upload(
+                    document_id=sample_document.id,
+                    company_id=sample_company.id,
+                    chunks=chunks,
+                )
+
+        pack_keys = {
+            call.args[0]
+            for call in mock_storage.upload.call_args_list
+            if call.args[0].endswith(".pack")
+        }
+        assert len(pack_keys) == 2
@@ -0,0 +1,127 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from common.providers.caching import ContentCache
+from packages.documents.models.database.chunk import ChunkEntity
+from packages.documents.models.database.chunk_set import ChunkSetEntity
+from packages.documents.services.document_chunking_service import (
+    DocumentChunkingService,
+)
+
+PACK = "first chunksecond chunk".encode("utf-8")
+
+
+@pytest.fixture
+def chunking_service(test_db, mock_storage):
+    """Create a DocumentChunkingService with mocked storage and a fresh cache."""
+    with patch(
+        "packages.documents.services.document_chunking_service.get_storage",
+        return_value=mock_storage,
+    ), patch(
+        "packages.documents.services.document_chunking_service.get_chunk_content_cache",
+        return_value=ContentCache(namespace="test", max_bytes=1024),
+    ):
+        return DocumentChunkingService()
+
+
+@pytest.fixture
+async def packed_chunks(test_db, sample_document, sample_company):
+    """Create a packed chunk set with two chunks."""
+    chunk_set = ChunkSetEntity(
+        document_id=sample_document.id,
+        company_id=sample_company.id,
+        chunking_strategy="agentic",
+        total_chunks=2,
+        s3_prefix="chunks/prefix",
+    )
+    test_db.add(chunk_set)
+    await test_db.commit()
+    await test_db.refresh(chunk_set)
+
+    for idx, (offset, length) in enumerate([(0, 11), (11, 12)]):
+        test_db.add(
+            ChunkEntity(
+                chunk_set_id=chunk_set.id,
+                chunk_id=f"chunk_{idx + 1}",
+                document_id=sample_document.id,
+                company_id=sample_company.id,
+                s3_key="chunks/prefix/chunks.pack",
+                content_offset=offset,
+                content_length=length,
+                chunk_metadata={},
+                chunk_order=idx,
+            )
+        )
+    await test_db.commit()
+
+
+class TestDocumentChunkingServicePacked:
+    """Unit tests for reading packed chunk sets."""
+
+    @pytest.mark.asyncio
+    async def test_get_chunk_by_id_uses_range_read(
+        self,
+        chunking_service,
+        mock_storage,
+        sample_document,
+        sample_company,
+        packed_chunks,
+    ):
+        """Test that a single packed chunk is read with a ranged GET."""
+        mock_storage.download_range = AsyncMock(return_value=b"second chunk")
+
+        chunk = await chunking_service.get_chunk_by_id(
+            "chunk_2", sample_document.id, sample_company.id
+        )
+
+        assert chunk.content == "second chunk"
+        mock_storage.download_range.assert_awaited_once_with(
+            "chunks/prefix/chunks.pack", 11, 12
+        )
+        mock_storage.download.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_chunks_for_document_fetches_pack_once(
+        self,
+        chunking_service,
+        mock_storage,
+        sample_document,
+        sample_company,
+        packed_chunks,
+    ):
+        """Test that loading a packed document fetches the blob once."""
+        mock_storage.download = AsyncMock(return_value=PACK)
+        mock_storage.download_range = AsyncMock()
+
+        chunks = await chunking_service.get_chunks_for_document(
+            sample_document.id, sample_company.id
+        )
+
+        assert [c.content for c in chunks] == ["first chunk", "second chunk"]
+        mock_storage.download.assert_awaited_once_with("chunks/prefix/chunks.pack")
+        mock_storage.download_range.assert_not_awaited()
+
+
+class TestDocumentChunkingServiceGetChunksByIds:
+    """Unit tests for loading specific chunks."""
+
+    @pytest.mark.asyncio
+    async def test_get_chunks_by_ids_loads_only_requested(
+        self,
+        chunking_service,
+        mock_storage,
+        sample_document,
+        sample_company,
+        packed_chunks,
+    ):
+        """Test that only requested chunks are loaded, once each."""
+        mock_storage.download_range = AsyncMock(return_value=b"first chunk")
+
+        chunks = await chunking_service.get_chunks_by_ids(
+            [(sample_document.id, "chunk_1"), (sample_document.id, "chunk_1")],
+            sample_company.id,
+        )
+
+        assert list(chunks) == [(sample_document.id, "chunk_1")]
+        assert chunks[(sample_document.id, "chunk_1")].content == "first chunk"
+        mock_storage.download_range.assert_awaited_once()
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 
 
+from common.providers.caching import ContentCache
 from packages.billing.models.domain.usage import QuotaCheck
 from packages.documents.services.document_service import DocumentService
 from packages.documents.models.domain.document import DocumentModel
@@ -81,6 +82,9 @@ def document_service(
     ), patch(
         "packages.documents.services.document_service.QuotaService",
         return_value=mock_quota_service,
+    ), patch(
+        "packages.documents.services.document_service.get_extracted_content_cache",
+        return_value=ContentCache(namespace="test", max_bytes=1024 * 1024),
     ):
         yield DocumentService()
 
@@ -121,6 +125,36 @@ class TestDocumentService:
         assert result == test_content
         mock_storage.download.assert_called_once_with("extracted/content.txt")
 
+    @pytest.mark.asyncio
+    async def test_get_extracted_content_cached(
+        self, mock_start_span, document_service, mock_storage, sample_document
+    ):
+        """Test that repeated loads of the same document hit the cache."""
+        mock_storage.download.return_value = b"cached content"
+
+        first = await document_service.get_extracted_content(sample_document)
+        second = await document_service.get_extracted_content(sample_document)
+
+        assert first == second == "cached content"
+        mock_storage.download.assert_called_once_with("extracted/content.txt")
+
+    @pytest.mark.asyncio
+    async def test_get_extracted_content_reextraction_not_stale(
+        self, mock_start_span, document_service, mock_storage, sample_document
+    ):
+        """Test that a re-extracted document doesn't serve old cached content."""
+        mock_storage.download.return_value = b"old content"
+        sample_document.extraction_completed_at = datetime(2025, 1, 1)
+        assert await document_service.get_extracted_content(sample_document) == (
+            "old content"
+        )
+
+        mock_storage.download.return_value = b"new content"
+        sample_document.extraction_completed_at = datetime(2025, 1, 2)
+        assert await document_service.get_extracted_content(sample_document) == (
+            "new content"
+        )
+
     @pytest.mark.asyncio
     async def test_get_extracted_content_no_path(
         self, mock_start_span, document_service, mock_storage, sample_document
@@ -3,6 +3,7 @@ import io
 from unittest.mock import AsyncMock, patch, MagicMock
 from PyPDF2 import PdfReader, PdfWriter
 
+from common.providers.extraction.worker import ConversionResult
 from packages.documents.services.pdf_service import PdfService
 
 
@@ -16,13 +17,21 @@ def mock_storage():
 
 
 @pytest.fixture
-def mock_markitdown():
-    """Create a mocked MarkItDown service."""
-    markitdown = MagicMock()
-    mock_result = MagicMock()
-    mock_result.text_content = "# Test Markdown Content\n\nThis is extracted content."
-    markitdown.convert_stream.return_value = mock_result
-    return markitdown
+def mock_engine():
+    """Create a mocked extraction engine."""
+    engine = MagicMock()
+    engine.convert_storage_object = AsyncMock(
+        return_value=ConversionResult(
+            text_content="# Test Markdown Content\n\nThis is extracted content.",
+            title=None,
+            file_size=1024,
+        )
+    )
+    with patch(
+        "packages.documents.services.pdf_service.get_extraction_engine",
+        return_value=engine,
+    ):
+        yield engine
 
 
 @pytest.fixture
@@ -44,13 +53,10 @@ def sample_pdf_data():
 
 
 @pytest.fixture
-def pdf_service(mock_storage, mock_markitdown):
+def pdf_service(mock_storage):
     """Create a PdfService instance with mocked dependencies."""
     with patch(
         "packages.documents.services.pdf_service.get_storage", return_value=mock_storage
-    ), patch(
-        "packages.documents.services.pdf_service.MarkItDown",
-        return_value=mock_markitdown,
     ):
         return PdfService()
 
@@ -168,7 +174,7 @@ class TestPdfService:
         mock_start_span,
         pdf_service,
         mock_storage,
-        sample_pdf_data,
+        mock_engine,
     ):
         """Test successful conversion of PDF page to markdown."""
         # Setup
@@ -177,7 +183,6 @@ class TestPdfService:
         mock_start_span.return_value.__enter__ = MagicMock(return_value=mock_span)
         mock_start_span.return_value.__exit__ = MagicMock(return_value=None)
 
-        mock_storage.download.return_value = sample_pdf_data
         page_url = "s3://test-bucket/documents/test_page_1.pdf"
 
         # Execute
@@ -185,12 +190,14 @@ class TestPdfService:
 
         # Verify
         assert result == "# Test Markdown Content\n\nThis is extracted content."
-        mock_storage.download.assert_called_once_with("documents/test_page_1.pdf")
-        assert pdf_service.markitdown.convert_stream.called
+        mock_engine.convert_storage_object.assert_called_once()
+        call_args = mock_engine.convert_storage_object.call_args
+        assert call_args[0] == (mock_storage, "documents/test_page_1.pdf")
+        assert call_args[1]["mimetype"] == "application/pdf"
 
     @pytest.mark.asyncio
     async def test_convert_page_to_markdown_download_failure(
-        self, mock_settings, mock_start_span, pdf_service, mock_storage
+        self, mock_settings, mock_start_span, pdf_service, mock_engine
     ):
         """Test handling of download failure in markdown conversion."""
         # Setup
@@ -199,11 +206,13 @@ class TestPdfService:
         mock_start_span.return_value.__enter__ = MagicMock(return_value=mock_span)
         mock_start_span.return_value.__exit__ = MagicMock(return_value=None)
 
-        mock_storage.download.return_value = None
+        mock_engine.convert_storage_object.side_effect = ValueError(
+            "Failed to download file from documents/test_page_1.pdf"
+        )
         page_url = "s3://test-bucket/documents/test_page_1.pdf"
 
         # Execute & Verify
-        with pytest.raises(ValueError, match="Failed to download page PDF from"):
+        with pytest.raises(ValueError, match="Failed to download file from"):
             await pdf_service.convert_page_to_markdown(page_url)
 
     def test_generate_chunk_key_single_page(
@@ -240,3 +249,59 @@ class TestPdfService:
         assert isinstance(chunk_buffer, io.BytesIO)
         chunk_reader = PdfReader(chunk_buffer)
         assert len(chunk_reader.pages) == 2
+
+    def test_plan_page_batches_bounded_by_pages_and_bytes(
+        self, mock_settings, mock_start_span, pdf_service
+    ):
+        """Test that batch size adapts to the average page size."""
+        # Text-heavy PDF: small pages, bounded by page count
+        assert pdf_service.plan_page_batches(
+            10, 10 * 1024, max_pages=4, max_bytes=1024 * 1024
+        ) == [(0, 4), (4, 8), (8, 10)]
+
+        # Scanned PDF: ~1MB pages, bounded by bytes
+        assert pdf_service.plan_page_batches(
+            5, 5 * 1024 * 1024, max_pages=50, max_bytes=2 * 1024 * 1024
+        ) == [(0, 2), (2, 4), (4, 5)]
+
+        assert pdf_service.plan_page_batches(0, 0, 50, 1024) == []
+
+    @pytest.mark.asyncio
+    async def test_convert_pdf_in_batches(
+        self,
+        mock_settings,
+        mock_start_span,
+        pdf_service,
+        mock_storage,
+        mock_engine,
+        sample_pdf_data,
+    ):
+        """Test batched conversion from one download without uploads."""
+        mock_settings.pdf_batch_max_pages = 2
+        mock_settings.pdf_batch_max_bytes = 1024 * 1024
+        mock_settings.pdf_batch_concurrency = 2
+
+        async def download_to_file(storage, key, file):
+            file.write(sample_pdf_data)
+
+        async def convert_file(path, mimetype, extension, filename=None):
+            page_count = len(PdfReader(path).pages)
+            return ConversionResult(
+                text_content=f" {filename}: {page_count} pages ",
+                title=None,
+                file_size=0,
+            )
+
+        mock_engine.download_to_file = AsyncMock(side_effect=download_to_file)
+        mock_engine.convert_file = AsyncMock(side_effect=convert_file)
+        heartbeat = MagicMock()
+
+        result = await pdf_service.convert_pdf_in_batches(
+            "documents/test.pdf", on_batch_converted=heartbeat
+        )
+
+        assert result == (
+            "test_pages_1-2.pdf: 2 pages\n\n---\n\ntest_pages_3-3.pdf: 1 pages"
+        )
+        assert heartbeat.call_count == 2
+        mock_storage.upload.assert_not_called()
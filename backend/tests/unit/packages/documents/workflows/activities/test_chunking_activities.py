@@ -200,12 +200,14 @@ class TestRefundAgenticChunkingCreditActivity:
         # Verify both events exist and net to zero
         usage_repo = UsageEventRepository()
         now = datetime.now(timezone.utc)
-        total = await usage_repo.get_monthly_count(
-            sample_company.id,
-            UsageEventType.AGENTIC_CHUNKING,
-            year=now.year,
-            month=now.month,
-        )
+        total = (
+            await usage_repo.get_period_total(
+                sample_company.id,
+                UsageEventType.AGENTIC_CHUNKING,
+                start_date=now - timedelta(days=1),
+                end_date=now + timedelta(days=1),
+            )
+        ).quantity
 
         assert total == 0  # +1 and -1 = 0
 
@@ -223,6 +223,47 @@ class TestEntitySetMemberRepository:
         assert len(result) == 3
         assert all(r.id in member_ids for r in result)
 
+    @pytest.mark.asyncio
+    async def test_get_by_member_ids_excludes_deleted_and_other_companies(
+        self,
+        member_repo,
+        test_db,
+        sample_entity_set,
+        sample_document,
+        sample_company,
+        second_company,
+    ):
+        """Test that get_by_member_ids skips deleted and out-of-company members."""
+        active = MatrixEntitySetMemberEntity(
+            entity_set_id=sample_entity_set.id,
+            company_id=sample_company.id,
+            entity_type=EntityType.DOCUMENT.value,
+            entity_id=sample_document.id,
+            member_order=0,
+        )
+        deleted = MatrixEntitySetMemberEntity(
+            entity_set_id=sample_entity_set.id,
+            company_id=sample_company.id,
+            entity_type=EntityType.DOCUMENT.value,
+            entity_id=sample_document.id,
+            member_order=1,
+            deleted=True,
+        )
+        test_db.add_all([active, deleted])
+        await test_db.commit()
+        await test_db.refresh(active)
+        await test_db.refresh(deleted)
+
+        result = await member_repo.get_by_member_ids(
+            [active.id, deleted.id], company_id=sample_company.id
+        )
+        assert [r.id for r in result] == [active.id]
+
+        result = await member_repo.get_by_member_ids(
+            [active.id], company_id=second_company.id
+        )
+        assert result == []
+
     @pytest.mark.asyncio
     async def test_get_by_member_ids_empty_list(self, member_repo):
         """Test get_by_member_ids with empty list."""
@@ -500,3 +500,78 @@ class TestMatrixCellRepository:
     async def test_bulk_soft_delete_empty_lists(self, matrix_cell_repo):
         """Test bulk soft delete with empty lists."""
         assert await matrix_cell_repo.bulk_soft_delete_by_matrix_ids([]) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_existing_signatures(self, matrix_cell_repo):
+        """Test that only candidate signatures present in the matrix are returned."""
+        await matrix_cell_repo.create(
+            self.create_matrix_cell_model(matrix_id=1, cell_signature="sig_a")
+        )
+        await matrix_cell_repo.create(
+            self.create_matrix_cell_model(matrix_id=1, cell_signature="sig_b")
+        )
+        await matrix_cell_repo.create(
+            self.create_matrix_cell_model(matrix_id=2, cell_signature="sig_c")
+        )
+        deleted = await matrix_cell_repo.create(
+            self.create_matrix_cell_model(matrix_id=1, cell_signature="sig_d")
+        )
+        await matrix_cell_repo.soft_delete(deleted.id)
+
+        result = await matrix_cell_repo.get_existing_signatures(
+            1, ["sig_a", "sig_c", "sig_d", "sig_e", "sig_a"], batch_size=2
+        )
+
+        assert result == {"sig_a"}
+
+    @pytest.mark.asyncio
+    async def test_get_existing_signatures_empty_list(self, matrix_cell_repo):
+        """Test signature lookup with no candidates."""
+        assert await matrix_cell_repo.get_existing_signatures(1, []) == set()
+
+    @pytest.mark.asyncio
+    async def test_mark_cells_pending_for_reprocess_by_cell_ids(self, matrix_cell_repo):
+        """Test that listed cells in the matrix are reset and returned."""
+        completed = await matrix_cell_repo.create(
+            self.create_matrix_cell_model(
+                matrix_id=1, status=MatrixCellStatus.COMPLETED
+            )
+        )
+        await matrix_cell_repo.update_current_answer_set(completed.id, 100)
+        other_matrix = await matrix_cell_repo.create(
+            self.create_matrix_cell_model(
+                matrix_id=2, status=MatrixCellStatus.COMPLETED
+            )
+        )
+        deleted = await matrix_cell_repo.create(
+            self.create_matrix_cell_model(matrix_id=1, status=MatrixCellStatus.FAILED)
+        )
+        await matrix_cell_repo.soft_delete(deleted.id)
+
+        plan = await matrix_cell_repo.mark_cells_pending_for_reprocess(
+            1, cell_ids=[completed.id, other_matrix.id, deleted.id]
+        )
+
+        assert [cell.id for cell in plan.cells] == [completed.id]
+        assert plan.cells[0].status == MatrixCellStatus.PENDING
+        assert plan.cells[0].current_answer_set_id is None
+        assert plan.question_ids == []
+
+        untouched = await matrix_cell_repo.get(other_matrix.id)
+        assert untouched.status == MatrixCellStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_mark_cells_pending_for_reprocess_no_criteria(self, matrix_cell_repo):
+        """Test that a request without criteria matches nothing."""
+        await matrix_cell_repo.create(
+            self.create_matrix_cell_model(
+                matrix_id=1, status=MatrixCellStatus.COMPLETED
+            )
+        )
+
+        plan = await matrix_cell_repo.mark_cells_pending_for_reprocess(
+            1, entity_set_filters=[(1, [])]
+        )
+
+        assert plan.cells == []
+        assert plan.question_ids == []
@@ -0,0 +1,378 @@
+import hashlib
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from packages.documents.models.database.document import DocumentEntity
+from packages.matrices.models.database.matrix import MatrixCellEntity, MatrixEntity
+from packages.matrices.models.database.matrix_entity_set import (
+    MatrixCellEntityReferenceEntity,
+    MatrixEntitySetEntity,
+    MatrixEntitySetMemberEntity,
+)
+from packages.matrices.models.database.matrix_template_variable import (
+    MatrixTemplateVariableEntity,
+)
+from packages.matrices.models.domain.matrix_enums import EntityRole, EntityType
+from packages.matrices.repositories.matrix_duplication_repository import (
+    MatrixDuplicationRepository,
+)
+from packages.qa.models.database.answer import AnswerEntity
+from packages.qa.models.database.answer_set import AnswerSetEntity
+from packages.qa.models.database.citation import CitationEntity, CitationSetEntity
+from packages.questions.models.database.question import QuestionEntity
+from packages.questions.models.database.question_option import (
+    QuestionOptionEntity,
+    QuestionOptionSetEntity,
+)
+from packages.questions.models.database.question_template_variable import (
+    QuestionTemplateVariableEntity,
+)
+
+
+async def _add(test_db: AsyncSession, *entities):
+    test_db.add_all(entities)
+    await test_db.commit()
+    for entity in entities:
+        await test_db.refresh(entity)
+
+
+def _signature(*parts: str) -> str:
+    return hashlib.md5(",".join(sorted(parts)).encode()).hexdigest()
+
+
+class TestMatrixDuplicationRepository:
+    """Test MatrixDuplicationRepository.copy_matrix_contents."""
+
+    @pytest.fixture
+    async def repository(self, test_db: AsyncSession):
+        return MatrixDuplicationRepository()
+
+    @pytest.fixture
+    async def source(self, test_db, sample_workspace, sample_company):
+        """Source and (empty) target matrix: 2 documents x 1 question, one answered cell."""
+        company_id = sample_company.id
+        source_matrix = MatrixEntity(
+            name="Source", workspace_id=sample_workspace.id, company_id=company_id
+        )
+        target_matrix = MatrixEntity(
+            name="Target", workspace_id=sample_workspace.id, company_id=company_id
+        )
+        await _add(test_db, source_matrix, target_matrix)
+
+        sets = {}
+        for matrix in (source_matrix, target_matrix):
+            doc_set = MatrixEntitySetEntity(
+                matrix_id=matrix.id,
+                company_id=company_id,
+                name="Documents",
+                entity_type=EntityType.DOCUMENT.value,
+            )
+            question_set = MatrixEntitySetEntity(
+                matrix_id=matrix.id,
+                company_id=company_id,
+                name="Questions",
+                entity_type=EntityType.QUESTION.value,
+            )
+            await _add(test_db, doc_set, question_set)
+            sets[matrix.id] = (doc_set, question_set)
+
+        variables = [
+            MatrixTemplateVariableEntity(
+                template_string="company",
+                value=value,
+                matrix_id=matrix.id,
+                company_id=company_id,
+            )
+            for matrix, value in ((source_matrix, "Acme"), (target_matrix, "Other"))
+        ]
+        await _add(test_db, *variables)
+
+        question = QuestionEntity(
+            matrix_id=source_matrix.id,
+            company_id=company_id,
+            question_text=f"Who owns #{{{{{variables[0].id}}}}}?",
+            question_type_id=1,
+            label="Owner",
+        )
+        deleted_question = QuestionEntity(
+            matrix_id=source_matrix.id,
+            company_id=company_id,
+            question_text="Gone",
+            question_type_id=1,
+            deleted=True,
+        )
+        documents = [
+            DocumentEntity(
+                filename=f"doc{i}.pdf",
+                storage_key=f"documents/doc{i}.pdf",
+                checksum=f"checksum{i}",
+                content_type="application/pdf",
+                file_size=1024,
+                company_id=company_id,
+            )
+            for i in range(2)
+        ]
+        await _add(test_db, question, deleted_question, *documents)
+
+        option_set = QuestionOptionSetEntity(question_id=question.id)
+        await _add(test_db, option_set)
+        await _add(
+            test_db,
+            QuestionOptionEntity(option_set_id=option_set.id, value="Alice"),
+            QuestionOptionEntity(option_set_id=option_set.id, value="Bob"),
+            QuestionTemplateVariableEntity(
+                question_id=question.id,
+                template_variable_id=variables[0].id,
+                company_id=company_id,
+            ),
+        )
+
+        doc_set, question_set = sets[source_matrix.id]
+        doc_members = [
+            MatrixEntitySetMemberEntity(
+                entity_set_id=doc_set.id,
+                company_id=company_id,
+                entity_type=EntityType.DOCUMENT.value,
+                entity_id=document.id,
+                member_order=i,
+            )
+            for i, document in enumerate(documents)
+        ]
+        question_members = [
+            MatrixEntitySetMemberEntity(
+                entity_set_id=question_set.id,
+                company_id=company_id,
+                entity_type=EntityType.QUESTION.value,
+                entity_id=q.id,
+                member_order=i,
+            )
+            for i, q in enumerate((question, deleted_question))
+        ]
+        await _add(test_db, *doc_members, *question_members)
+
+        answered, pending = [
+            MatrixCellEntity(
+                matrix_id=source_matrix.id,
+                company_id=company_id,
+                cell_type="standard",
+                status=status,
+                cell_signature=status,
+            )
+            for status in ("completed", "pending")
+        ]
+        await _add(test_db, answered, pending)
+        for cell, doc_member in ((answered, doc_members[0]), (pending, doc_members[1])):
+            await _add(
+                test_db,
+                MatrixCellEntityReferenceEntity(
+                    matrix_id=source_matrix.id,
+                    matrix_cell_id=cell.id,
+                    entity_set_id=doc_set.id,
+                    entity_set_member_id=doc_member.id,
+                    company_id=company_id,
+                    role=EntityRole.DOCUMENT.value,
+                ),
+                MatrixCellEntityReferenceEntity(
+                    matrix_id=source_matrix.id,
+                    matrix_cell_id=cell.id,
+                    entity_set_id=question_set.id,
+                    entity_set_member_id=question_members[0].id,
+                    company_id=company_id,
+                    role=EntityRole.QUESTION.value,
+                ),
+            )
+
+        stale_answer_set, answer_set = [
+            AnswerSetEntity(
+                matrix_cell_id=answered.id,
+                question_type_id=1,
+                company_id=company_id,
+                answer_found=True,
+                confidence=confidence,
+                context_chunk_ids={str(documents[0].id): ["chunk-1", "chunk-3"]},
+            )
+            for confidence in (0.1, 0.8)
+        ]
+        await _add(test_db, stale_answer_set, answer_set)
+        answer = AnswerEntity(
+            answer_set_id=answer_set.id,
+            company_id=company_id,
+            answer_data={"type": "text", "value": "Alice"},
+        )
+        await _add(test_db, answer)
+        citation_set = CitationSetEntity(answer_id=answer.id, company_id=company_id)
+        await _add(test_db, citation_set)
+        await _add(
+            test_db,
+            CitationEntity(
+                citation_set_id=citation_set.id,
+                document_id=documents[0].id,
+                company_id=company_id,
+                quote_text="Alice owns it",
+                citation_order=1,
+            ),
+        )
+        answer.current_citation_set_id = citation_set.id
+        answered.current_answer_set_id = answer_set.id
+        await test_db.commit()
+
+        return {
+            "source_matrix": source_matrix,
+            "target_matrix": target_matrix,
+            "entity_set_id_mapping": {
+                source_set.id: target_set.id
+                for source_set, target_set in zip(
+                    sets[source_matrix.id], sets[target_matrix.id]
+                )
+            },
+            "template_variable_id_mapping": {variables[0].id: variables[1].id},
+            "target_sets": sets[target_matrix.id],
+            "documents": documents,
+        }
+
+    async def test_copies_questions_and_members(self, repository, test_db, source):
+        """Test the structural copy without cells."""
+        source_matrix = source["source_matrix"]
+        target_matrix = source["target_matrix"]
+        target_variable_id = next(iter(source["template_variable_id_mapping"].values()))
+
+        result = await repository.copy_matrix_contents(
+            source_matrix.id,
+            target_matrix.id,
+            source["entity_set_id_mapping"],
+            source["template_variable_id_mapping"],
+            copy_questions=True,
+        )
+
+        assert result.questions_copied == 1
+        assert sorted(result.members_copied.values()) == [1, 2]
+        assert result.cells_copied == 0
+
+        question = (
+            await test_db.execute(
+                select(QuestionEntity).where(
+                    QuestionEntity.matrix_id == target_matrix.id
+                )
+            )
+        ).scalar_one()
+        assert question.question_text == f"Who owns #{{{{{target_variable_id}}}}}?"
+        assert question.label == "Owner"
+
+        options = (
+            await test_db.execute(
+                select(QuestionOptionEntity.value)
+                .join(
+                    QuestionOptionSetEntity,
+                    QuestionOptionSetEntity.id == QuestionOptionEntity.option_set_id,
+                )
+                .where(QuestionOptionSetEntity.question_id == question.id)
+                .order_by(QuestionOptionEntity.id)
+            )
+        ).scalars()
+        assert list(options) == ["Alice", "Bob"]
+
+        association = (
+            await test_db.execute(
+                select(QuestionTemplateVariableEntity).where(
+                    QuestionTemplateVariableEntity.question_id == question.id
+                )
+            )
+        ).scalar_one()
+        assert association.template_variable_id == target_variable_id
+
+        doc_set, question_set = source["target_sets"]
+        members = (
+            await test_db.execute(
+                select(
+                    MatrixEntitySetMemberEntity.entity_set_id,
+                    MatrixEntitySetMemberEntity.entity_id,
+                ).order_by(MatrixEntitySetMemberEntity.id)
+            )
+        ).all()
+        assert members[-3:] == [
+            (doc_set.id, source["documents"][0].id),
+            (doc_set.id, source["documents"][1].id),
+            (question_set.id, question.id),
+        ]
+
+        cells = await test_db.execute(
+            select(MatrixCellEntity).where(
+                MatrixCellEntity.matrix_id == target_matrix.id
+            )
+        )
+        assert cells.scalars().all() == []
+
+    async def test_copies_answered_cells_with_current_answers(
+        self, repository, test_db, source
+    ):
+        """Test that only the completed cell is copied, remapped and re-signed."""
+        target_matrix = source["target_matrix"]
+
+        result = await repository.copy_matrix_contents(
+            source["source_matrix"].id,
+            target_matrix.id,
+            source["entity_set_id_mapping"],
+            source["template_variable_id_mapping"],
+            copy_questions=True,
+            copy_answers=True,
+        )
+
+        assert result.cells_copied == 1
+
+        cell = (
+            await test_db.execute(
+                select(MatrixCellEntity).where(
+                    MatrixCellEntity.matrix_id == target_matrix.id
+                )
+            )
+        ).scalar_one()
+        assert cell.status == "completed"
+
+        refs = (
+            (
+                await test_db.execute(
+                    select(MatrixCellEntityReferenceEntity).where(
+                        MatrixCellEntityReferenceEntity.matrix_cell_id == cell.id
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert {ref.entity_set_id for ref in refs} == {
+            es.id for es in source["target_sets"]
+        }
+        assert cell.cell_signature == _signature(
+            *(
+                f"{ref.role}|{ref.entity_set_id}|{ref.entity_set_member_id}"
+                for ref in refs
+            )
+        )
+
+        answer_set = await test_db.get(AnswerSetEntity, cell.current_answer_set_id)
+        assert answer_set.matrix_cell_id == cell.id
+        assert answer_set.confidence == 0.8
+        assert answer_set.context_chunk_ids == {
+            str(source["documents"][0].id): ["chunk-1", "chunk-3"]
+        }
+        answer = (
+            await test_db.execute(
+                select(AnswerEntity).where(AnswerEntity.answer_set_id == answer_set.id)
+            )
+        ).scalar_one()
+        assert answer.answer_data["value"] == "Alice"
+
+        citation_set = await test_db.get(
+            CitationSetEntity, answer.current_citation_set_id
+        )
+        assert citation_set.answer_id == answer.id
+        citation = (
+            await test_db.execute(
+                select(CitationEntity).where(
+                    CitationEntity.citation_set_id == citation_set.id
+                )
+            )
+        ).scalar_one()
+        assert citation.quote_text == "Alice owns it"
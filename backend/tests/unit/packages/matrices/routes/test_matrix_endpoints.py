@@ -568,6 +568,12 @@ class TestMatrixCellStreamingEndpoints:
         assert result["duplicateMatrixId"] != matrix_id
         assert result["duplicateMatrixId"] > 0
         assert "Successfully duplicated matrix" in result["message"]
+        assert result["complete"] is True
         assert doc_entity_set_id in [
             int(k) for k in result["entitySetsDuplicated"].keys()
         ]
+
+    async def test_resume_duplication_nonexistent_matrix(self, client: AsyncClient):
+        """Test resuming the duplication of a matrix that doesn't exist."""
+        response = await client.post("/api/v1/matrices/99999/duplicate/resume")
+        assert response.status_code == 404
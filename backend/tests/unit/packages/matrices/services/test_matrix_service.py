@@ -3,8 +3,15 @@ import hashlib
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from common.core.config import settings
+
 from packages.matrices.services.matrix_service import MatrixService
 from packages.matrices.services.entity_set_service import EntitySetService
+from packages.matrices.services.batch_processing_service import BatchProcessingService
+from packages.matrices.models.database.matrix import MatrixEntity, MatrixCellEntity
 from packages.matrices.models.domain.matrix import (
     MatrixCreateModel,
     MatrixCellModel,
@@ -283,6 +290,216 @@ class TestMatrixService:
 
         assert len(target_questions) == 2
 
+    async def _create_source_matrix_with_cells(
+        self, matrix_service, sample_workspace, sample_company, test_db
+    ):
+        """Create a source matrix with 2 documents x 2 questions (4 cells)."""
+        source_matrix = await matrix_service.create_matrix(
+            MatrixCreateModel(
+                name="Source Matrix",
+                description="Source",
+                workspace_id=sample_workspace.id,
+                company_id=sample_company.id,
+            )
+        )
+        documents = [
+            DocumentEntity(
+                filename=f"doc{i}.pdf",
+                storage_key=f"documents/doc{i}.pdf",
+                content_type="application/pdf",
+                file_size=1024,
+                checksum=f"doc{i}checksum" + "0" * 54,
+                company_id=sample_company.id,
+            )
+            for i in range(2)
+        ]
+        questions = [
+            QuestionEntity(
+                matrix_id=source_matrix.id,
+                company_id=sample_company.id,
+                question_text=f"Question {i}?",
+                question_type_id=1,
+            )
+            for i in range(2)
+        ]
+        test_db.add_all(documents + questions)
+        await test_db.commit()
+
+        entity_set_service = EntitySetService()
+        entity_sets = await entity_set_service.get_matrix_entity_sets(
+            source_matrix.id, sample_company.id
+        )
+        for entity_set in entity_sets:
+            entities = (
+                documents
+                if entity_set.entity_type == EntityType.DOCUMENT
+                else questions
+            )
+            await entity_set_service.add_members_batch(
+                entity_set.id,
+                [entity.id for entity in entities],
+                entity_set.entity_type,
+                sample_company.id,
+            )
+
+        return source_matrix, MatrixDuplicateRequest(
+            name="Duplicated Matrix",
+            description="Full",
+            entity_set_ids=[entity_set.id for entity_set in entity_sets],
+        )
+
+    async def _get_duplicate(self, test_db):
+        """Load the duplicate matrix row, deleted or not."""
+        result = await test_db.execute(
+            select(MatrixEntity).where(MatrixEntity.name == "Duplicated Matrix")
+        )
+        return result.scalar_one_or_none()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [2000, 2])
+    @patch("packages.matrices.services.matrix_service.QuotaService")
+    @patch("packages.matrices.services.batch_processing_service.get_message_queue")
+    @patch("common.core.otel_axiom_exporter.axiom_tracer.start_as_current_span")
+    async def test_duplicate_matrix_creates_cells(
+        self,
+        mock_tracer,
+        mock_queue,
+        mock_quota_service,
+        chunk_size,
+        matrix_service,
+        sample_workspace,
+        sample_company,
+        test_db,
+        mock_message_queue,
+    ):
+        """Test that small duplicates (one transaction) and large ones (streamed) create every cell."""
+        mock_queue.return_value = mock_message_queue
+        mock_message_queue.publish_batch = AsyncMock(
+            side_effect=lambda queue, messages: len(messages)
+        )
+        mock_quota_service.return_value.check_cell_operation_quota = AsyncMock()
+        mock_quota_service.return_value.check_agentic_qa_quota = AsyncMock()
+        source_matrix, duplicate_request = await self._create_source_matrix_with_cells(
+            matrix_service, sample_workspace, sample_company, test_db
+        )
+
+        with (
+            patch.object(settings, "matrix_cell_batch_chunk_size", chunk_size),
+            patch.object(
+                BatchProcessingService,
+                "_check_quota_for_cells",
+                AsyncMock(return_value=0),
+            ),
+        ):
+            result = await matrix_service.duplicate_matrix(
+                source_matrix.id, duplicate_request
+            )
+
+        assert result.cells_created == 4
+        cells = await matrix_service.get_matrix_cells(result.duplicate_matrix_id)
+        assert len(cells) == 4
+
+    @pytest.mark.asyncio
+    @patch("packages.matrices.services.matrix_service.QuotaService")
+    @patch("packages.matrices.services.batch_processing_service.get_message_queue")
+    @patch("common.core.otel_axiom_exporter.axiom_tracer.start_as_current_span")
+    async def test_small_duplicate_rolls_back_on_cell_failure(
+        self,
+        mock_tracer,
+        mock_queue,
+        mock_quota_service,
+        matrix_service,
+        sample_workspace,
+        sample_company,
+        test_db,
+        mock_message_queue,
+    ):
+        """Test that a duplicate that fits in one chunk leaves nothing behind on failure."""
+        mock_queue.return_value = mock_message_queue
+        mock_quota_service.return_value.check_cell_operation_quota = AsyncMock()
+        mock_quota_service.return_value.check_agentic_qa_quota = AsyncMock()
+        source_matrix, duplicate_request = await self._create_source_matrix_with_cells(
+            matrix_service, sample_workspace, sample_company, test_db
+        )
+
+        with (
+            patch.object(
+                BatchProcessingService,
+                "_check_quota_for_cells",
+                AsyncMock(side_effect=HTTPException(status_code=429)),
+            ),
+            pytest.raises(HTTPException),
+        ):
+            await matrix_service.duplicate_matrix(source_matrix.id, duplicate_request)
+
+        assert await self._get_duplicate(test_db) is None
+
+    @pytest.mark.asyncio
+    @patch("packages.matrices.services.matrix_service.QuotaService")
+    @patch("packages.matrices.services.batch_processing_service.get_message_queue")
+    @patch("common.core.otel_axiom_exporter.axiom_tracer.start_as_current_span")
+    async def test_streamed_duplicate_resumes_after_chunk_failure(
+        self,
+        mock_tracer,
+        mock_queue,
+        mock_quota_service,
+        matrix_service,
+        sample_workspace,
+        sample_company,
+        test_db,
+        mock_message_queue,
+    ):
+        """Test that a streamed duplicate keeps its committed chunks and can be resumed."""
+        mock_queue.return_value = mock_message_queue
+        mock_message_queue.publish_batch = AsyncMock(
+            side_effect=lambda queue, messages: len(messages)
+        )
+        mock_quota_service.return_value.check_cell_operation_quota = AsyncMock()
+        mock_quota_service.return_value.check_agentic_qa_quota = AsyncMock()
+        source_matrix, duplicate_request = await self._create_source_matrix_with_cells(
+            matrix_service, sample_workspace, sample_company, test_db
+        )
+
+        with (
+            patch.object(settings, "matrix_cell_batch_chunk_size", 2),
+            patch.object(
+                BatchProcessingService,
+                "_check_quota_for_cells",
+                AsyncMock(
+                    side_effect=[
+                        0,
+                        HTTPException(status_code=429, detail="Cell quota exceeded"),
+                    ]
+                ),
+            ),
+        ):
+            result = await matrix_service.duplicate_matrix(
+                source_matrix.id, duplicate_request
+            )
+
+        assert result.complete is False
+        assert result.cells_created == 2  # The first chunk committed
+        assert "Cell quota exceeded" in result.message
+        duplicate = await self._get_duplicate(test_db)
+        assert duplicate.deleted is False
+
+        with (
+            patch.object(settings, "matrix_cell_batch_chunk_size", 2),
+            patch.object(
+                BatchProcessingService,
+                "_check_quota_for_cells",
+                AsyncMock(return_value=0),
+            ),
+        ):
+            resumed = await matrix_service.resume_matrix_duplication(duplicate.id)
+
+        assert resumed.complete is True
+        assert resumed.cells_created == 2
+        assert resumed.jobs_requeued == 0
+        cells = await matrix_service.get_matrix_cells(duplicate.id)
+        assert len(cells) == 4
+        assert mock_message_queue.publish_batch.await_count == 2
+
 
 class TestMatrixServiceStreamingMethods:
     """Unit tests for new MatrixService streaming methods."""
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from packages.matrices.models.domain.matrix_enums import (
     MatrixType,
@@ -230,6 +230,96 @@ class TestReprocessingService:
         # Should reprocess 2 cells (1 doc × 2 questions)
         assert result == 2
 
+    @pytest.mark.asyncio
+    async def test_reprocess_matrix_cells_checks_quota_for_cell_questions(
+        self,
+        mock_get_message_queue,
+        mock_start_span,
+        test_db,
+        sample_company,
+        sample_subscription,
+        mock_message_queue,
+        reprocessing_service,
+    ):
+        """Test that question IDs for the agentic quota come from the cells' refs."""
+        mock_get_message_queue.return_value = mock_message_queue
+
+        matrix = await MatrixRepository().create(
+            MatrixCreateModel(
+                name="Test Matrix",
+                workspace_id=1,
+                company_id=sample_company.id,
+                matrix_type=MatrixType.STANDARD,
+            )
+        )
+        entity_set_repo = EntitySetRepository()
+        doc_set = await entity_set_repo.create(
+            MatrixEntitySetCreateModel(
+                matrix_id=matrix.id,
+                company_id=sample_company.id,
+                name="Documents",
+                entity_type=EntityType.DOCUMENT,
+            )
+        )
+        question_set = await entity_set_repo.create(
+            MatrixEntitySetCreateModel(
+                matrix_id=matrix.id,
+                company_id=sample_company.id,
+                name="Questions",
+                entity_type=EntityType.QUESTION,
+            )
+        )
+        member_repo = EntitySetMemberRepository()
+        for i in range(2):
+            await member_repo.create(
+                MatrixEntitySetMemberCreateModel(
+                    entity_set_id=doc_set.id,
+                    entity_type=EntityType.DOCUMENT,
+                    entity_id=i + 1,
+                    member_order=i,
+                    company_id=sample_company.id,
+                )
+            )
+        for i, question_id in enumerate((7, 8)):
+            await member_repo.create(
+                MatrixEntitySetMemberCreateModel(
+                    entity_set_id=question_set.id,
+                    entity_type=EntityType.QUESTION,
+                    entity_id=question_id,
+                    member_order=i,
+                    company_id=sample_company.id,
+                )
+            )
+        await test_db.commit()
+
+        await reprocessing_service.batch_processing_service.batch_create_matrix_cells_and_jobs(
+            matrix_id=matrix.id,
+            entity_set_ids=[doc_set.id, question_set.id],
+            create_qa_jobs=False,
+        )
+
+        request = MatrixReprocessRequest(
+            entity_set_filters=[
+                EntitySetFilter(
+                    entity_set_id=question_set.id,
+                    entity_ids=[8],
+                    role=EntityRole.QUESTION,
+                )
+            ]
+        )
+
+        with patch(
+            "packages.questions.services.question_service.QuestionService.count_agentic_questions",
+            new_callable=AsyncMock,
+            return_value=0,
+        ) as mock_count:
+            result = await reprocessing_service.reprocess_matrix_cells(
+                matrix.id, request
+            )
+
+        assert result == 2  # 2 docs × 1 question
+        mock_count.assert_awaited_once_with([8], sample_company.id)
+
     @pytest.mark.asyncio
     async def test_reprocess_matrix_cells_by_cell_ids(
         self,
@@ -479,7 +479,6 @@ class TestSoftDeleteService:
         assert service.matrix_repo is not None
         assert service.matrix_cell_repo is not None
         assert service.member_repo is not None
-        assert service.cell_ref_repo is not None
 
     @pytest.mark.asyncio
     @pytest.mark.skip(
@@ -763,3 +762,138 @@ class TestSoftDeleteService:
         # Verify cell is marked as deleted
         await test_db.refresh(cell)
         assert cell.deleted is True
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_entity_filters_sharing_cells(
+        self,
+        service,
+        test_db,
+        sample_company,
+        sample_workspace,
+    ):
+        """Test that cells shared by several filters are counted once and their refs deleted."""
+        matrix = MatrixEntity(
+            name="Test Matrix",
+            workspace_id=sample_workspace.id,
+            company_id=sample_company.id,
+            matrix_type="standard",
+        )
+        test_db.add(matrix)
+        await test_db.commit()
+        await test_db.refresh(matrix)
+
+        documents = [
+            DocumentEntity(
+                filename=f"doc{i}.pdf",
+                storage_key=f"documents/doc{i}.pdf",
+                checksum=f"checksum{i}",
+                content_type="application/pdf",
+                file_size=1024,
+                company_id=sample_company.id,
+            )
+            for i in range(2)
+        ]
+        question = QuestionEntity(
+            matrix_id=matrix.id,
+            company_id=sample_company.id,
+            question_text="What is the date?",
+            question_type_id=1,
+        )
+        doc_entity_set = MatrixEntitySetEntity(
+            matrix_id=matrix.id,
+            name="Documents",
+            entity_type=EntityType.DOCUMENT.value,
+            company_id=sample_company.id,
+        )
+        question_entity_set = MatrixEntitySetEntity(
+            matrix_id=matrix.id,
+            name="Questions",
+            entity_type=EntityType.QUESTION.value,
+            company_id=sample_company.id,
+        )
+        test_db.add_all([*documents, question, doc_entity_set, question_entity_set])
+        await test_db.commit()
+
+        doc_members = [
+            MatrixEntitySetMemberEntity(
+                entity_set_id=doc_entity_set.id,
+                entity_type=EntityType.DOCUMENT.value,
+                entity_id=document.id,
+                member_order=i,
+                company_id=sample_company.id,
+            )
+            for i, document in enumerate(documents)
+        ]
+        question_member = MatrixEntitySetMemberEntity(
+            entity_set_id=question_entity_set.id,
+            entity_type=EntityType.QUESTION.value,
+            entity_id=question.id,
+            member_order=0,
+            company_id=sample_company.id,
+        )
+        cells = [
+            MatrixCellEntity(
+                matrix_id=matrix.id,
+                company_id=sample_company.id,
+                cell_type="standard",
+                status="pending",
+                cell_signature=hashlib.md5(f"shared_cell_{i}".encode()).hexdigest(),
+            )
+            for i in range(2)
+        ]
+        test_db.add_all([*doc_members, question_member, *cells])
+        await test_db.commit()
+
+        refs = []
+        for cell, doc_member in zip(cells, doc_members):
+            refs.append(
+                MatrixCellEntityReferenceEntity(
+                    matrix_id=matrix.id,
+                    matrix_cell_id=cell.id,
+                    entity_set_id=doc_entity_set.id,
+                    entity_set_member_id=doc_member.id,
+                    role=EntityRole.DOCUMENT.value,
+                    company_id=sample_company.id,
+                )
+            )
+            refs.append(
+                MatrixCellEntityReferenceEntity(
+                    matrix_id=matrix.id,
+                    matrix_cell_id=cell.id,
+                    entity_set_id=question_entity_set.id,
+                    entity_set_member_id=question_member.id,
+                    role=EntityRole.QUESTION.value,
+                    company_id=sample_company.id,
+                )
+            )
+        test_db.add_all(refs)
+        await test_db.commit()
+
+        # The first document's cell is also reached through the question
+        request = MatrixSoftDeleteRequest(
+            entity_set_filters=[
+                EntitySetFilter(
+                    entity_set_id=doc_entity_set.id,
+                    entity_ids=[documents[0].id],
+                    role=EntityRole.DOCUMENT,
+                ),
+                EntitySetFilter(
+                    entity_set_id=question_entity_set.id,
+                    entity_ids=[question.id],
+                    role=EntityRole.QUESTION,
+                ),
+            ]
+        )
+
+        entities_deleted, cells_deleted = await service.soft_delete_entities(
+            matrix.id, request
+        )
+
+        assert entities_deleted == 2
+        assert cells_deleted == 2
+
+        for entity in [*cells, *refs, doc_members[0], question_member]:
+            await test_db.refresh(entity)
+            assert entity.deleted is True
+        await test_db.refresh(doc_members[1])
+        assert doc_members[1].deleted is False
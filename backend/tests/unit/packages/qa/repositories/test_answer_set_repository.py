@@ -0,0 +1,138 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from packages.matrices.models.database.matrix import MatrixCellEntity
+from packages.qa.models.database.answer import AnswerEntity
+from packages.qa.models.database.citation import CitationEntity, CitationSetEntity
+from packages.qa.models.domain.answer_data import TextAnswerData
+from packages.qa.models.domain.citation import CitationReference
+from packages.qa.repositories.answer_set_repository import AnswerSetRepository
+
+
+class TestAnswerSetRepositoryBulkCreate:
+    """Test AnswerSetRepository.create_with_answers."""
+
+    @pytest.fixture
+    async def repository(self, test_db: AsyncSession):
+        return AnswerSetRepository()
+
+    async def test_creates_answers_citations_and_current_pointers(
+        self, repository, test_db, sample_matrix_cell, sample_document
+    ):
+        """Test that the full answer tree is written and linked."""
+        answers = [
+            TextAnswerData(
+                value="first",
+                confidence=0.9,
+                citations=[
+                    CitationReference(
+                        citation_number=1,
+                        quote_text="quote one",
+                        document_id=sample_document.id,
+                    ),
+                    CitationReference(
+                        citation_number=2,
+                        quote_text="quote two",
+                        document_id=sample_document.id,
+                    ),
+                ],
+            ),
+            TextAnswerData(value="uncited"),
+            TextAnswerData(
+                value="third",
+                citations=[
+                    CitationReference(
+                        citation_number=1,
+                        quote_text="quote three",
+                        document_id=sample_document.id,
+                    )
+                ],
+            ),
+        ]
+
+        answer_set = await repository.create_with_answers(
+            sample_matrix_cell.id,
+            question_type_id=1,
+            answer_found=True,
+            confidence=0.9,
+            answers=answers,
+        )
+
+        assert answer_set.company_id == sample_matrix_cell.company_id
+        assert answer_set.matrix_cell_id == sample_matrix_cell.id
+
+        rows = (
+            (
+                await test_db.execute(
+                    select(AnswerEntity)
+                    .where(AnswerEntity.answer_set_id == answer_set.id)
+                    .order_by(AnswerEntity.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert [row.answer_data["value"] for row in rows] == [
+            "first",
+            "uncited",
+            "third",
+        ]
+        assert rows[1].current_citation_set_id is None
+
+        for row, expected in (
+            (rows[0], ["quote one", "quote two"]),
+            (rows[2], ["quote three"]),
+        ):
+            citation_set = await test_db.get(
+                CitationSetEntity, row.current_citation_set_id
+            )
+            assert citation_set.answer_id == row.id
+            quotes = (
+                (
+                    await test_db.execute(
+                        select(CitationEntity.quote_text)
+                        .where(CitationEntity.citation_set_id == citation_set.id)
+                        .order_by(CitationEntity.citation_order)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            assert quotes == expected
+
+        cell = await test_db.get(MatrixCellEntity, sample_matrix_cell.id)
+        await test_db.refresh(cell)
+        assert cell.current_answer_set_id == answer_set.id
+
+    async def test_records_context_chunk_ids(
+        self, repository, sample_matrix_cell, sample_document
+    ):
+        """Test that the chunks shown to the model are stored on the answer set."""
+        answer_set = await repository.create_with_answers(
+            sample_matrix_cell.id,
+            question_type_id=1,
+            answer_found=False,
+            confidence=1.0,
+            answers=[],
+            context_chunk_ids={sample_document.id: ["chunk_2", "chunk_7"]},
+        )
+
+        assert answer_set.context_chunk_ids == {
+            sample_document.id: ["chunk_2", "chunk_7"]
+        }
+        stored = await repository.get(answer_set.id)
+        assert stored.context_chunk_ids == {sample_document.id: ["chunk_2", "chunk_7"]}
+
+    async def test_missing_cell_creates_nothing(self, repository, test_db):
+        """Test that an unknown cell returns None without writing answers."""
+        answer_set = await repository.create_with_answers(
+            999999,
+            question_type_id=1,
+            answer_found=True,
+            confidence=1.0,
+            answers=[TextAnswerData(value="orphan")],
+        )
+
+        assert answer_set is None
+        assert (await test_db.execute(select(AnswerEntity))).first() is None
@@ -10,11 +10,14 @@ from packages.matrices.models.domain.matrix_entity_set import (
     MatrixEntitySetCreateModel,
     MatrixEntitySetMemberCreateModel,
 )
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+
+from common.db.scoped import transaction
 
 from packages.matrices.services.batch_processing_service import BatchProcessingService
 from packages.matrices.models.domain.matrix_enums import MatrixType, EntityType
 from packages.qa.models.domain.qa_job import QAJobStatus
+from packages.qa.repositories.qa_job_repository import QAJobRepository
 from packages.questions.repositories.question_repository import QuestionRepository
 from packages.questions.models.domain.question import QuestionCreateModel
 
@@ -523,3 +526,180 @@ class TestBatchProcessingService:
         # Should have created 1 cell (1 agentic question × 1 doc)
         assert len(cells) == 1
         assert len(jobs) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_create_matrix_cells_and_jobs_in_chunks(
+        self,
+        mock_get_message_queue,
+        mock_start_span,
+        test_db,
+        sample_company,
+        sample_subscription,
+        mock_message_queue,
+    ):
+        """Test that cells commit and publish per chunk, and a re-run resumes."""
+        mock_message_queue.publish_batch = AsyncMock(
+            side_effect=lambda queue, messages: len(messages)
+        )
+        mock_get_message_queue.return_value = mock_message_queue
+        service = BatchProcessingService()
+
+        matrix = await MatrixRepository().create(
+            MatrixCreateModel(
+                name="Test Matrix",
+                workspace_id=1,
+                company_id=sample_company.id,
+                matrix_type=MatrixType.STANDARD,
+            )
+        )
+        entity_set_repo = EntitySetRepository()
+        doc_set = await entity_set_repo.create(
+            MatrixEntitySetCreateModel(
+                matrix_id=matrix.id,
+                company_id=sample_company.id,
+                name="Documents",
+                entity_type=EntityType.DOCUMENT,
+            )
+        )
+        question_set = await entity_set_repo.create(
+            MatrixEntitySetCreateModel(
+                matrix_id=matrix.id,
+                company_id=sample_company.id,
+                name="Questions",
+                entity_type=EntityType.QUESTION,
+            )
+        )
+        member_repo = EntitySetMemberRepository()
+        for entity_set, entity_type in (
+            (doc_set, EntityType.DOCUMENT),
+            (question_set, EntityType.QUESTION),
+        ):
+            for i in range(2):
+                await member_repo.create(
+                    MatrixEntitySetMemberCreateModel(
+                        entity_set_id=entity_set.id,
+                        entity_type=entity_type,
+                        entity_id=i + 1,
+                        member_order=i,
+                        company_id=sample_company.id,
+                    )
+                )
+        await test_db.commit()
+
+        result = await service.stream_create_matrix_cells_and_jobs(
+            matrix_id=matrix.id,
+            entity_set_ids=[doc_set.id, question_set.id],
+            chunk_size=3,
+        )
+
+        # 2 docs × 2 questions in chunks of 3 and 1
+        assert result.cells_created == 4
+        assert result.jobs_created == 4
+        assert result.chunks_committed == 2
+        published = [
+            len(call.args[1])
+            for call in mock_message_queue.publish_batch.call_args_list
+        ]
+        assert published == [3, 1]
+
+        # Re-running skips the committed cells
+        resumed = await service.stream_create_matrix_cells_and_jobs(
+            matrix_id=matrix.id,
+            entity_set_ids=[doc_set.id, question_set.id],
+            chunk_size=3,
+        )
+        assert resumed.cells_created == 0
+        assert resumed.chunks_committed == 0
+        assert len(await MatrixCellRepository().get_cells_by_matrix_id(matrix.id)) == 4
+
+    @pytest.mark.asyncio
+    async def test_stream_resume_requeues_unpublished_jobs(
+        self,
+        mock_get_message_queue,
+        mock_start_span,
+        test_db,
+        sample_company,
+        sample_subscription,
+        mock_message_queue,
+    ):
+        """Test that jobs committed but never published are requeued on resume."""
+        mock_message_queue.publish_batch = AsyncMock(return_value=0)
+        mock_get_message_queue.return_value = mock_message_queue
+        service = BatchProcessingService()
+
+        matrix = await MatrixRepository().create(
+            MatrixCreateModel(
+                name="Test Matrix",
+                workspace_id=1,
+                company_id=sample_company.id,
+                matrix_type=MatrixType.STANDARD,
+            )
+        )
+        entity_set_repo = EntitySetRepository()
+        member_repo = EntitySetMemberRepository()
+        entity_set_ids = []
+        for name, entity_type, count in (
+            ("Documents", EntityType.DOCUMENT, 1),
+            ("Questions", EntityType.QUESTION, 2),
+        ):
+            entity_set = await entity_set_repo.create(
+                MatrixEntitySetCreateModel(
+                    matrix_id=matrix.id,
+                    company_id=sample_company.id,
+                    name=name,
+                    entity_type=entity_type,
+                )
+            )
+            entity_set_ids.append(entity_set.id)
+            for i in range(count):
+                await member_repo.create(
+                    MatrixEntitySetMemberCreateModel(
+                        entity_set_id=entity_set.id,
+                        entity_type=entity_type,
+                        entity_id=i + 1,
+                        member_order=i,
+                        company_id=sample_company.id,
+                    )
+                )
+        await test_db.commit()
+
+        # The chunk commits, then publishing falls short
+        with pytest.raises(RuntimeError):
+            await service.stream_create_matrix_cells_and_jobs(
+                matrix_id=matrix.id, entity_set_ids=entity_set_ids
+            )
+        unpublished = await QAJobRepository().get_unpublished_for_matrix(matrix.id)
+        assert len(unpublished) == 2
+
+        mock_message_queue.publish_batch = AsyncMock(
+            side_effect=lambda queue, messages: len(messages)
+        )
+        resumed = await service.stream_create_matrix_cells_and_jobs(
+            matrix_id=matrix.id, entity_set_ids=entity_set_ids
+        )
+
+        assert resumed.jobs_requeued == 2
+        assert resumed.cells_created == 0
+        requeued = mock_message_queue.publish_batch.await_args.args[1]
+        assert sorted(message["job_id"] for message in requeued) == sorted(
+            job.id for job in unpublished
+        )
+        assert await QAJobRepository().get_unpublished_for_matrix(matrix.id) == []
+
+    @pytest.mark.asyncio
+    async def test_stream_create_matrix_cells_and_jobs_inside_transaction(
+        self,
+        mock_get_message_queue,
+        mock_start_span,
+        test_db,
+        mock_message_queue,
+    ):
+        """Test that streaming refuses to run inside an open transaction."""
+        mock_get_message_queue.return_value = mock_message_queue
+        service = BatchProcessingService()
+
+        with pytest.raises(RuntimeError):
+            async with transaction():
+                await service.stream_create_matrix_cells_and_jobs(
+                    matrix_id=1, entity_set_ids=[1]
+                )
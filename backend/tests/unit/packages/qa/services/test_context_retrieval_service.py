@@ -0,0 +1,149 @@
+"""Unit tests for retrieval-trimmed QA context."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from packages.documents.providers.document_search.types import (
+    ChunkSearchHit,
+    ChunkSearchResult,
+)
+from packages.qa.services.context_retrieval_service import ContextRetrievalService
+from packages.qa.utils.message_builders import DocumentContext
+
+
+def _hit(document_id: int, chunk_order: int, content: str) -> ChunkSearchHit:
+    # Agentic chunks carry no chunk_index metadata; order comes from the DB
+    return ChunkSearchHit(
+        chunk_id=f"chunk-{document_id}-{chunk_order}",
+        document_id=document_id,
+        company_id=1,
+        content=content,
+        metadata={},
+        score=1.0,
+    )
+
+
+@pytest.fixture
+def chunk_search_service():
+    service = MagicMock()
+    service.hybrid_search_chunks = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def chunk_service():
+    async def get_chunks_by_document_chunk_ids(document_chunk_ids, company_id):
+        return [
+            SimpleNamespace(chunk_id=chunk_id, chunk_order=int(chunk_id.split("-")[-1]))
+            for _, chunk_id in document_chunk_ids
+        ]
+
+    service = MagicMock()
+    service.get_chunks_by_document_chunk_ids = AsyncMock(
+        side_effect=get_chunks_by_document_chunk_ids
+    )
+    return service
+
+
+@pytest.fixture
+def retrieval_service(chunk_search_service, chunk_service):
+    return ContextRetrievalService(
+        chunk_search_service=chunk_search_service, chunk_service=chunk_service
+    )
+
+
+class TestContextRetrievalService:
+    @pytest.mark.asyncio
+    async def test_documents_within_budget_are_untouched(
+        self, retrieval_service, chunk_search_service
+    ):
+        """Test that no search happens when everything fits."""
+        documents = [DocumentContext(document_id=1, content="a" * 400)]
+
+        result = await retrieval_service.trim_documents(
+            documents, "question", company_id=1, token_budget=1000
+        )
+
+        assert result == documents
+        chunk_search_service.hybrid_search_chunks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_document_trimmed_to_ranked_chunks_in_reading_order(
+        self, retrieval_service, chunk_search_service
+    ):
+        """Test that top chunks are kept within budget and rendered in order."""
+        chunk_search_service.hybrid_search_chunks.return_value = ChunkSearchResult(
+            chunks=[
+                _hit(1, 7, "most relevant " + "x" * 186),
+                _hit(1, 2, "second " + "y" * 193),
+                _hit(1, 4, "z" * 4000),  # Over budget, skipped
+            ],
+            total_count=3,
+            has_more=False,
+        )
+        documents = [DocumentContext(document_id=1, content="a" * 40000)]
+
+        result = await retrieval_service.trim_documents(
+            documents, "question", company_id=1, token_budget=200
+        )
+
+        assert result[0].included_chunk_ids == ["chunk-1-2", "chunk-1-7"]
+        rendered = result[0].render()
+        assert rendered.index("[Excerpt chunk-1-2]") < rendered.index(
+            "[Excerpt chunk-1-7]"
+        )
+        assert "a" * 100 not in rendered
+
+    @pytest.mark.asyncio
+    async def test_small_documents_keep_full_content(
+        self, retrieval_service, chunk_search_service
+    ):
+        """Test that only documents over their share are trimmed."""
+        chunk_search_service.hybrid_search_chunks.return_value = ChunkSearchResult(
+            chunks=[_hit(2, 0, "relevant")], total_count=1, has_more=False
+        )
+        small = DocumentContext(document_id=1, content="s" * 40)
+        large = DocumentContext(document_id=2, content="l" * 40000)
+
+        result = await retrieval_service.trim_documents(
+            [small, large], "question", company_id=1, token_budget=1000
+        )
+
+        assert result[0] is small
+        assert result[1].included_chunk_ids == ["chunk-2-0"]
+        filters = chunk_search_service.hybrid_search_chunks.await_args.kwargs["filters"]
+        assert filters.document_ids == [2]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_truncated_content_without_chunks(
+        self, retrieval_service, chunk_search_service
+    ):
+        """Test that unindexed documents are cut to their budget, not dropped."""
+        chunk_search_service.hybrid_search_chunks.return_value = ChunkSearchResult(
+            chunks=[], total_count=0, has_more=False
+        )
+        documents = [DocumentContext(document_id=1, content="a" * 40000)]
+
+        result = await retrieval_service.trim_documents(
+            documents, "question", company_id=1, token_budget=100
+        )
+
+        assert result[0].included_chunk_ids is None
+        assert result[0].render() == "a" * 400
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_sends_no_large_document_content(
+        self, retrieval_service, chunk_search_service
+    ):
+        """Test that a document with no budget left is emptied, not sent whole."""
+        documents = [
+            DocumentContext(document_id=i, content="l" * 40000) for i in (1, 2, 3)
+        ]
+
+        result = await retrieval_service.trim_documents(
+            documents, "question", company_id=1, token_budget=2
+        )
+
+        assert [doc.render() for doc in result] == ["", "", ""]
+        chunk_search_service.hybrid_search_chunks.assert_not_called()
@@ -0,0 +1,41 @@
+"""
+Fixtures for tests that must run against Postgres.
+
+Repositories take Postgres-only paths (sequences, ON CONFLICT upserts) that the
+default SQLite database never executes. Tests in this package get the shared
+fixtures (test_db, sample_company, ...) backed by a Postgres testcontainer
+instead, and are skipped when Docker is unavailable.
+"""
+
+import pytest
+import pytest_asyncio
+from docker.errors import DockerException
+from sqlalchemy.ext.asyncio import create_async_engine
+from testcontainers.postgres import PostgresContainer
+
+from common.db.base import Base
+
+
+@pytest.fixture(scope="session")
+def postgres_url():
+    """Start one Postgres container for the session."""
+    try:
+        container = PostgresContainer("postgres:16", driver="asyncpg")
+        container.start()
+    except DockerException as e:
+        pytest.skip(f"Docker is not available: {e}")
+
+    try:
+        yield container.get_connection_url()
+    finally:
+        container.stop()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_engine(postgres_url):
+    """Postgres engine with the schema created (overrides the SQLite engine)."""
+    engine = create_async_engine(postgres_url, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
@@ -0,0 +1,139 @@
+"""Postgres tests for reprocess cell resolution (one UPDATE ... RETURNING)."""
+
+import pytest
+from sqlalchemy import event
+
+from packages.matrices.models.database.matrix import MatrixEntity, MatrixCellEntity
+from packages.matrices.models.database.matrix_entity_set import (
+    MatrixEntitySetEntity,
+    MatrixEntitySetMemberEntity,
+    MatrixCellEntityReferenceEntity,
+)
+from packages.matrices.models.domain.matrix import MatrixCellStatus
+from packages.matrices.models.domain.matrix_enums import EntityRole, EntityType
+from packages.matrices.repositories.matrix_cell_repository import MatrixCellRepository
+
+
+@pytest.fixture
+async def matrix(test_db, sample_company, sample_workspace):
+    """A 2 documents x 2 questions (entity IDs 7 and 8) matrix of completed cells."""
+    matrix = MatrixEntity(
+        name="Test Matrix",
+        workspace_id=sample_workspace.id,
+        company_id=sample_company.id,
+        matrix_type="standard",
+    )
+    test_db.add(matrix)
+    await test_db.commit()
+
+    entity_sets = {
+        entity_type: MatrixEntitySetEntity(
+            matrix_id=matrix.id,
+            name=entity_type.value,
+            entity_type=entity_type.value,
+            company_id=sample_company.id,
+        )
+        for entity_type in (EntityType.DOCUMENT, EntityType.QUESTION)
+    }
+    test_db.add_all(entity_sets.values())
+    await test_db.commit()
+
+    members = {
+        entity_type: [
+            MatrixEntitySetMemberEntity(
+                entity_set_id=entity_sets[entity_type].id,
+                entity_type=entity_type.value,
+                entity_id=entity_id,
+                member_order=i,
+                company_id=sample_company.id,
+            )
+            for i, entity_id in enumerate(entity_ids)
+        ]
+        for entity_type, entity_ids in (
+            (EntityType.DOCUMENT, (1, 2)),
+            (EntityType.QUESTION, (7, 8)),
+        )
+    }
+    test_db.add_all([*members[EntityType.DOCUMENT], *members[EntityType.QUESTION]])
+    await test_db.commit()
+
+    pairs = [
+        (doc_member, question_member)
+        for doc_member in members[EntityType.DOCUMENT]
+        for question_member in members[EntityType.QUESTION]
+    ]
+    cells = [
+        MatrixCellEntity(
+            matrix_id=matrix.id,
+            company_id=sample_company.id,
+            cell_type="standard",
+            status=MatrixCellStatus.COMPLETED.value,
+            cell_signature=f"cell_{i}",
+        )
+        for i in range(len(pairs))
+    ]
+    test_db.add_all(cells)
+    await test_db.commit()
+
+    test_db.add_all(
+        MatrixCellEntityReferenceEntity(
+            matrix_id=matrix.id,
+            matrix_cell_id=cell.id,
+            entity_set_id=member.entity_set_id,
+            entity_set_member_id=member.id,
+            role=role.value,
+            company_id=sample_company.id,
+        )
+        for cell, (doc_member, question_member) in zip(cells, pairs)
+        for member, role in (
+            (doc_member, EntityRole.DOCUMENT),
+            (question_member, EntityRole.QUESTION),
+        )
+    )
+    await test_db.commit()
+
+    return matrix, entity_sets
+
+
+@pytest.fixture
+def statements(test_engine):
+    """Record the SQL statements sent to the database."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestMarkCellsPendingForReprocessPostgres:
+    @pytest.mark.asyncio
+    async def test_returns_cells_and_questions_in_one_statement(
+        self, test_db, matrix, statements
+    ):
+        """Test that the UPDATE itself returns the reset cells' question IDs."""
+        matrix, entity_sets = matrix
+
+        plan = await MatrixCellRepository().mark_cells_pending_for_reprocess(
+            matrix.id, entity_set_filters=[(entity_sets[EntityType.QUESTION].id, [8])]
+        )
+
+        assert len(plan.cells) == 2  # 2 documents x question 8
+        assert all(cell.status == MatrixCellStatus.PENDING for cell in plan.cells)
+        assert plan.question_ids == [8]
+        assert len([s for s in statements if s.lstrip().startswith("UPDATE")]) == 1
+        assert not [s for s in statements if s.lstrip().startswith("SELECT")]
+
+    @pytest.mark.asyncio
+    async def test_whole_matrix_returns_every_question(self, test_db, matrix):
+        """Test that whole-matrix reprocessing returns each question ID once."""
+        matrix, _ = matrix
+
+        plan = await MatrixCellRepository().mark_cells_pending_for_reprocess(
+            matrix.id, whole_matrix=True
+        )
+
+        assert len(plan.cells) == 4
+        assert plan.question_ids == [7, 8]
@@ -0,0 +1,165 @@
+"""Postgres tests for set-wise matrix duplication (sequence-allocated IDs)."""
+
+import pytest
+from sqlalchemy import event, select
+
+from packages.matrices.models.database.matrix import MatrixCellEntity
+from packages.matrices.models.database.matrix_entity_set import (
+    MatrixCellEntityReferenceEntity,
+    MatrixEntitySetMemberEntity,
+)
+from packages.matrices.models.domain.matrix_enums import EntityRole
+from packages.questions.models.database.question import QuestionEntity
+from tests.unit.packages.matrices.repositories.test_matrix_duplication_repository import (
+    TestMatrixDuplicationRepository as _SQLiteScenarios,
+    _signature,
+)
+
+
+@pytest.fixture(autouse=True)
+async def question_types(sample_question_types):
+    """Postgres enforces the question_type_id foreign keys the scenario uses."""
+    return sample_question_types
+
+
+class TestMatrixDuplicationRepositoryPostgres(_SQLiteScenarios):
+    """The duplication scenarios, with IDs drawn from the tables' sequences."""
+
+    async def test_allocated_ids_advance_sequences(self, repository, test_db, source):
+        """Test that rows inserted after a copy don't collide with copied IDs."""
+        target_matrix = source["target_matrix"]
+
+        await repository.copy_matrix_contents(
+            source["source_matrix"].id,
+            target_matrix.id,
+            source["entity_set_id_mapping"],
+            source["template_variable_id_mapping"],
+            copy_questions=True,
+            copy_answers=True,
+        )
+
+        copied_question_id = (
+            await test_db.execute(
+                select(QuestionEntity.id).where(
+                    QuestionEntity.matrix_id == target_matrix.id
+                )
+            )
+        ).scalar_one()
+        copied_cell_id = (
+            await test_db.execute(
+                select(MatrixCellEntity.id).where(
+                    MatrixCellEntity.matrix_id == target_matrix.id
+                )
+            )
+        ).scalar_one()
+
+        question = QuestionEntity(
+            matrix_id=target_matrix.id,
+            company_id=target_matrix.company_id,
+            question_text="Added after the copy",
+            question_type_id=1,
+        )
+        cell = MatrixCellEntity(
+            matrix_id=target_matrix.id,
+            company_id=target_matrix.company_id,
+            cell_type="standard",
+            status="pending",
+            cell_signature="added-after-copy",
+        )
+        test_db.add_all([question, cell])
+        await test_db.commit()
+
+        assert question.id > copied_question_id
+        assert cell.id > copied_cell_id
+
+    async def test_signatures_computed_in_one_update(
+        self, repository, test_db, test_engine, source
+    ):
+        """Test that copied cell signatures are hashed in SQL, matching Python's."""
+        source_matrix = source["source_matrix"]
+        target_matrix = source["target_matrix"]
+        answered = (
+            await test_db.execute(
+                select(MatrixCellEntity).where(
+                    MatrixCellEntity.matrix_id == source_matrix.id,
+                    MatrixCellEntity.status == "completed",
+                )
+            )
+        ).scalar_one()
+        second_doc_member = (
+            await test_db.execute(
+                select(MatrixEntitySetMemberEntity).where(
+                    MatrixEntitySetMemberEntity.entity_id == source["documents"][1].id,
+                    MatrixEntitySetMemberEntity.entity_set_id.in_(
+                        source["entity_set_id_mapping"]
+                    ),
+                )
+            )
+        ).scalar_one()
+        # A second document coordinate, so the signature hashes several parts
+        test_db.add(
+            MatrixCellEntityReferenceEntity(
+                matrix_id=source_matrix.id,
+                matrix_cell_id=answered.id,
+                entity_set_id=second_doc_member.entity_set_id,
+                entity_set_member_id=second_doc_member.id,
+                company_id=source_matrix.company_id,
+                role=EntityRole.DOCUMENT.value,
+                entity_order=1,
+            )
+        )
+        await test_db.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            await repository.copy_matrix_contents(
+                source_matrix.id,
+                target_matrix.id,
+                source["entity_set_id_mapping"],
+                source["template_variable_id_mapping"],
+                copy_questions=True,
+                copy_answers=True,
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+        cell = (
+            await test_db.execute(
+                select(MatrixCellEntity).where(
+                    MatrixCellEntity.matrix_id == target_matrix.id
+                )
+            )
+        ).scalar_one()
+        refs = (
+            (
+                await test_db.execute(
+                    select(MatrixCellEntityReferenceEntity).where(
+                        MatrixCellEntityReferenceEntity.matrix_cell_id == cell.id
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        assert len(refs) == 3
+        assert cell.cell_signature == _signature(
+            *(
+                f"{ref.role}|{ref.entity_set_id}|{ref.entity_set_member_id}"
+                for ref in refs
+            )
+        )
+
+        signature_statements = [s for s in statements if "string_agg" in s]
+        assert len(signature_statements) == 1
+        assert signature_statements[0].lstrip().startswith("UPDATE")
+        assert not any(
+            s.lstrip().startswith("SELECT")
+            and "matrix_cell_entity_refs" in s
+            and "||" in s
+            for s in statements
+        )
@@ -0,0 +1,25 @@
+"""Postgres tests for set-wise soft delete (one data-modifying CTE per filter)."""
+
+import pytest
+
+from tests.unit.packages.matrices.services.test_soft_delete_service import (
+    TestSoftDeleteService as _SQLiteScenarios,
+)
+
+
+@pytest.fixture(autouse=True)
+async def question_types(sample_question_types):
+    """Postgres enforces the question_type_id foreign keys the scenarios use."""
+    return sample_question_types
+
+
+class TestSoftDeleteServicePostgres:
+    """The entity-filter scenarios, run through the single-statement CTE."""
+
+    service = _SQLiteScenarios.service
+    test_soft_delete_entity_set_member_with_entity_filters = (
+        _SQLiteScenarios.test_soft_delete_entity_set_member_with_entity_filters
+    )
+    test_soft_delete_entity_filters_sharing_cells = (
+        _SQLiteScenarios.test_soft_delete_entity_filters_sharing_cells
+    )
@@ -0,0 +1,50 @@
+"""Postgres tests for the usage daily counter upsert."""
+
+from sqlalchemy import select
+
+from packages.billing.models.database.usage import UsageDailyCounterEntity
+from packages.billing.models.domain.enums import UsageEventType
+from packages.billing.models.domain.usage import UsageEventCreateModel
+from packages.billing.repositories.usage_repository import UsageEventRepository
+
+
+class TestUsageDailyCounterUpsert:
+    async def test_create_upserts_daily_counter(
+        self, test_db, sample_company, sample_user_entity
+    ):
+        """Test that ON CONFLICT adds each event to the existing counter row."""
+        repo = UsageEventRepository()
+
+        for size in (1000, 2000):
+            await repo.create(
+                UsageEventCreateModel(
+                    company_id=sample_company.id,
+                    user_id=sample_user_entity.id,
+                    event_type=UsageEventType.STORAGE_UPLOAD,
+                    file_size_bytes=size,
+                )
+            )
+        await repo.create(
+            UsageEventCreateModel(
+                company_id=sample_company.id,
+                user_id=sample_user_entity.id,
+                event_type=UsageEventType.CELL_OPERATION,
+                quantity=5,
+            )
+        )
+
+        counters = {
+            counter.event_type: counter
+            for counter in (
+                await test_db.execute(select(UsageDailyCounterEntity))
+            ).scalars()
+        }
+
+        storage = counters[UsageEventType.STORAGE_UPLOAD.value]
+        assert (storage.quantity, storage.event_count, storage.file_size_bytes) == (
+            2,
+            2,
+            3000,
+        )
+        cells = counters[UsageEventType.CELL_OPERATION.value]
+        assert (cells.quantity, cells.event_count) == (5, 1)
@@ -4,7 +4,7 @@ from pydantic import BaseModel
 from testcontainers.redis import RedisContainer
 
 from common.core.config import settings
-from common.providers.caching import cache
+from common.providers.caching import cache, invalidate_cache_namespace
 import common.providers.caching.factory as cache_factory
 
 
@@ -77,3 +77,53 @@ class TestCaching:
         result2 = await repo.exists(1)
         assert result2 is True
         assert repo.bool_call_count == 1  # Function not called again
+
+    @pytest.mark.asyncio
+    async def test_delete_pattern_in_batches(self):
+        """Test that pattern deletes remove matching keys and their index entries."""
+        with patch.object(settings, "cache_invalidation_batch_size", 3):
+            cache_provider = cache_factory.get_cache_provider()
+
+            for i in range(10):
+                await cache_provider.set(f"matrix:1:cell:{i}", i, ttl=60)
+            await cache_provider.set("matrix:2:cell:0", 0, ttl=60)
+
+            deleted = await cache_provider.delete_pattern("matrix:1:*")
+
+            assert deleted == 10
+            assert await cache_provider.get_keys("matrix:*") == ["matrix:2:cell:0"]
+            assert await cache_provider.get("matrix:2:cell:0") == 0
+
+    @pytest.mark.asyncio
+    async def test_unindexed_keys_skip_pattern_index(self):
+        """Test that unindexed keys are readable but not added to the pattern index."""
+        cache_provider = cache_factory.get_cache_provider()
+
+        await cache_provider.set("embedding:m:abc", [1.0], ttl=60, indexed=False)
+        await cache_provider.set("embedding:m:def", [2.0], ttl=60)
+
+        assert await cache_provider.get("embedding:m:abc") == [1.0]
+        assert await cache_provider.get_keys("embedding:*") == ["embedding:m:def"]
+
+    @pytest.mark.asyncio
+    async def test_namespace_generation_invalidation(self):
+        """Test that bumping a namespace generation invalidates its entries."""
+        calls = []
+
+        @cache(
+            TestModel,
+            ttl=60,
+            key_generator=lambda matrix_id, id: f"matrix_item:{id}",
+            namespace=lambda matrix_id, id: f"matrix:{matrix_id}",
+        )
+        async def get_item(matrix_id: int, id: int) -> TestModel:
+            calls.append(id)
+            return TestModel(id=id, name=f"v{len(calls)}")
+
+        assert (await get_item(1, 7)).name == "v1"
+        assert (await get_item(1, 7)).name == "v1"
+
+        await invalidate_cache_namespace("matrix:1")
+
+        assert (await get_item(1, 7)).name == "v2"
+        assert calls == [7, 7]
@@ -0,0 +1,56 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.providers.api_keys.client_pool import KeyedClientPool, close_client_pools
+
+
+class TestKeyedClientPool:
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_key(self):
+        """Test that one client is built per API key and then reused."""
+        created = []
+
+        def factory(api_key):
+            created.append(api_key)
+            return object()
+
+        pool = KeyedClientPool(factory)
+
+        first = pool.get("key-a")
+        assert pool.get("key-a") is first
+        assert pool.get("key-b") is not first
+        assert created == ["key-a", "key-b"]
+
+    def test_clients_scoped_to_event_loop(self):
+        """Test that a new event loop gets its own clients."""
+        pool = KeyedClientPool(lambda api_key: object())
+
+        async def get_client():
+            return pool.get("key-a")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_close_client_pools_closes_loop_clients(self):
+        """Test that shutdown closes pooled clients and the next get rebuilds."""
+        clients = []
+
+        def factory(api_key):
+            client = MagicMock(spec=["aclose"])
+            client.aclose = AsyncMock()
+            clients.append(client)
+            return client
+
+        pool = KeyedClientPool(factory)
+        first = pool.get("key-a")
+
+        await close_client_pools()
+
+        first.aclose.assert_awaited_once()
+        assert pool.get("key-a") is not first
+        assert len(clients) == 2
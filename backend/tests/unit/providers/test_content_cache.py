@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from common.providers.caching import ContentCache, MemoryCache, RedisCache
+
+
+class TestContentCache:
+    @pytest.mark.asyncio
+    async def test_get_or_load_caches_content(self):
+        """Test that the loader only runs on the first miss."""
+        cache = ContentCache(namespace="test", max_bytes=1024)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return "hello"
+
+        assert await cache.get_or_load("a", loader) == "hello"
+        assert await cache.get_or_load("a", loader) == "hello"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_content_not_cached(self):
+        """Test that missing content is not pinned in the cache."""
+        cache = ContentCache(namespace="test", max_bytes=1024)
+
+        async def loader():
+            return None
+
+        assert await cache.get_or_load("a", loader) is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_bytes(self):
+        """Test that least recently used entries are evicted past the byte budget."""
+        cache = ContentCache(namespace="test", max_bytes=10)
+
+        await cache.set("a", "aaaa")
+        await cache.set("b", "bbbb")
+        # Touch "a" so "b" becomes least recently used
+        assert await cache.get("a") == "aaaa"
+        await cache.set("c", "cccc")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "aaaa"
+        assert await cache.get("c") == "cccc"
+        assert cache.current_bytes == 8
+
+    @pytest.mark.asyncio
+    async def test_oversized_entry_skipped(self):
+        """Test that an entry larger than the budget doesn't flush the cache."""
+        cache = ContentCache(namespace="test", max_bytes=10)
+
+        await cache.set("a", "aaaa")
+        await cache.set("big", "x" * 11)
+
+        assert await cache.get("big") is None
+        assert await cache.get("a") == "aaaa"
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_populates_local(self):
+        """Test that a shared tier hit is served and promoted to L1."""
+        shared = MemoryCache()
+        writer = ContentCache(namespace="test", max_bytes=1024, shared_cache=shared)
+        reader = ContentCache(namespace="test", max_bytes=1024, shared_cache=shared)
+
+        await writer.set("key", "shared content")
+        assert await shared.get("test:key") == "shared content"
+
+        assert await reader.get("key") == "shared content"
+        assert len(reader) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_writes_skip_pattern_index(self):
+        """Test that shared entries expire by TTL without growing cache_index sets."""
+        shared = RedisCache()
+        shared._client = AsyncMock()
+        shared._connected = True
+        cache = ContentCache(
+            namespace="chunk_content",
+            max_bytes=1024,
+            shared_cache=shared,
+            shared_ttl=60,
+        )
+
+        await cache.set("key", "content")
+
+        shared._client.setex.assert_awaited_once_with(
+            "chunk_content:key", 60, '"content"'
+        )
+        shared._client.sadd.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stats_track_hits_misses_and_evictions(self):
+        """Test that get_or_load and eviction update the cache counters."""
+        cache = ContentCache(namespace="test", max_bytes=4)
+
+        async def loader():
+            return "aaaa"
+
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("a", loader)
+        await cache.set("b", "bbbb")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 1
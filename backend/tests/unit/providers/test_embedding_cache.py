@@ -0,0 +1,144 @@
+import pytest
+from typing import List
+from unittest.mock import patch
+
+from common.providers.caching import MemoryCache
+from common.providers.embeddings import (
+    CachedEmbeddingProvider,
+    EmbeddingCache,
+    EmbeddingProviderInterface,
+)
+
+
+class FakeEmbeddingProvider(EmbeddingProviderInterface):
+    """Deterministic provider that records each request."""
+
+    def __init__(self, failures: int = 0):
+        self.requests: List[List[str]] = []
+        self.failures = failures
+
+    async def generate_embedding(self, text: str) -> List[float]:
+        return (await self.generate_embeddings([text]))[0]
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.requests.append(list(texts))
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("transient failure")
+        return [[float(len(text))] for text in texts]
+
+    def get_embedding_dimension(self) -> int:
+        return 1
+
+    def get_model_name(self) -> str:
+        return "fake-model"
+
+
+def _make_provider(inner, cache=None, **kwargs):
+    return CachedEmbeddingProvider(
+        inner,
+        cache=cache if cache is not None else EmbeddingCache(max_entries=100),
+        retry_base_delay=0,
+        **kwargs,
+    )
+
+
+class TestCachedEmbeddingProvider:
+    @pytest.mark.asyncio
+    async def test_repeated_text_served_from_cache(self):
+        """Test that embedding the same text twice calls the provider once."""
+        inner = FakeEmbeddingProvider()
+        provider = _make_provider(inner)
+
+        first = await provider.generate_embedding("query")
+        second = await provider.generate_embedding("query")
+
+        assert first == second == [5.0]
+        assert inner.requests == [["query"]]
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_embedded_and_order_kept(self):
+        """Test that cached and duplicate texts are not re-sent."""
+        inner = FakeEmbeddingProvider()
+        provider = _make_provider(inner)
+        await provider.generate_embeddings(["a"])
+
+        result = await provider.generate_embeddings(["bb", "a", "bb", "ccc"])
+
+        assert result == [[2.0], [1.0], [2.0], [3.0]]
+        assert inner.requests[1] == ["bb", "ccc"]
+
+    @pytest.mark.asyncio
+    async def test_batches_bounded_by_count_and_chars(self):
+        """Test that misses are split by max texts and max characters."""
+        inner = FakeEmbeddingProvider()
+        provider = _make_provider(inner, max_batch_texts=2, max_batch_chars=5)
+
+        await provider.generate_embeddings(["a", "b", "c", "dddd", "eeeeee"])
+
+        assert inner.requests == [["a", "b"], ["c", "dddd"], ["eeeeee"]]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self):
+        """Test that a transient batch failure is retried."""
+        inner = FakeEmbeddingProvider(failures=1)
+        provider = _make_provider(inner, max_retries=2)
+
+        assert await provider.generate_embeddings(["x"]) == [[1.0]]
+        assert len(inner.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_after_retries_raises(self):
+        """Test that a batch failing every attempt raises."""
+        inner = FakeEmbeddingProvider(failures=5)
+        provider = _make_provider(inner, max_retries=1)
+
+        with pytest.raises(RuntimeError):
+            await provider.generate_embeddings(["x"])
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_reused_across_processes(self):
+        """Test that a fresh L1 is filled from the shared tier."""
+        shared = MemoryCache()
+        writer_inner = FakeEmbeddingProvider()
+        await _make_provider(
+            writer_inner, cache=EmbeddingCache(max_entries=10, shared_cache=shared)
+        ).generate_embeddings(["shared"])
+
+        reader_inner = FakeEmbeddingProvider()
+        reader = _make_provider(
+            reader_inner, cache=EmbeddingCache(max_entries=10, shared_cache=shared)
+        )
+
+        assert await reader.generate_embeddings(["shared"]) == [[6.0]]
+        assert reader_inner.requests == []
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_writes_are_unindexed(self):
+        """Test that embeddings don't grow the shared tier's pattern index."""
+        shared = MemoryCache()
+        cache = EmbeddingCache(max_entries=10, shared_cache=shared, shared_ttl=60)
+
+        with patch.object(shared, "set", wraps=shared.set) as shared_set:
+            await _make_provider(
+                FakeEmbeddingProvider(), cache=cache
+            ).generate_embeddings(["text"])
+
+        shared_set.assert_awaited_once()
+        assert shared_set.await_args.kwargs["indexed"] is False
+
+
+class TestEmbeddingCache:
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test that least recently used entries are evicted past max_entries."""
+        cache = EmbeddingCache(max_entries=2)
+        await cache.set_many({"a": [1.0], "b": [2.0]})
+        await cache.get_many(["a"])
+        await cache.set_many({"c": [3.0]})
+
+        assert set(await cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_key_depends_on_model(self):
+        """Test that the same text under different models gets different keys."""
+        assert EmbeddingCache.make_key("m1", "t") != EmbeddingCache.make_key("m2", "t")
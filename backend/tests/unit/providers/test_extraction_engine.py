@@ -0,0 +1,128 @@
+import os
+from typing import Optional
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from common.core.config import settings
+from common.providers.extraction.engine import ExtractionEngine
+from common.providers.extraction.worker import ConversionResult
+
+
+def _range_storage(data: Optional[bytes], failing_offset: Optional[int] = None):
+    """Storage mock serving byte ranges of one object (None if it's missing)."""
+    storage = MagicMock()
+
+    async def download_range(key, offset, length):
+        if data is None or offset == failing_offset:
+            return None
+        return data[offset : offset + length]
+
+    storage.get_size = AsyncMock(return_value=None if data is None else len(data))
+    storage.download_range = AsyncMock(side_effect=download_range)
+    return storage
+
+
+class TestExtractionEngine:
+    @pytest.fixture
+    def engine(self):
+        engine = ExtractionEngine(max_workers=1, memory_limit_bytes=None, timeout=60)
+        yield engine
+        engine.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_streams_object_to_temp_file_in_ranges(self, engine):
+        """Test that the object is written to disk range by range and cleaned up."""
+        data = b"a,b\n" * 10
+        storage = _range_storage(data)
+        seen = {}
+
+        async def convert_file(path, mimetype, extension, filename=None):
+            with open(path, "rb") as f:
+                seen["data"] = f.read()
+            seen["path"] = path
+            return ConversionResult(text_content="ok", title=None, file_size=len(data))
+
+        with (
+            patch.object(settings, "storage_multipart_chunk_size", 16),
+            patch.object(engine, "convert_file", side_effect=convert_file),
+        ):
+            result = await engine.convert_storage_object(
+                storage, "key.csv", mimetype="text/csv", extension=".csv"
+            )
+
+        assert result.text_content == "ok"
+        assert seen["data"] == data
+        assert storage.download_range.await_count == 3
+        assert not os.path.exists(seen["path"])
+
+    @pytest.mark.asyncio
+    async def test_missing_object_raises(self, engine):
+        """Test that a missing object fails before anything is converted."""
+        storage = _range_storage(None)
+
+        with pytest.raises(ValueError, match="Failed to download file from"):
+            await engine.convert_storage_object(
+                storage, "missing.xlsx", mimetype="text/csv", extension=".csv"
+            )
+
+        storage.download_range.assert_not_awaited()
+        assert engine.stats()["completed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stops_at_object_size(self, engine):
+        """Test that a size that's a multiple of the chunk size reads no extra range."""
+        storage = _range_storage(b"x" * 32)
+        seen = {}
+
+        async def convert_file(path, mimetype, extension, filename=None):
+            with open(path, "rb") as f:
+                seen["data"] = f.read()
+            return ConversionResult(text_content="ok", title=None, file_size=32)
+
+        with (
+            patch.object(settings, "storage_multipart_chunk_size", 16),
+            patch.object(engine, "convert_file", side_effect=convert_file),
+        ):
+            await engine.convert_storage_object(
+                storage, "key.csv", mimetype="text/csv", extension=".csv"
+            )
+
+        assert seen["data"] == b"x" * 32
+        assert storage.download_range.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_range_read_raises(self, engine):
+        """Test that a range read failing mid-file doesn't convert a truncated file."""
+        storage = _range_storage(b"a,b\n" * 10, failing_offset=16)
+
+        with (
+            patch.object(settings, "storage_multipart_chunk_size", 16),
+            patch.object(engine, "convert_file") as convert_file,
+            pytest.raises(ValueError, match="Failed to download bytes 16-39"),
+        ):
+            await engine.convert_storage_object(
+                storage, "key.csv", mimetype="text/csv", extension=".csv"
+            )
+
+        convert_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_converts_in_worker_process(self, engine, tmp_path):
+        """Test a real conversion through the process pool."""
+        path = tmp_path / "table.csv"
+        path.write_text("name,amount\nwidget,3\n")
+
+        result = await engine.convert_file(
+            str(path), mimetype="text/csv", extension=".csv", filename="table.csv"
+        )
+
+        assert "widget" in result.text_content
+        assert result.file_size == path.stat().st_size
+        assert engine.stats() == {
+            "max_workers": 1,
+            "running": 0,
+            "queued": 0,
+            "completed": 1,
+            "failed": 0,
+        }
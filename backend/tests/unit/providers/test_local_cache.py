@@ -0,0 +1,320 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+from unittest.mock import patch
+
+from common.providers.caching import (
+    LocalCache,
+    MemoryCache,
+    SingleFlight,
+    cache,
+    invalidate_cache_namespace,
+)
+
+
+class ItemModel(BaseModel):
+    id: int
+    name: str
+
+
+class TestLocalCache:
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL passes."""
+        local = LocalCache(max_entries=10, ttl_jitter=0)
+
+        with patch("common.providers.caching.local_cache.time.monotonic") as clock:
+            clock.return_value = 100.0
+            local.set("a", 1, ttl=10)
+            clock.return_value = 109.0
+            assert local.get("a") == 1
+            clock.return_value = 111.0
+            assert local.get("a") is None
+
+    def test_entries_without_ttl_never_expire(self):
+        """Test that an entry stored without a TTL stays until evicted."""
+        local = LocalCache(max_entries=10)
+
+        with patch("common.providers.caching.local_cache.time.monotonic") as clock:
+            clock.return_value = 0.0
+            local.set("a", 1, ttl=None)
+            clock.return_value = 1e12
+            assert local.get("a") == 1
+
+    def test_ttl_jitter_stays_within_bounds(self):
+        """Test that jittered expiry stays within the configured fraction."""
+        local = LocalCache(max_entries=100, ttl_jitter=0.1)
+
+        with patch("common.providers.caching.local_cache.time.monotonic") as clock:
+            clock.return_value = 0.0
+            for i in range(50):
+                local.set(str(i), i, ttl=100)
+
+        expiries = [expires_at for expires_at, _ in local._entries.values()]
+        assert all(90.0 <= expires_at <= 110.0 for expires_at in expiries)
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test that the least recently used entry is evicted when full."""
+        local = LocalCache(max_entries=2)
+
+        local.set("a", 1, ttl=60)
+        local.set("b", 2, ttl=60)
+        assert local.get("a") == 1
+        local.set("c", 3, ttl=60)
+
+        assert local.get("b") is None
+        assert local.get("a") == 1
+        assert local.get("c") == 3
+
+    def test_delete_pattern(self):
+        """Test glob-pattern invalidation."""
+        local = LocalCache(max_entries=10)
+        local.set("company:1:subscription", 1, ttl=60)
+        local.set("company:2:subscription", 2, ttl=60)
+        local.set("ai_model:get", 3, ttl=60)
+
+        assert local.delete_pattern("company:*") == 2
+        assert len(local) == 1
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_load(self):
+        """Test that concurrent callers for a key run the loader once."""
+        single_flight = SingleFlight()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            *(single_flight.do("key", loader) for _ in range(5))
+        )
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        assert single_flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_callers(self):
+        """Test that a failed load fails every waiter and is not remembered."""
+        single_flight = SingleFlight()
+
+        async def failing_loader():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(single_flight.do("key", failing_loader) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+        async def loader():
+            return "recovered"
+
+        assert await single_flight.do("key", loader) == "recovered"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that followers retry the load when only the leader is cancelled."""
+        single_flight = SingleFlight()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(single_flight.do("key", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", loader))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "value"
+        assert leader.cancelled()
+        assert len(calls) == 2
+        assert single_flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_is_cancelled(self):
+        """Test that cancelling a follower cancels it without affecting the leader."""
+        single_flight = SingleFlight()
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(single_flight.do("key", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", loader))
+        await asyncio.sleep(0)
+
+        follower.cancel()
+
+        assert await leader == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+
+
+class TestCacheDecoratorLocalTier:
+    @pytest.fixture
+    def shared_cache(self):
+        shared = MemoryCache()
+        with patch(
+            "common.providers.caching.decorators.get_cache_provider",
+            return_value=shared,
+        ):
+            yield shared
+
+    @pytest.fixture
+    def local_cache(self):
+        local = LocalCache(max_entries=100)
+        with patch(
+            "common.providers.caching.decorators.get_local_cache",
+            return_value=local,
+        ):
+            yield local
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_shared_cache(self, shared_cache, local_cache):
+        """Test that L1 hits return the validated model without the shared tier."""
+        calls = []
+
+        @cache(ItemModel, ttl=300, key_generator=lambda id: f"item:{id}", local_ttl=30)
+        async def get_item(id: int) -> ItemModel:
+            calls.append(id)
+            return ItemModel(id=id, name="first")
+
+        first = await get_item(1)
+        # Shared tier changes are not seen while the L1 entry is fresh
+        await shared_cache.set("item:1", {"id": 1, "name": "other"})
+        second = await get_item(1)
+
+        assert second is first
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_populates_local_tier(self, shared_cache, local_cache):
+        """Test that a shared-tier hit is promoted into L1."""
+        await shared_cache.set("item:2", {"id": 2, "name": "shared"})
+
+        @cache(ItemModel, ttl=300, key_generator=lambda id: f"item:{id}", local_ttl=30)
+        async def get_item(id: int) -> ItemModel:
+            raise AssertionError("should be served from cache")
+
+        result = await get_item(2)
+
+        assert result == ItemModel(id=2, name="shared")
+        assert local_cache.get("item:2") == result
+
+    @pytest.mark.asyncio
+    async def test_without_local_ttl_local_tier_is_unused(
+        self, shared_cache, local_cache
+    ):
+        """Test that the L1 tier is opt-in."""
+
+        @cache(ItemModel, ttl=300, key_generator=lambda id: f"item:{id}")
+        async def get_item(id: int) -> ItemModel:
+            return ItemModel(id=id, name="x")
+
+        await get_item(3)
+
+        assert len(local_cache) == 0
+        assert await shared_cache.get("item:3") == {"id": 3, "name": "x"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_run_function_once(self, shared_cache, local_cache):
+        """Test singleflight: concurrent misses on one key share a single call."""
+        calls = []
+
+        @cache(ItemModel, ttl=300, key_generator=lambda id: f"item:{id}")
+        async def get_item(id: int) -> ItemModel:
+            calls.append(id)
+            await asyncio.sleep(0.01)
+            return ItemModel(id=id, name="slow")
+
+        results = await asyncio.gather(*(get_item(4) for _ in range(10)))
+
+        assert len(calls) == 1
+        assert all(r == ItemModel(id=4, name="slow") for r in results)
+
+    @pytest.mark.asyncio
+    async def test_namespace_generation_invalidation(self, shared_cache, local_cache):
+        """Test that bumping a namespace generation invalidates both tiers."""
+        calls = []
+
+        @cache(
+            ItemModel,
+            ttl=300,
+            key_generator=lambda matrix_id, id: f"matrix_item:{id}",
+            namespace=lambda matrix_id, id: f"matrix:{matrix_id}",
+            local_ttl=30,
+        )
+        async def get_item(matrix_id: int, id: int) -> ItemModel:
+            calls.append(id)
+            return ItemModel(id=id, name=f"v{len(calls)}")
+
+        assert (await get_item(1, 7)).name == "v1"
+        assert (await get_item(1, 7)).name == "v1"
+
+        await invalidate_cache_namespace("matrix:1")
+
+        assert (await get_item(1, 7)).name == "v2"
+        assert calls == [7, 7]
+
+    @pytest.mark.asyncio
+    async def test_namespace_on_method_skips_self(self, shared_cache, local_cache):
+        """Test that key_generator and namespace get method args without self."""
+
+        class Repository:
+            def __init__(self):
+                self.calls = 0
+
+            @cache(
+                ItemModel,
+                ttl=300,
+                key_generator=lambda matrix_id, id: f"matrix_item:{id}",
+                namespace=lambda matrix_id, id: f"matrix:{matrix_id}",
+            )
+            async def get_item(self, matrix_id: int, id: int) -> ItemModel:
+                self.calls += 1
+                return ItemModel(id=id, name="x")
+
+        repo = Repository()
+        await repo.get_item(2, 8)
+        await repo.get_item(2, 8)
+
+        assert repo.calls == 1
+        assert await shared_cache.get("matrix:2@0:matrix_item:8") is not None
+
+    @pytest.mark.asyncio
+    async def test_namespace_lookup_failure_skips_cache(
+        self, shared_cache, local_cache
+    ):
+        """Test that an unreadable generation bypasses both tiers."""
+        calls = []
+
+        @cache(
+            ItemModel,
+            ttl=300,
+            key_generator=lambda matrix_id, id: f"matrix_item:{id}",
+            namespace=lambda matrix_id, id: f"matrix:{matrix_id}",
+            local_ttl=30,
+        )
+        async def get_item(matrix_id: int, id: int) -> ItemModel:
+            calls.append(id)
+            return ItemModel(id=id, name="x")
+
+        await get_item(1, 9)
+        with patch.object(
+            shared_cache, "get_generation", side_effect=ConnectionError("down")
+        ):
+            await get_item(1, 9)
+
+        assert calls == [9, 9]
@@ -0,0 +1,161 @@
+import httpx
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from openai import RateLimitError
+
+from common.core.config import settings
+from common.providers.ai.models import InputMessage
+from common.providers.ai.openrouter_provider import OpenRouterProvider
+from common.providers.ai.rate_governor import ModelRateGovernor
+from common.providers.caching import ContentCache, RedisCache
+
+
+def _completion(content: str):
+    message = SimpleNamespace(content=content, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _rate_limit_error(retry_after: str) -> RateLimitError:
+    request = httpx.Request("POST", "https://openrouter.ai/api/v1/chat/completions")
+    response = httpx.Response(
+        429, headers={"retry-after": retry_after}, request=request
+    )
+    return RateLimitError("rate limited", response=response, body=None)
+
+
+@pytest.fixture
+def response_cache():
+    cache = ContentCache(namespace="llm_response", max_bytes=1024 * 1024)
+    with patch(
+        "common.providers.ai.openrouter_provider.get_llm_response_cache",
+        return_value=cache,
+    ):
+        yield cache
+
+
+@pytest.fixture
+def governor():
+    governor = ModelRateGovernor(max_concurrency=4, rate=1000.0, burst=100)
+    governor.pause = MagicMock()
+    with patch(
+        "common.providers.ai.openrouter_provider.get_model_governor",
+        return_value=governor,
+    ):
+        yield governor
+
+
+@pytest.fixture
+def provider(governor):
+    provider = OpenRouterProvider(model_name="test/model")
+    provider.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=AsyncMock()))
+    )
+    return provider
+
+
+class TestOpenRouterResponseCache:
+    @pytest.mark.asyncio
+    async def test_zero_temperature_requests_are_cached(self, provider, response_cache):
+        """Test that a repeated deterministic request reuses the completion."""
+        create = provider.client.chat.completions.create
+        create.return_value = _completion("answer")
+        messages = [InputMessage(role="user", content="question")]
+
+        first = await provider.send_messages(messages, temperature=0.0)
+        second = await provider.send_messages(messages, temperature=0.0)
+
+        assert first.content == second.content == "answer"
+        assert create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_tools_are_part_of_the_cache_key(self, provider, response_cache):
+        """Test that the same messages with different tools are not conflated."""
+        create = provider.client.chat.completions.create
+        create.return_value = _completion("answer")
+        messages = [InputMessage(role="user", content="question")]
+        tool = {"type": "function", "function": {"name": "search"}}
+
+        await provider.send_messages(messages, temperature=0.0)
+        await provider.send_messages(messages, tools=[tool], temperature=0.0)
+
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_are_not_cached(self, provider, response_cache):
+        """Test that requests above the max temperature always hit the API."""
+        create = provider.client.chat.completions.create
+        create.return_value = _completion("answer")
+
+        await provider.send_message("system", "question", temperature=0.7)
+        await provider.send_message("system", "question", temperature=0.7)
+
+        assert create.await_count == 2
+        assert len(response_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_completions_are_not_indexed_in_redis(self, provider):
+        """Test that shared-tier completions don't grow cache_index:llm_response."""
+        shared = RedisCache()
+        shared._client = AsyncMock()
+        shared._connected = True
+        cache = ContentCache(
+            namespace="llm_response",
+            max_bytes=1024 * 1024,
+            shared_cache=shared,
+            shared_ttl=60,
+        )
+        provider.client.chat.completions.create.return_value = _completion("answer")
+
+        with patch(
+            "common.providers.ai.openrouter_provider.get_llm_response_cache",
+            return_value=cache,
+        ):
+            await provider.send_messages(
+                [InputMessage(role="user", content="question")], temperature=0.0
+            )
+
+        shared._client.setex.assert_awaited_once()
+        assert shared._client.setex.await_args.args[0].startswith("llm_response:")
+        shared._client.sadd.assert_not_awaited()
+
+
+class TestOpenRouterRetries:
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_after_server_hint(
+        self, provider, governor, response_cache
+    ):
+        """Test that a 429 waits out the retry-after and pauses the model."""
+        create = provider.client.chat.completions.create
+        create.side_effect = [_rate_limit_error("2"), _completion("answer")]
+
+        with patch(
+            "common.providers.ai.openrouter_provider.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as sleep:
+            result = await provider.send_message("system", "question", temperature=0.7)
+
+        assert result == "answer"
+        assert create.await_count == 2
+        delay = sleep.await_args.args[0]
+        assert 2.0 <= delay <= 3.0
+        governor.pause.assert_called_once_with(delay)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, provider, response_cache):
+        """Test that persistent failures surface once retries are exhausted."""
+        create = provider.client.chat.completions.create
+        create.side_effect = _rate_limit_error("0")
+
+        with (
+            patch(
+                "common.providers.ai.openrouter_provider.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+            patch.object(settings, "llm_max_retries", 2),
+        ):
+            with pytest.raises(Exception, match="Failed to get response"):
+                await provider.send_message("system", "question", temperature=0.7)
+
+        assert create.await_count == 3
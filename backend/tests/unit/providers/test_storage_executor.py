@@ -0,0 +1,29 @@
+import threading
+
+import pytest
+
+from common.providers.storage.executor import get_storage_executor, run_blocking
+
+
+class TestStorageExecutor:
+    @pytest.mark.asyncio
+    async def test_run_blocking_runs_off_event_loop_thread(self):
+        """Test that blocking calls are moved onto the storage thread pool."""
+        loop_thread = threading.get_ident()
+
+        worker_thread = await run_blocking(threading.get_ident)
+
+        assert worker_thread != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_run_blocking_passes_args_and_kwargs(self):
+        """Test that positional and keyword arguments are forwarded."""
+
+        def combine(a, b, sep="-"):
+            return f"{a}{sep}{b}"
+
+        assert await run_blocking(combine, "x", "y", sep="+") == "x+y"
+
+    def test_executor_is_shared(self):
+        """Test that the storage executor is a process-wide singleton."""
+        assert get_storage_executor() is get_storage_executor()
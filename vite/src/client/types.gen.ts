@@ -1587,6 +1587,10 @@ export type MatrixDuplicateRequest = {
      * Templatevariableoverrides
      */
     templateVariableOverrides?: Array<TemplateVariableOverride> | null;
+    /**
+     * Copyanswers
+     */
+    copyAnswers?: boolean;
 };
 
 /**